@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""比較各傳輸層每秒可完成的 yutu 呼叫數
+
+預設使用內附的假 yutu 與本機的假 Data API 伺服器（不需連線 YouTube）：
+
+    uv run python benchmarks/bench_transport.py --calls 200 --threads 4
+
+加上 --cli-path 可改為測量真實的 yutu 執行檔（api 仍使用假伺服器）。
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from yutu_cli.config import reset_config  # noqa: E402
+from yutu_cli.testing import fake_yutu  # noqa: E402
+from yutu_cli.testing.fake_api import FakeApiServer  # noqa: E402
+from yutu_cli.utils.yutu import YutuCLI  # noqa: E402
+
+
+def bench(transport: str, calls: int, threads: int) -> float:
+    """回傳每秒呼叫數"""
+    os.environ["YUTU_TRANSPORT"] = transport
+    reset_config()
+    yutu = YutuCLI()
+    try:
+        # 暖機：讓常駐工作程序完成啟動與握手
+        yutu.list_my_playlists()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(lambda _: yutu.list_my_playlists(), range(calls)))
+        elapsed = time.perf_counter() - start
+    finally:
+        yutu.close()
+    failures = sum(not r.success for r in results)
+    if failures:
+        print(f"  警告：{transport} 有 {failures} 次呼叫失敗", file=sys.stderr)
+    return calls / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="每個傳輸層的呼叫次數")
+    parser.add_argument("--threads", type=int, default=1, help="同時呼叫的執行緒數")
+    parser.add_argument("--cli-path", default=str(Path(fake_yutu.__file__)), help="yutu 執行檔路徑")
+    args = parser.parse_args()
+
+    os.environ["YUTU_CLI_PATH"] = args.cli_path
+    os.environ["YUTU_CACHE_ENABLED"] = "false"
+
+    with FakeApiServer() as server, tempfile.TemporaryDirectory() as tmp:
+        token_path, credential_path = server.write_credentials(tmp)
+        os.environ["YUTU_API_BASE_URL"] = server.url
+        os.environ["YUTU_CACHE_TOKEN"] = str(token_path)
+        os.environ["YUTU_CREDENTIAL"] = str(credential_path)
+        # 配額帳本與鏡像寫入暫存目錄，不影響使用者的狀態
+        os.environ["YUTU_STATE_DIR"] = str(Path(tmp) / "state")
+        rates = {name: bench(name, args.calls, args.threads) for name in ("subprocess", "mcp", "api")}
+    for name, rate in rates.items():
+        print(f"{name:<12} {rate:10.1f} 次/秒")
+    for name in ("mcp", "api"):
+        print(f"{name + ' 加速':<10} {rates[name] / rates['subprocess']:10.1f} 倍")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""效能基準測試 - 以內附的假 yutu 離線量測各環節的耗時
+
+量測項目：
+    startup.*  yutu-manager 本身的啟動成本（新的直譯器，不含互動式介面）
+    spawn.*    啟動 yutu 程序的固定成本（每次呼叫）
+    parse.*    大型 JSON 輸出的解析成本（一次載入 vs 串流）
+    render.*   rich 表格的繪製成本（輸出至記憶體，不佔用終端機）
+    e2e.*      完整的選單操作（呼叫假 yutu、解析、顯示）
+
+    uv run python benchmarks/run_benchmarks.py
+    uv run python benchmarks/run_benchmarks.py --check          # 超過門檻時以非零狀態結束
+    uv run python benchmarks/run_benchmarks.py --only parse     # 只執行名稱符合的項目
+
+門檻記錄於 benchmarks/thresholds.json（單位：毫秒，取多次執行的最佳值比較），
+約為 benchmarks/baseline.json 所記錄基準值的 1.5–2 倍；效能有意改變時以
+`--save-baseline` 更新基準值，並依新的基準值調整門檻。
+"""
+
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from yutu_cli.config import reset_config  # noqa: E402
+from yutu_cli.testing import fake_yutu  # noqa: E402
+from yutu_cli.testing.fake_yutu import FakeChannel  # noqa: E402
+from yutu_cli.utils import display, video_catalog  # noqa: E402
+from yutu_cli.utils.json_stream import iter_json_items  # noqa: E402
+from yutu_cli.utils.models import Playlist  # noqa: E402
+from yutu_cli.utils.yutu import YutuCLI  # noqa: E402
+
+THRESHOLDS_PATH = Path(__file__).with_name("thresholds.json")
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# 基準測試使用的頻道規模
+PARSE_ITEMS = 50_000
+PLAYLIST_ITEMS = 10_000
+VIDEOS = 2_000
+COMMENTS = 1_000
+RENDER_ROWS = 2_000
+RENDER_ROWS_LARGE = 100_000
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """註冊基準測試：被裝飾的函式負責準備資料，並回傳要計時的函式"""
+
+    def decorator(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+@contextmanager
+def fake_env(**overrides: object) -> Iterator[YutuCLI]:
+    """以假 yutu 與指定的頻道規模建立 YutuCLI（停用快取，狀態寫入暫存目錄）"""
+    state_dir = tempfile.TemporaryDirectory()
+    env = {
+        "YUTU_CLI_PATH": str(Path(fake_yutu.__file__)),
+        "YUTU_CACHE_ENABLED": "false",
+        # 配額帳本與鏡像不使用使用者的 ~/.cache/yutu-manager
+        "YUTU_STATE_DIR": state_dir.name,
+        **{f"FAKE_YUTU_{key.upper()}": str(value) for key, value in overrides.items()},
+    }
+    saved = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    reset_config()
+    yutu = YutuCLI()
+    try:
+        yield yutu
+    finally:
+        yutu.close()
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        reset_config()
+        state_dir.cleanup()
+
+
+@contextmanager
+def captured_console() -> Iterator[io.StringIO]:
+    """將共用的 rich console 暫時導向記憶體"""
+    console = display.console
+    saved_file, saved_width = console.file, console.width
+    buffer = io.StringIO()
+    console.file = buffer
+    console.width = 120
+    try:
+        yield buffer
+    finally:
+        console.file = saved_file
+        console.width = saved_width
+
+
+def _playlist_items_json(count: int) -> str:
+    channel = FakeChannel(items_per_playlist=count, videos=count)
+    return json.dumps(channel.playlist_items("PLbench"), ensure_ascii=False)
+
+
+# --- startup -------------------------------------------------------------------
+
+@benchmark("startup.import")
+def bench_startup_import():
+    # 只匯入入口點（含 click），不執行命令
+    cmd = [sys.executable, "-c", "import yutu_cli.__main__"]
+    cwd = Path(__file__).resolve().parent.parent
+    return lambda: subprocess.run(cmd, cwd=cwd, capture_output=True, check=True)
+
+
+@benchmark("startup.version")
+def bench_startup_version():
+    cmd = [sys.executable, "-m", "yutu_cli", "--version"]
+    cwd = Path(__file__).resolve().parent.parent
+    return lambda: subprocess.run(cmd, cwd=cwd, capture_output=True, check=True)
+
+
+# --- spawn ---------------------------------------------------------------------
+
+@benchmark("spawn.subprocess")
+def bench_spawn_subprocess():
+    def run():
+        with fake_env() as yutu:
+            for _ in range(10):
+                assert yutu.run("channel", "list", mine="true").success
+    return run
+
+
+@benchmark("spawn.mcp")
+def bench_spawn_mcp():
+    def run():
+        with fake_env() as yutu:
+            yutu.config.transport = "mcp"
+            for _ in range(10):
+                assert yutu.run("channel", "list", mine="true").success
+    return run
+
+
+# --- parse ---------------------------------------------------------------------
+
+@benchmark("parse.json_loads")
+def bench_parse_json_loads():
+    text = _playlist_items_json(PARSE_ITEMS)
+    return lambda: len(json.loads(text))
+
+
+@benchmark("parse.stream")
+def bench_parse_stream():
+    text = _playlist_items_json(PARSE_ITEMS)
+    chunks = [text[i : i + 65536] for i in range(0, len(text), 65536)]
+    return lambda: sum(1 for _ in iter_json_items(chunks))
+
+
+# --- render --------------------------------------------------------------------
+
+@benchmark("render.playlist_items")
+def bench_render_playlist_items():
+    items = json.loads(_playlist_items_json(RENDER_ROWS))
+
+    def run():
+        with captured_console():
+            display.display_playlist_items(items, "基準測試")
+    return run
+
+
+@benchmark("render.playlist_items_large")
+def bench_render_playlist_items_large():
+    items = json.loads(_playlist_items_json(RENDER_ROWS_LARGE))
+
+    def run():
+        with captured_console():
+            display.display_playlist_items(items, "基準測試")
+    return run
+
+
+@benchmark("render.comments")
+def bench_render_comments():
+    channel = FakeChannel()
+    threads = [channel.comment_thread("v0000000001", n) for n in range(COMMENTS)]
+
+    def run():
+        with captured_console():
+            display.display_comments(threads, "基準測試")
+    return run
+
+
+# --- e2e -----------------------------------------------------------------------
+
+@benchmark("e2e.view_large_playlist")
+def bench_view_large_playlist():
+    from yutu_cli.commands import playlists
+
+    def run():
+        with fake_env(items=PLAYLIST_ITEMS, videos=PLAYLIST_ITEMS) as yutu, captured_console():
+            playlist = Playlist.from_api(FakeChannel(items_per_playlist=PLAYLIST_ITEMS).playlist(0))
+            select, playlists._select_playlist = playlists._select_playlist, lambda *_: playlist
+            try:
+                playlists._view_playlist(yutu)
+            finally:
+                playlists._select_playlist = select
+    return run
+
+
+@benchmark("e2e.list_my_videos")
+def bench_list_my_videos():
+    from yutu_cli.commands import videos
+
+    def run():
+        with fake_env(videos=VIDEOS) as yutu, captured_console():
+            video_catalog._catalog = video_catalog.VideoCatalog(yutu)
+            try:
+                assert len(videos._list_my_videos(yutu, complete=True)) == VIDEOS
+            finally:
+                video_catalog._catalog = None
+    return run
+
+
+@benchmark("e2e.list_comments")
+def bench_list_comments():
+    def run():
+        with fake_env(comments=COMMENTS) as yutu, captured_console():
+            result = yutu.list_comment_threads("v0000000001")
+            assert result.success
+            display.display_comments(result.data, "基準測試")
+    return run
+
+
+def measure(setup: Callable[[], Callable[[], object]], repeat: int) -> float:
+    """回傳最佳一次的耗時（毫秒）"""
+    run = setup()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="每個項目的執行次數")
+    parser.add_argument("--only", default="", help="只執行名稱包含此字串的項目")
+    parser.add_argument("--check", action="store_true", help="與門檻比較，超過時以狀態 1 結束")
+    parser.add_argument("--json", action="store_true", help="以 JSON 輸出結果")
+    parser.add_argument("--save-baseline", action="store_true", help="將本次結果寫入 baseline.json")
+    args = parser.parse_args()
+
+    thresholds = json.loads(THRESHOLDS_PATH.read_text(encoding="utf-8"))
+    baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")) if BASELINE_PATH.exists() else {}
+    results: dict[str, float] = {}
+    regressions = []
+
+    for name, setup in BENCHMARKS.items():
+        if args.only not in name:
+            continue
+        elapsed = results[name] = measure(setup, args.repeat)
+        limit = thresholds.get(name)
+        over = limit is not None and elapsed > limit
+        if over:
+            regressions.append(name)
+        if not args.json:
+            status = "" if limit is None else ("  ❌ 超過門檻" if over else "  ✓")
+            limit_text = "-" if limit is None else f"{limit:.0f}"
+            base = baseline.get(name)
+            base_text = "-" if not base else f"{elapsed / base:.2f}x"
+            print(f"{name:<26} {elapsed:10.1f} ms   基準 {base_text:>6}   門檻 {limit_text:>7}{status}")
+
+    if args.save_baseline:
+        baseline.update({name: round(elapsed, 1) for name, elapsed in results.items()})
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressions}, ensure_ascii=False, indent=2))
+    if args.check and regressions:
+        print(f"效能退步：{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
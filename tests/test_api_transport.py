@@ -0,0 +1,196 @@
+"""測試 api_transport 模組（使用本機的假 Data API 伺服器）"""
+
+import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing.fake_api import FakeApiServer
+from yutu_cli.testing.fake_yutu import FakeChannel, FaultInjector
+from yutu_cli.utils.api_transport import (
+    ApiTransport,
+    TokenSource,
+    _parse_expiry,
+    format_api_error,
+    parse_command,
+)
+from yutu_cli.utils.retry import AUTH_ERROR, NOT_FOUND, classify_error
+from yutu_cli.utils.async_yutu import AsyncYutuCLI
+from yutu_cli.utils.yutu import YutuCLI
+
+
+@pytest.fixture
+def server():
+    with FakeApiServer(FakeChannel(items_per_playlist=120, videos=30)) as server:
+        yield server
+
+
+@pytest.fixture
+def env(server, tmp_path):
+    token_path, credential_path = server.write_credentials(tmp_path)
+    return {"YUTU_CACHE_TOKEN": str(token_path), "YUTU_CREDENTIAL": str(credential_path)}
+
+
+@pytest.fixture
+def transport(server):
+    transport = ApiTransport(base_url=server.url)
+    yield transport
+    transport.close()
+
+
+def _run(transport, env, *args):
+    output = transport.execute(["yutu", *args], env, 10)
+    assert output.returncode == 0, output.stderr
+    return json.loads(output.stdout) if output.stdout else None
+
+
+class TestHelpers:
+    """測試命令與錯誤格式的轉換"""
+
+    def test_parse_command(self):
+        assert parse_command(["yutu", "playlist", "list", "--mine", "true"]) == ("playlist", "list", {"mine": "true"})
+
+    def test_parse_go_expiry(self):
+        expiry = _parse_expiry("2026-10-16T08:30:00.123456789+08:00")
+        assert expiry == datetime(2026, 10, 16, 0, 30, 0, 123456, tzinfo=timezone.utc)
+        assert _parse_expiry("0001-01-01T00:00:00Z") is None
+
+    def test_error_format_is_classified(self):
+        body = json.dumps({"error": {"code": 404, "message": "Playlist not found.", "errors": [
+            {"reason": "playlistNotFound"}
+        ]}}).encode()
+        message = format_api_error(404, body)
+        assert message == "googleapi: Error 404: Playlist not found., playlistNotFound"
+        assert classify_error(message) == NOT_FOUND
+
+
+class TestApiTransport:
+    """測試 ApiTransport 類別"""
+
+    def test_pages_through_all_items(self, server, transport, env):
+        items = _run(transport, env, "playlistItem", "list", "--playlistId", "PL1", "--maxResults", "0")
+        assert len(items) == 120
+        assert [item["snippet"]["position"] for item in items[:3]] == [0, 1, 2]
+        # 每頁 50 筆：3 個請求
+        assert [call[2].get("maxResults") for call in server.calls] == ["50", "50", "50"]
+
+    def test_respects_max_results(self, server, transport, env):
+        items = _run(transport, env, "playlistItem", "list", "--playlistId", "PL1", "--maxResults", "60")
+        assert len(items) == 60
+        assert [call[2]["maxResults"] for call in server.calls] == ["50", "10"]
+
+    def test_keep_alive_and_gzip(self, server, transport, env):
+        for _ in range(5):
+            _run(transport, env, "channel", "list", "--mine", "true")
+        assert server.connections == 1
+        assert transport.pool.opened == 1
+        assert server.gzip_responses == 5
+
+    def test_concurrent_calls_share_pool(self, server, transport, env):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: _run(transport, env, "video", "getRating", "--ids", "v1"), range(20)))
+        assert all(r == [{"videoId": "v1", "rating": "none"}] for r in results)
+        assert transport.pool.opened <= 4
+
+    def test_write_request_bodies(self, transport, env):
+        created = _run(transport, env, "playlistItem", "insert", "--playlistId", "PL1", "--videoId", "v9")
+        assert created["snippet"]["resourceId"]["videoId"] == "v9"
+        assert _run(transport, env, "playlistItem", "delete", "--ids", "a,b") is None
+
+    def test_refreshes_expired_token(self, server, transport, tmp_path):
+        token_path, credential_path = server.write_credentials(tmp_path, expiry="2000-01-01T00:00:00Z")
+        env = {"YUTU_CACHE_TOKEN": str(token_path), "YUTU_CREDENTIAL": str(credential_path)}
+        _run(transport, env, "channel", "list", "--mine", "true")
+        _run(transport, env, "channel", "list", "--mine", "true")
+        assert server.refreshes == 1
+        saved = json.loads(token_path.read_text())
+        assert saved["access_token"] == server.access_token
+        assert saved["refresh_token"] == server.refresh_token
+
+    def test_refreshes_rejected_token(self, server, transport, env):
+        server.rotate_token()
+        assert _run(transport, env, "channel", "list", "--mine", "true")
+        assert server.refreshes == 1
+
+    def test_missing_token_is_auth_error(self, transport, tmp_path):
+        env = {"YUTU_CACHE_TOKEN": str(tmp_path / "none.json"), "YUTU_CREDENTIAL": str(tmp_path / "cs.json")}
+        output = transport.execute(["yutu", "channel", "list"], env, 10)
+        assert output.returncode == 1
+        assert classify_error(output.stderr) == AUTH_ERROR
+
+    def test_api_error(self, env):
+        faults = FaultInjector(error_rate=1, error_kind="notFound")
+        with FakeApiServer(faults=faults) as server:
+            transport = ApiTransport(base_url=server.url)
+            output = transport.execute(["yutu", "playlist", "delete", "--id", "PL1"], env, 10)
+            transport.close()
+        assert output.returncode == 1
+        assert classify_error(output.stderr) == NOT_FOUND
+
+    def test_unsupported_command_falls_back(self, transport, env):
+        with pytest.raises(FileNotFoundError):
+            transport.execute(["/nonexistent/yutu", "video", "insert", "--file", "a.mp4"], env, 10)
+        assert transport.fallback_calls == 1
+
+    def test_timeout(self, env):
+        with FakeApiServer(faults=FaultInjector(latency_ms=500)) as server:
+            transport = ApiTransport(base_url=server.url)
+            with pytest.raises(subprocess.TimeoutExpired):
+                transport.execute(["yutu", "channel", "list"], env, 0.1)
+            transport.close()
+
+
+class TestTokenSource:
+    """測試 TokenSource 類別"""
+
+    def test_reloads_when_file_changes(self, server, tmp_path):
+        token_path, credential_path = server.write_credentials(tmp_path)
+        tokens = TokenSource(token_path, credential_path)
+        assert tokens.access_token() == "fake-access-0"
+        data = json.loads(token_path.read_text())
+        data["access_token"] = "from-yutu"
+        token_path.write_text(json.dumps(data))
+        assert tokens.access_token() == "from-yutu"
+
+
+@pytest.fixture
+def api_env(server, tmp_path, monkeypatch):
+    token_path, credential_path = server.write_credentials(tmp_path)
+    monkeypatch.setenv("YUTU_TRANSPORT", "api")
+    monkeypatch.setenv("YUTU_API_BASE_URL", server.url)
+    monkeypatch.setenv("YUTU_CACHE_TOKEN", str(token_path))
+    monkeypatch.setenv("YUTU_CREDENTIAL", str(credential_path))
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    reset_config()
+    yield
+    reset_config()
+
+
+class TestYutuCLIWithApi:
+    """測試 YutuCLI 以 api 傳輸層執行"""
+
+    def test_convenience_methods(self, server, api_env):
+        yutu = YutuCLI()
+        try:
+            assert yutu.transport.name == "api"
+            assert len(yutu.list_my_playlists().data) == 5
+            assert yutu.get_uploads_playlist_id() == FakeChannel.uploads_id
+            streamed = yutu.stream_playlist_items("PL1")
+            assert len(list(streamed.iter_items())) == 120
+            assert yutu.add_to_playlist("PL1", "v1").success
+        finally:
+            yutu.close()
+        assert server.connections == 1
+
+    def test_async_stream(self, api_env):
+        """AsyncYutuCLI 的 stream 同樣回傳結果而非協程"""
+        yutu = AsyncYutuCLI()
+        try:
+            streamed = yutu.stream_playlist_items("PL1")
+            assert len(list(streamed.iter_items())) == 120
+        finally:
+            yutu.close()
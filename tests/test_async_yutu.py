@@ -0,0 +1,115 @@
+"""測試 async_yutu 模組"""
+
+import asyncio
+import os
+import stat
+import time
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.utils.async_yutu import AsyncYutuCLI, run_async
+
+FAKE_YUTU = """#!/bin/sh
+# 假 yutu：記錄 PID 後依 FAKE_SLEEP 延遲，輸出包含參數的 JSON
+echo $$ >> "$FAKE_PID_FILE"
+if [ -n "$FAKE_HANG" ]; then
+  exec sleep 30
+fi
+sleep "${FAKE_SLEEP:-0}"
+if [ "$2" = "fail" ]; then
+  echo "boom" >&2
+  exit 1
+fi
+printf '{"items": [{"id": "%s"}]}' "$8"
+"""
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    script = tmp_path / "yutu"
+    script.write_text(FAKE_YUTU)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("YUTU_CLI_PATH", str(script))
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("FAKE_PID_FILE", str(tmp_path / "pids"))
+    monkeypatch.setenv("YUTU_RETRY_BACKOFF", "0")
+    reset_config()
+    yield tmp_path
+    reset_config()
+
+
+def _pids(tmp_path) -> list[int]:
+    return [int(line) for line in (tmp_path / "pids").read_text().split()]
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestAsyncYutuCLI:
+    """測試 AsyncYutuCLI 類別"""
+
+    def test_convenience_method(self, fake_cli):
+        yutu = AsyncYutuCLI()
+        result = run_async(yutu.list_captions("vid1"))
+        assert result.success is True
+        assert result.data == {"items": [{"id": "vid1"}]}
+
+    def test_download_caption_is_indexed(self, fake_cli):
+        path = fake_cli / "cap.srt"
+        path.write_text("1\n00:00:01,000 --> 00:00:02,000\n量子電腦\n", encoding="utf-8")
+        yutu = AsyncYutuCLI()
+        result = run_async(yutu.download_caption("C1", str(path)))
+        assert result.success
+        assert [hit.kind for hit in yutu.get_mirror().search("量子")] == ["caption"]
+
+    def test_failure(self, fake_cli):
+        yutu = AsyncYutuCLI()
+        result = run_async(yutu.run("video", "fail"))
+        assert result.success is False
+        assert "boom" in result.error
+
+    def test_fan_out_runs_concurrently(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_SLEEP", "0.3")
+        yutu = AsyncYutuCLI(max_concurrency=8)
+        start = time.monotonic()
+        results = run_async(yutu.fetch_many(yutu.list_playlist_items, [f"PL{i}" for i in range(8)]))
+        elapsed = time.monotonic() - start
+        assert list(results) == [f"PL{i}" for i in range(8)]
+        assert all(r.success for r in results.values())
+        assert elapsed < 0.3 * 4
+
+    def test_semaphore_bounds_concurrency(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_SLEEP", "0.2")
+        yutu = AsyncYutuCLI(max_concurrency=1)
+        start = time.monotonic()
+        run_async(yutu.fetch_many(yutu.list_captions, ["a", "b", "c"]))
+        assert time.monotonic() - start >= 0.6
+
+    def test_timeout_kills_child(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_HANG", "1")
+        yutu = AsyncYutuCLI()
+        result = run_async(yutu.run("video", "list", timeout=0.2))
+        assert result.success is False
+        assert "超時" in result.error
+        assert not any(_alive(pid) for pid in _pids(fake_cli))
+
+    def test_cancellation_kills_child(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_HANG", "1")
+        yutu = AsyncYutuCLI()
+
+        async def scenario():
+            task = asyncio.create_task(yutu.list_captions("x"))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        run_async(scenario())
+        assert not any(_alive(pid) for pid in _pids(fake_cli))
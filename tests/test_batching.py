@@ -0,0 +1,99 @@
+"""測試 batching 模組"""
+
+import threading
+
+import pytest
+
+from yutu_cli.utils.batching import (
+    MAX_IDS_PER_REQUEST,
+    chunked,
+    dedupe,
+    fetch_in_batches,
+    split_ids,
+)
+from yutu_cli.utils.yutu import YutuResult
+
+
+def _fake_fetch(deleted=(), failing=()):
+    """回傳假的批次查詢函式，略過 deleted 中的 ID，含 failing ID 的批次失敗"""
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(ids):
+        with lock:
+            calls.append(list(ids))
+        if any(i in failing for i in ids):
+            return YutuResult(success=False, error="backendError")
+        return YutuResult(
+            success=True,
+            data={"items": [{"id": i} for i in reversed(ids) if i not in deleted]},
+        )
+
+    fetch.calls = calls
+    return fetch
+
+
+class TestHelpers:
+    """測試輔助函式"""
+
+    def test_dedupe_preserves_order(self):
+        assert dedupe(["b", "a", "b", " ", "c", "a"]) == ["b", "a", "c"]
+
+    def test_chunked(self):
+        assert chunked(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+        assert chunked([], 2) == []
+
+    def test_chunked_invalid_size(self):
+        with pytest.raises(ValueError):
+            chunked([1], 0)
+
+    def test_split_ids_string(self):
+        assert split_ids("a,b, a") == ["a", "b"]
+
+
+class TestFetchInBatches:
+    """測試 fetch_in_batches 函式"""
+
+    def test_respects_api_limit(self):
+        ids = [f"v{i}" for i in range(120)]
+        fetch = _fake_fetch()
+        batch = fetch_in_batches(fetch, ids, key=lambda item: item["id"])
+        assert batch.calls == 3
+        assert all(len(c) <= MAX_IDS_PER_REQUEST for c in fetch.calls)
+        assert [item["id"] for item in batch.items] == ids
+
+    def test_dedupes_before_fetching(self):
+        fetch = _fake_fetch()
+        batch = fetch_in_batches(fetch, ["a", "b", "a"], key=lambda item: item["id"])
+        assert fetch.calls == [["a", "b"]]
+        assert [item["id"] for item in batch.items] == ["a", "b"]
+
+    def test_reports_missing(self):
+        fetch = _fake_fetch(deleted={"v3", "v70"})
+        ids = [f"v{i}" for i in range(100)]
+        batch = fetch_in_batches(fetch, ids, key=lambda item: item["id"])
+        assert batch.success is True
+        assert batch.missing == ["v3", "v70"]
+        assert len(batch.items) == 98
+
+    def test_failed_chunk(self):
+        fetch = _fake_fetch(failing={"v60"})
+        ids = [f"v{i}" for i in range(100)]
+        batch = fetch_in_batches(fetch, ids, key=lambda item: item["id"])
+        assert batch.success is False
+        assert batch.errors == ["backendError"]
+        assert batch.failed == ids[50:]
+        assert len(batch.items) == 50
+        assert batch.missing == []
+
+
+class TestYutuResultFromBatch:
+    """測試 YutuResult.from_batch"""
+
+    def test_missing_ids(self):
+        fetch = _fake_fetch(deleted={"b"})
+        batch = fetch_in_batches(fetch, ["a", "b"], key=lambda item: item["id"])
+        result = YutuResult.from_batch(batch)
+        assert result.success is True
+        assert result.data == {"items": [{"id": "a"}]}
+        assert result.missing_ids == ["b"]
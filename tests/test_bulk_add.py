@@ -0,0 +1,91 @@
+"""測試 bulk_add 模組"""
+
+import pytest
+
+from yutu_cli.utils.bulk_add import BulkAdder, ImportManifest, parse_video_refs
+from yutu_cli.utils.yutu import YutuResult
+
+
+def _vid(n: int) -> str:
+    return f"v{n:010d}"
+
+
+class FakeYutu:
+    """記錄新增呼叫的假 YutuCLI"""
+
+    def __init__(self, existing=(), fail=None):
+        self.existing = list(existing)
+        self.fail = dict(fail or {})
+        self.added: list[str] = []
+
+    def run(self, resource, action, **kwargs):
+        items = [{"contentDetails": {"videoId": v}} for v in self.existing]
+        return YutuResult(success=True, data=items)
+
+    def add_to_playlist(self, playlist_id, video_id):
+        error = self.fail.get(video_id)
+        if error:
+            if error != "quotaExceeded":
+                self.fail[video_id] = None  # 只失敗一次
+            return YutuResult(success=False, error=error)
+        self.added.append(video_id)
+        return YutuResult(success=True, data={})
+
+
+class TestParseVideoRefs:
+    """測試 parse_video_refs 函式"""
+
+    def test_urls_ids_and_dedupe(self):
+        text = (
+            "# 註解\n"
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ\n"
+            "https://youtu.be/aaaaaaaaaaa, bbbbbbbbbbb dQw4w9WgXcQ\n"
+            "oops\n"
+        )
+        ids, invalid = parse_video_refs(text)
+        assert ids == ["dQw4w9WgXcQ", "aaaaaaaaaaa", "bbbbbbbbbbb"]
+        assert invalid == ["oops"]
+
+
+class TestBulkAdder:
+    """測試 BulkAdder 類別"""
+
+    def test_skips_existing(self, tmp_path):
+        ids = [_vid(n) for n in range(5)]
+        yutu = FakeYutu(existing=[_vid(1), _vid(3)])
+        manifest = ImportManifest.for_import(tmp_path, "PL1", ids)
+        report = BulkAdder(yutu, "PL1", manifest, max_workers=1).run()
+        assert report.success
+        assert yutu.added == [_vid(0), _vid(2), _vid(4)]
+        assert report.already_present == 2
+        assert not manifest.path.exists()
+
+    def test_failure_is_not_retried_again(self, tmp_path):
+        """暫時性錯誤已由 YutuCLI.run 重試過，失敗的影片留在進度檔中"""
+        ids = [_vid(n) for n in range(20)]
+        yutu = FakeYutu(fail={_vid(7): "backendError"})
+        manifest = ImportManifest.for_import(tmp_path, "PL1", ids)
+        report = BulkAdder(yutu, "PL1", manifest, max_workers=4).run()
+        assert list(report.failed) == [_vid(7)]
+        assert sorted(yutu.added) == [v for v in ids if v != _vid(7)]
+        assert report.calls == 1 + 20
+        assert manifest.path.exists()
+
+    def test_resume_after_quota_exhausted(self, tmp_path):
+        ids = [_vid(n) for n in range(6)]
+        yutu = FakeYutu(fail={_vid(3): "quotaExceeded"})
+        manifest = ImportManifest.for_import(tmp_path, "PL1", ids)
+        report = BulkAdder(yutu, "PL1", manifest, max_workers=1).run()
+        assert report.aborted
+        assert yutu.added == ids[:3]
+        assert manifest.path.exists()
+
+        # 重新執行時只處理尚未完成的影片
+        resumed = ImportManifest.for_import(tmp_path, "PL1", ids)
+        assert resumed.resumed
+        assert resumed.pending == ids[3:]
+        yutu.fail.clear()
+        report = BulkAdder(yutu, "PL1", resumed, max_workers=1).run()
+        assert report.success
+        assert report.resumed == 3
+        assert yutu.added == ids
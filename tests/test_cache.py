@@ -0,0 +1,140 @@
+"""測試 cache 模組"""
+
+import subprocess
+import time
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.utils.cache import ResponseCache, make_cache_key
+from yutu_cli.utils.yutu import YutuCLI
+
+
+class TestMakeCacheKey:
+    """測試 make_cache_key 函式"""
+
+    def test_flag_order_ignored(self):
+        a = ["yutu", "playlist", "list", "--output", "json", "--mine", "true"]
+        b = ["yutu", "playlist", "list", "--mine", "true", "--output", "json"]
+        assert make_cache_key(a) == make_cache_key(b)
+
+    def test_binary_path_ignored(self):
+        a = ["/usr/local/bin/yutu", "video", "list", "--ids", "x"]
+        b = ["/opt/yutu", "video", "list", "--ids", "x"]
+        assert make_cache_key(a) == make_cache_key(b)
+
+    def test_identity_separates_accounts(self):
+        cmd = ["yutu", "playlist", "list", "--mine", "true"]
+        assert make_cache_key(cmd, "a") != make_cache_key(cmd, "b")
+
+    def test_different_values(self):
+        a = ["yutu", "video", "list", "--ids", "x"]
+        b = ["yutu", "video", "list", "--ids", "y"]
+        assert make_cache_key(a) != make_cache_key(b)
+
+
+class TestResponseCache:
+    """測試 ResponseCache 類別"""
+
+    def test_miss_then_hit(self):
+        cache = ResponseCache(":memory:")
+        assert cache.get("k") is None
+        cache.put("k", "playlist", "list", '{"items": []}')
+        assert cache.get("k") == '{"items": []}'
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_expired_entry(self):
+        cache = ResponseCache(":memory:", ttls={"playlist": 1})
+        cache.put("k", "playlist", "list", "{}")
+        cache._conn.execute("UPDATE responses SET expires_at = ?", (time.time() - 1,))
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_zero_ttl_not_stored(self):
+        cache = ResponseCache(":memory:", ttls={"search": 0})
+        cache.put("k", "search", "list", "{}")
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_count(self):
+        cache = ResponseCache(":memory:", max_entries=2)
+        cache.put("a", "video", "list", "1")
+        cache.put("b", "video", "list", "2")
+        cache.get("a")  # a 成為最近使用
+        cache.put("c", "video", "list", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.stats.evictions == 1
+
+    def test_eviction_by_size(self):
+        cache = ResponseCache(":memory:", max_bytes=10)
+        cache.put("a", "video", "list", "x" * 6)
+        cache.put("b", "video", "list", "y" * 6)
+        assert len(cache) == 1
+        assert cache.get("b") == "y" * 6
+
+    def test_invalidate_related(self):
+        cache = ResponseCache(":memory:")
+        cache.put("p", "playlist", "list", "{}")
+        cache.put("i", "playlistItem", "list", "{}")
+        cache.put("c", "channel", "list", "{}")
+        cache.invalidate("playlistItem")
+        assert cache.get("p") is None
+        assert cache.get("i") is None
+        assert cache.get("c") == "{}"
+
+
+class TestYutuCLICache:
+    """測試 YutuCLI.run 的快取整合"""
+
+    @pytest.fixture
+    def yutu(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+        reset_config()
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout='{"items": [1]}', stderr="")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        cli = YutuCLI()
+        cli.calls = calls
+        yield cli
+        reset_config()
+
+    def test_second_list_is_cached(self, yutu):
+        first = yutu.list_my_playlists()
+        second = yutu.list_my_playlists()
+        assert len(yutu.calls) == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.data == {"items": [1]}
+
+    def test_write_invalidates(self, yutu):
+        yutu.list_my_playlists()
+        yutu.create_playlist("新清單")
+        yutu.list_my_playlists()
+        assert len(yutu.calls) == 3
+
+    def test_write_in_new_process_invalidates(self, yutu):
+        """程序的第一個呼叫是寫入時，也要讓磁碟上的快取失效"""
+        yutu.list_my_playlists()
+        writer = YutuCLI()
+        writer.create_playlist("新清單")
+        reader = YutuCLI()
+        assert reader.list_my_playlists().cached is False
+
+    def test_refresh_bypasses_read(self, yutu):
+        yutu.list_my_playlists()
+        yutu.config.cache_refresh = True
+        yutu.list_my_playlists()
+        assert len(yutu.calls) == 2
+
+    def test_disabled(self, yutu):
+        yutu.config.cache_enabled = False
+        yutu.list_my_playlists()
+        yutu.list_my_playlists()
+        assert len(yutu.calls) == 2
+        assert yutu.cache_stats is None
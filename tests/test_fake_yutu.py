@@ -0,0 +1,95 @@
+"""測試假 yutu 執行檔"""
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing import fake_yutu
+from yutu_cli.testing.fake_yutu import FakeChannel, FaultInjector, format_api_error
+from yutu_cli.utils.yutu import YutuCLI
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    """以假 yutu 建立的 YutuCLI（停用快取）"""
+    monkeypatch.setenv("YUTU_CLI_PATH", fake_yutu.__file__)
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("YUTU_RETRY_BACKOFF", "0")
+    reset_config()
+    yutu = YutuCLI()
+    yield yutu
+    yutu.close()
+    reset_config()
+
+
+class TestFakeChannel:
+    """測試 FakeChannel 類別"""
+
+    def test_playlist_items_size(self):
+        channel = FakeChannel(items_per_playlist=50_000, videos=1000)
+        items = channel.handle("playlistItem", "list", {"playlistId": "PLx"})
+        assert len(items) == 50_000
+        assert items[-1]["snippet"]["position"] == 49_999
+
+    def test_uploads_newest_first(self):
+        channel = FakeChannel(videos=3)
+        items = channel.handle("playlistItem", "list", {"playlistId": channel.uploads_id})
+        assert [i["contentDetails"]["videoId"] for i in items] == [
+            channel.video_id(2), channel.video_id(1), channel.video_id(0)
+        ]
+
+    def test_max_results(self):
+        channel = FakeChannel(comments_per_video=100)
+        threads = channel.handle("commentThread", "list", {"videoId": "v1", "maxResults": "5"})
+        assert len(threads) == 5
+
+    def test_deleted_videos_omitted(self):
+        channel = FakeChannel(videos=10)
+        ids = f"{channel.video_id(1)},{channel.video_id(99)}"
+        videos = channel.handle("video", "list", {"ids": ids})
+        assert [v["id"] for v in videos] == [channel.video_id(1)]
+
+
+class TestFaultInjector:
+    """測試 FaultInjector 類別"""
+
+    def test_error_rate(self):
+        faults = FaultInjector(error_rate=1, error_kind="rateLimitExceeded")
+        assert faults.check("video", "list") == format_api_error("rateLimitExceeded")
+        assert "Error 403" in faults.check("video", "list")
+
+    def test_quota_limit(self):
+        faults = FaultInjector(quota_limit=150)
+        assert faults.check("search", "list") is None  # 100
+        assert faults.check("playlist", "insert") is None  # 50
+        assert "quotaExceeded" in faults.check("playlist", "list")
+
+    def test_quota_file_shared(self, tmp_path):
+        path = str(tmp_path / "quota")
+        assert FaultInjector(quota_limit=100, quota_file=path).check("search", "list") is None
+        assert "quotaExceeded" in FaultInjector(quota_limit=100, quota_file=path).check("video", "list")
+
+
+class TestFakeYutuBinary:
+    """透過 YutuCLI 執行假 yutu"""
+
+    def test_list_playlist_items(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_YUTU_ITEMS", "120")
+        result = fake_cli.list_playlist_items("PL1")
+        assert result.success
+        assert len(result.data) == 120
+
+    def test_injected_error(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_YUTU_ERROR_RATE", "1")
+        monkeypatch.setenv("FAKE_YUTU_ERROR_KIND", "backendError")
+        result = fake_cli.list_my_playlists()
+        assert result.success is False
+        assert "googleapi: Error 503" in result.error
+
+    def test_quota_exhausted(self, fake_cli, monkeypatch, tmp_path):
+        monkeypatch.setenv("FAKE_YUTU_QUOTA_LIMIT", "1")
+        monkeypatch.setenv("FAKE_YUTU_QUOTA_FILE", str(tmp_path / "quota"))
+        assert fake_cli.list_my_playlists().success
+        result = fake_cli.list_my_playlists()
+        assert result.success is False
+        assert "quotaExceeded" in result.error
@@ -0,0 +1,155 @@
+"""測試 fields 模組與 YutuCLI 的欄位投影"""
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing.fake_api import FakeApiServer
+from yutu_cli.testing.fake_yutu import FakeChannel
+from yutu_cli.utils.fields import (
+    FieldPlanner,
+    covers,
+    fields_mask,
+    normalize,
+    parse_mask,
+    parts_for,
+    project,
+)
+from yutu_cli.utils.transport import CommandOutput
+from yutu_cli.utils.yutu import YutuCLI
+
+
+class TestFieldHelpers:
+    """測試欄位路徑的換算"""
+
+    def test_normalize_drops_covered_paths(self):
+        assert normalize(["snippet", "snippet.title", "id", ""]) == {"snippet", "id"}
+
+    def test_covers(self):
+        assert covers(["id", "snippet"], ["snippet.title", "id"])
+        assert not covers(["id", "snippet.title"], ["snippet.description"])
+
+    def test_parts_for(self):
+        assert parts_for(["id", "snippet.title", "status.privacyStatus"]) == "snippet,status"
+        assert parts_for(["id"]) == "id"
+
+    def test_mask_round_trip(self):
+        fields = ["id", "snippet.title", "snippet.resourceId.videoId", "contentDetails"]
+        mask = fields_mask(fields)
+        assert mask == "items(contentDetails,id,snippet(resourceId(videoId),title)),nextPageToken"
+        assert parse_mask(mask) == {f"items.{path}" for path in fields} | {"nextPageToken"}
+
+    def test_project(self):
+        page = {
+            "items": [{"id": "v1", "snippet": {"title": "A", "tags": ["x"]}, "status": {}}],
+            "nextPageToken": "5",
+            "pageInfo": {},
+        }
+        assert project(page, ["items.id", "items.snippet.title", "nextPageToken"]) == {
+            "items": [{"id": "v1", "snippet": {"title": "A"}}],
+            "nextPageToken": "5",
+        }
+
+
+class TestFieldPlanner:
+    """測試 FieldPlanner 類別"""
+
+    def test_covered_need_reuses_plan(self):
+        planner = FieldPlanner()
+        full = planner.plan("video", "list", ["id", "snippet", "statistics"])
+        assert planner.plan("video", "list", ["id", "snippet.title"]) == full
+
+    def test_overlapping_needs_merge(self):
+        planner = FieldPlanner()
+        planner.plan("video", "list", ["id", "snippet.title"])
+        merged = planner.plan("video", "list", ["snippet.tags", "status.privacyStatus"])
+        assert merged == {"id", "snippet.title", "snippet.tags", "status.privacyStatus"}
+        assert planner.plan("video", "list", ["id", "snippet.title"]) == merged
+
+    def test_disjoint_needs_stay_separate(self):
+        planner = FieldPlanner()
+        planner.plan("video", "list", ["id", "snippet.title"])
+        assert planner.plan("video", "list", ["id", "statistics.viewCount"]) == {"id", "statistics.viewCount"}
+        assert planner.plan("playlist", "list", ["id"]) == {"id"}
+
+
+class RecordingTransport:
+    """記錄命令並回傳空列表的傳輸層"""
+
+    name = "subprocess"
+
+    def __init__(self):
+        self.commands: list[list[str]] = []
+
+    def execute(self, cmd, env, timeout):
+        self.commands.append(cmd)
+        return CommandOutput(0, "[]", "")
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def yutu(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_MIRROR_ENABLED", "false")
+    reset_config()
+    yutu = YutuCLI()
+    yutu._transport = RecordingTransport()
+    yield yutu
+    yutu.close()
+    reset_config()
+
+
+def _flag(cmd: list[str], name: str):
+    return cmd[cmd.index(name) + 1] if name in cmd else None
+
+
+class TestYutuCLIProjection:
+    """測試便捷方法依欄位需求決定 parts"""
+
+    def test_default_parts(self, yutu):
+        yutu.get_video_details("v1")
+        yutu.list_my_playlists()
+        video, playlist = yutu.transport.commands
+        assert _flag(video, "--parts") == "contentDetails,snippet,statistics,status"
+        assert _flag(playlist, "--parts") == "contentDetails,snippet,status"
+        # yutu 沒有 fields 旗標
+        assert "--fields" not in video
+
+    def test_minimal_parts(self, yutu):
+        yutu.list_my_playlists(fields=["id", "snippet.title"])
+        yutu.get_video_details(["v1"], fields=["id", "statistics.viewCount"])
+        assert [_flag(cmd, "--parts") for cmd in yutu.transport.commands] == ["snippet", "statistics"]
+
+    def test_merged_needs_share_cache(self, yutu):
+        yutu.get_video_details("v1", fields=["id", "snippet.title"])
+        yutu.get_video_details("v1", fields=["id", "snippet.tags", "status.privacyStatus"])
+        # 合併後的命令已快取，原本的需求直接命中
+        assert yutu.get_video_details("v1", fields=["id", "snippet.title"]).success
+        assert [_flag(cmd, "--parts") for cmd in yutu.transport.commands] == ["snippet", "snippet,status"]
+
+
+class TestApiFieldsMask:
+    """測試 api 傳輸層送出 fields 遮罩"""
+
+    def test_mask_trims_response(self, tmp_path, monkeypatch):
+        with FakeApiServer(FakeChannel(videos=10)) as server:
+            token_path, credential_path = server.write_credentials(tmp_path)
+            monkeypatch.setenv("YUTU_TRANSPORT", "api")
+            monkeypatch.setenv("YUTU_API_BASE_URL", server.url)
+            monkeypatch.setenv("YUTU_CACHE_TOKEN", str(token_path))
+            monkeypatch.setenv("YUTU_CREDENTIAL", str(credential_path))
+            monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+            monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+            reset_config()
+            yutu = YutuCLI()
+            try:
+                result = yutu.list_my_playlists(fields=["id", "snippet.title"])
+            finally:
+                yutu.close()
+                reset_config()
+        assert result.success
+        assert all(set(item) == {"id", "snippet"} and list(item["snippet"]) == ["title"] for item in result.data)
+        query = server.calls[0][2]
+        assert query["part"] == "snippet"
+        assert query["fields"] == "items(id,snippet(title)),nextPageToken"
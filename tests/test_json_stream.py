@@ -0,0 +1,143 @@
+"""測試 json_stream 模組"""
+
+import json
+import stat
+import time
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.utils.json_stream import JsonItemStream, iter_json_items
+from yutu_cli.utils.retry import TIMEOUT
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
+
+PAYLOAD = {
+    "kind": "youtube#playlistItemListResponse",
+    "items": [
+        {"id": "a", "snippet": {"title": "中文標題 \"引號\" ]}"}, "position": 0},
+        {"id": "b", "snippet": {"title": "b"}, "position": 12345},
+        {"id": "c", "tags": [1, 2, [3]], "position": 2},
+    ],
+    "pageInfo": {"totalResults": 3, "resultsPerPage": 50},
+    "count": 3,
+}
+
+
+def _split(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestJsonItemStream:
+    """測試 JsonItemStream 類別"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+    def test_object_any_chunking(self, size):
+        text = json.dumps(PAYLOAD, ensure_ascii=False, indent=2)
+        stream = JsonItemStream(_split(text, size))
+        assert list(stream) == PAYLOAD["items"]
+        assert stream.metadata["pageInfo"] == PAYLOAD["pageInfo"]
+        assert stream.metadata["count"] == 3
+
+    @pytest.mark.parametrize("size", [1, 5, 10_000])
+    def test_top_level_array(self, size):
+        text = json.dumps(PAYLOAD["items"])
+        assert list(iter_json_items(_split(text, size))) == PAYLOAD["items"]
+
+    def test_empty_inputs(self):
+        assert list(iter_json_items([])) == []
+        assert list(iter_json_items(["[]"])) == []
+        assert list(iter_json_items(['{"items": []}'])) == []
+        assert list(iter_json_items(["{}"])) == []
+
+    def test_number_at_chunk_boundary(self):
+        assert list(iter_json_items(["[1", "23, 4", "5]"])) == [123, 45]
+
+    def test_lazy(self):
+        """第一筆項目完整後即可取得，不需等待後續輸入"""
+
+        def chunks():
+            yield '{"items": [{"id": 1}, '
+            raise AssertionError("不應該讀取更多資料")
+
+        assert next(iter_json_items(chunks())) == {"id": 1}
+
+    def test_truncated(self):
+        with pytest.raises(ValueError):
+            list(iter_json_items(['{"items": [{"id": 1}, {"id"']))
+
+    def test_invalid_start(self):
+        with pytest.raises(ValueError):
+            list(iter_json_items(["oops"]))
+
+
+FAKE_YUTU = """#!/bin/sh
+if [ "$2" = "hang" ]; then
+  printf '{"items": [{"id": 1}, '
+  exec sleep 30
+fi
+if [ "$2" = "garbage" ]; then
+  printf 'oops'
+  exec yes x
+fi
+if [ "$2" = "fail" ]; then
+  printf '{"items": [{"id": 1}'
+  echo "quotaExceeded" >&2
+  exit 1
+fi
+printf '{"items": [{"id": 1}, {"id": 2}], "pageInfo": {"totalResults": 2}}'
+"""
+
+
+class TestYutuCLIStream:
+    """測試 YutuCLI.stream"""
+
+    @pytest.fixture
+    def yutu(self, tmp_path, monkeypatch):
+        script = tmp_path / "yutu"
+        script.write_text(FAKE_YUTU)
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setenv("YUTU_CLI_PATH", str(script))
+        monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+        reset_config()
+        yield YutuCLI()
+        reset_config()
+
+    def test_stream_items(self, yutu):
+        result = yutu.stream_playlist_items("PL1")
+        assert result.streaming is True
+        assert list(result.iter_items()) == [{"id": 1}, {"id": 2}]
+        assert result.success is True
+        assert result.data == {"pageInfo": {"totalResults": 2}}
+        assert result.raw_output == ""
+
+    def test_stream_failure(self, yutu):
+        result = yutu.stream("playlistItem", "fail")
+        list(result.iter_items())
+        assert result.success is False
+        assert "quotaExceeded" in result.error
+
+    def test_stream_timeout(self, yutu):
+        """yutu 沒有輸出超過 command_timeout 秒時終止子程序"""
+        yutu.config.command_timeout = 1
+        start = time.perf_counter()
+        result = yutu.stream("playlistItem", "hang")
+        assert list(result.iter_items()) == [{"id": 1}]
+        assert time.perf_counter() - start < 10
+        assert result.success is False and result.error_kind == TIMEOUT
+
+    def test_parse_error_kills_child(self, yutu):
+        """解析失敗後不再讀取輸出，子程序不會因管線寫滿而卡住"""
+        result = yutu.stream("playlistItem", "garbage")
+        assert list(result.iter_items()) == []
+        assert result.success is False and "JSON 解析錯誤" in result.error
+
+    def test_missing_binary(self, yutu):
+        yutu.config.cli_path = yutu.config.cli_path.parent / "missing"
+        result = yutu.stream("playlistItem", "list")
+        assert result.success is False
+        assert "找不到 yutu CLI" in result.error
+
+    def test_iter_items_buffered(self):
+        assert list(YutuResult(success=True, data={"items": [1, 2]}).iter_items()) == [1, 2]
+        assert list(YutuResult(success=True, data=[3]).iter_items()) == [3]
+        assert list(YutuResult(success=True).iter_items()) == []
@@ -0,0 +1,126 @@
+"""測試 metrics 模組與 YutuCLI 的指標"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing.fake_yutu import format_api_error
+from yutu_cli.utils.metrics import Counter, Histogram, MetricsRegistry, MetricsServer, YutuMetrics
+from yutu_cli.utils.retry import NOT_FOUND
+from yutu_cli.utils.transport import CommandOutput
+from yutu_cli.utils.yutu import YutuCLI
+
+
+class TestExposition:
+    """測試 Prometheus 文字格式"""
+
+    def test_counter(self):
+        counter = Counter("calls_total", "calls", ("resource",))
+        counter.inc("video")
+        counter.inc("video", amount=2)
+        counter.inc('a"b')
+        assert counter.render().splitlines() == [
+            "# HELP calls_total calls",
+            "# TYPE calls_total counter",
+            'calls_total{resource="a\\"b"} 1',
+            'calls_total{resource="video"} 3',
+        ]
+
+    def test_histogram_is_cumulative(self):
+        histogram = Histogram("latency_seconds", "latency", ("action",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe("list", value=value)
+        lines = histogram.render().splitlines()[2:]
+        assert lines == [
+            'latency_seconds_bucket{action="list",le="0.1"} 1',
+            'latency_seconds_bucket{action="list",le="1"} 2',
+            'latency_seconds_bucket{action="list",le="+Inf"} 3',
+            'latency_seconds_sum{action="list"} 5.55',
+            'latency_seconds_count{action="list"} 3',
+        ]
+
+    def test_label_count_is_checked(self):
+        with pytest.raises(ValueError):
+            Counter("x_total", "x", ("a", "b")).inc("only-one")
+
+    def test_write_textfile(self, tmp_path):
+        registry = YutuMetrics()
+        registry.calls.inc("video", "list", "api")
+        path = registry.write_textfile(tmp_path / "textfile" / "yutu.prom")
+        text = path.read_text()
+        assert 'yutu_calls_total{resource="video",action="list",source="api"} 1' in text
+        assert "yutu_metrics_flush_timestamp_seconds " in text
+        assert [p.name for p in path.parent.iterdir()] == ["yutu.prom"]
+
+
+class TestMetricsServer:
+    """測試 /metrics 端點"""
+
+    def test_serves_metrics(self):
+        registry = MetricsRegistry()
+        registry.register(Counter("up_total", "up")).inc()
+        server = MetricsServer(registry, 0)
+        try:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert "up_total 1" in response.read().decode()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"), timeout=5)
+        finally:
+            server.close()
+
+
+class ScriptedTransport:
+    """依序回傳預先定義輸出的傳輸層"""
+
+    name = "subprocess"
+
+    def __init__(self, *outputs):
+        self.outputs = list(outputs)
+
+    def execute(self, cmd, env, timeout):
+        return self.outputs.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def yutu(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_METRICS_TEXTFILE", str(tmp_path / "yutu.prom"))
+    monkeypatch.setenv("YUTU_RETRY_ATTEMPTS", "0")
+    reset_config()
+    yield YutuCLI()
+    reset_config()
+
+
+class TestYutuCLIMetrics:
+    """測試 YutuCLI.run 更新的指標"""
+
+    def test_calls_cache_hits_bytes_and_quota(self, yutu):
+        stdout = '[{"id": "PL1"}]'
+        yutu._transport = ScriptedTransport(CommandOutput(0, stdout))
+        yutu.list_my_playlists()
+        yutu.list_my_playlists()
+        metrics = yutu.metrics
+        assert metrics.calls.value("playlist", "list", "subprocess") == 1
+        assert metrics.calls.value("playlist", "list", "local") == 1
+        assert metrics.cache_hits.value("playlist", "list", "cache") == 1
+        assert metrics.output_bytes.value("playlist", "list") == len(stdout)
+        assert metrics.quota_units.value("playlist", "list") == 1
+        assert metrics.duration.count("playlist", "list") == 2
+
+    def test_failures_by_error_class(self, yutu):
+        yutu._transport = ScriptedTransport(CommandOutput(1, "", format_api_error("notFound")))
+        assert not yutu.delete_playlist("PL1").success
+        assert yutu.metrics.failures.value("playlist", "delete", NOT_FOUND) == 1
+
+    def test_close_writes_textfile(self, yutu, tmp_path):
+        yutu._transport = ScriptedTransport(CommandOutput(0, "[]"))
+        yutu.list_my_playlists()
+        yutu.close()
+        text = (tmp_path / "yutu.prom").read_text()
+        assert 'yutu_calls_total{resource="playlist",action="list",source="subprocess"} 1' in text
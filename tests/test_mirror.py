@@ -0,0 +1,103 @@
+"""測試 mirror 模組"""
+
+import time
+
+import pytest
+
+from yutu_cli.utils.mirror import ChannelMirror
+
+
+def _item(playlist_id: str, item_id: str, video_id: str) -> dict:
+    return {"id": item_id, "snippet": {"playlistId": playlist_id}, "contentDetails": {"videoId": video_id}}
+
+
+@pytest.fixture
+def mirror():
+    m = ChannelMirror(":memory:")
+    yield m
+    m.close()
+
+
+class TestLookup:
+    """測試 ChannelMirror.lookup"""
+
+    def test_unsynced_returns_none(self, mirror):
+        assert mirror.lookup("playlist", "list", {"mine": True}) is None
+        assert mirror.lookup("playlistItem", "list", {"playlistId": "PL1"}) is None
+
+    def test_playlists_in_order(self, mirror):
+        mirror.replace_playlists([{"id": "PL2"}, {"id": "PL1"}])
+        mirror.set_state("playlists")
+        assert [p["id"] for p in mirror.lookup("playlist", "list", {"mine": True})] == ["PL2", "PL1"]
+
+    def test_playlist_items(self, mirror):
+        mirror.replace_playlist_items("PL1", [_item("PL1", "i2", "b"), _item("PL1", "i1", "a")])
+        mirror.set_state("playlist:PL1", item_count=2)
+        assert [i["id"] for i in mirror.lookup("playlistItem", "list", {"playlistId": "PL1"})] == ["i2", "i1"]
+
+    def test_videos_require_all_ids(self, mirror):
+        mirror.upsert_videos([{"id": "a"}, {"id": "b"}])
+        mirror.set_state("videos")
+        assert [v["id"] for v in mirror.lookup("video", "list", {"ids": "b,a"})] == ["b", "a"]
+        assert mirror.lookup("video", "list", {"ids": "a,c"}) is None
+
+    def test_videos_require_synced_scope(self, mirror):
+        mirror.upsert_videos([{"id": "a"}])
+        assert mirror.lookup("video", "list", {"ids": "a"}) is None
+
+    def test_expired_scopes_not_served(self, monkeypatch):
+        mirror = ChannelMirror(":memory:", max_age=60)
+        mirror.replace_playlists([{"id": "PL1"}])
+        mirror.upsert_videos([{"id": "a"}])
+        mirror.set_state("playlists")
+        mirror.set_state("videos")
+        assert mirror.lookup("playlist", "list", {"mine": True})
+        assert mirror.lookup("video", "list", {"ids": "a"})
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+        assert mirror.lookup("playlist", "list", {"mine": True}) is None
+        assert mirror.lookup("video", "list", {"ids": "a"}) is None
+        mirror.close()
+
+    def test_write_actions_not_served(self, mirror):
+        mirror.set_state("playlists")
+        assert mirror.lookup("playlist", "insert", {"mine": True}) is None
+
+    def test_removed_playlist_dropped(self, mirror):
+        mirror.replace_playlists([{"id": "PL1"}])
+        mirror.replace_playlist_items("PL1", [_item("PL1", "i1", "a")])
+        mirror.set_state("playlist:PL1")
+        assert mirror.replace_playlists([]) == ["PL1"]
+        assert mirror.state("playlist:PL1") is None
+        assert mirror.get_playlist_items("PL1") == []
+
+
+class TestInvalidate:
+    """測試寫入動作後的失效處理"""
+
+    def test_insert_marks_playlist_stale(self, mirror):
+        mirror.set_state("playlist:PL1")
+        mirror.set_state("playlist:PL2")
+        mirror.invalidate("playlistItem", "insert", {"playlistId": "PL1", "videoId": "a"})
+        assert mirror.is_fresh("playlist:PL1") is False
+        assert mirror.is_fresh("playlist:PL2") is True
+
+    def test_delete_finds_playlist_by_item(self, mirror):
+        mirror.replace_playlist_items("PL2", [_item("PL2", "i9", "a")])
+        mirror.set_state("playlist:PL1")
+        mirror.set_state("playlist:PL2")
+        mirror.invalidate("playlistItem", "delete", {"ids": "i9"})
+        assert mirror.is_fresh("playlist:PL1") is True
+        assert mirror.is_fresh("playlist:PL2") is False
+
+    def test_video_update_drops_row(self, mirror):
+        mirror.upsert_videos([{"id": "a"}])
+        mirror.invalidate("video", "update", {"id": "a", "title": "新標題"})
+        assert mirror.lookup("video", "list", {"ids": "a"}) is None
+
+    def test_reply_marks_video_comments_stale(self, mirror):
+        mirror.replace_comment_threads("v1", [{"id": "T1"}])
+        mirror.set_state("comments:v1")
+        mirror.set_state("comments:v2")
+        mirror.invalidate("comment", "delete", {"ids": "T1.r1"})
+        assert mirror.stale_scopes("comments:") == ["comments:v1"]
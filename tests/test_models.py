@@ -0,0 +1,171 @@
+"""測試 models 模組"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from yutu_cli.utils import json_stream
+from yutu_cli.utils.display import console, display_captions, display_comment_detail
+from yutu_cli.utils.models import (
+    Caption,
+    Comment,
+    CommentThread,
+    Playlist,
+    PlaylistItem,
+    Video,
+    parse_models,
+)
+from yutu_cli.utils.yutu import YutuResult
+
+
+def _playlist_item(index: int) -> dict:
+    video_id = f"vid{index:08d}"
+    return {
+        "kind": "youtube#playlistItem",
+        "etag": f"etag-{index}",
+        "id": f"UEx{index:020d}",
+        "snippet": {
+            "publishedAt": "2024-01-01T00:00:00Z",
+            "channelId": "UC1234567890",
+            "title": f"影片 {index}",
+            "description": "說明文字 " * 10,
+            "thumbnails": {
+                size: {"url": f"https://i.ytimg.com/vi/{video_id}/{size}.jpg", "width": 120, "height": 90}
+                for size in ("default", "medium", "high")
+            },
+            "channelTitle": "我的頻道",
+            "playlistId": "PL1",
+            "position": index,
+            "resourceId": {"kind": "youtube#video", "videoId": video_id},
+            "videoOwnerChannelTitle": "我的頻道",
+            "videoOwnerChannelId": "UC1234567890",
+        },
+        "contentDetails": {"videoId": video_id, "videoPublishedAt": "2023-12-31T00:00:00Z"},
+    }
+
+
+class TestVideo:
+    """測試 Video 的 ID 結構正規化"""
+
+    def test_video_resource(self):
+        video = Video.from_api({
+            "id": "v1",
+            "snippet": {"title": "標題", "channelTitle": "頻道", "tags": ["a", "b"]},
+            "statistics": {"viewCount": "1500", "likeCount": "3"},
+            "contentDetails": {"duration": "PT1M"},
+            "status": {"privacyStatus": "public"},
+        })
+        assert video.id == "v1" and video.title == "標題"
+        assert video.view_count == 1500 and video.like_count == 3 and video.comment_count is None
+        assert video.tags == ("a", "b") and video.privacy_status == "public"
+
+    def test_search_result(self):
+        video = Video.from_api({"id": {"kind": "youtube#video", "videoId": "v2"}, "snippet": {"title": "x"}})
+        assert video.id == "v2"
+
+    def test_playlist_item(self):
+        video = Video.from_api(_playlist_item(7))
+        assert video.id == "vid00000007"
+        assert video.published_at == "2023-12-31T00:00:00Z"
+
+    def test_no_instance_dict(self):
+        assert not hasattr(Video(id="v1"), "__dict__")
+
+
+class TestOtherModels:
+    """測試播放清單、留言與字幕模型"""
+
+    def test_playlist(self):
+        playlist = Playlist.from_api({
+            "id": "PL1", "snippet": {"title": "清單"}, "contentDetails": {"itemCount": 3},
+        })
+        assert (playlist.id, playlist.title, playlist.item_count, playlist.privacy_status) == ("PL1", "清單", 3, "")
+
+    def test_playlist_item(self):
+        item = PlaylistItem.from_api(_playlist_item(3))
+        assert item.video_id == "vid00000003" and item.position == 3
+        assert item.channel_title == "我的頻道"
+
+    def test_playlist_item_without_content_details(self):
+        item = PlaylistItem.from_api({"id": "i1", "snippet": {"resourceId": {"videoId": "v9"}}})
+        assert item.video_id == "v9"
+
+    def test_comment_thread(self):
+        thread = CommentThread.from_api({
+            "id": "t1",
+            "snippet": {
+                "videoId": "v1",
+                "totalReplyCount": 1,
+                "topLevelComment": {"id": "c1", "snippet": {"authorDisplayName": "小明", "textDisplay": "讚"}},
+            },
+            "replies": {"comments": [{"id": "c2", "snippet": {"authorDisplayName": "我", "textDisplay": "謝謝"}}]},
+        })
+        assert thread.comment.id == "c1" and thread.comment.author == "小明"
+        assert thread.reply_count == 1 and [reply.text for reply in thread.replies] == ["謝謝"]
+
+    def test_caption(self):
+        caption = Caption.from_api({"id": "cap1", "snippet": {"language": "zh-TW", "isDraft": True}})
+        assert caption.language == "zh-TW" and caption.track_kind == "standard" and caption.is_draft
+
+
+class TestParseModels:
+    """測試 parse_models 與 YutuResult.models"""
+
+    def test_accepts_response_list_and_models(self):
+        playlist = Playlist(id="PL2")
+        assert [p.id for p in parse_models({"items": [{"id": "PL1"}]}, Playlist)] == ["PL1"]
+        assert parse_models([playlist], Playlist)[0] is playlist
+        assert parse_models(None, Playlist) == []
+
+    def test_result_models(self):
+        result = YutuResult(success=True, data=[_playlist_item(1), _playlist_item(2)])
+        assert [item.position for item in result.models(PlaylistItem)] == [1, 2]
+
+    def test_result_models_from_stream(self):
+        result = YutuResult(success=True, _stream=iter([_playlist_item(5)]))
+        assert result.models(PlaylistItem)[0].video_id == "vid00000005"
+        assert result.models(PlaylistItem) == []
+
+    def test_memory_for_large_playlist(self):
+        """20,000 項的播放清單解析為模型後，保留的記憶體遠小於原始字典"""
+        payload = json.dumps([_playlist_item(i) for i in range(20_000)])
+
+        tracemalloc.start()
+        try:
+            data = json.loads(payload)
+            dict_bytes = tracemalloc.get_traced_memory()[0]
+            items = parse_models(data, PlaylistItem)
+            del data
+            model_bytes = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert len(items) == 20_000
+        assert model_bytes * 4 < dict_bytes
+
+
+class TestFastDecoder:
+    """測試選用的 JSON 解析器"""
+
+    def test_loads_falls_back_to_json(self, monkeypatch):
+        monkeypatch.setattr(json_stream, "orjson", None)
+        assert json_stream.loads('{"items": [1]}') == {"items": [1]}
+
+    def test_decode_error_is_json_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_stream.loads("{")
+
+
+class TestDisplayModels:
+    """測試顯示函式接受模型"""
+
+    def test_comment_detail(self):
+        thread = CommentThread(id="t1", comment=Comment(id="c1", text="你好"), reply_count=0)
+        with console.capture() as captured:
+            display_comment_detail(thread)
+        assert "匿名" in captured.get() and "你好" in captured.get()
+
+    def test_captions(self):
+        with console.capture() as captured:
+            display_captions([Caption(id="cap1", language="ja", name="")])
+        assert "日文 (ja)" in captured.get()
@@ -0,0 +1,109 @@
+"""測試 playlist_index 與 playlist_cleanup 模組"""
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing import fake_yutu
+from yutu_cli.utils.playlist_cleanup import CleanupPlan, remove_entries
+from yutu_cli.utils.playlist_index import PlaylistIndex, load_playlist_index
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
+
+
+def _item(item_id: str, video_id: str, position: int, title: str = "") -> dict:
+    return {
+        "id": item_id,
+        "snippet": {"title": title or video_id, "position": position},
+        "contentDetails": {"videoId": video_id},
+    }
+
+
+@pytest.fixture
+def index():
+    index = PlaylistIndex()
+    index.add_playlist("PL1", [
+        _item("i0", "a", 0),
+        _item("i1", "b", 1),
+        _item("i2", "a", 2),
+        _item("i3", "x", 3, "Deleted video"),
+        _item("i4", "y", 4, "Private video"),
+        _item("i5", "a", 5),
+    ])
+    index.add_playlist("PL2", [_item("j0", "a", 0), _item("j1", "c", 1)])
+    return index
+
+
+class TestPlaylistIndex:
+    """測試 PlaylistIndex 類別"""
+
+    def test_entries_by_video(self, index):
+        assert [(e.playlist_id, e.item_id) for e in index.entries("a")] == [
+            ("PL1", "i0"), ("PL1", "i2"), ("PL1", "i5"), ("PL2", "j0"),
+        ]
+
+    def test_duplicates_keep_first(self, index):
+        assert [e.item_id for e in index.duplicates()] == ["i2", "i5"]
+        assert index.duplicates("PL2") == []
+
+    def test_placeholders(self, index):
+        assert [e.item_id for e in index.placeholders("PL1")] == ["i3", "i4"]
+
+    def test_replace_playlist(self, index):
+        index.add_playlist("PL2", [_item("k0", "d", 0)])
+        assert [e.playlist_id for e in index.entries("a")] == ["PL1"] * 3
+        assert index.entries("c") == []
+
+
+class TestCleanupPlan:
+    """測試 CleanupPlan 類別"""
+
+    def test_counts(self, index):
+        plan = CleanupPlan.from_index(index)
+        assert len(plan.entries) == 4
+        assert plan.calls == 1
+        assert plan.quota == 200
+
+
+class FakeRemover:
+    """整批失敗時逐項移除的假 YutuCLI"""
+
+    def __init__(self, bad: set[str]):
+        self.bad = bad
+        self.calls: list[str] = []
+        self.config = type("Config", (), {"max_concurrency": 2})()
+
+    def remove_from_playlist(self, ids):
+        ids = [ids] if isinstance(ids, str) else list(ids)
+        self.calls.append(",".join(ids))
+        if self.bad & set(ids):
+            return YutuResult(success=False, error="notFound")
+        return YutuResult(success=True)
+
+
+class TestRemoveEntries:
+    """測試 remove_entries 函式"""
+
+    def test_batches_and_isolates_failures(self, index):
+        entries = index.playlists["PL1"]
+        yutu = FakeRemover(bad={"i4"})
+        report = remove_entries(yutu, entries, batch_size=3, max_workers=1)
+        assert [e.item_id for e in report.removed] == ["i0", "i1", "i2", "i3", "i5"]
+        assert list(report.failed) == ["i4"]
+        assert report.calls == 2 + 3
+
+
+def test_load_playlist_index_with_fake_yutu(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_CLI_PATH", fake_yutu.__file__)
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("FAKE_YUTU_ITEMS", "4")
+    reset_config()
+    yutu = YutuCLI()
+    try:
+        loaded = load_playlist_index(yutu, ["PLa", "PLb"], use_cache=False)
+    finally:
+        yutu.close()
+        reset_config()
+    assert not loaded.errors
+    assert loaded.calls == 2
+    assert set(loaded.index.playlists) == {"PLa", "PLb"}
+    assert all(len(entries) == 4 for entries in loaded.index.playlists.values())
@@ -0,0 +1,127 @@
+"""測試 playlist_membership 模組"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from yutu_cli.utils.playlist_index import PlaylistEntry, PlaylistIndex
+from yutu_cli.utils.playlist_membership import PlaylistMembership
+from yutu_cli.utils.yutu import YutuResult
+
+
+class FakeChannel:
+    """保存多個播放清單的假 YutuCLI"""
+
+    def __init__(self, playlists: dict[str, list[str]]):
+        self.config = SimpleNamespace(max_concurrency=4)
+        self.playlists = {
+            playlist_id: [(f"{playlist_id}-{i}", video_id) for i, video_id in enumerate(videos)]
+            for playlist_id, videos in playlists.items()
+        }
+        self.calls: list[tuple] = []
+        self.lock = threading.Lock()
+
+    def run(self, resource, action, **kwargs):
+        with self.lock:
+            self.calls.append((resource, action))
+        if resource == "playlist":
+            return YutuResult(success=True, data=[
+                {"id": playlist_id, "snippet": {"title": f"清單 {playlist_id}"}}
+                for playlist_id in self.playlists
+            ])
+        items = [
+            {
+                "id": item_id,
+                "snippet": {"position": position, "title": video_id},
+                "contentDetails": {"videoId": video_id},
+            }
+            for position, (item_id, video_id) in enumerate(self.playlists[kwargs["playlistId"]])
+        ]
+        return YutuResult(success=True, data=items)
+
+    def remove_from_playlist(self, ids):
+        ids = set([ids] if isinstance(ids, str) else ids)
+        with self.lock:
+            self.calls.append(("playlistItem", "delete"))
+            for playlist_id, items in self.playlists.items():
+                self.playlists[playlist_id] = [item for item in items if item[0] not in ids]
+        return YutuResult(success=True)
+
+
+@pytest.fixture
+def channel():
+    return FakeChannel({
+        "PL1": ["a", "b", "a"],
+        "PL2": ["c"],
+        "PL3": ["b", "a"],
+    })
+
+
+class TestPlaylistMembership:
+    """測試 PlaylistMembership 類別"""
+
+    def test_find(self, channel):
+        membership = PlaylistMembership(channel)
+        assert membership.load().success
+        assert membership.playlists_containing("a") == ["PL1", "PL3"]
+        assert [e.item_id for e in membership.find("a")] == ["PL1-0", "PL1-2", "PL3-1"]
+        assert membership.find("zzz") == []
+        assert membership.titles["PL2"] == "清單 PL2"
+
+    def test_load_once(self, channel):
+        membership = PlaylistMembership(channel)
+        membership.load()
+        calls = len(channel.calls)
+        membership.load()
+        membership.find("a")
+        assert len(channel.calls) == calls == 4
+
+    def test_remove_everywhere(self, channel):
+        membership = PlaylistMembership(channel)
+        membership.load()
+        channel.calls.clear()
+
+        report = membership.remove_everywhere("a")
+
+        assert report.success and len(report.removed) == 3
+        assert channel.calls == [("playlistItem", "delete")]
+        assert membership.find("a") == []
+        assert [video for _, video in channel.playlists["PL1"]] == ["b"]
+        assert [e.playlist_id for e in membership.find("b")] == ["PL1", "PL3"]
+
+    def test_remove_absent_video_makes_no_calls(self, channel):
+        membership = PlaylistMembership(channel)
+        membership.load()
+        channel.calls.clear()
+        assert membership.remove_everywhere("zzz").calls == 0
+        assert channel.calls == []
+
+    def test_remove_from_selected_playlists(self, channel):
+        membership = PlaylistMembership(channel)
+        membership.load()
+        membership.remove_everywhere("a", playlist_ids=["PL3"])
+        assert membership.playlists_containing("a") == ["PL1"]
+
+    def test_invalidate_reloads(self, channel):
+        membership = PlaylistMembership(channel)
+        membership.load()
+        channel.playlists["PL2"].append(("PL2-9", "a"))
+        membership.invalidate()
+        assert not membership.loaded
+        membership.load()
+        assert membership.playlists_containing("a") == ["PL1", "PL2", "PL3"]
+
+
+class TestPlaylistIndexDiscard:
+    """測試 PlaylistIndex.discard"""
+
+    def test_discard_keeps_other_entries(self):
+        index = PlaylistIndex()
+        index.add_playlist("PL1", [
+            {"id": "i0", "snippet": {"position": 0}, "contentDetails": {"videoId": "a"}},
+            {"id": "i1", "snippet": {"position": 1}, "contentDetails": {"videoId": "a"}},
+        ])
+        index.discard([PlaylistEntry("PL1", "i0", "a", 0)])
+        assert [e.item_id for e in index.entries("a")] == ["i1"]
+        assert [e.item_id for e in index.playlists["PL1"]] == ["i1"]
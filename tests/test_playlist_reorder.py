@@ -0,0 +1,134 @@
+"""測試 playlist_reorder 模組"""
+
+import random
+
+import pytest
+
+from yutu_cli.utils.playlist_reorder import (
+    Move,
+    apply_moves,
+    longest_increasing_subsequence,
+    plan_moves,
+    sort_items,
+)
+from yutu_cli.utils.yutu import YutuResult
+
+
+def _apply(order: list[str], moves: list[Move]) -> list[str]:
+    """模擬 API 的移動語意：取出項目後插入指定位置"""
+    order = list(order)
+    for move in moves:
+        order.remove(move.item_id)
+        order.insert(move.position, move.item_id)
+    return order
+
+
+def _item(item_id: str, title: str, published: str, video_id: str = "") -> dict:
+    return {
+        "id": item_id,
+        "snippet": {"title": title},
+        "contentDetails": {"videoId": video_id or f"v{item_id}", "videoPublishedAt": published},
+    }
+
+
+class TestLongestIncreasingSubsequence:
+    """測試 longest_increasing_subsequence 函式"""
+
+    def test_empty(self):
+        assert longest_increasing_subsequence([]) == []
+
+    def test_sorted(self):
+        assert longest_increasing_subsequence([0, 1, 2]) == [0, 1, 2]
+
+    def test_mixed(self):
+        values = [5, 1, 6, 2, 7, 3, 8]
+        result = longest_increasing_subsequence(values)
+        assert len(result) == 4
+        picked = [values[i] for i in result]
+        assert picked == sorted(picked)
+
+
+class TestPlanMoves:
+    """測試 plan_moves 函式"""
+
+    def test_already_sorted(self):
+        assert plan_moves(["a", "b", "c"], ["a", "b", "c"]) == []
+
+    def test_single_move(self):
+        moves = plan_moves(["b", "c", "d", "a"], ["a", "b", "c", "d"])
+        assert moves == [Move("a", 0)]
+
+    def test_random_orders(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            current = [str(i) for i in range(rng.randint(0, 30))]
+            rng.shuffle(current)
+            target = current[:]
+            rng.shuffle(target)
+            assert _apply(current, plan_moves(current, target)) == target
+
+    def test_few_moves_for_nearly_sorted(self):
+        current = [f"i{n}" for n in range(400)]
+        target = current[:]
+        rng = random.Random(1)
+        for _ in range(15):
+            target.insert(rng.randrange(400), target.pop(rng.randrange(400)))
+        assert len(plan_moves(current, target)) <= 15
+
+    def test_mismatched_items(self):
+        with pytest.raises(ValueError):
+            plan_moves(["a", "b"], ["a", "c"])
+
+
+class TestSortItems:
+    """測試 sort_items 函式"""
+
+    @pytest.fixture
+    def items(self):
+        return [
+            _item("1", "Banana", "2021-01-01"),
+            _item("2", "apple", "2020-01-01"),
+            _item("3", "Cherry", "2021-01-01"),
+        ]
+
+    def test_published_stable(self, items):
+        assert sort_items(items, "published") == ["2", "1", "3"]
+        assert sort_items(items, "published", descending=True) == ["1", "3", "2"]
+
+    def test_title_casefold(self, items):
+        assert sort_items(items, "title") == ["2", "1", "3"]
+
+    def test_views(self, items):
+        views = {"v1": 10, "v2": 30, "v3": 20}
+        assert sort_items(items, "views", descending=True, views=views) == ["2", "3", "1"]
+
+    def test_custom_unlisted_last(self, items):
+        assert sort_items(items, "custom", custom=["v3"]) == ["3", "1", "2"]
+
+
+class FakeMover:
+    """記錄移動的假 YutuCLI"""
+
+    def __init__(self, fail_at: int = -1):
+        self.moves: list[tuple] = []
+        self.fail_at = fail_at
+
+    def move_playlist_item(self, item_id, playlist_id, video_id, position):
+        if len(self.moves) == self.fail_at:
+            return YutuResult(success=False, error="backendError")
+        self.moves.append((item_id, playlist_id, video_id, position))
+        return YutuResult(success=True)
+
+
+def test_apply_moves_stops_on_error():
+    items = [_item(str(n), "", "") for n in range(3)]
+    moves = [Move("2", 0), Move("1", 0)]
+    yutu = FakeMover()
+    report = apply_moves(yutu, "PL", items, moves)
+    assert report.success
+    assert yutu.moves == [("2", "PL", "v2", 0), ("1", "PL", "v1", 0)]
+
+    report = apply_moves(FakeMover(fail_at=1), "PL", items, moves)
+    assert not report.success
+    assert report.moved == 1
+    assert report.error == "backendError"
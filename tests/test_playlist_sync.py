@@ -0,0 +1,113 @@
+"""測試 playlist_sync 模組"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from yutu_cli.utils.playlist_sync import PlaylistSyncer, diff_playlist, load_manifest
+from yutu_cli.utils.yutu import YutuResult
+
+
+def _vid(n: int) -> str:
+    return f"v{n:010d}"
+
+
+class FakePlaylist:
+    """保存播放清單狀態的假 YutuCLI（支援列出、加入、移除與移動）"""
+
+    def __init__(self, video_ids, state_dir):
+        self.config = SimpleNamespace(state_dir=state_dir, max_concurrency=4)
+        self.items = [(f"item{i}", video_id) for i, video_id in enumerate(video_ids)]
+        self.next_id = len(self.items)
+        self.writes = 0
+        self.lock = threading.Lock()
+
+    def run(self, resource, action, **kwargs):
+        items = [
+            {
+                "id": item_id,
+                "snippet": {"position": position, "title": video_id},
+                "contentDetails": {"videoId": video_id},
+            }
+            for position, (item_id, video_id) in enumerate(self.items)
+        ]
+        return YutuResult(success=True, data=items)
+
+    def add_to_playlist(self, playlist_id, video_id):
+        with self.lock:
+            self.items.append((f"item{self.next_id}", video_id))
+            self.next_id += 1
+            self.writes += 1
+        return YutuResult(success=True)
+
+    def remove_from_playlist(self, ids):
+        ids = set([ids] if isinstance(ids, str) else ids)
+        with self.lock:
+            self.items = [item for item in self.items if item[0] not in ids]
+            self.writes += 1
+        return YutuResult(success=True)
+
+    def move_playlist_item(self, item_id, playlist_id, video_id, position):
+        item = next(item for item in self.items if item[0] == item_id)
+        self.items.remove(item)
+        self.items.insert(position, item)
+        self.writes += 1
+        return YutuResult(success=True)
+
+
+class TestLoadManifest:
+    """測試 load_manifest 函式"""
+
+    def test_json_object(self, tmp_path):
+        path = tmp_path / "series.json"
+        path.write_text(json.dumps({
+            "playlist": "PL1",
+            "title": "系列",
+            "videos": ["https://youtu.be/aaaaaaaaaaa", {"id": "bbbbbbbbbbb"}, "bad"],
+        }))
+        manifest = load_manifest(path)
+        assert manifest.playlist_id == "PL1"
+        assert manifest.video_ids == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+        assert manifest.invalid == ["bad"]
+
+    def test_csv_with_header(self, tmp_path):
+        path = tmp_path / "series.csv"
+        path.write_text("title,video_id\nA,aaaaaaaaaaa\nB,bbbbbbbbbbb\n")
+        assert load_manifest(path).video_ids == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+
+    def test_text(self, tmp_path):
+        path = tmp_path / "series.txt"
+        path.write_text("# 系列\naaaaaaaaaaa\nbbbbbbbbbbb\n")
+        assert load_manifest(path).video_ids == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+
+
+class TestDiffPlaylist:
+    """測試 diff_playlist 函式"""
+
+    def test_diff(self, tmp_path):
+        yutu = FakePlaylist([_vid(0), _vid(1), _vid(1), _vid(2)], tmp_path)
+        items = yutu.run("playlistItem", "list").data
+        diff = diff_playlist("PL", items, [_vid(2), _vid(0), _vid(3)])
+        assert [e.item_id for e in diff.deletes] == ["item1", "item2"]
+        assert diff.inserts == [_vid(3)]
+        assert diff.moves == 1
+        assert diff.quota == (2 + 1 + 1) * 50
+
+
+class TestPlaylistSyncer:
+    """測試 PlaylistSyncer 類別"""
+
+    def test_apply_then_idempotent(self, tmp_path):
+        yutu = FakePlaylist([_vid(n) for n in range(30)], tmp_path)
+        target = [_vid(n) for n in range(40, 20, -1)] + [_vid(5)]
+        syncer = PlaylistSyncer(yutu, "PL")
+        report = syncer.apply(syncer.diff(target))
+        assert report.success, report.errors
+        assert [video_id for _, video_id in yutu.items] == target
+
+        writes = yutu.writes
+        diff = PlaylistSyncer(yutu, "PL").diff(target)
+        assert diff.empty
+        assert yutu.writes == writes
@@ -0,0 +1,186 @@
+"""測試 quota 模組"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing import fake_yutu
+from yutu_cli.utils import quota as quota_module
+from yutu_cli.utils.bulk_add import BulkAdder, ImportManifest
+from yutu_cli.utils.quota import (
+    BUDGET_ERROR_MARKER,
+    QuotaLedger,
+    is_quota_error,
+    next_reset,
+    quota_cost,
+    quota_day,
+)
+from yutu_cli.utils.sync import ChannelSync
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    """以假 yutu 建立的 YutuCLI（停用快取，預算 120）"""
+    monkeypatch.setenv("YUTU_CLI_PATH", fake_yutu.__file__)
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("YUTU_QUOTA_BUDGET", "120")
+    reset_config()
+    yutu = YutuCLI()
+    yield yutu
+    yutu.close()
+    reset_config()
+
+
+class TestQuotaCost:
+    """測試 quota_cost 函式"""
+
+    def test_costs(self):
+        assert quota_cost("playlist", "list") == 1
+        assert quota_cost("search", "list") == 100
+        assert quota_cost("playlistItem", "insert") == 50
+        assert quota_cost("caption", "insert") == 400
+        assert quota_cost("caption", "list") == 50
+
+    def test_batched_delete(self):
+        assert quota_cost("playlistItem", "delete", {"ids": "a,b,c"}) == 150
+        assert quota_cost("playlistItem", "delete", {"ids": "a"}) == 50
+
+
+class TestQuotaDay:
+    """測試太平洋時間的日期切換"""
+
+    def test_day_follows_pacific_midnight(self):
+        # 2026-10-16 06:59 UTC 為太平洋夏令時間 10-15 23:59
+        assert quota_day(datetime(2026, 10, 16, 6, 59, tzinfo=timezone.utc)) == "2026-10-15"
+        assert quota_day(datetime(2026, 10, 16, 7, 0, tzinfo=timezone.utc)) == "2026-10-16"
+
+    def test_next_reset(self):
+        now = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+        assert next_reset(now) == datetime(2026, 10, 17, 7, 0, tzinfo=timezone.utc)
+
+    def test_fallback_without_tzdata(self, monkeypatch):
+        def missing(key):
+            raise quota_module.ZoneInfoNotFoundError(key)
+
+        monkeypatch.setattr(quota_module, "ZoneInfo", missing)
+        assert quota_day(datetime(2026, 1, 1, 7, 59, tzinfo=timezone.utc)) == "2025-12-31"
+
+
+class TestQuotaLedger:
+    """測試 QuotaLedger 類別"""
+
+    def test_reserve_and_persist(self, tmp_path):
+        ledger = QuotaLedger(tmp_path / "quota.json", budget=100)
+        assert ledger.reserve("playlistItem", "insert", 50) is None
+        assert ledger.reserve("playlist", "list", 1) is None
+        assert ledger.used == 51
+
+        reopened = QuotaLedger(tmp_path / "quota.json", budget=100)
+        assert reopened.remaining == 49
+        assert reopened.usage().by_action == {"playlistItem.insert": 50, "playlist.list": 1}
+
+    def test_refuses_over_budget(self, tmp_path):
+        ledger = QuotaLedger(tmp_path / "quota.json", budget=100)
+        ledger.reserve("playlistItem", "insert", 50)
+        ledger.reserve("playlistItem", "insert", 50)
+        error = ledger.reserve("playlistItem", "insert", 50)
+        assert BUDGET_ERROR_MARKER in error and is_quota_error(error)
+        assert ledger.used == 100
+
+    def test_resets_on_new_day(self, tmp_path):
+        path = tmp_path / "quota.json"
+        path.write_text(json.dumps({"day": "2000-01-01", "used": 9999}))
+        assert QuotaLedger(path).used == 0
+
+    def test_affordable(self, tmp_path):
+        ledger = QuotaLedger(tmp_path / "quota.json", budget=175)
+        assert ledger.affordable(50, 10) == 3
+        assert ledger.affordable(50, 2) == 2
+
+    def test_budget_capped_by_daily_limit(self, tmp_path):
+        assert QuotaLedger(tmp_path / "q.json", daily_limit=500, budget=900).budget == 500
+        assert QuotaLedger(tmp_path / "q.json", daily_limit=500).budget == 500
+
+
+class TestYutuCLIQuota:
+    """測試 YutuCLI 的配額記帳與預算"""
+
+    def test_charges_actual_calls(self, fake_cli):
+        assert fake_cli.list_my_playlists().success
+        assert fake_cli.quota.used == 1
+        assert fake_cli.quota.session_used == 1
+
+    def test_refuses_without_calling(self, fake_cli):
+        assert fake_cli.run("search", "list", q="x", max_results=50).success
+        result = fake_cli.run("search", "list", q="y", max_results=50)
+        assert result.success is False
+        assert BUDGET_ERROR_MARKER in result.error
+        assert fake_cli.quota.used == 100
+
+    def test_unbounded_list_charged_per_page(self, fake_cli, monkeypatch):
+        """maxResults 0 時 yutu 逐頁取得，依實際回傳的頁數記帳"""
+        monkeypatch.setenv("FAKE_YUTU_VIDEOS", "120")
+        assert len(fake_cli.run("search", "list", q="x", max_results=0).data) == 120
+        assert fake_cli.quota.used == 300
+        assert fake_cli.quota.usage().by_action == {"search.list": 300}
+        assert not fake_cli.list_my_playlists().success
+
+    def test_bounded_list_reserves_pages_up_front(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_YUTU_VIDEOS", "120")
+        result = fake_cli.run("search", "list", q="x", max_results=100)
+        assert result.success is False and BUDGET_ERROR_MARKER in result.error
+        # 回傳的項目少於預估時退還多記的頁數
+        monkeypatch.setenv("FAKE_YUTU_ITEMS", "3")
+        assert fake_cli.run("playlistItem", "list", playlistId="PL1", max_results=100).success
+        assert fake_cli.quota.used == 1
+
+    def test_stream_charged_per_page(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_YUTU_ITEMS", "120")
+        result = fake_cli.stream_playlist_items("PL1", max_results=0)
+        assert fake_cli.quota.used == 1
+        assert len(list(result.iter_items())) == 120
+        assert fake_cli.quota.used == 3
+
+    def test_quota_exceeded_marks_exhausted(self, fake_cli, monkeypatch, tmp_path):
+        monkeypatch.setenv("FAKE_YUTU_QUOTA_LIMIT", "1")
+        monkeypatch.setenv("FAKE_YUTU_QUOTA_FILE", str(tmp_path / "fake-quota"))
+        fake_cli.list_my_playlists()
+        assert not fake_cli.list_my_playlists().success
+        assert fake_cli.quota.remaining == 0
+
+    def test_caption_sync_stops_at_budget(self, fake_cli):
+        """逐部影片同步字幕列表時，每部 50 配額，超出預算的影片不會送出"""
+        sync = ChannelSync(fake_cli)
+        sync.sync_captions([f"v{n:010d}" for n in range(1, 6)])
+        assert sync.report.caption_videos == 2
+        assert fake_cli.quota.used == 100
+
+
+class TestBulkAdderBudget:
+    """測試 BulkAdder 依剩餘預算延後加入"""
+
+    def test_defers_unaffordable(self, tmp_path):
+        class FakeYutu:
+            def __init__(self):
+                self.added: list[str] = []
+
+            def run(self, resource, action, **kwargs):
+                return YutuResult(success=True, data=[])
+
+            def add_to_playlist(self, playlist_id, video_id):
+                self.added.append(video_id)
+                return YutuResult(success=True, data={})
+
+        ids = [f"v{n:010d}" for n in range(5)]
+        manifest = ImportManifest.for_import(tmp_path, "PL1", ids)
+        ledger = QuotaLedger(tmp_path / "quota.json", budget=120)
+        adder = BulkAdder(FakeYutu(), "PL1", manifest, max_workers=1, ledger=ledger)
+        report = adder.run()
+        assert report.added == 2 and report.deferred == 3
+        assert manifest.pending == ids[2:]
+        assert manifest.path.exists()
+
@@ -0,0 +1,175 @@
+"""測試 retry 模組與 YutuCLI 的重試"""
+
+import random
+import subprocess
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing.fake_yutu import format_api_error
+from yutu_cli.utils.retry import (
+    AUTH_ERROR,
+    BACKEND_ERROR,
+    FORBIDDEN,
+    NETWORK_ERROR,
+    NOT_FOUND,
+    QUOTA_EXCEEDED,
+    RATE_LIMITED,
+    UNKNOWN,
+    backoff_delay,
+    can_retry,
+    classify_error,
+)
+from yutu_cli.utils.transport import CommandOutput
+from yutu_cli.utils.yutu import YutuCLI
+
+
+class ScriptedTransport:
+    """依序回傳預先定義輸出的傳輸層（依 resource.action 分別排隊）"""
+
+    name = "subprocess"
+
+    def __init__(self, script):
+        self.script = {key: list(outputs) for key, outputs in script.items()}
+        self.calls: list[str] = []
+
+    def execute(self, cmd, env, timeout):
+        key = f"{cmd[1]}.{cmd[2]}"
+        self.calls.append(key)
+        output = self.script[key].pop(0)
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+
+def _fail(kind: str) -> CommandOutput:
+    return CommandOutput(1, "", format_api_error(kind))
+
+
+OK = CommandOutput(0, '{"id": "new"}')
+
+
+@pytest.fixture
+def yutu(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("YUTU_RETRY_BACKOFF", "0")
+    reset_config()
+    yield YutuCLI()
+    reset_config()
+
+
+def _script(yutu: YutuCLI, **script) -> ScriptedTransport:
+    transport = ScriptedTransport({key.replace("_", "."): value for key, value in script.items()})
+    yutu._transport = transport
+    return transport
+
+
+class TestClassifyError:
+    """測試 classify_error 函式"""
+
+    @pytest.mark.parametrize("kind, expected", [
+        ("backendError", BACKEND_ERROR),
+        ("rateLimitExceeded", RATE_LIMITED),
+        ("quotaExceeded", QUOTA_EXCEEDED),
+        ("notFound", NOT_FOUND),
+        ("forbidden", FORBIDDEN),
+        ("authError", AUTH_ERROR),
+    ])
+    def test_googleapi_reasons(self, kind, expected):
+        assert classify_error(format_api_error(kind)) == expected
+
+    def test_specific_not_found(self):
+        assert classify_error("googleapi: Error 404: Playlist not found., playlistNotFound") == NOT_FOUND
+
+    def test_status_and_network(self):
+        assert classify_error("googleapi: Error 500: Internal error") == BACKEND_ERROR
+        assert classify_error("googleapi: got HTTP response code 429 Error 429") == RATE_LIMITED
+        assert classify_error('Get "https://youtube.googleapis.com": read: connection reset by peer') == NETWORK_ERROR
+        assert classify_error("oauth2: cannot fetch token: 400 Bad Request") == AUTH_ERROR
+        assert classify_error("something else") == UNKNOWN
+
+
+class TestRetryPolicy:
+    """測試重試規則"""
+
+    def test_reads_and_idempotent_writes(self):
+        assert can_retry("playlist", "list", BACKEND_ERROR)
+        assert can_retry("playlistItem", "delete", NETWORK_ERROR)
+        assert not can_retry("playlist", "list", NOT_FOUND)
+
+    def test_inserts(self):
+        assert can_retry("video", "insert", RATE_LIMITED)
+        assert not can_retry("video", "insert", BACKEND_ERROR)
+        assert can_retry("playlistItem", "insert", BACKEND_ERROR)
+
+    def test_backoff_bounds(self):
+        rng = random.Random(1)
+        delays = [backoff_delay(attempt, 1.0, 5.0, rng) for attempt in range(10)]
+        assert all(0 <= delay <= min(5.0, 2 ** attempt) for attempt, delay in enumerate(delays))
+
+
+class TestYutuCLIRetry:
+    """測試 YutuCLI.run 的重試"""
+
+    def test_retries_transient_read(self, yutu):
+        transport = _script(yutu, playlist_list=[_fail("backendError"), _fail("rateLimitExceeded"), OK])
+        assert yutu.run("playlist", "list", mine=True).success
+        assert len(transport.calls) == 3
+        assert yutu.error_stats.retries == {BACKEND_ERROR: 1, RATE_LIMITED: 1}
+        assert yutu.error_stats.recovered == 1
+        assert yutu.quota.used == 3
+
+    def test_gives_up_after_attempts(self, yutu):
+        _script(yutu, playlist_list=[_fail("backendError")] * 4)
+        result = yutu.run("playlist", "list", mine=True)
+        assert not result.success
+        assert result.error_kind == BACKEND_ERROR
+        assert yutu.error_stats.errors[BACKEND_ERROR] == 4
+
+    def test_does_not_retry_permanent_error(self, yutu):
+        transport = _script(yutu, video_list=[_fail("notFound")])
+        result = yutu.run("video", "list", ids="x")
+        assert result.error_kind == NOT_FOUND
+        assert len(transport.calls) == 1
+
+    def test_timeout_is_retried(self, yutu):
+        transport = _script(yutu, playlist_list=[subprocess.TimeoutExpired("yutu", 1), OK])
+        assert yutu.run("playlist", "list", mine=True).success
+        assert len(transport.calls) == 2
+
+    def test_insert_already_applied_is_not_repeated(self, yutu):
+        listed = CommandOutput(0, '[{"id": "item9", "contentDetails": {"videoId": "v1"}}]')
+        transport = _script(
+            yutu,
+            playlistItem_insert=[_fail("backendError")],
+            playlistItem_list=[listed],
+        )
+        result = yutu.add_to_playlist("PL1", "v1")
+        assert result.success and result.data["id"] == "item9"
+        assert transport.calls == ["playlistItem.insert", "playlistItem.list"]
+
+    def test_insert_retried_when_not_applied(self, yutu):
+        transport = _script(
+            yutu,
+            playlistItem_insert=[_fail("backendError"), OK],
+            playlistItem_list=[CommandOutput(0, "[]")],
+        )
+        assert yutu.add_to_playlist("PL1", "v1").success
+        assert transport.calls == ["playlistItem.insert", "playlistItem.list", "playlistItem.insert"]
+
+    def test_unverifiable_insert_not_retried(self, yutu):
+        transport = _script(yutu, video_insert=[_fail("backendError")])
+        assert not yutu.run("video", "insert", file="a.mp4").success
+        assert len(transport.calls) == 1
+
+    def test_retried_delete_not_found_is_success(self, yutu):
+        _script(yutu, playlistItem_delete=[_fail("backendError"), _fail("notFound")])
+        assert yutu.remove_from_playlist("item1").success
+
+    def test_retried_batch_delete_not_found_is_failure(self, yutu):
+        """批次中第一個 ID 已刪除時，不能把整批視為已刪除"""
+        transport = _script(yutu, playlistItem_delete=[_fail("backendError"), _fail("notFound")])
+        result = yutu.remove_from_playlist(["a", "b", "c"])
+        assert not result.success and result.error_kind == NOT_FOUND
+        assert transport.calls == ["playlistItem.delete", "playlistItem.delete"]
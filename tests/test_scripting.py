@@ -0,0 +1,139 @@
+"""測試 scripting 模組與非互動子命令"""
+
+import json
+import threading
+import time
+from typing import Iterable, Optional
+
+import pytest
+from click.testing import CliRunner
+
+from yutu_cli.__main__ import main
+from yutu_cli.config import reset_config
+from yutu_cli.scripting import call_operation, execute_jsonl, operations, parameter_types
+from yutu_cli.testing import fake_yutu
+from yutu_cli.utils import yutu as yutu_module
+from yutu_cli.utils.yutu import YutuResult
+
+
+@pytest.fixture
+def fake_env(tmp_path, monkeypatch):
+    """讓 get_yutu() 使用假 yutu（停用快取）"""
+    monkeypatch.setenv("YUTU_CLI_PATH", fake_yutu.__file__)
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("YUTU_RETRY_BACKOFF", "0")
+    monkeypatch.setattr(yutu_module, "_yutu", None)
+    reset_config()
+    yield
+    reset_config()
+
+
+class SlowYutu:
+    """依參數延遲回應的替身（驗證並行與輸出順序）"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def delete_comment(self, comment_id: str) -> YutuResult:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05 if comment_id == "slow" else 0.01)
+        with self.lock:
+            self.active -= 1
+        return YutuResult(success=comment_id != "bad", data={"id": comment_id}, error=None)
+
+
+class TestOperations:
+    """測試操作清單與參數型別"""
+
+    def test_excludes_non_operations(self):
+        ops = operations()
+        assert "add_to_playlist" in ops and "run" in ops
+        assert "close" not in ops and "stream" not in ops and "flush_metrics" not in ops
+
+    def test_parameter_types(self):
+        assert parameter_types(str) == (str, False)
+        assert parameter_types(int | None) == (int, False)
+        assert parameter_types(str | list[str]) == (str, False)
+        assert parameter_types(list[str] | None) == (str, True)
+        assert parameter_types(Optional[Iterable[str]]) == (str, True)
+
+    def test_call_operation_validates_args(self):
+        with pytest.raises(ValueError, match="未知的操作"):
+            call_operation(SlowYutu(), "nope")
+        with pytest.raises(ValueError, match="參數錯誤"):
+            call_operation(SlowYutu(), "add_to_playlist", {"playlist_id": "PL1"})
+
+
+class TestExecuteJsonl:
+    """測試 execute_jsonl 函式"""
+
+    def test_results_in_input_order(self, monkeypatch):
+        monkeypatch.setattr("yutu_cli.scripting.operations", lambda: {"delete_comment": SlowYutu.delete_comment})
+        yutu = SlowYutu()
+        lines = [
+            json.dumps({"id": n, "op": "delete_comment", "args": {"comment_id": "slow" if n == 0 else f"c{n}"}})
+            for n in range(6)
+        ]
+        out: list[str] = []
+        total, failed = execute_jsonl(yutu, lines, out.append, workers=3)
+        records = [json.loads(line) for line in out]
+        assert (total, failed) == (6, 0)
+        assert [r["id"] for r in records] == list(range(6))
+        assert 1 < yutu.peak <= 3
+
+    def test_invalid_lines_reported(self, monkeypatch):
+        monkeypatch.setattr("yutu_cli.scripting.operations", lambda: {"delete_comment": SlowYutu.delete_comment})
+        lines = [
+            "# 註解",
+            "",
+            "{not json",
+            '{"op": "unknown"}',
+            '{"op": "delete_comment", "args": ["bad"]}',
+            '{"op": "delete_comment", "args": ["ok"]}',
+        ]
+        out: list[str] = []
+        total, failed = execute_jsonl(SlowYutu(), lines, out.append, workers=2)
+        records = [json.loads(line) for line in out]
+        assert (total, failed) == (4, 3)
+        assert [r["index"] for r in records] == [0, 1, 2, 3]
+        assert records[0]["error_kind"] == records[1]["error_kind"] == "invalidRequest"
+        assert records[2]["success"] is False and "error_kind" not in records[2]
+        assert records[3]["success"] is True
+
+
+class TestCommands:
+    """測試非互動子命令（使用假 yutu）"""
+
+    def test_operation_command(self, fake_env):
+        result = CliRunner().invoke(main, ["list-my-playlists", "--max-results", "2"])
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert payload["success"] is True and len(payload["data"]) == 2
+
+    def test_run_command_params(self, fake_env):
+        result = CliRunner().invoke(main, ["run", "playlist", "list", "-p", "mine=true", "--max-results", "1"])
+        assert result.exit_code == 0
+        assert len(json.loads(result.output)["data"]) == 1
+
+    def test_failure_exit_code(self, fake_env, monkeypatch):
+        monkeypatch.setenv("FAKE_YUTU_ERROR_RATE", "1")
+        monkeypatch.setenv("FAKE_YUTU_ERROR_KIND", "notFound")
+        result = CliRunner().invoke(main, ["delete-playlist", "PL1"])
+        assert result.exit_code == 1
+        assert json.loads(result.output)["error_kind"] == "notFound"
+
+    def test_exec(self, fake_env):
+        lines = "\n".join([
+            json.dumps({"id": "a", "op": "add_to_playlist", "args": {"playlist_id": "PL1", "video_id": "v1"}}),
+            json.dumps({"id": "b", "op": "get_my_channel"}),
+        ])
+        result = CliRunner().invoke(main, ["exec", "--workers", "2"], input=lines)
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["id"] for r in records] == ["a", "b"]
+        assert all(r["success"] for r in records)
@@ -0,0 +1,99 @@
+"""測試 search_index 模組"""
+
+import pytest
+
+from yutu_cli.utils.mirror import ChannelMirror
+from yutu_cli.utils.search_index import build_query, caption_text, segment
+
+
+def _video(video_id: str, title: str, description: str = "") -> dict:
+    return {"id": video_id, "snippet": {"title": title, "description": description}}
+
+
+def _thread(thread_id: str, text: str) -> dict:
+    return {
+        "id": thread_id,
+        "snippet": {"topLevelComment": {"snippet": {"authorDisplayName": "觀眾", "textOriginal": text}}},
+    }
+
+
+@pytest.fixture
+def mirror():
+    m = ChannelMirror(":memory:")
+    yield m
+    m.close()
+
+
+class TestQueryHelpers:
+    """測試分詞與查詢轉換"""
+
+    def test_segment_cjk(self):
+        assert segment("Yutu頻道管理 tool") == "Yutu 頻 道 管 理 tool"
+
+    def test_build_query(self):
+        assert build_query('頻道 "open source" pyth*') == '"頻 道" AND "open source" AND "pyth"*'
+
+    def test_operators_are_quoted(self):
+        assert build_query('a OR b NEAR("x")') == '"a" AND "OR" AND "b" AND "NEAR(x)"'
+        assert build_query('   ') == ""
+
+    def test_caption_text(self):
+        srt = "1\n00:00:01,000 --> 00:00:02,000\n<i>大家好</i>\n\n2\n00:00:03,000 --> 00:00:04,000\n歡迎收看\n"
+        assert caption_text(srt) == "大家好\n歡迎收看"
+        vtt = "WEBVTT\n\n00:01.000 --> 00:02.000\nhello\n"
+        assert caption_text(vtt) == "hello"
+
+
+class TestMirrorSearch:
+    """測試鏡像的全文搜尋"""
+
+    def test_cjk_phrase(self, mirror):
+        mirror.upsert_videos([_video("v1", "頻道管理教學"), _video("v2", "管道頻繁")])
+        assert [h.video_id for h in mirror.search("頻道")] == ["v1"]
+        # snippet 中的 CJK 字元間不會留下分詞用的空白
+        assert mirror.search("管理")[0].snippet == "頻道\x02管理\x03教學"
+
+    def test_prefix_and_phrase(self, mirror):
+        mirror.upsert_videos([
+            _video("v1", "Python tutorial", "learn python programming"),
+            _video("v2", "Rust", "python bindings are not covered"),
+        ])
+        assert {h.video_id for h in mirror.search("prog*")} == {"v1"}
+        assert {h.video_id for h in mirror.search('"learn python"')} == {"v1"}
+        assert {h.video_id for h in mirror.search("python")} == {"v1", "v2"}
+
+    def test_title_ranks_higher(self, mirror):
+        mirror.upsert_videos([_video("v1", "其他", "烹飪"), _video("v2", "烹飪", "其他")])
+        assert mirror.search("烹飪")[0].video_id == "v2"
+
+    def test_comments_replaced_incrementally(self, mirror):
+        mirror.replace_comment_threads("v1", [_thread("T1", "第一集很好看")])
+        assert [h.kind for h in mirror.search("好看")] == ["comment"]
+        mirror.replace_comment_threads("v1", [_thread("T2", "音樂很棒")])
+        assert mirror.search("好看") == []
+        assert mirror.search("音樂")[0].ref == "v1"
+
+    def test_caption_file(self, mirror):
+        mirror.replace_captions("v1", [{"id": "C1", "snippet": {"language": "zh-TW"}}])
+        mirror.index_caption("C1", "1\n00:00:01,000 --> 00:00:02,000\n今天介紹量子電腦\n")
+        hit = mirror.search("量子")[0]
+        assert (hit.kind, hit.video_id, hit.title) == ("caption", "v1", "zh-TW")
+        mirror.replace_captions("v1", [])
+        assert mirror.search("量子") == []
+
+    def test_removed_videos_leave_index(self, mirror):
+        mirror.upsert_videos([_video("v1", "刪除測試")])
+        mirror.remove_videos(["v1"])
+        assert mirror.search("刪除") == []
+
+    def test_existing_mirror_is_indexed(self, tmp_path):
+        path = tmp_path / "mirror.sqlite"
+        first = ChannelMirror(path)
+        first.upsert_videos([_video("v1", "舊資料")])
+        first.index.clear()
+        first._conn.commit()
+        first.close()
+
+        reopened = ChannelMirror(path)
+        assert [h.video_id for h in reopened.search("舊資料")] == ["v1"]
+        reopened.close()
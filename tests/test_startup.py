@@ -0,0 +1,82 @@
+"""測試啟動耗時：入口點只載入必要的模組（耗時門檻見 benchmarks/thresholds.json）"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from yutu_cli import __version__
+from yutu_cli.__main__ import main
+from yutu_cli.testing.importtime import loaded_heavy_modules, measure_imports, parse_importtime
+
+
+class TestParseImporttime:
+    """測試 parse_importtime 函式"""
+
+    def test_cumulative_per_module(self):
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   click.types",
+            "import time:       417 |      40697 | click",
+            "import time:        10 |         10 | click",
+        ])
+        assert parse_importtime(output) == {"click.types": 120, "click": 40697}
+
+
+class TestStartup:
+    """測試入口點的延遲載入"""
+
+    def test_entry_point_skips_heavy_modules(self):
+        modules = measure_imports("import yutu_cli.__main__")
+        assert "click" in modules
+        assert loaded_heavy_modules(modules) == []
+
+    def test_version_skips_heavy_modules(self):
+        modules = measure_imports(
+            "from yutu_cli.__main__ import main; main(['--version'], standalone_mode=False)"
+        )
+        assert loaded_heavy_modules(modules) == []
+
+    def test_scripting_skips_interactive_ui(self):
+        modules = measure_imports("import yutu_cli.scripting")
+        assert "yutu_cli.utils.yutu" in modules
+        assert not [name for name in modules if name.split(".")[0] in ("rich", "questionary", "prompt_toolkit")]
+
+
+class TestLazyCommands:
+    """測試延遲建立的子命令"""
+
+    def test_version(self):
+        result = CliRunner().invoke(main, ["--version"])
+        assert result.exit_code == 0
+        assert __version__ in result.output
+
+    def test_help_lists_operations(self):
+        result = CliRunner().invoke(main, ["--help"])
+        assert result.exit_code == 0
+        assert "add-to-playlist" in result.output and "exec" in result.output
+
+    def test_options_apply_to_config(self, tmp_path, monkeypatch):
+        from yutu_cli.config import get_config, reset_config
+        from yutu_cli.testing import fake_yutu
+        from yutu_cli.utils import yutu as yutu_module
+
+        monkeypatch.setenv("YUTU_CLI_PATH", fake_yutu.__file__)
+        monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+        monkeypatch.setattr(yutu_module, "_yutu", None)
+        reset_config()
+        try:
+            result = CliRunner().invoke(main, ["--no-cache", "get-my-channel"])
+            assert result.exit_code == 0
+            assert json.loads(result.output)["success"] is True
+            assert get_config().cache_enabled is False
+        finally:
+            reset_config()
+
+
+@pytest.mark.parametrize("menu", ["playlists", "videos", "search", "channel", "comments", "captions", "sync"])
+def test_menu_handlers_resolve(menu):
+    """互動式選單的每個功能都能延遲載入"""
+    from yutu_cli.app import load_handler
+
+    assert callable(load_handler(menu))
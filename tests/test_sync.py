@@ -0,0 +1,89 @@
+"""測試 sync 模組（使用假 yutu）"""
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.testing import fake_yutu
+from yutu_cli.utils.sync import ChannelSync
+from yutu_cli.utils.yutu import YutuCLI
+
+
+@pytest.fixture
+def yutu(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_CLI_PATH", fake_yutu.__file__)
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("FAKE_YUTU_VIDEOS", "10")
+    monkeypatch.setenv("FAKE_YUTU_PLAYLISTS", "2")
+    monkeypatch.setenv("FAKE_YUTU_ITEMS", "5")
+    monkeypatch.setenv("FAKE_YUTU_COMMENTS", "3")
+    reset_config()
+    cli = YutuCLI()
+    yield cli
+    cli.close()
+    reset_config()
+
+
+class TestChannelSync:
+    """測試 ChannelSync 類別"""
+
+    def test_initial_sync(self, yutu):
+        report = ChannelSync(yutu).sync_all()
+        assert report.success, report.errors
+        assert report.videos_added == 10
+        assert report.playlists_synced == 2
+        assert report.comment_videos == 10
+        assert report.caption_videos == 10
+        assert yutu.get_mirror().counts()["comment_threads"] == 30
+
+    def test_incremental_sync(self, yutu, monkeypatch):
+        ChannelSync(yutu).sync_all()
+        monkeypatch.setenv("FAKE_YUTU_VIDEOS", "12")
+        report = ChannelSync(yutu).sync_all()
+        assert report.success, report.errors
+        assert report.videos_added == 2
+        assert report.videos_removed == 0
+        assert report.playlists_synced == 0
+        assert report.comment_videos == 2
+        assert report.caption_videos == 2
+
+    def test_deleted_videos_trigger_full_reread(self, yutu, monkeypatch):
+        ChannelSync(yutu).sync_all(comments=False, captions=False)
+        monkeypatch.setenv("FAKE_YUTU_VIDEOS", "8")
+        report = ChannelSync(yutu).sync_all(comments=False, captions=False)
+        assert report.videos_removed == 2
+        assert len(yutu.get_mirror().get_videos([f"v{n:010d}" for n in range(10)])) == 8
+
+    def test_menus_read_from_mirror(self, yutu, tmp_path):
+        ChannelSync(yutu).sync_all()
+        # 同步後不需要 yutu 執行檔也能瀏覽
+        yutu.config.cli_path = tmp_path / "missing"
+        playlists = yutu.list_my_playlists()
+        assert playlists.success and playlists.cached
+        assert len(yutu.list_playlist_items(playlists.data[0]["id"]).data) == 5
+        assert len(yutu.list_comment_threads("v0000000001").data) == 3
+        assert len(yutu.list_my_videos().data["items"]) == 10
+
+    def test_write_falls_back_to_api(self, yutu):
+        ChannelSync(yutu).sync_all(comments=False, captions=False)
+        playlist_id = yutu.list_my_playlists().data[0]["id"]
+        assert yutu.add_to_playlist(playlist_id, "v0000000001").success
+        assert yutu.list_playlist_items(playlist_id).cached is False
+
+    def test_refresh_bypasses_mirror(self, yutu):
+        ChannelSync(yutu).sync_all(comments=False, captions=False)
+        yutu.config.cache_refresh = True
+        assert yutu.list_my_playlists().cached is False
+
+    def test_playlist_items_include_content_details(self, yutu, monkeypatch):
+        calls = []
+        run = yutu.run
+
+        def recording_run(resource, action, **kwargs):
+            calls.append((resource, action, kwargs))
+            return run(resource, action, **kwargs)
+
+        monkeypatch.setattr(yutu, "run", recording_run)
+        ChannelSync(yutu).sync_playlists()
+        item_calls = [kwargs for resource, _, kwargs in calls if resource == "playlistItem"]
+        assert item_calls and all(kw["parts"] == "snippet,contentDetails" for kw in item_calls)
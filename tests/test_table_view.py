@@ -0,0 +1,81 @@
+"""測試 table_view 模組"""
+
+import io
+
+from rich.console import Console
+
+from yutu_cli.utils.table_view import Column, TableView, browse, handle_key, plain_text
+
+
+def _view(count: int, page_size: int = 10, **kwargs) -> tuple[TableView, list[int]]:
+    """建立記錄格式化呼叫的表格"""
+    calls: list[int] = []
+
+    def row(index: int, item: str) -> tuple[str, str]:
+        calls.append(index)
+        return str(index), item
+
+    items = [f"影片 {i}" for i in range(count)]
+    view = TableView(items, [Column("#"), Column("標題", max_width=8)], row, page_size=page_size, **kwargs)
+    return view, calls
+
+
+class TestPlainText:
+    """測試 plain_text 函式"""
+
+    def test_strips_markup(self):
+        assert plain_text("[green]影片[/green]") == "影片"
+
+    def test_plain(self):
+        assert plain_text("abc") == "abc"
+
+
+class TestTableView:
+    """測試 TableView 類別"""
+
+    def test_formats_only_visible_and_sampled_rows(self):
+        view, calls = _view(100_000, sample_size=50)
+        table = view.render()
+        assert table.row_count == 10
+        assert len(set(calls)) <= 60
+
+    def test_paging_clamps(self):
+        view, _ = _view(25)
+        assert view.page_count == 3
+        view.go_to(99)
+        assert view.visible_indices() == [20, 21, 22, 23, 24]
+        view.go_to(-1)
+        assert view.page == 0
+
+    def test_widths_from_sample_capped(self):
+        view, _ = _view(1000, sample_size=20)
+        assert view.sample_indices()[-1] == 999
+        assert view.column_widths() == [len("1000"), 8]
+
+    def test_filter(self):
+        view, _ = _view(200)
+        assert view.set_filter("影片 19") == 11  # 19, 190-199
+        assert view.visible_indices()[0] == 19
+        assert "篩選：影片 19" in view.caption()
+        view.set_filter("")
+        assert view.total == 200
+
+    def test_handle_key(self):
+        view, _ = _view(30)
+        assert handle_key(view, "n") == "next"
+        assert handle_key(view, "\x1b[C") == "next"
+        assert view.page == 2
+        assert handle_key(view, "^") == "first"
+        assert view.page == 0
+        assert handle_key(view, "G") == "last"
+        assert view.page == 2
+        assert handle_key(view, "q") == "quit"
+        assert handle_key(view, "x") == ""
+
+    def test_browse_non_terminal_prints_first_page(self):
+        view, _ = _view(50)
+        buffer = io.StringIO()
+        browse(view, Console(file=buffer, width=80))
+        output = buffer.getvalue()
+        assert "影片 9" in output and "影片 10" not in output
+        assert "共 50 筆" in output
@@ -0,0 +1,145 @@
+"""測試 tracing 模組與 YutuCLI 的追蹤區段"""
+
+import io
+import json
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from yutu_cli.__main__ import main
+from yutu_cli.config import reset_config
+from yutu_cli.testing import fake_yutu
+from yutu_cli.utils import tracing
+from yutu_cli.utils import yutu as yutu_module
+from yutu_cli.utils.tracing import (
+    COMMAND_CATEGORY,
+    Tracer,
+    annotate,
+    disable_tracing,
+    enable_tracing,
+    percentile,
+    span,
+    traced,
+)
+from yutu_cli.utils.yutu import YutuCLI
+
+
+@pytest.fixture
+def tracer():
+    tracer = enable_tracing(at_exit=False)
+    yield tracer
+    disable_tracing()
+
+
+class TestDisabled:
+    """測試未啟用時的行為"""
+
+    def test_span_is_shared_noop(self):
+        assert tracing.get_tracer() is None
+        with span("a") as first, span("b") as second:
+            first.set(x=1)
+            annotate(y=2)
+        assert first is second
+
+    def test_traced_passes_through(self):
+        @traced("ui")
+        def render(value):
+            return value * 2
+
+        assert render(21) == 42
+        assert render.__name__ == "render"
+
+    def test_overhead_is_negligible(self):
+        start = time.perf_counter()
+        for _ in range(100_000):
+            with span("noop", COMMAND_CATEGORY):
+                pass
+        assert time.perf_counter() - start < 0.5
+
+
+class TestTracer:
+    """測試 Tracer 類別"""
+
+    def test_nested_spans_report_phase_durations(self, tracer):
+        with span("video.list", COMMAND_CATEGORY, argv=["yutu"]) as current:
+            with span("wait", "yutu.phase"):
+                time.sleep(0.01)
+            annotate(exit_code=0)
+            current.set(success=True)
+        wait, command = tracer.events
+        assert wait["name"] == "wait" and command["name"] == "video.list"
+        assert command["args"]["wait_ms"] >= 10
+        assert command["args"]["exit_code"] == 0
+        assert command["ts"] <= wait["ts"] and command["dur"] >= wait["dur"]
+
+    def test_error_is_recorded(self, tracer):
+        with pytest.raises(KeyError):
+            with span("menu.videos", "menu"):
+                raise KeyError("x")
+        assert tracer.events[0]["args"]["error"] == "KeyError"
+
+    def test_summary(self):
+        tracer = Tracer()
+        for ms in range(1, 21):
+            tracer.events.append({
+                "name": "playlist.list", "cat": COMMAND_CATEGORY, "dur": ms * 1000,
+                "args": {"success": ms != 20, "cached": ms <= 5},
+            })
+        tracer.events.append({"name": "parse", "cat": "yutu.phase", "dur": 1, "args": {}})
+        (row,) = tracer.summary()
+        assert row["count"] == 20 and row["failed"] == 1 and row["cached"] == 5
+        assert row["p50_ms"] == 10 and row["p95_ms"] == 19
+        assert "playlist.list" in tracer.format_summary()
+
+    def test_percentile(self):
+        assert percentile([], 0.5) == 0
+        assert percentile([5.0], 0.95) == 5.0
+
+    def test_chrome_trace_file(self, tmp_path, tracer):
+        with span("render", "ui"):
+            pass
+        stream = io.StringIO()
+        tracer.path = tmp_path / "trace.json"
+        tracer.finish(stream)
+        trace = json.loads(tracer.path.read_text())
+        phases = {event["ph"] for event in trace["traceEvents"]}
+        assert phases == {"M", "X"}
+        assert "追蹤檔已寫入" in stream.getvalue()
+
+
+@pytest.fixture
+def fake_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_CLI_PATH", fake_yutu.__file__)
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    reset_config()
+    yield
+    reset_config()
+
+
+class TestYutuCLITracing:
+    """測試 YutuCLI.run 的追蹤區段"""
+
+    def test_run_span(self, fake_env, tracer):
+        result = YutuCLI().list_playlist_items("PL1")
+        assert result.success
+        events = {event["name"]: event for event in tracer.events}
+        assert {"spawn", "wait", "parse", "playlistItem.list"} <= set(events)
+        args = events["playlistItem.list"]["args"]
+        assert args["argv"][1:3] == ["playlistItem", "list"]
+        assert args["exit_code"] == 0 and args["success"] is True
+        assert args["bytes_out"] == events["parse"]["args"]["bytes"] > 0
+        assert all(f"{phase}_ms" in args for phase in ("spawn", "wait", "parse"))
+
+    def test_trace_option(self, fake_env, tmp_path, monkeypatch):
+        monkeypatch.setattr(yutu_module, "_yutu", None)
+        path = tmp_path / "trace.json"
+        try:
+            result = CliRunner().invoke(main, ["--trace", str(path), "get-my-channel"])
+            assert result.exit_code == 0
+            tracer = tracing.get_tracer()
+            assert tracer is not None and tracer.path == path
+            assert [row["name"] for row in tracer.summary()] == ["channel.list"]
+        finally:
+            disable_tracing()
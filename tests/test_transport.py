@@ -0,0 +1,127 @@
+"""測試 transport 模組"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from yutu_cli.config import reset_config
+from yutu_cli.utils import yutu as yutu_module
+from yutu_cli.testing import fake_yutu
+from yutu_cli.utils.transport import McpTransport, command_to_tool_call
+from yutu_cli.utils.yutu import YutuCLI
+
+FAKE_YUTU = Path(fake_yutu.__file__)
+
+
+@pytest.fixture
+def mcp_yutu(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_CLI_PATH", str(FAKE_YUTU))
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("YUTU_CACHE_ENABLED", "false")
+    monkeypatch.setenv("YUTU_TRANSPORT", "mcp")
+    reset_config()
+    yutu = YutuCLI()
+    yield yutu
+    yutu.close()
+    reset_config()
+
+
+class TestCommandToToolCall:
+    """測試 command_to_tool_call 函式"""
+
+    def test_basic(self):
+        cmd = ["yutu", "playlist", "list", "--output", "json", "--mine", "true", "--maxResults", "0"]
+        assert command_to_tool_call(cmd) == ("playlist-list", {"mine": True, "maxResults": 0})
+
+    def test_string_values(self):
+        cmd = ["yutu", "video", "list", "--ids", "a,b", "--parts", "snippet"]
+        assert command_to_tool_call(cmd) == ("video-list", {"ids": "a,b", "parts": "snippet"})
+
+    def test_numeric_text_stays_string(self):
+        cmd = ["yutu", "search", "list", "--q", "2024", "--maxResults", "10"]
+        assert command_to_tool_call(cmd) == ("search-list", {"q": "2024", "maxResults": 10})
+        cmd = ["yutu", "playlistItem", "insert", "--title", "1984", "--position", "3"]
+        assert command_to_tool_call(cmd)[1] == {"title": "1984", "position": 3}
+
+    def test_boolean_text_stays_string(self):
+        cmd = ["yutu", "search", "list", "--q", "true", "--forMine", "true"]
+        assert command_to_tool_call(cmd) == ("search-list", {"q": "true", "forMine": True})
+        cmd = ["yutu", "commentThread", "insert", "--textOriginal", "false", "--videoId", "v1"]
+        assert command_to_tool_call(cmd)[1] == {"textOriginal": "false", "videoId": "v1"}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="假 yutu 依賴 shebang 執行")
+class TestMcpTransport:
+    """測試 McpTransport（使用假 yutu mcp 工作程序）"""
+
+    def test_calls_go_through_worker(self, mcp_yutu):
+        result = mcp_yutu.list_my_playlists()
+        assert result.success is True
+        assert len(result.data) == 5
+        details = mcp_yutu.get_video_details(["v0000000001", "v0000000002"])
+        assert [v["id"] for v in details.data["items"]] == ["v0000000001", "v0000000002"]
+        transport = mcp_yutu.transport
+        assert isinstance(transport, McpTransport)
+        assert transport.fallback_calls == 0
+        assert transport.restarts == 0
+
+    def test_concurrent_requests_multiplexed(self, mcp_yutu):
+        ids = [f"PLfake{n:06d}" for n in range(20)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(mcp_yutu.list_playlist_items, ids))
+        assert all(r.success for r in results)
+        assert [r.data[0]["snippet"]["playlistId"] for r in results] == ids
+        assert mcp_yutu.transport.fallback_calls == 0
+
+    def test_restart_after_crash(self, mcp_yutu, monkeypatch):
+        monkeypatch.setenv("FAKE_YUTU_CRASH_AFTER", "1")
+        assert mcp_yutu.list_my_playlists().success is True
+        # 第二次呼叫時工作程序當機：唯讀命令改用子程序
+        assert mcp_yutu.list_my_playlists().success is True
+        assert mcp_yutu.transport.fallback_calls == 1
+        # 下一次呼叫重新啟動工作程序
+        assert mcp_yutu.list_my_playlists().success is True
+        assert mcp_yutu.transport.restarts == 1
+
+    def test_non_json_output_uses_subprocess(self, mcp_yutu):
+        result = mcp_yutu.run("caption", "download", output_format="silent", id="c1")
+        assert result.success is True
+        assert mcp_yutu.transport.fallback_calls == 1
+
+    def test_worker_unavailable(self, mcp_yutu, tmp_path):
+        broken = tmp_path / "yutu"
+        broken.write_text(f"#!/bin/sh\n[ \"$1\" = mcp ] && exit 1\nexec {FAKE_YUTU} \"$@\"\n")
+        broken.chmod(0o755)
+        mcp_yutu.config.cli_path = broken
+        result = mcp_yutu.list_my_playlists()
+        assert result.success is True
+        assert mcp_yutu.transport.fallback_calls == 1
+
+
+class TestLazyTransport:
+    """測試延遲建立傳輸層"""
+
+    def test_concurrent_first_calls_create_one_transport(self, monkeypatch):
+        created = []
+
+        def slow_create(name, *, api_base_url=None):
+            time.sleep(0.05)
+            created.append(name)
+            return object()
+
+        monkeypatch.setattr(yutu_module, "create_transport", slow_create)
+        yutu = YutuCLI()
+        start = threading.Barrier(8)
+
+        def first_access(_):
+            start.wait()
+            return yutu.transport
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            transports = list(pool.map(first_access, range(8)))
+        assert len(created) == 1
+        assert all(t is transports[0] for t in transports)
@@ -0,0 +1,105 @@
+"""測試 video_catalog 模組"""
+
+import pytest
+
+from yutu_cli.utils.video_catalog import VideoCatalog, get_video_id
+from yutu_cli.utils.yutu import YutuResult
+
+
+def _video(video_id: str, title: str = "") -> dict:
+    return {
+        "id": {"kind": "youtube#video", "videoId": video_id},
+        "snippet": {"title": title or video_id},
+    }
+
+
+class FakeYutu:
+    """記錄呼叫次數的假 YutuCLI"""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = 0
+        self.requested = []
+
+    def list_my_videos(self, max_results=None, *, use_cache=True):
+        self.calls += 1
+        self.requested.append(max_results)
+        items = self.pages.pop(0) if len(self.pages) > 1 else self.pages[0]
+        return YutuResult(success=True, data={"items": items})
+
+
+class TestGetVideoId:
+    """測試 get_video_id 函式"""
+
+    def test_search_result(self):
+        assert get_video_id(_video("abc")) == "abc"
+
+    def test_video_resource(self):
+        assert get_video_id({"id": "abc"}) == "abc"
+
+    def test_missing(self):
+        assert get_video_id({}) == ""
+
+
+class TestVideoCatalog:
+    """測試 VideoCatalog 類別"""
+
+    def test_loads_once(self):
+        yutu = FakeYutu([[_video("a"), _video("b")]])
+        catalog = VideoCatalog(yutu, refresh_interval=3600)
+        for _ in range(10):
+            result = catalog.load()
+        assert yutu.calls == 1
+        assert [get_video_id(v) for v in result.data["items"]] == ["a", "b"]
+
+    def test_failed_load_not_cached(self):
+        yutu = FakeYutu([[]])
+        yutu.list_my_videos = lambda *a, **k: YutuResult(success=False, error="x")
+        catalog = VideoCatalog(yutu)
+        assert catalog.load().success is False
+        assert catalog.loaded is False
+
+    def test_merge_newest_first(self):
+        catalog = VideoCatalog(FakeYutu([[_video("a"), _video("b")]]))
+        catalog.load()
+        catalog.merge([_video("c"), _video("a", "新標題")])
+        items = catalog.load().data["items"]
+        assert [get_video_id(v) for v in items] == ["c", "a", "b"]
+        assert items[1]["snippet"]["title"] == "新標題"
+
+    def test_background_refresh(self):
+        yutu = FakeYutu([[_video("a")], [_video("b"), _video("a")]])
+        catalog = VideoCatalog(yutu, refresh_interval=0)
+        catalog.load()
+        catalog.load()  # 觸發背景更新
+        catalog._refresh_thread.join(timeout=5)
+        items = catalog.load().data["items"]
+        assert [get_video_id(v) for v in items][:2] == ["b", "a"]
+
+    def test_discard_and_invalidate(self):
+        yutu = FakeYutu([[_video("a"), _video("b")]])
+        catalog = VideoCatalog(yutu, refresh_interval=3600)
+        catalog.load()
+        catalog.discard("a")
+        assert [get_video_id(v) for v in catalog.load().data["items"]] == ["b"]
+        catalog.invalidate()
+        catalog.load()
+        assert yutu.calls == 2
+
+    def test_first_load_is_one_page(self):
+        page = [_video(f"v{n}") for n in range(50)]
+        yutu = FakeYutu([page, page + [_video("old")]])
+        catalog = VideoCatalog(yutu, refresh_interval=3600)
+        assert len(catalog.load().data["items"]) == 50
+        assert yutu.requested == [50]
+        assert catalog.complete is False
+        # 使用者要求時才載入全部，之後不再重新呼叫
+        assert len(catalog.load(complete=True).data["items"]) == 51
+        catalog.load(complete=True)
+        assert yutu.requested == [50, 0]
+        assert catalog.complete is True
+
+    def test_short_first_page_is_complete(self):
+        catalog = VideoCatalog(FakeYutu([[_video("a")]]))
+        catalog.load()
+        assert catalog.complete is True
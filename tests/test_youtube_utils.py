@@ -2,7 +2,7 @@
 
 import pytest
 
-from yutu_cli.utils.youtube_utils import extract_video_id
+from yutu_cli.utils.youtube_utils import extract_video_id, playlist_item_to_search_result
 
 
 class TestExtractVideoId:
@@ -46,3 +46,34 @@ class TestExtractVideoId:
         """測試含有特殊字元的 ID（- 和 _）"""
         video_id = "abc-_123XYZ"
         assert extract_video_id(video_id) == video_id
+
+
+class TestPlaylistItemToSearchResult:
+    """測試 playlist_item_to_search_result 函式"""
+
+    def test_uploads_item(self):
+        item = {
+            "id": "UUxxx",
+            "snippet": {
+                "title": "影片",
+                "channelTitle": "我的頻道",
+                "publishedAt": "2024-02-01T00:00:00Z",
+                "resourceId": {"videoId": "dQw4w9WgXcQ"},
+            },
+            "contentDetails": {
+                "videoId": "dQw4w9WgXcQ",
+                "videoPublishedAt": "2024-01-15T10:30:00Z",
+            },
+        }
+        result = playlist_item_to_search_result(item)
+        assert result["id"] == {"kind": "youtube#video", "videoId": "dQw4w9WgXcQ"}
+        assert result["snippet"]["title"] == "影片"
+        assert result["snippet"]["channelTitle"] == "我的頻道"
+        assert result["snippet"]["publishedAt"] == "2024-01-15T10:30:00Z"
+
+    def test_snippet_only(self):
+        """沒有 contentDetails 時改用 snippet.resourceId"""
+        item = {"snippet": {"resourceId": {"videoId": "abc"}, "publishedAt": "2024"}}
+        result = playlist_item_to_search_result(item)
+        assert result["id"]["videoId"] == "abc"
+        assert result["snippet"]["publishedAt"] == "2024"
@@ -2,7 +2,9 @@
 
 import pytest
 
-from yutu_cli.utils.yutu import YutuResult
+from yutu_cli.config import reset_config
+from yutu_cli.utils.retry import BACKEND_ERROR
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
 
 
 class TestYutuResult:
@@ -37,3 +39,94 @@ class TestYutuResult:
         assert result.data is None
         assert result.error is None
         assert result.raw_output == ""
+
+
+class FakeRunYutu(YutuCLI):
+    """以預先定義的回應取代 run 的 YutuCLI"""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = responses
+        self.calls = []
+
+    def run(self, resource, action, **kwargs):
+        self.calls.append((resource, action, kwargs))
+        return self.responses[(resource, action)](kwargs)
+
+
+@pytest.fixture
+def isolated_config(tmp_path, monkeypatch):
+    monkeypatch.setenv("YUTU_STATE_DIR", str(tmp_path))
+    reset_config()
+    yield
+    reset_config()
+
+
+def _uploads_item(video_id):
+    return {
+        "snippet": {"title": f"t-{video_id}", "resourceId": {"videoId": video_id}},
+        "contentDetails": {"videoId": video_id, "videoPublishedAt": "2024-01-01T00:00:00Z"},
+    }
+
+
+class TestListMyVideos:
+    """測試 list_my_videos 透過 uploads 播放清單列出影片"""
+
+    def _responses(self, uploads="UUmine"):
+        channel = {"items": [{"contentDetails": {"relatedPlaylists": {"uploads": uploads}}}]}
+        return {
+            ("channel", "list"): lambda kw: YutuResult(success=True, data=channel),
+            ("playlistItem", "list"): lambda kw: YutuResult(
+                success=True, data={"items": [_uploads_item("a"), _uploads_item("b")]}
+            ),
+            ("video", "list"): lambda kw: YutuResult(
+                success=True,
+                data={"items": [{"id": "a", "statistics": {"viewCount": "5"}}]},
+            ),
+            ("search", "list"): lambda kw: YutuResult(success=True, data={"items": []}),
+        }
+
+    def test_uses_uploads_playlist(self, isolated_config):
+        yutu = FakeRunYutu(self._responses())
+        result = yutu.list_my_videos()
+        assert result.success is True
+        items = result.data["items"]
+        assert [i["id"]["videoId"] for i in items] == ["a", "b"]
+        assert ("search", "list") not in [c[:2] for c in yutu.calls]
+        assert yutu.calls[1][2]["playlistId"] == "UUmine"
+
+    def test_uploads_id_resolved_once(self, isolated_config):
+        yutu = FakeRunYutu(self._responses())
+        yutu.list_my_videos()
+        yutu.list_my_videos()
+        assert [c[:2] for c in yutu.calls].count(("channel", "list")) == 1
+
+    def test_hydrate(self, isolated_config):
+        yutu = FakeRunYutu(self._responses())
+        result = yutu.list_my_videos(hydrate=True)
+        items = result.data["items"]
+        assert items[0]["statistics"] == {"viewCount": "5"}
+        assert "statistics" not in items[1]
+        assert result.missing_ids == ["b"]
+
+    def test_fallback_to_search(self, isolated_config):
+        yutu = FakeRunYutu(self._responses(uploads=""))
+        yutu.list_my_videos()
+        assert ("search", "list") in [c[:2] for c in yutu.calls]
+        # 頻道確實沒有 uploads 清單時只查詢一次
+        yutu.list_my_videos()
+        assert [c[:2] for c in yutu.calls].count(("channel", "list")) == 1
+
+    def test_failed_channel_lookup_is_returned(self, isolated_config):
+        responses = self._responses()
+        responses[("channel", "list")] = lambda kw: YutuResult(
+            success=False, error="503 backendError", error_kind=BACKEND_ERROR
+        )
+        yutu = FakeRunYutu(responses)
+        result = yutu.list_my_videos()
+        assert result.success is False and "backendError" in result.error
+        assert ("search", "list") not in [c[:2] for c in yutu.calls]
+        # 暫時性錯誤不保留，下次呼叫重新查詢
+        yutu.responses = self._responses()
+        assert yutu.list_my_videos().success
+        assert [c[:2] for c in yutu.calls].count(("channel", "list")) == 2
@@ -1,26 +1,231 @@
 #!/usr/bin/env python3
-"""Yutu Manager 入口點 - 支援 python -m yutu_cli 執行"""
+"""Yutu Manager 入口點 - 支援 python -m yutu_cli 執行
+
+啟動時只載入 click：設定（pydantic-settings）、YutuCLI 與互動式介面
+（questionary、rich、各功能模組）都在實際需要時才載入，
+因此 `--version`、`--help` 與腳本呼叫的子命令不需負擔互動式介面的載入成本。
+"""
+
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable
 
 import click
 
 from yutu_cli import __version__
-from yutu_cli.app import run_interactive
 
 
-@click.command()
+@cache
+def _operation_commands() -> dict[str, click.Command]:
+    """由 YutuCLI 的便捷方法建立的子命令（第一次查詢子命令時才建立）"""
+    from yutu_cli.scripting import operations
+
+    return {
+        name.replace("_", "-"): _operation_command(name, method)
+        for name, method in operations().items()
+    }
+
+
+class LazyGroup(click.Group):
+    """子命令在第一次需要時才建立的命令群組"""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *_operation_commands()})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        return super().get_command(ctx, cmd_name) or _operation_commands().get(cmd_name)
+
+
+def _load_config() -> Any:
+    """取得設定並套用命令列選項（延後到第一次需要設定時）"""
+    from yutu_cli.config import get_config
+
+    config = get_config()
+    ctx = click.get_current_context(silent=True)
+    overrides = ctx.find_root().obj if ctx is not None else None
+    for key, value in (overrides or {}).items():
+        setattr(config, key, value)
+    return config
+
+
+def _get_yutu() -> Any:
+    from yutu_cli.utils.yutu import get_yutu
+
+    _load_config()
+    return get_yutu()
+
+
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.version_option(version=__version__, prog_name="yutu-manager")
-@click.option("--non-interactive", "-n", is_flag=True, help="非互動模式（用於腳本）")
-def main(non_interactive: bool) -> None:
+@click.option("--non-interactive", "-n", is_flag=True, help="非互動模式（用於腳本；需搭配子命令）")
+@click.option("--no-cache", is_flag=True, help="停用回應快取")
+@click.option("--refresh", is_flag=True, help="忽略既有快取，重新取得資料")
+@click.option("--no-mirror", is_flag=True, help="不從本機鏡像讀取已同步的資料")
+@click.option(
+    "--transport",
+    type=click.Choice(["subprocess", "mcp", "api"]),
+    default=None,
+    help="命令傳輸方式（預設依 YUTU_TRANSPORT 設定）",
+)
+@click.option(
+    "--trace",
+    type=click.Path(dir_okay=False, writable=True),
+    envvar="YUTU_TRACE",
+    default=None,
+    help="記錄每個 yutu 呼叫的耗時，結束時寫入 Chrome trace 檔並輸出延遲摘要（YUTU_TRACE）",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="結束時寫入 Prometheus 指標（node-exporter textfile；預設依 YUTU_METRICS_TEXTFILE 設定）",
+)
+@click.pass_context
+def main(
+    ctx: click.Context,
+    non_interactive: bool,
+    no_cache: bool,
+    refresh: bool,
+    no_mirror: bool,
+    transport: str | None,
+    trace: str | None,
+    metrics_file: str | None,
+) -> None:
     """🎬 Yutu Manager - 互動式 YouTube 頻道管理工具
-    
-    透過友善的選單介面管理您的 YouTube 頻道，包括播放清單、影片、留言等功能。
+
+    不帶子命令時進入互動式選單，管理播放清單、影片、留言等功能。
+    子命令以 JSON 輸出結果，`exec` 從標準輸入批次執行 JSONL 操作，供腳本與排程使用。
     """
+    overrides: dict[str, Any] = {}
+    if no_cache:
+        overrides["cache_enabled"] = False
+    if refresh:
+        overrides["cache_refresh"] = True
+    if no_mirror:
+        overrides["mirror_enabled"] = False
+    if transport:
+        overrides["transport"] = transport
+    if metrics_file:
+        overrides["metrics_textfile"] = Path(metrics_file)
+    ctx.obj = overrides
+    if trace:
+        from yutu_cli.utils.tracing import enable_tracing
+
+        enable_tracing(trace)
+
+    if ctx.invoked_subcommand is not None:
+        return
     if non_interactive:
-        click.echo("非互動模式尚未實作")
+        click.echo(ctx.get_help())
         return
-    
+
+    # 互動式介面才需要 questionary 與 rich
+    from yutu_cli.app import run_interactive
+
+    _load_config()
     run_interactive()
 
 
+def _emit(line: str) -> None:
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+def _parse_params(pairs: tuple[str, ...]) -> dict[str, str]:
+    params = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise click.BadParameter(f"應為 KEY=VALUE：{pair}", param_hint="--param")
+        params[key] = value
+    return params
+
+
+def _operation_command(name: str, method: Callable) -> click.Command:
+    """由 YutuCLI 方法的簽章建立子命令（必要參數為引數，其餘為選項）"""
+    import inspect
+
+    from yutu_cli.scripting import describe_operation, parameter_types
+
+    params: list[click.Parameter] = []
+    lists: set[str] = set()
+    has_kwargs = False
+    for parameter in list(inspect.signature(method).parameters.values())[1:]:
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            has_kwargs = True
+            continue
+        base, is_list = parameter_types(parameter.annotation)
+        flag = parameter.name.replace("_", "-")
+        if parameter.default is inspect.Parameter.empty:
+            params.append(click.Argument([parameter.name], type=base))
+        elif base is bool:
+            params.append(click.Option(
+                [f"--{flag}/--no-{flag}", parameter.name], default=parameter.default, show_default=True,
+            ))
+        elif is_list:
+            lists.add(parameter.name)
+            params.append(click.Option([f"--{flag}", parameter.name], multiple=True, help="可重複指定"))
+        else:
+            params.append(click.Option(
+                [f"--{flag}", parameter.name], type=base, default=parameter.default,
+                show_default=parameter.default is not None,
+            ))
+    if has_kwargs:
+        params.append(click.Option(
+            ["--param", "-p", "extra"], multiple=True, metavar="KEY=VALUE", help="其他 yutu 參數（可重複指定）",
+        ))
+
+    def callback(**values) -> None:
+        import json
+
+        from yutu_cli.scripting import result_payload, to_result
+
+        extra = _parse_params(values.pop("extra", ()))
+        for key in lists:
+            values[key] = list(values[key]) or None
+        yutu = _get_yutu()
+        try:
+            result = to_result(method(yutu, **values, **extra))
+        finally:
+            yutu.close()
+        _emit(json.dumps(result_payload(result), ensure_ascii=False))
+        if not result.success:
+            sys.exit(1)
+
+    return click.Command(
+        name.replace("_", "-"),
+        params=params,
+        callback=callback,
+        help=describe_operation(name),
+    )
+
+
+@main.command("exec")
+@click.option(
+    "--workers", "-w", type=click.IntRange(min=1), default=None,
+    help="同時執行的操作數（預設為 YUTU_MAX_CONCURRENCY；有先後關係的操作請用 1）",
+)
+@click.option(
+    "--input", "-i", "source", type=click.File("r", encoding="utf-8"), default="-",
+    help="JSONL 操作檔（預設為標準輸入）",
+)
+def exec_command(workers: int | None, source) -> None:
+    """從 JSONL 批次執行操作，依輸入順序輸出 JSONL 結果
+
+    每行一個操作，例如 {"id": 1, "op": "add_to_playlist", "args": {"playlist_id": "PL...", "video_id": "..."}}；
+    任何操作失敗時結束代碼為 1。
+    """
+    from yutu_cli.scripting import execute_jsonl
+
+    yutu = _get_yutu()
+    try:
+        _, failed = execute_jsonl(yutu, source, _emit, workers=workers or yutu.config.max_concurrency)
+    finally:
+        yutu.close()
+    if failed:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -1,18 +1,39 @@
 """主應用程式 - 互動式選單"""
 
+import importlib
+from datetime import datetime, timezone
+from typing import Callable
+
 import questionary
 from rich.panel import Panel
 from rich.text import Text
 
 from yutu_cli import __version__
-from yutu_cli.commands.captions import captions_menu
-from yutu_cli.commands.channel import channel_menu
-from yutu_cli.commands.comments import comments_menu
-from yutu_cli.commands.playlists import playlist_menu
-from yutu_cli.commands.search import search_menu
-from yutu_cli.commands.videos import video_menu
 from yutu_cli.config import get_config
 from yutu_cli.utils.display import console, display_error, display_warning
+from yutu_cli.utils.quota import next_reset
+from yutu_cli.utils.tracing import span
+from yutu_cli.utils.yutu import get_yutu
+
+# 功能對應：選單值 -> (模組, 函式)，模組在第一次選擇時才載入
+MENU_HANDLERS: dict[str, tuple[str, str]] = {
+    "playlists": ("yutu_cli.commands.playlists", "playlist_menu"),
+    "videos": ("yutu_cli.commands.videos", "video_menu"),
+    "search": ("yutu_cli.commands.search", "search_menu"),
+    "channel": ("yutu_cli.commands.channel", "channel_menu"),
+    "comments": ("yutu_cli.commands.comments", "comments_menu"),
+    "captions": ("yutu_cli.commands.captions", "captions_menu"),
+    "sync": ("yutu_cli.commands.sync", "sync_menu"),
+}
+
+
+def load_handler(choice: str) -> Callable[[], bool] | None:
+    """載入選單值對應的功能函式"""
+    target = MENU_HANDLERS.get(choice)
+    if target is None:
+        return None
+    module, name = target
+    return getattr(importlib.import_module(module), name)
 
 
 def show_banner() -> None:
@@ -23,10 +44,24 @@ def show_banner() -> None:
     banner.append(f" v{__version__}", style="dim")
     banner.append("\n")
     banner.append("YouTube 頻道管理工具 - 互動式 CLI", style="dim")
+    banner.append("\n")
+    banner.append_text(quota_status())
     
     console.print(Panel(banner, border_style="cyan", padding=(0, 2)))
 
 
+def quota_status() -> Text:
+    """今日配額用量與剩餘預算"""
+    quota = get_yutu().quota
+    used, remaining = quota.used, quota.remaining
+    hours = (next_reset() - datetime.now(timezone.utc)).total_seconds() / 3600
+    style = "green" if remaining > quota.budget * 0.2 else "yellow" if remaining else "red"
+    status = Text("今日配額：", style="dim")
+    status.append(f"剩餘 {remaining:,}", style=f"bold {style}")
+    status.append(f" / 預算 {quota.budget:,}（已用 {used:,}，{hours:.1f} 小時後重置）", style="dim")
+    return status
+
+
 def check_config() -> bool:
     """檢查設定是否正確"""
     config = get_config()
@@ -45,6 +80,29 @@ def check_config() -> bool:
     return True
 
 
+def show_cache_summary() -> None:
+    """顯示本次執行的配額用量、錯誤重試與快取命中統計"""
+    quota = get_yutu().quota
+    if quota.session_used:
+        console.print(
+            f"[dim]本次使用 {quota.session_used:,} 配額，今日剩餘 {quota.remaining:,}[/dim]"
+        )
+    errors = get_yutu().error_stats
+    if errors.retries:
+        detail = "、".join(f"{kind} {count}" for kind, count in errors.retries.most_common())
+        console.print(
+            f"[dim]暫時性錯誤重試 {sum(errors.retries.values())} 次（{detail}），"
+            f"{errors.recovered} 個呼叫重試後成功[/dim]"
+        )
+    stats = get_yutu().cache_stats
+    if stats is None or stats.hits + stats.misses == 0:
+        return
+    console.print(
+        f"[dim]快取命中 {stats.hits} 次、未命中 {stats.misses} 次"
+        f"（命中率 {stats.hit_rate:.0%}）[/dim]"
+    )
+
+
 def run_interactive() -> None:
     """執行互動式介面"""
     show_banner()
@@ -63,20 +121,11 @@ def run_interactive() -> None:
         questionary.Choice("📺 頻道資訊", value="channel", shortcut_key="4"),
         questionary.Choice("💬 留言管理", value="comments", shortcut_key="5"),
         questionary.Choice("📝 字幕管理", value="captions", shortcut_key="6"),
+        questionary.Choice("🗄️  本機鏡像同步", value="sync", shortcut_key="7"),
         questionary.Separator("─────────────────"),
         questionary.Choice("🚪 離開", value="exit", shortcut_key="0"),
     ]
     
-    # 功能對應
-    handlers = {
-        "playlists": playlist_menu,
-        "videos": video_menu,
-        "search": search_menu,
-        "channel": channel_menu,
-        "comments": comments_menu,
-        "captions": captions_menu,
-    }
-    
     # 主迴圈
     while True:
         try:
@@ -89,20 +138,26 @@ def run_interactive() -> None:
             ).ask()
             
             if choice is None or choice == "exit":
+                show_cache_summary()
                 console.print("\n[cyan]感謝使用 Yutu Manager，再見！👋[/cyan]\n")
                 break
             
-            handler = handlers.get(choice)
+            handler = load_handler(choice)
             if handler:
                 console.print()  # 空行
-                continue_running = handler()
+                with span(f"menu.{choice}", "menu"):
+                    continue_running = handler()
                 console.print()  # 空行
                 
                 if not continue_running:
                     break
         
         except KeyboardInterrupt:
+            show_cache_summary()
             console.print("\n\n[cyan]感謝使用 Yutu Manager，再見！👋[/cyan]\n")
             break
         except Exception as e:
             display_error(f"發生錯誤：{e}")
+    
+    # 結束常駐的 yutu 工作程序（若有）
+    get_yutu().close()
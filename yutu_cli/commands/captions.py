@@ -6,6 +6,7 @@ from typing import Optional
 
 import questionary
 
+from yutu_cli.commands.pickers import select_my_video
 from yutu_cli.utils.display import (
     console,
     display_captions,
@@ -13,8 +14,10 @@ from yutu_cli.utils.display import (
     display_success,
     display_warning,
     format_language_name,
-    truncate,
 )
+from yutu_cli.utils.models import Caption
+from yutu_cli.utils.quota import quota_cost
+from yutu_cli.utils.video_catalog import get_video_id
 from yutu_cli.utils.yutu import YutuCLI, get_yutu
 
 
@@ -55,59 +58,9 @@ def captions_menu() -> bool:
             _delete_caption(yutu)
 
 
-def _select_my_video(yutu: YutuCLI, prompt: str = "選擇影片") -> Optional[dict]:
-    """讓使用者選擇自己的一部影片
-
-    Args:
-        yutu: YutuCLI 實例
-        prompt: 提示文字
-
-    Returns:
-        選中的影片資料，或 None
-    """
-    with console.status("[cyan]正在載入影片列表...[/cyan]"):
-        result = yutu.list_my_videos(max_results=50)
-
-    if not result.success:
-        display_error(result.error or "無法取得影片列表")
-        return None
-
-    items = result.data if isinstance(result.data, list) else result.data.get("items", [])
-    if not items:
-        display_warning("沒有找到任何影片")
-        return None
-
-    choices = [
-        questionary.Choice(
-            truncate(item.get("snippet", {}).get("title", "無標題"), 60),
-            value=item,
-        )
-        for item in items
-    ]
-    choices.append(questionary.Choice("⬅️  取消", value=None))
-
-    return questionary.select(prompt, choices=choices).ask()
-
-
-def _get_video_id_from_selection(video: dict) -> str:
-    """從搜尋結果中提取 video ID
-
-    Args:
-        video: 搜尋結果項目
-
-    Returns:
-        影片 ID
-    """
-    # 搜尋結果的 ID 結構：{"kind": "youtube#video", "videoId": "xxx"}
-    id_info = video.get("id", {})
-    if isinstance(id_info, dict):
-        return id_info.get("videoId", "")
-    return str(id_info)
-
-
 def _select_caption(
     yutu: YutuCLI, video_id: str, video_title: str
-) -> Optional[dict]:
+) -> Optional[Caption]:
     """讓使用者選擇一個字幕軌道
 
     Args:
@@ -125,20 +78,19 @@ def _select_caption(
         display_error(result.error or "無法取得字幕")
         return None
 
-    items = result.data if isinstance(result.data, list) else result.data.get("items", [])
-    if not items:
+    captions = result.models(Caption)
+    if not captions:
         display_warning("此影片沒有字幕")
         return None
 
-    display_captions(result.data, video_title)
+    display_captions(captions, video_title)
 
     choices = [
         questionary.Choice(
-            f"{format_language_name(item.get('snippet', {}).get('language', ''))} - "
-            f"{item.get('snippet', {}).get('name', '') or '（預設）'}",
-            value=item,
+            f"{format_language_name(caption.language)} - {caption.name or '（預設）'}",
+            value=caption,
         )
-        for item in items
+        for caption in captions
     ]
     choices.append(questionary.Choice("⬅️  取消", value=None))
 
@@ -147,11 +99,11 @@ def _select_caption(
 
 def _list_video_captions(yutu: YutuCLI) -> None:
     """列出影片的字幕"""
-    video = _select_my_video(yutu, "選擇要查看字幕的影片")
+    video = select_my_video("選擇要查看字幕的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     with console.status(f"[cyan]正在載入「{video_title}」的字幕...[/cyan]"):
@@ -166,19 +118,19 @@ def _list_video_captions(yutu: YutuCLI) -> None:
 
 def _download_caption(yutu: YutuCLI) -> None:
     """下載字幕"""
-    video = _select_my_video(yutu, "選擇要下載字幕的影片")
+    video = select_my_video("選擇要下載字幕的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     caption = _select_caption(yutu, video_id, video_title)
     if not caption:
         return
 
-    caption_id = caption.get("id", "")
-    lang_code = caption.get("snippet", {}).get("language", "unknown")
+    caption_id = caption.id
+    lang_code = caption.language or "unknown"
 
     # 選擇格式
     fmt = questionary.select(
@@ -235,13 +187,16 @@ def _download_caption(yutu: YutuCLI) -> None:
 
 def _upload_caption(yutu: YutuCLI) -> None:
     """上傳字幕"""
-    display_warning("上傳字幕將消耗 400 API 配額，請謹慎使用！")
+    cost = quota_cost("caption", "insert")
+    display_warning(
+        f"上傳字幕將消耗 {cost} API 配額（今日剩餘 {yutu.quota.remaining:,}），請謹慎使用！"
+    )
 
-    video = _select_my_video(yutu, "選擇要上傳字幕的影片")
+    video = select_my_video("選擇要上傳字幕的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     # 輸入字幕檔案路徑
@@ -306,7 +261,7 @@ def _upload_caption(yutu: YutuCLI) -> None:
     console.print()
 
     confirm = questionary.confirm(
-        "確定要上傳嗎？（消耗 400 API 配額）",
+        f"確定要上傳嗎？（消耗 {cost} API 配額）",
         default=False,
     ).ask()
 
@@ -324,20 +279,20 @@ def _upload_caption(yutu: YutuCLI) -> None:
 
 def _delete_caption(yutu: YutuCLI) -> None:
     """刪除字幕"""
-    video = _select_my_video(yutu, "選擇要刪除字幕的影片")
+    video = select_my_video("選擇要刪除字幕的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     caption = _select_caption(yutu, video_id, video_title)
     if not caption:
         return
 
-    caption_id = caption.get("id", "")
-    lang_code = caption.get("snippet", {}).get("language", "")
-    caption_name = caption.get("snippet", {}).get("name", "") or "（預設）"
+    caption_id = caption.id
+    lang_code = caption.language
+    caption_name = caption.name or "（預設）"
 
     # 確認刪除
     display_warning("刪除字幕後無法復原！")
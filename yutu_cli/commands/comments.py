@@ -4,6 +4,7 @@ from typing import Optional
 
 import questionary
 
+from yutu_cli.commands.pickers import select_my_video
 from yutu_cli.utils.display import (
     console,
     display_comment_detail,
@@ -13,6 +14,9 @@ from yutu_cli.utils.display import (
     display_warning,
     truncate,
 )
+from yutu_cli.utils.models import CommentThread
+from yutu_cli.utils.quota import quota_cost
+from yutu_cli.utils.video_catalog import get_video_id
 from yutu_cli.utils.yutu import YutuCLI, get_yutu
 
 
@@ -53,59 +57,15 @@ def comments_menu() -> bool:
             _moderate_comment(yutu)
 
 
-def _select_my_video(yutu: YutuCLI, prompt: str = "選擇影片") -> Optional[dict]:
-    """讓使用者選擇自己的一部影片
-
-    Args:
-        yutu: YutuCLI 實例
-        prompt: 提示文字
-
-    Returns:
-        選中的影片資料，或 None
-    """
-    with console.status("[cyan]正在載入影片列表...[/cyan]"):
-        result = yutu.list_my_videos(max_results=50)
-
-    if not result.success:
-        display_error(result.error or "無法取得影片列表")
-        return None
-
-    items = result.data if isinstance(result.data, list) else result.data.get("items", [])
-    if not items:
-        display_warning("沒有找到任何影片")
-        return None
-
-    choices = [
-        questionary.Choice(
-            truncate(item.get("snippet", {}).get("title", "無標題"), 60),
-            value=item,
-        )
-        for item in items
-    ]
-    choices.append(questionary.Choice("⬅️  取消", value=None))
-
-    return questionary.select(prompt, choices=choices).ask()
-
-
-def _get_video_id_from_selection(video: dict) -> str:
-    """從搜尋結果中提取 video ID
-
-    Args:
-        video: 搜尋結果項目
-
-    Returns:
-        影片 ID
-    """
-    # 搜尋結果的 ID 結構：{"kind": "youtube#video", "videoId": "xxx"}
-    id_info = video.get("id", {})
-    if isinstance(id_info, dict):
-        return id_info.get("videoId", "")
-    return str(id_info)
+def _comment_choice(thread: CommentThread, width: int) -> questionary.Choice:
+    """評論串的選項（作者與內容摘要）"""
+    comment = thread.comment
+    return questionary.Choice(f"{truncate(comment.author, 15)} - {truncate(comment.text, width)}", value=thread)
 
 
 def _select_comment(
     yutu: YutuCLI, video_id: str, video_title: str
-) -> Optional[dict]:
+) -> Optional[CommentThread]:
     """讓使用者選擇一則評論
 
     Args:
@@ -123,21 +83,14 @@ def _select_comment(
         display_error(result.error or "無法取得評論")
         return None
 
-    items = result.data if isinstance(result.data, list) else result.data.get("items", [])
-    if not items:
+    threads = result.models(CommentThread)
+    if not threads:
         display_warning("此影片沒有評論")
         return None
 
-    display_comments(result.data, video_title)
+    display_comments(threads, video_title)
 
-    choices = [
-        questionary.Choice(
-            f"{truncate(item.get('snippet', {}).get('topLevelComment', {}).get('snippet', {}).get('authorDisplayName', ''), 15)} - "
-            f"{truncate(item.get('snippet', {}).get('topLevelComment', {}).get('snippet', {}).get('textDisplay', ''), 40)}",
-            value=item,
-        )
-        for item in items
-    ]
+    choices = [_comment_choice(thread, 40) for thread in threads]
     choices.append(questionary.Choice("⬅️  取消", value=None))
 
     return questionary.select("選擇評論", choices=choices).ask()
@@ -164,11 +117,11 @@ def _get_my_channel_id(yutu: YutuCLI) -> Optional[str]:
 
 def _list_video_comments(yutu: YutuCLI) -> None:
     """列出影片的評論"""
-    video = _select_my_video(yutu, "選擇要查看評論的影片")
+    video = select_my_video("選擇要查看評論的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     with console.status(f"[cyan]正在載入「{video_title}」的評論...[/cyan]"):
@@ -178,10 +131,10 @@ def _list_video_comments(yutu: YutuCLI) -> None:
         display_error(result.error or "無法取得評論")
         return
 
-    items = result.data if isinstance(result.data, list) else result.data.get("items", [])
-    display_comments(result.data, video_title)
+    threads = result.models(CommentThread)
+    display_comments(threads, video_title)
 
-    if not items:
+    if not threads:
         return
 
     # 詢問是否查看詳情
@@ -191,14 +144,7 @@ def _list_video_comments(yutu: YutuCLI) -> None:
     ).ask()
 
     if view_detail:
-        choices = [
-            questionary.Choice(
-                f"{truncate(item.get('snippet', {}).get('topLevelComment', {}).get('snippet', {}).get('authorDisplayName', ''), 15)} - "
-                f"{truncate(item.get('snippet', {}).get('topLevelComment', {}).get('snippet', {}).get('textDisplay', ''), 30)}",
-                value=item,
-            )
-            for item in items
-        ]
+        choices = [_comment_choice(thread, 30) for thread in threads]
         choices.append(questionary.Choice("⬅️  取消", value=None))
 
         selected = questionary.select("選擇要查看的評論", choices=choices).ask()
@@ -208,11 +154,11 @@ def _list_video_comments(yutu: YutuCLI) -> None:
 
 def _reply_to_comment(yutu: YutuCLI) -> None:
     """回覆評論"""
-    video = _select_my_video(yutu, "選擇要回覆評論的影片")
+    video = select_my_video("選擇要回覆評論的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     comment = _select_comment(yutu, video_id, video_title)
@@ -223,8 +169,7 @@ def _reply_to_comment(yutu: YutuCLI) -> None:
     display_comment_detail(comment, include_replies=True)
 
     # 取得父評論 ID
-    top_comment = comment.get("snippet", {}).get("topLevelComment", {})
-    parent_id = top_comment.get("id")
+    parent_id = comment.comment.id
 
     # 輸入回覆內容
     reply_text = questionary.text(
@@ -244,7 +189,8 @@ def _reply_to_comment(yutu: YutuCLI) -> None:
 
     # 確認送出
     confirm = questionary.confirm(
-        "確定要發送回覆嗎？（消耗 50 API 配額）",
+        f"確定要發送回覆嗎？（消耗 {quota_cost('comment', 'insert')} API 配額，"
+        f"今日剩餘 {yutu.quota.remaining:,}）",
         default=True,
     ).ask()
 
@@ -262,11 +208,11 @@ def _reply_to_comment(yutu: YutuCLI) -> None:
 
 def _delete_comment(yutu: YutuCLI) -> None:
     """刪除評論"""
-    video = _select_my_video(yutu, "選擇要刪除評論的影片")
+    video = select_my_video("選擇要刪除評論的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     comment = _select_comment(yutu, video_id, video_title)
@@ -277,9 +223,8 @@ def _delete_comment(yutu: YutuCLI) -> None:
     display_comment_detail(comment, include_replies=False)
 
     # 取得評論 ID
-    top_comment = comment.get("snippet", {}).get("topLevelComment", {})
-    comment_id = top_comment.get("id")
-    author = top_comment.get("snippet", {}).get("authorDisplayName", "")
+    comment_id = comment.comment.id
+    author = comment.comment.author
 
     # 確認刪除
     display_warning("刪除評論後無法復原！")
@@ -302,11 +247,11 @@ def _delete_comment(yutu: YutuCLI) -> None:
 
 def _moderate_comment(yutu: YutuCLI) -> None:
     """審核評論"""
-    video = _select_my_video(yutu, "選擇要審核評論的影片")
+    video = select_my_video("選擇要審核評論的影片")
     if not video:
         return
 
-    video_id = _get_video_id_from_selection(video)
+    video_id = get_video_id(video)
     video_title = video.get("snippet", {}).get("title", "")
 
     comment = _select_comment(yutu, video_id, video_title)
@@ -317,8 +262,7 @@ def _moderate_comment(yutu: YutuCLI) -> None:
     display_comment_detail(comment, include_replies=False)
 
     # 取得評論 ID
-    top_comment = comment.get("snippet", {}).get("topLevelComment", {})
-    comment_id = top_comment.get("id")
+    comment_id = comment.comment.id
 
     # 選擇審核狀態
     status = questionary.select(
@@ -0,0 +1,67 @@
+"""共用選擇器 - 供各功能選單挑選影片"""
+
+from typing import Optional
+
+import questionary
+
+from yutu_cli.utils.display import console, display_error, display_warning, truncate
+from yutu_cli.utils.video_catalog import get_video_catalog
+
+# 「載入全部影片」選項的值
+LOAD_ALL = "load_all"
+
+
+def select_my_video(prompt: str = "選擇影片") -> Optional[dict]:
+    """讓使用者選擇自己的一部影片
+
+    影片清單來自工作階段共用的目錄，只有第一次需要呼叫 API；
+    預設只列出最新一頁，使用者選擇「載入全部影片」時才取得其餘頁面。
+
+    Args:
+        prompt: 提示文字
+
+    Returns:
+        選中的影片資料，或 None
+    """
+    catalog = get_video_catalog()
+    complete = False
+    while True:
+        if catalog.loaded and (catalog.complete or not complete):
+            result = catalog.load()
+        else:
+            with console.status("[cyan]正在載入影片列表...[/cyan]"):
+                result = catalog.load(complete=complete)
+
+        if not result.success:
+            display_error(result.error or "無法取得影片列表")
+            return None
+
+        items = result.data.get("items", []) if result.data else []
+        if not items:
+            display_warning("沒有找到任何影片")
+            return None
+
+        choices = [
+            questionary.Choice(
+                truncate(item.get("snippet", {}).get("title", "無標題"), 60),
+                value=item,
+            )
+            for item in items
+        ]
+        if not catalog.complete:
+            choices.append(
+                questionary.Choice(f"📥 載入全部影片（目前顯示最新 {len(items)} 部）", value=LOAD_ALL)
+            )
+        choices.append(questionary.Choice("⬅️  取消", value=None))
+
+        # 影片很多時開啟輸入篩選（篩選模式需停用 j/k 鍵移動）
+        searchable = len(items) > 20
+        choice = questionary.select(
+            prompt,
+            choices=choices,
+            use_search_filter=searchable,
+            use_jk_keys=not searchable,
+        ).ask()
+        if choice != LOAD_ALL:
+            return choice
+        complete = True
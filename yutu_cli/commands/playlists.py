@@ -3,18 +3,32 @@
 from typing import Optional
 
 import questionary
+from rich.table import Table
 
+from yutu_cli.utils.bulk_add import BulkAdder, ImportManifest, parse_video_refs, read_video_refs
 from yutu_cli.utils.display import (
     console,
     display_error,
     display_playlist_items,
+    display_playlist_items_progressive,
     display_playlists,
     display_success,
     display_warning,
 )
+from yutu_cli.utils.models import Playlist, PlaylistItem
+from yutu_cli.utils.playlist_cleanup import CleanupPlan, remove_entries
+from yutu_cli.utils.playlist_index import load_playlist_index
+from yutu_cli.utils.playlist_membership import get_playlist_membership
+from yutu_cli.utils.playlist_reorder import MOVE_COST, apply_moves, plan_moves, sort_items
+from yutu_cli.utils.playlist_sync import PlaylistSyncer, load_manifest
 from yutu_cli.utils.youtube_utils import extract_video_id
 from yutu_cli.utils.yutu import YutuCLI, get_yutu
 
+# 各功能需要的欄位（只查詢用得到的 part 與欄位）
+LISTING_FIELDS = ("id", "snippet.title", "contentDetails.itemCount", "status.privacyStatus")
+TITLE_FIELDS = ("id", "snippet.title")
+VIEW_COUNT_FIELDS = ("id", "statistics.viewCount")
+
 
 def playlist_menu() -> bool:
     """播放清單管理選單
@@ -29,8 +43,12 @@ def playlist_menu() -> bool:
         questionary.Choice("👁️  查看播放清單內容", value="view", shortcut_key="2"),
         questionary.Choice("➕ 新增播放清單", value="create", shortcut_key="3"),
         questionary.Choice("➕ 新增影片到播放清單", value="add_video", shortcut_key="4"),
-        questionary.Choice("➖ 從播放清單移除影片", value="remove_video", shortcut_key="5"),
-        questionary.Choice("🗑️  刪除播放清單", value="delete", shortcut_key="6"),
+        questionary.Choice("📥 批次加入影片（檔案/貼上）", value="bulk_add", shortcut_key="5"),
+        questionary.Choice("➖ 從播放清單移除影片", value="remove_video", shortcut_key="6"),
+        questionary.Choice("🧹 清理重複與失效影片", value="cleanup", shortcut_key="7"),
+        questionary.Choice("🔀 排序播放清單", value="reorder", shortcut_key="8"),
+        questionary.Choice("📑 依清單檔同步播放清單", value="sync", shortcut_key="9"),
+        questionary.Choice("🗑️  刪除播放清單", value="delete", shortcut_key="d"),
         questionary.Choice("⬅️  返回主選單", value="back", shortcut_key="0"),
     ]
     
@@ -53,40 +71,56 @@ def playlist_menu() -> bool:
             _create_playlist(yutu)
         elif action == "add_video":
             _add_video_to_playlist(yutu)
+        elif action == "bulk_add":
+            _bulk_add_videos(yutu)
         elif action == "remove_video":
             _remove_video_from_playlist(yutu)
+        elif action == "cleanup":
+            _cleanup_playlists(yutu)
+        elif action == "reorder":
+            _reorder_playlist(yutu)
+        elif action == "sync":
+            _sync_from_manifest(yutu)
         elif action == "delete":
             _delete_playlist(yutu)
+        
+        if action not in ("list", "view"):
+            # 播放清單可能已變更，影片所在清單的索引需重新載入
+            get_playlist_membership().invalidate()
+
+
+def _within_budget(yutu: YutuCLI, units: int) -> bool:
+    """預估用量是否在今日剩餘配額預算內（超出時顯示錯誤）"""
+    error = yutu.quota.check(units)
+    if error:
+        display_error(error)
+        return False
+    return True
 
 
-def _list_playlists(yutu: YutuCLI) -> Optional[list]:
-    """列出播放清單並回傳項目列表"""
+def _list_playlists(yutu: YutuCLI) -> Optional[list[Playlist]]:
+    """列出播放清單並回傳播放清單列表"""
     with console.status("[cyan]正在載入播放清單...[/cyan]"):
-        result = yutu.list_my_playlists()
+        result = yutu.list_my_playlists(fields=LISTING_FIELDS)
     
     if not result.success:
         display_error(result.error or "無法取得播放清單")
         return None
     
-    display_playlists(result.data)
-    # result.data 可能是 dict 或 list
-    if isinstance(result.data, list):
-        return result.data
-    return result.data.get("items", []) if result.data else []
+    playlists = result.models(Playlist)
+    display_playlists(playlists)
+    return playlists
 
 
-def _select_playlist(yutu: YutuCLI, prompt: str = "選擇播放清單") -> Optional[dict]:
+def _select_playlist(yutu: YutuCLI, prompt: str = "選擇播放清單") -> Optional[Playlist]:
     """讓使用者選擇一個播放清單"""
-    items = _list_playlists(yutu)
-    if not items:
+    playlists = _list_playlists(yutu)
+    if not playlists:
         return None
     
     choices = [
-        questionary.Choice(
-            f"{item.get('snippet', {}).get('title', '無標題')} ({item.get('contentDetails', {}).get('itemCount', 0)} 部影片)",
-            value=item,
-        )
-        for item in items
+        questionary.Choice(f"{playlist.title or '無標題'} ({playlist.item_count} 部影片)", value=playlist)
+        for playlist in playlists
     ]
     choices.append(questionary.Choice("⬅️  取消", value=None))
     
@@ -99,8 +133,18 @@ def _view_playlist(yutu: YutuCLI) -> None:
     if not playlist:
         return
     
-    playlist_id = playlist.get("id")
-    playlist_title = playlist.get("snippet", {}).get("title", "")
+    playlist_id = playlist.id
+    playlist_title = playlist.title
+    item_count = playlist.item_count
+    
+    # 大型播放清單改以串流讀取，邊解析邊顯示
+    if item_count > yutu.config.stream_threshold:
+        result = yutu.stream_playlist_items(playlist_id)
+        if result.success:
+            display_playlist_items_progressive(result.iter_items(), playlist_title)
+        if not result.success:
+            display_error(result.error or "無法取得播放清單內容")
+        return
     
     with console.status(f"[cyan]正在載入「{playlist_title}」...[/cyan]"):
         result = yutu.list_playlist_items(playlist_id)
@@ -163,8 +207,8 @@ def _add_video_to_playlist(yutu: YutuCLI) -> None:
     
     # 從網址提取 video ID
     video_id = extract_video_id(video_id.strip())
-    playlist_id = playlist.get("id")
-    playlist_title = playlist.get("snippet", {}).get("title", "")
+    playlist_id = playlist.id
+    playlist_title = playlist.title
     
     with console.status("[cyan]正在新增影片...[/cyan]"):
         result = yutu.add_to_playlist(playlist_id, video_id)
@@ -175,14 +219,133 @@ def _add_video_to_playlist(yutu: YutuCLI) -> None:
         display_error(result.error or "新增失敗")
 
 
+def _read_bulk_input() -> Optional[list[str]]:
+    """讓使用者提供影片清單（檔案或貼上），回傳影片 ID"""
+    source = questionary.select(
+        "影片清單來源：",
+        choices=[
+            questionary.Choice("📄 從檔案讀取（- 為標準輸入）", value="file"),
+            questionary.Choice("📋 貼上網址或 ID", value="paste"),
+        ],
+    ).ask()
+    if not source:
+        return None
+    
+    try:
+        if source == "file":
+            path = questionary.path("檔案路徑：").ask()
+            if not path:
+                return None
+            video_ids, invalid = read_video_refs(path.strip())
+        else:
+            text = questionary.text(
+                "貼上網址或 ID（每行一個，Esc 再按 Enter 完成）：",
+                multiline=True,
+            ).ask()
+            if not text:
+                return None
+            video_ids, invalid = parse_video_refs(text)
+    except OSError as e:
+        display_error(f"無法讀取檔案：{e}")
+        return None
+    
+    if invalid:
+        display_warning(f"略過 {len(invalid)} 個無法辨識的項目（例如：{invalid[0]}）")
+    if not video_ids:
+        display_warning("沒有找到任何影片 ID")
+        return None
+    return video_ids
+
+
+def _bulk_add_videos(yutu: YutuCLI) -> None:
+    """從檔案或貼上的清單批次加入影片（可中斷後續傳）"""
+    playlist = _select_playlist(yutu, "選擇目標播放清單")
+    if not playlist:
+        return
+    
+    video_ids = _read_bulk_input()
+    if not video_ids:
+        return
+    
+    playlist_id = playlist.id
+    playlist_title = playlist.title
+    manifest = ImportManifest.for_import(yutu.config.state_dir / "imports", playlist_id, video_ids)
+    if manifest.resumed:
+        console.print(
+            f"[cyan]接續上次中斷的匯入：已完成 {len(manifest.done)} / {len(video_ids)} 部[/cyan]"
+        )
+    
+    keep_order = questionary.confirm(
+        "依清單順序加入？（否則並行加入，較快但順序不固定）",
+        default=True,
+    ).ask()
+    if keep_order is None:
+        return
+    
+    adder = BulkAdder(
+        yutu,
+        playlist_id,
+        manifest,
+        max_workers=1 if keep_order else yutu.config.max_concurrency,
+        ledger=yutu.quota,
+    )
+    with console.status(f"[cyan]正在比對「{playlist_title}」現有內容...[/cyan]"):
+        todo = adder.plan()
+    if todo is None:
+        display_error("無法取得播放清單內容")
+        return
+    
+    console.print(
+        f"共 {len(video_ids)} 部：已在清單中 {adder.report.already_present} 部、"
+        f"先前已完成 {adder.report.resumed} 部、待加入 {len(todo)} 部"
+        f"（約 {len(todo) * 50} 配額）"
+    )
+    if adder.report.deferred:
+        display_warning(
+            f"今日剩餘配額預算（{yutu.quota.remaining:,}）只夠加入 {len(todo)} 部，"
+            f"其餘 {adder.report.deferred} 部留待配額重置後以相同清單再執行"
+        )
+    if not todo:
+        if not adder.report.deferred:
+            manifest.remove()
+            display_success("所有影片都已在播放清單中")
+        return
+    if not questionary.confirm("開始加入？", default=True).ask():
+        return
+    
+    try:
+        with console.status("[cyan]正在加入影片...[/cyan]") as status:
+            adder.progress = lambda done, total: status.update(
+                f"[cyan]正在加入影片... {done}/{total}[/cyan]"
+            )
+            report = adder.run(todo)
+    except KeyboardInterrupt:
+        display_warning("已中斷，下次以相同清單執行會從中斷處繼續")
+        return
+    
+    console.print(f"[dim]共呼叫 API {report.calls} 次[/dim]")
+    if report.success:
+        display_success(f"已將 {report.added} 部影片加入「{playlist_title}」")
+        if report.deferred:
+            display_warning(f"尚有 {report.deferred} 部待配額重置後加入")
+        return
+    if report.aborted:
+        display_error("配額已用盡或超出預算，已停止；下次以相同清單執行會從中斷處繼續")
+    for video_id, error in list(report.failed.items())[:5]:
+        display_error(f"{video_id}：{error}")
+    if len(report.failed) > 5:
+        display_warning(f"另有 {len(report.failed) - 5} 部影片失敗")
+    display_warning(f"已加入 {report.added} 部；重新執行可重試未完成的影片")
+
+
 def _remove_video_from_playlist(yutu: YutuCLI) -> None:
     """從播放清單移除影片"""
     playlist = _select_playlist(yutu, "選擇播放清單")
     if not playlist:
         return
     
-    playlist_id = playlist.get("id")
-    playlist_title = playlist.get("snippet", {}).get("title", "")
+    playlist_id = playlist.id
+    playlist_title = playlist.title
     
     # 取得播放清單項目
     with console.status(f"[cyan]正在載入「{playlist_title}」...[/cyan]"):
@@ -192,31 +355,21 @@ def _remove_video_from_playlist(yutu: YutuCLI) -> None:
         display_error(result.error or "無法取得播放清單內容")
         return
     
-    # result.data 可能是 dict 或 list
-    if isinstance(result.data, list):
-        items = result.data
-    else:
-        items = result.data.get("items", []) if result.data else []
+    items = result.models(PlaylistItem)
     if not items:
         display_warning("播放清單是空的")
         return
     
     # 讓使用者選擇要移除的影片
-    choices = [
-        questionary.Choice(
-            f"{item.get('snippet', {}).get('title', '無標題')}",
-            value=item,
-        )
-        for item in items
-    ]
+    choices = [questionary.Choice(item.title or "無標題", value=item) for item in items]
     choices.append(questionary.Choice("⬅️  取消", value=None))
     
     selected = questionary.select("選擇要移除的影片", choices=choices).ask()
     if not selected:
         return
     
-    video_title = selected.get("snippet", {}).get("title", "")
-    playlist_item_id = selected.get("id")  # 注意：這是 playlistItem ID
+    video_title = selected.title
+    playlist_item_id = selected.id  # 注意：這是 playlistItem ID
     
     # 確認刪除
     confirm = questionary.confirm(
@@ -236,15 +389,253 @@ def _remove_video_from_playlist(yutu: YutuCLI) -> None:
         display_error(result.error or "移除失敗")
 
 
+def _cleanup_playlists(yutu: YutuCLI) -> None:
+    """找出重複項目與已刪除/私人影片，預覽後批次移除"""
+    with console.status("[cyan]正在載入播放清單...[/cyan]"):
+        result = yutu.list_my_playlists(fields=TITLE_FIELDS)
+    if not result.success:
+        display_error(result.error or "無法取得播放清單")
+        return
+    playlists = result.models(Playlist)
+    if not playlists:
+        display_warning("沒有任何播放清單")
+        return
+    
+    choices = [questionary.Choice(f"📚 全部播放清單（{len(playlists)} 個）", value="*")]
+    choices += [
+        questionary.Choice(playlist.title or "無標題", value=playlist.id)
+        for playlist in playlists
+    ]
+    choices.append(questionary.Choice("⬅️  取消", value=None))
+    scope = questionary.select("要掃描哪個播放清單？", choices=choices).ask()
+    if not scope:
+        return
+    
+    titles = {playlist.id: playlist.title for playlist in playlists}
+    playlist_ids = list(titles) if scope == "*" else [scope]
+    with console.status(f"[cyan]正在掃描 {len(playlist_ids)} 個播放清單...[/cyan]"):
+        loaded = load_playlist_index(yutu, playlist_ids, use_cache=False)
+    for playlist_id, error in loaded.errors.items():
+        display_error(f"「{titles.get(playlist_id, playlist_id)}」：{error}")
+    
+    plan = CleanupPlan.from_index(loaded.index)
+    if not plan.entries:
+        display_success("沒有發現重複或失效的影片")
+        return
+    
+    table = Table(title="🧹 清理計畫", show_header=True, header_style="bold cyan")
+    table.add_column("播放清單", style="bold", max_width=30)
+    table.add_column("位置", justify="right", style="dim")
+    table.add_column("原因", justify="center")
+    table.add_column("標題", max_width=40)
+    table.add_column("Video ID", style="dim")
+    for entry in plan.entries[:100]:
+        reason = "[yellow]重複[/yellow]" if not entry.placeholder else "[red]已失效[/red]"
+        table.add_row(
+            titles.get(entry.playlist_id, entry.playlist_id),
+            str(entry.position + 1),
+            reason,
+            entry.title,
+            entry.video_id,
+        )
+    console.print(table)
+    if len(plan.entries) > 100:
+        console.print(f"[dim]...另有 {len(plan.entries) - 100} 項[/dim]")
+    
+    console.print(
+        f"重複 {len(plan.duplicates)} 項、已刪除/私人 {len(plan.placeholders)} 項；"
+        f"將呼叫 yutu {plan.calls} 次，約耗用 {plan.quota:,} 配額"
+    )
+    if not _within_budget(yutu, plan.quota):
+        return
+    if not questionary.confirm("確定要移除以上項目嗎？", default=False).ask():
+        return
+    
+    with console.status("[cyan]正在移除...[/cyan]") as status:
+        report = remove_entries(
+            yutu,
+            plan.entries,
+            progress=lambda done, total: status.update(f"[cyan]正在移除... {done}/{total}[/cyan]"),
+        )
+    
+    console.print(f"[dim]共呼叫 yutu {report.calls} 次[/dim]")
+    if report.success:
+        display_success(f"已移除 {len(report.removed)} 個項目")
+        return
+    for item_id, error in list(report.failed.items())[:5]:
+        display_error(f"{item_id}：{error}")
+    display_warning(f"已移除 {len(report.removed)} 項，{len(report.failed)} 項失敗")
+
+
+def _reorder_playlist(yutu: YutuCLI) -> None:
+    """依發布日期、觀看次數、標題或自訂清單排序播放清單（只移動必要的項目）"""
+    playlist = _select_playlist(yutu, "選擇要排序的播放清單")
+    if not playlist:
+        return
+    
+    key = questionary.select(
+        "排序方式：",
+        choices=[
+            questionary.Choice("📅 發布日期", value="published"),
+            questionary.Choice("👁️  觀看次數", value="views"),
+            questionary.Choice("🔤 標題", value="title"),
+            questionary.Choice("📄 自訂順序（檔案或貼上）", value="custom"),
+        ],
+    ).ask()
+    if not key:
+        return
+    
+    descending = False
+    custom = None
+    if key == "custom":
+        custom = _read_bulk_input()
+        if not custom:
+            return
+    else:
+        descending = questionary.select(
+            "順序：",
+            choices=[
+                questionary.Choice("由小到大（舊→新、A→Z）", value=False),
+                questionary.Choice("由大到小（新→舊、多→少）", value=True),
+            ],
+        ).ask()
+        if descending is None:
+            return
+    
+    playlist_id = playlist.id
+    playlist_title = playlist.title
+    with console.status(f"[cyan]正在載入「{playlist_title}」...[/cyan]"):
+        result = yutu.run(
+            "playlistItem", "list",
+            playlistId=playlist_id,
+            parts="snippet,contentDetails",
+            use_cache=False,
+        )
+        items = result.data if isinstance(result.data, list) else (result.data or {}).get("items", [])
+        views = None
+        if result.success and key == "views":
+            details = yutu.batch_video_details(
+                [item.get("contentDetails", {}).get("videoId", "") for item in items],
+                fields=VIEW_COUNT_FIELDS,
+            )
+            views = {
+                video.get("id", ""): int(video.get("statistics", {}).get("viewCount", 0) or 0)
+                for video in details.items
+            }
+    
+    if not result.success:
+        display_error(result.error or "無法取得播放清單內容")
+        return
+    if len(items) < 2:
+        display_warning("播放清單項目不足，無需排序")
+        return
+    
+    items.sort(key=lambda item: item.get("snippet", {}).get("position", 0))
+    current = [item.get("id", "") for item in items]
+    moves = plan_moves(current, sort_items(items, key, descending=descending, views=views, custom=custom))
+    if not moves:
+        display_success("播放清單已是目標順序")
+        return
+    
+    console.print(
+        f"共 {len(items)} 項，需移動 {len(moves)} 項"
+        f"（逐一重新排列需 {len(items)} 次），約耗用 {len(moves) * MOVE_COST:,} 配額"
+    )
+    if not _within_budget(yutu, len(moves) * MOVE_COST):
+        return
+    if not questionary.confirm("開始排序？", default=True).ask():
+        return
+    
+    with console.status("[cyan]正在排序...[/cyan]") as status:
+        report = apply_moves(
+            yutu, playlist_id, items, moves,
+            progress=lambda done, total: status.update(f"[cyan]正在排序... {done}/{total}[/cyan]"),
+        )
+    
+    if report.success:
+        display_success(f"已排序「{playlist_title}」（移動 {report.moved} 項）")
+    else:
+        display_error(
+            f"排序在第 {report.moved + 1}/{report.total} 次移動時失敗：{report.error}\n"
+            "重新執行會依目前的順序重新計算"
+        )
+
+
+def _sync_from_manifest(yutu: YutuCLI) -> None:
+    """讓播放清單與清單檔（JSON/YAML/CSV/文字）一致：先顯示差異，確認後套用"""
+    path = questionary.path("清單檔路徑（.json/.yaml/.csv/.txt）：").ask()
+    if not path:
+        return
+    
+    try:
+        manifest = load_manifest(path.strip())
+    except (OSError, ValueError) as e:
+        display_error(f"無法讀取清單檔：{e}")
+        return
+    if manifest.invalid:
+        display_warning(f"略過 {len(manifest.invalid)} 個無法辨識的項目（例如：{manifest.invalid[0]}）")
+    
+    playlist_id = manifest.playlist_id
+    playlist_title = manifest.title or playlist_id or ""
+    if not playlist_id:
+        playlist = _select_playlist(yutu, "選擇要同步的播放清單")
+        if not playlist:
+            return
+        playlist_id = playlist.id
+        playlist_title = playlist.title
+    
+    syncer = PlaylistSyncer(yutu, playlist_id)
+    with console.status(f"[cyan]正在比對「{playlist_title}」...[/cyan]"):
+        diff = syncer.diff(manifest.video_ids)
+    if diff is None:
+        display_error(syncer.report.errors[-1])
+        return
+    if diff.empty:
+        display_success(f"「{playlist_title}」已與清單檔一致")
+        return
+    
+    table = Table(title=f"📑 {playlist_title} 的差異", show_header=True, header_style="bold cyan")
+    table.add_column("動作", justify="center")
+    table.add_column("項目", max_width=60)
+    for video_id in diff.inserts[:20]:
+        table.add_row("[green]加入[/green]", video_id)
+    for entry in diff.deletes[:20]:
+        table.add_row("[red]移除[/red]", f"{entry.title}（{entry.video_id}）")
+    console.print(table)
+    console.print(
+        f"加入 {len(diff.inserts)} 部、移除 {len(diff.deletes)} 項、"
+        f"約移動 {diff.moves} 項；約耗用 {diff.quota:,} 配額"
+    )
+    if not _within_budget(yutu, diff.quota):
+        return
+    if not questionary.confirm("套用以上變更？", default=False).ask():
+        return
+    
+    with console.status("[cyan]正在同步...[/cyan]") as status:
+        syncer.progress = lambda message: status.update(f"[cyan]{message}[/cyan]")
+        report = syncer.apply(diff)
+    
+    console.print(
+        f"加入 {report.added} 部、移除 {report.removed} 項、移動 {report.moved} 項"
+        f"[dim]（共呼叫 yutu {report.calls} 次）[/dim]"
+    )
+    if report.success:
+        display_success(f"「{playlist_title}」已與清單檔一致")
+        return
+    for error in report.errors[:5]:
+        display_error(error)
+    display_warning("重新執行會從目前狀態繼續同步")
+
+
 def _delete_playlist(yutu: YutuCLI) -> None:
     """刪除播放清單"""
     playlist = _select_playlist(yutu, "選擇要刪除的播放清單")
     if not playlist:
         return
     
-    playlist_title = playlist.get("snippet", {}).get("title", "")
-    playlist_id = playlist.get("id")
-    video_count = playlist.get("contentDetails", {}).get("itemCount", 0)
+    playlist_title = playlist.title
+    playlist_id = playlist.id
+    video_count = playlist.item_count
     
     # 確認刪除
     display_warning(f"將刪除「{playlist_title}」（包含 {video_count} 部影片）")
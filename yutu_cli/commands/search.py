@@ -1,8 +1,16 @@
 """搜尋功能"""
 
+import time
+
 import questionary
 
-from yutu_cli.utils.display import console, display_error, display_search_results
+from yutu_cli.utils.display import (
+    console,
+    display_error,
+    display_local_search_hits,
+    display_search_results,
+    display_warning,
+)
 from yutu_cli.utils.yutu import YutuCLI, get_yutu
 
 
@@ -18,6 +26,7 @@ def search_menu() -> bool:
         questionary.Choice("🔍 搜尋影片", value="video", shortcut_key="1"),
         questionary.Choice("📋 搜尋播放清單", value="playlist", shortcut_key="2"),
         questionary.Choice("📺 搜尋頻道", value="channel", shortcut_key="3"),
+        questionary.Choice("🏠 搜尋我的頻道（本機，不耗配額）", value="local", shortcut_key="4"),
         questionary.Choice("⬅️  返回主選單", value="back", shortcut_key="0"),
     ]
     
@@ -34,6 +43,30 @@ def search_menu() -> bool:
         
         if action in ("video", "playlist", "channel"):
             _search(yutu, search_type=action)
+        elif action == "local":
+            _search_my_channel(yutu)
+
+
+def _search_my_channel(yutu: YutuCLI) -> None:
+    """以本機全文索引搜尋自己頻道的標題、說明、評論與字幕"""
+    mirror = yutu.get_mirror()
+    if mirror is not None and not mirror.index.available:
+        display_error("此 Python 的 SQLite 不支援 FTS5 全文索引")
+        return
+    if mirror is None or not len(mirror.index):
+        display_warning("本機索引是空的，請先從主選單執行「本機鏡像同步」")
+        return
+
+    console.print('[dim]支援 "完整片語" 與 字首*，多個關鍵字需同時符合[/dim]')
+    while True:
+        query = questionary.text("搜尋關鍵字（留空返回）：").ask()
+        if not query:
+            return
+
+        start = time.perf_counter()
+        hits = mirror.search(query, limit=50)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        display_local_search_hits(hits, query, elapsed_ms)
 
 
 def _search(yutu: YutuCLI, search_type: str = "video") -> None:
@@ -0,0 +1,113 @@
+"""本機鏡像同步功能"""
+
+from datetime import datetime
+
+import questionary
+from rich.table import Table
+
+from yutu_cli.utils.display import console, display_error, display_success, display_warning
+from yutu_cli.utils.sync import ChannelSync, SyncReport
+from yutu_cli.utils.yutu import YutuCLI, get_yutu
+
+
+def sync_menu() -> bool:
+    """本機鏡像選單
+
+    Returns:
+        True 繼續主選單，False 結束程式
+    """
+    yutu = get_yutu()
+
+    choices = [
+        questionary.Choice("🔄 增量同步", value="sync", shortcut_key="1"),
+        questionary.Choice("♻️  完整重新同步", value="full", shortcut_key="2"),
+        questionary.Choice("📊 查看鏡像狀態", value="status", shortcut_key="3"),
+        questionary.Choice("⬅️  返回主選單", value="back", shortcut_key="0"),
+    ]
+
+    while True:
+        action = questionary.select(
+            "🗄️  本機鏡像",
+            choices=choices,
+            instruction="輸入數字或使用 ↑↓ 選擇，Enter 確認",
+            use_shortcuts=True,
+        ).ask()
+
+        if action is None or action == "back":
+            return True
+
+        if action == "sync":
+            _sync(yutu, force=False)
+        elif action == "full":
+            _sync(yutu, force=True)
+        elif action == "status":
+            _show_status(yutu)
+
+
+def _sync(yutu: YutuCLI, force: bool) -> None:
+    """執行同步"""
+    captions = questionary.confirm(
+        "同步字幕列表？（每部新影片耗用 50 配額）",
+        default=False,
+    ).ask()
+    if captions is None:
+        return
+
+    try:
+        with console.status("[cyan]正在同步...[/cyan]") as status:
+            sync = ChannelSync(
+                yutu,
+                progress=lambda message: status.update(f"[cyan]{message}[/cyan]"),
+            )
+            report = sync.sync_all(force=force, captions=captions)
+    except OSError as e:
+        display_error(str(e))
+        return
+
+    _display_report(report)
+
+
+def _display_report(report: SyncReport) -> None:
+    """顯示同步結果"""
+    console.print(
+        f"新增影片 {report.videos_added} 部、移除 {report.videos_removed} 部；"
+        f"更新播放清單 {report.playlists_synced} 個（{report.playlist_items} 項）；"
+        f"更新 {report.comment_videos} 部影片的評論（{report.comment_threads} 串）；"
+        f"更新 {report.caption_videos} 部影片的字幕列表"
+    )
+    console.print(f"[dim]共呼叫 API {report.calls} 次[/dim]")
+
+    if report.success:
+        display_success("同步完成")
+    else:
+        for error in report.errors[:5]:
+            display_error(error)
+        if len(report.errors) > 5:
+            display_warning(f"另有 {len(report.errors) - 5} 個錯誤")
+
+
+def _show_status(yutu: YutuCLI) -> None:
+    """顯示鏡像內容統計"""
+    mirror = yutu.get_mirror()
+    if mirror is None or mirror.last_synced() is None:
+        display_warning("尚未同步，請先執行同步")
+        return
+
+    labels = {
+        "videos": "影片",
+        "playlists": "播放清單",
+        "playlist_items": "播放清單項目",
+        "comment_threads": "評論串",
+        "captions": "字幕軌道",
+    }
+    table = Table(title="🗄️  本機鏡像", show_header=True, header_style="bold magenta")
+    table.add_column("資料", style="cyan")
+    table.add_column("筆數", justify="right")
+    for key, count in mirror.counts().items():
+        table.add_row(labels.get(key, key), f"{count:,}")
+    console.print(table)
+
+    synced_at = datetime.fromtimestamp(mirror.last_synced()).strftime("%Y-%m-%d %H:%M")
+    console.print(f"[dim]最近同步：{synced_at}[/dim]")
+    if not yutu.config.mirror_enabled:
+        display_warning("鏡像讀取已停用（YUTU_MIRROR_ENABLED=false）")
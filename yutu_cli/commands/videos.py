@@ -4,6 +4,7 @@ from typing import Optional
 
 import questionary
 from rich.panel import Panel
+from rich.table import Table
 
 from yutu_cli.utils.display import (
     console,
@@ -15,9 +16,23 @@ from yutu_cli.utils.display import (
     format_date,
     format_duration,
 )
+from yutu_cli.utils.models import Video
+from yutu_cli.utils.playlist_membership import PlaylistMembership, get_playlist_membership
+from yutu_cli.utils.video_catalog import get_video_catalog
 from yutu_cli.utils.youtube_utils import extract_video_id
 from yutu_cli.utils.yutu import YutuCLI, get_yutu
 
+# 各功能需要的影片欄位（只查詢用得到的 part 與欄位）
+DETAIL_FIELDS = (
+    "id",
+    "snippet.title", "snippet.description", "snippet.channelTitle", "snippet.publishedAt",
+    "statistics.viewCount", "statistics.likeCount", "statistics.commentCount",
+    "contentDetails.duration", "contentDetails.definition",
+    "status.privacyStatus",
+)
+EDIT_FIELDS = ("id", "snippet.title", "snippet.description", "snippet.tags", "status.privacyStatus")
+TITLE_FIELDS = ("id", "snippet.title")
+
 
 def video_menu() -> bool:
     """影片管理選單
@@ -33,6 +48,8 @@ def video_menu() -> bool:
         questionary.Choice("✏️  編輯影片資訊", value="update", shortcut_key="3"),
         questionary.Choice("👍 評分影片", value="rate", shortcut_key="4"),
         questionary.Choice("🗑️  刪除影片", value="delete", shortcut_key="5"),
+        questionary.Choice("📚 查看影片所在的播放清單", value="membership", shortcut_key="6"),
+        questionary.Choice("🧹 從所有播放清單移除影片", value="unlist", shortcut_key="7"),
         questionary.Choice("⬅️  返回主選單", value="back", shortcut_key="0"),
     ]
 
@@ -57,18 +74,28 @@ def video_menu() -> bool:
             _rate_video(yutu)
         elif action == "delete":
             _delete_video(yutu)
+        elif action == "membership":
+            _show_video_playlists(yutu)
+        elif action == "unlist":
+            _remove_from_all_playlists(yutu)
+
 
+def _list_my_videos(yutu: YutuCLI, *, complete: bool = False) -> Optional[list]:
+    """列出我的影片（來自工作階段共用的影片目錄）
 
-def _list_my_videos(yutu: YutuCLI, max_results: Optional[int] = 50) -> Optional[list]:
-    """列出我的影片"""
+    預設只列出最新一頁，還有更多影片時詢問是否載入全部。
+    """
+    catalog = get_video_catalog()
     with console.status("[cyan]正在載入影片...[/cyan]"):
-        result = yutu.list_my_videos(max_results=max_results)
+        result = catalog.load(complete=complete)
     
     if not result.success:
         display_error(result.error or "無法取得影片列表")
         return None
     
     display_search_results(result.data)
+    if not catalog.complete and questionary.confirm("還有更多影片，要載入全部嗎？", default=False).ask():
+        return _list_my_videos(yutu, complete=True)
     if isinstance(result.data, list):
         return result.data
     return result.data.get("items", []) if result.data else []
@@ -87,47 +114,40 @@ def _view_video_details(yutu: YutuCLI) -> None:
     video_id = extract_video_id(video_id.strip())
     
     with console.status("[cyan]正在載入影片詳情...[/cyan]"):
-        result = yutu.get_video_details(video_id)
+        result = yutu.get_video_details(video_id, fields=DETAIL_FIELDS)
     
     if not result.success:
         display_error(result.error or "無法取得影片詳情")
         return
     
-    if isinstance(result.data, list):
-        items = result.data
-    else:
-        items = result.data.get("items", []) if result.data else []
-    if not items:
+    videos = result.models(Video)
+    if not videos:
         display_error("找不到此影片")
         return
     
-    video = items[0]
-    snippet = video.get("snippet", {})
-    stats = video.get("statistics", {})
-    content = video.get("contentDetails", {})
-    status = video.get("status", {})
+    video = videos[0]
     
     # 格式化資訊
-    title = snippet.get("title", "無標題")
-    description = snippet.get("description", "")[:500]
-    channel = snippet.get("channelTitle", "")
-    published = format_date(snippet.get("publishedAt", ""))
+    title = video.title or "無標題"
+    description = video.description[:500]
+    channel = video.channel_title
+    published = format_date(video.published_at)
     
-    views = format_count(stats.get("viewCount"))
-    likes = format_count(stats.get("likeCount"))
-    comments_count = format_count(stats.get("commentCount"))
+    views = format_count(video.view_count)
+    likes = format_count(video.like_count)
+    comments_count = format_count(video.comment_count)
     
-    duration = format_duration(content.get("duration"))
-    definition = content.get("definition", "").upper()
+    duration = format_duration(video.duration)
+    definition = video.definition.upper()
     
-    privacy = status.get("privacyStatus", "")
+    privacy = video.privacy_status
     privacy_display = {
         "public": "[green]公開[/green]",
         "unlisted": "[yellow]不公開[/yellow]",
         "private": "[red]私人[/red]",
     }.get(privacy, privacy)
     
-    video_url = f"https://youtu.be/{video.get('id', '')}"
+    video_url = f"https://youtu.be/{video.id}"
     
     panel_content = f"""[bold cyan]{title}[/bold cyan]
 [dim]{video_url}[/dim]
@@ -163,7 +183,7 @@ def _update_video(yutu: YutuCLI) -> None:
 
     # 先取得現有影片資訊
     with console.status("[cyan]正在載入影片資訊...[/cyan]"):
-        result = yutu.get_video_details(video_id)
+        result = yutu.get_video_details(video_id, fields=EDIT_FIELDS)
 
     if not result.success:
         display_error(result.error or "無法取得影片資訊")
@@ -273,6 +293,7 @@ def _update_video(yutu: YutuCLI) -> None:
         )
 
     if result.success:
+        get_video_catalog().invalidate()
         display_success("影片已更新！")
     else:
         display_error(result.error or "更新失敗")
@@ -291,7 +312,7 @@ def _delete_video(yutu: YutuCLI) -> None:
 
     # 先取得影片資訊以確認
     with console.status("[cyan]正在載入影片資訊...[/cyan]"):
-        result = yutu.get_video_details(video_id)
+        result = yutu.get_video_details(video_id, fields=TITLE_FIELDS)
 
     if not result.success:
         display_error(result.error or "無法取得影片資訊")
@@ -323,11 +344,97 @@ def _delete_video(yutu: YutuCLI) -> None:
         result = yutu.delete_video(video_id)
 
     if result.success:
+        get_video_catalog().discard(video_id)
         display_success(f"影片 [bold]{title}[/bold] 已刪除！")
+        # 索引已載入時才提示，不為此額外呼叫 API
+        membership = get_playlist_membership()
+        if membership.loaded and membership.find(video_id):
+            _unlist_video(membership, video_id)
     else:
         display_error(result.error or "刪除失敗")
 
 
+def _load_membership() -> Optional[PlaylistMembership]:
+    """載入播放清單成員索引（已載入時直接使用）"""
+    membership = get_playlist_membership()
+    if not membership.loaded:
+        with console.status("[cyan]正在建立播放清單索引...[/cyan]"):
+            result = membership.load()
+        if not result.success:
+            display_error(result.error or "無法取得播放清單")
+            return None
+    for playlist_id, error in membership.errors.items():
+        display_warning(f"「{membership.titles.get(playlist_id, playlist_id)}」未納入索引：{error}")
+    return membership
+
+
+def _ask_video_id() -> Optional[str]:
+    video_input = questionary.text(
+        "輸入影片 ID 或 YouTube 網址（留空返回）：",
+    ).ask()
+    if not video_input:
+        return None
+    return extract_video_id(video_input.strip())
+
+
+def _show_membership(membership: PlaylistMembership, video_id: str) -> bool:
+    """顯示影片所在的播放清單，回傳是否有任何項目"""
+    entries = membership.find(video_id)
+    if not entries:
+        console.print(f"[yellow]影片 {video_id} 不在任何播放清單中[/yellow]")
+        return False
+
+    table = Table(title=f"📚 影片 {video_id} 所在的播放清單", show_header=True, header_style="bold cyan")
+    table.add_column("播放清單", style="bold", max_width=40)
+    table.add_column("位置", justify="right", style="dim")
+    table.add_column("播放清單 ID", style="dim")
+    for entry in entries:
+        table.add_row(
+            membership.titles.get(entry.playlist_id, entry.playlist_id),
+            str(entry.position + 1),
+            entry.playlist_id,
+        )
+    console.print(table)
+    return True
+
+
+def _show_video_playlists(yutu: YutuCLI) -> None:
+    """查看影片出現在哪些播放清單"""
+    video_id = _ask_video_id()
+    if not video_id:
+        return
+    membership = _load_membership()
+    if membership is not None:
+        _show_membership(membership, video_id)
+
+
+def _remove_from_all_playlists(yutu: YutuCLI) -> None:
+    """將影片從所有播放清單移除"""
+    video_id = _ask_video_id()
+    if not video_id:
+        return
+    membership = _load_membership()
+    if membership is not None:
+        _unlist_video(membership, video_id)
+
+
+def _unlist_video(membership: PlaylistMembership, video_id: str) -> None:
+    """顯示影片所在的播放清單，確認後全部移除"""
+    if not _show_membership(membership, video_id):
+        return
+    count = len(membership.find(video_id))
+    if not questionary.confirm(f"確定要從播放清單移除這 {count} 個項目嗎？", default=False).ask():
+        return
+
+    with console.status("[cyan]正在移除...[/cyan]"):
+        report = membership.remove_everywhere(video_id)
+
+    for item_id, error in report.failed.items():
+        display_error(f"{item_id}：{error}")
+    if report.removed:
+        display_success(f"已移除 {len(report.removed)} 個項目（呼叫 yutu {report.calls} 次）")
+
+
 def _rate_video(yutu: YutuCLI) -> None:
     """評分影片"""
     video_input = questionary.text(
@@ -1,5 +1,6 @@
 """設定管理模組 - 處理環境變數和使用者偏好"""
 
+import hashlib
 import os
 from pathlib import Path
 from typing import Optional
@@ -45,6 +46,120 @@ class YutuConfig(BaseSettings):
         description="預設最大結果數（0 表示無限制）",
     )
     
+    # 執行設定
+    transport: str = Field(
+        default="subprocess",
+        description=(
+            "命令傳輸方式：subprocess（每次啟動 yutu）、mcp（常駐 yutu mcp 工作程序）"
+            "或 api（以 yutu 的 token 直接呼叫 YouTube Data API）"
+        ),
+    )
+    
+    api_base_url: str = Field(
+        default="https://youtube.googleapis.com/youtube/v3",
+        description="transport 為 api 時呼叫的 YouTube Data API 位址",
+    )
+    
+    command_timeout: int = Field(
+        default=120,
+        description="單一 yutu 命令的超時秒數",
+    )
+    
+    retry_attempts: int = Field(
+        default=3,
+        description="暫時性錯誤（5xx、速率限制、網路中斷、超時）的最多重試次數（0 表示不重試）",
+    )
+    
+    retry_backoff: float = Field(
+        default=1.0,
+        description="第一次重試前的最長等待秒數（之後每次加倍，並隨機取 0 到上限之間）",
+    )
+    
+    retry_max_backoff: float = Field(
+        default=30.0,
+        description="單次重試等待秒數上限",
+    )
+    
+    max_concurrency: int = Field(
+        default=8,
+        description="非同步執行時同時執行的 yutu 程序上限",
+    )
+    
+    stream_threshold: int = Field(
+        default=500,
+        description="播放清單影片數超過此值時改以串流方式讀取並逐段顯示",
+    )
+    
+    table_page_size: int = Field(
+        default=0,
+        description="表格每頁顯示的列數（0 表示依終端機高度自動決定）",
+    )
+    
+    # 配額設定
+    quota_daily_limit: int = Field(
+        default=10_000,
+        description="YouTube Data API 每日配額（於太平洋時間午夜重置）",
+    )
+    
+    quota_budget: int = Field(
+        default=0,
+        description="每日可使用的配額預算，超過時不送出呼叫（0 表示使用每日配額）",
+    )
+    
+    # 本機狀態（快取等）存放目錄
+    state_dir: Path = Field(
+        default=Path.home() / ".cache" / "yutu-manager",
+        description="本機狀態資料目錄",
+    )
+    
+    # 回應快取設定
+    cache_enabled: bool = Field(
+        default=True,
+        description="是否快取唯讀命令（list/getRating）的回應",
+    )
+    
+    cache_refresh: bool = Field(
+        default=False,
+        description="略過快取讀取，強制重新取得並更新快取",
+    )
+    
+    cache_max_entries: int = Field(
+        default=2000,
+        description="快取最多保留的回應數",
+    )
+    
+    cache_max_bytes: int = Field(
+        default=50 * 1024 * 1024,
+        description="快取總容量上限（位元組）",
+    )
+    
+    cache_ttls: dict[str, int] = Field(
+        default_factory=dict,
+        description="各資源快取存活秒數覆寫（例如 {\"playlist\": 60}）",
+    )
+    
+    # 本機鏡像設定
+    mirror_enabled: bool = Field(
+        default=True,
+        description="已同步的資料是否直接由本機鏡像回應（需先執行同步）",
+    )
+    
+    mirror_max_age: int = Field(
+        default=3600,
+        description="鏡像資料的有效秒數，超過後改回呼叫 API 直到下次同步（0 表示不過期）",
+    )
+    
+    # 指標匯出設定
+    metrics_textfile: Optional[Path] = Field(
+        default=None,
+        description="結束時寫入 Prometheus 指標的檔案（node-exporter textfile collector 目錄下的 .prom）",
+    )
+    
+    metrics_port: Optional[int] = Field(
+        default=None,
+        description="在本機此連接埠提供 Prometheus /metrics 端點",
+    )
+    
     @property
     def credential_path(self) -> Path:
         """取得憑證檔案路徑"""
@@ -55,6 +170,24 @@ class YutuConfig(BaseSettings):
         """取得 token 快取路徑"""
         return self.cache_token or self.root / "youtube.token.json"
     
+    @property
+    def cache_path(self) -> Path:
+        """取得回應快取資料庫路徑"""
+        return self.state_dir / "responses.sqlite"
+    
+    @property
+    def mirror_path(self) -> Path:
+        """取得頻道鏡像資料庫路徑（依憑證區分帳號）"""
+        identity = f"{self.credential_path}|{self.token_path}"
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:12]
+        return self.state_dir / f"mirror-{digest}.sqlite"
+    
+    @property
+    def quota_path(self) -> Path:
+        """取得配額帳本路徑（配額依憑證所屬的專案計算）"""
+        digest = hashlib.sha256(str(self.credential_path).encode("utf-8")).hexdigest()[:12]
+        return self.state_dir / f"quota-{digest}.json"
+    
     def get_env_dict(self) -> dict[str, str]:
         """取得執行 yutu 時需要的環境變數"""
         return {
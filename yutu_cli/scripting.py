@@ -0,0 +1,175 @@
+"""非互動模式 - 以 JSON 輸出執行 YutuCLI 的便捷方法，並批次執行 JSONL 操作
+
+每個操作對應 YutuCLI 的一個便捷方法（或 `run`），結果以一行 JSON 表示：
+
+    {"index": 0, "id": "a1", "op": "add_to_playlist", "success": true, "data": {...}}
+
+`execute_jsonl` 從輸入逐行讀取操作，以執行緒池並行執行，並依輸入順序輸出結果。
+同時執行的操作最多為 workers 的兩倍，輸入再大記憶體用量也固定。
+"""
+
+import collections.abc
+import inspect
+import json
+import types
+import typing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+from yutu_cli.utils.batching import BatchResult
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
+
+# 不屬於便捷方法的公開方法（需要互動、回傳非結果物件或只用於資源管理）
+EXCLUDED_METHODS = frozenset({"get_mirror", "close", "stream", "flush_metrics"})
+
+
+def operations() -> dict[str, Callable]:
+    """可用的操作：YutuCLI 的公開方法名稱 -> 未繫結的方法"""
+    return {
+        name: member
+        for name, member in vars(YutuCLI).items()
+        if inspect.isfunction(member) and not name.startswith("_") and name not in EXCLUDED_METHODS
+    }
+
+
+def parameter_types(annotation: Any) -> tuple[type, bool]:
+    """由型別註記取得 (基本型別, 是否為字串列表)
+
+    `str | list[str]` 視為字串（可用逗號分隔多個 ID），
+    `Optional[list[str]]` 與 `Optional[Iterable[str]]` 視為字串列表。
+    """
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = tuple(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    else:
+        args = (annotation,)
+    if str in args:
+        return str, False
+    if any(typing.get_origin(arg) in (list, collections.abc.Iterable) for arg in args):
+        return str, True
+    base = args[0] if args else str
+    return (base if base in (int, float, bool) else str), False
+
+
+def to_result(value: Any) -> YutuResult:
+    """將便捷方法的回傳值轉為 YutuResult"""
+    if isinstance(value, YutuResult):
+        if value.streaming:
+            items = list(value.iter_items())
+            return YutuResult(success=value.success, data=items, error=value.error)
+        return value
+    if isinstance(value, BatchResult):
+        return YutuResult.from_batch(value)
+    return YutuResult(success=value is not None, data=value, error=None if value is not None else "查無資料")
+
+
+def result_payload(result: YutuResult) -> dict[str, Any]:
+    """結果的 JSON 表示"""
+    payload: dict[str, Any] = {"success": result.success, "data": result.data}
+    if result.error:
+        payload["error"] = result.error
+    if result.error_kind:
+        payload["error_kind"] = result.error_kind
+    if result.missing_ids:
+        payload["missing_ids"] = result.missing_ids
+    if result.cached:
+        payload["cached"] = True
+    return payload
+
+
+def call_operation(yutu: YutuCLI, op: str, args: Any = None) -> YutuResult:
+    """執行一個操作
+
+    Args:
+        yutu: YutuCLI 實例
+        op: 方法名稱（例如 add_to_playlist 或 run）
+        args: 參數物件（依名稱）或列表（依位置）
+
+    Raises:
+        ValueError: 未知的操作或參數不符
+    """
+    method = operations().get(op.replace("-", "_"))
+    if method is None:
+        raise ValueError(f"未知的操作：{op}")
+    if args is None:
+        args = {}
+    positional, named = (list(args), {}) if isinstance(args, list) else ([], dict(args))
+    try:
+        inspect.signature(method).bind(yutu, *positional, **named)
+    except TypeError as e:
+        raise ValueError(f"{op} 參數錯誤：{e}") from e
+    return to_result(method(yutu, *positional, **named))
+
+
+def _run_line(yutu: YutuCLI, index: int, line: str) -> dict[str, Any]:
+    """執行一行 JSONL 操作並回傳結果行（格式錯誤也回傳結果，不拋出例外）"""
+    record: dict[str, Any] = {"index": index}
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict) or "op" not in request:
+            raise ValueError('每一行必須是包含 "op" 的 JSON 物件')
+        if "id" in request:
+            record["id"] = request["id"]
+        record["op"] = request["op"]
+        result = call_operation(yutu, str(request["op"]), request.get("args"))
+    except ValueError as e:
+        # json.JSONDecodeError 也是 ValueError 的子類別
+        record.update(success=False, data=None, error=str(e), error_kind="invalidRequest")
+        return record
+    except Exception as e:
+        record.update(success=False, data=None, error=f"執行錯誤: {e}")
+        return record
+    record.update(result_payload(result))
+    return record
+
+
+def execute_jsonl(
+    yutu: YutuCLI,
+    lines: Iterable[str],
+    write: Callable[[str], None],
+    *,
+    workers: int = 4,
+) -> tuple[int, int]:
+    """並行執行 JSONL 操作，依輸入順序輸出結果
+
+    空白行與 # 開頭的行會略過（不佔用 index）。
+
+    Args:
+        yutu: YutuCLI 實例
+        lines: 輸入行
+        write: 輸出一行結果（不含換行）
+        workers: 同時執行的操作數（1 表示依序執行，適用於有先後關係的操作）
+
+    Returns:
+        (操作數, 失敗數)
+    """
+    workers = max(1, workers)
+    pending: deque[Future] = deque()
+    total = failed = 0
+
+    def emit(future: Future) -> None:
+        nonlocal failed
+        record = future.result()
+        if not record.get("success"):
+            failed += 1
+        write(json.dumps(record, ensure_ascii=False))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for line in lines:
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            pending.append(pool.submit(_run_line, yutu, total, line))
+            total += 1
+            # 限制同時保留的結果數，並盡早輸出已完成的開頭結果
+            while pending and (len(pending) >= workers * 2 or pending[0].done()):
+                emit(pending.popleft())
+        while pending:
+            emit(pending.popleft())
+    return total, failed
+
+
+def describe_operation(name: str) -> Optional[str]:
+    """操作說明（方法 docstring 的第一行）"""
+    method = operations().get(name)
+    doc = inspect.getdoc(method) if method else None
+    return doc.splitlines()[0] if doc else None
@@ -0,0 +1 @@
+"""測試輔助工具 - 不需連線 YouTube 的假 yutu 執行檔"""
@@ -0,0 +1,251 @@
+"""假 YouTube Data API 伺服器 - 在本機以 HTTP 模擬 Data API v3 與 OAuth token 端點
+
+資料與故障注入沿用 fake_yutu 的 FakeChannel 與 FaultInjector，只依賴標準函式庫：
+
+    with FakeApiServer() as server:
+        server.write_credentials(tmp_path)     # 產生 token 檔與 client_secret.json
+        YUTU_API_BASE_URL=server.url ...
+
+- 支援 HTTP/1.1 keep-alive，`connections` 記錄建立過的 TCP 連線數
+- 要求 `Accept-Encoding: gzip` 時以 gzip 壓縮回應
+- list 端點依 maxResults（預設 5，上限 50）分頁並回傳 nextPageToken
+- list 端點依 fields 遮罩只回傳指定的欄位
+- access token 不符時回傳 401；token 端點以 refresh token 發放新的 access token
+"""
+
+import gzip
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from yutu_cli.testing.fake_yutu import ERROR_KINDS, FakeChannel, FaultInjector
+from yutu_cli.utils.fields import parse_mask, project
+
+API_PREFIX = "/youtube/v3"
+
+# API 路徑 -> yutu 資源名稱
+RESOURCES = {
+    "channels": "channel",
+    "playlists": "playlist",
+    "playlistItems": "playlistItem",
+    "videos": "video",
+    "search": "search",
+    "commentThreads": "commentThread",
+    "comments": "comment",
+    "captions": "caption",
+}
+
+METHOD_ACTIONS = {"GET": "list", "POST": "insert", "PUT": "update", "DELETE": "delete"}
+
+DEFAULT_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 50
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # 用戶端逾時或中斷連線屬於測試情境，不輸出追蹤訊息
+        pass
+
+
+def error_body(kind: str) -> tuple[int, dict]:
+    """產生與 Data API 相同格式的錯誤回應"""
+    code, message = ERROR_KINDS.get(kind, ERROR_KINDS["backendError"])
+    return code, {"error": {"code": code, "message": message, "errors": [{"reason": kind, "message": message}]}}
+
+
+class FakeApiServer:
+    """在背景執行緒執行的假 Data API 伺服器"""
+
+    def __init__(
+        self,
+        channel: Optional[FakeChannel] = None,
+        faults: Optional[FaultInjector] = None,
+        *,
+        expires_in: int = 3600,
+    ):
+        self.channel = channel or FakeChannel()
+        self.faults = faults or FaultInjector()
+        self.expires_in = expires_in
+        self.refresh_token = "fake-refresh-token"
+        self.access_token = "fake-access-0"
+        self.connections = 0
+        self.requests = 0
+        self.refreshes = 0
+        self.gzip_responses = 0
+        self.calls: list[tuple[str, str, dict[str, str]]] = []
+        self._issued = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = _Server(("127.0.0.1", 0), _make_handler(self))
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-api", daemon=True,
+        )
+
+    @property
+    def origin(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        """Data API 位址（作為 YUTU_API_BASE_URL）"""
+        return self.origin + API_PREFIX
+
+    @property
+    def token_uri(self) -> str:
+        return self.origin + "/token"
+
+    def start(self) -> "FakeApiServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeApiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def write_credentials(self, directory: Path, *, expiry: str = "0001-01-01T00:00:00Z") -> tuple[Path, Path]:
+        """在目錄中寫入 yutu 格式的 token 檔與 client_secret.json
+
+        Returns:
+            (token 檔路徑, 憑證檔路徑)
+        """
+        directory = Path(directory)
+        token_path = directory / "youtube.token.json"
+        credential_path = directory / "client_secret.json"
+        token_path.write_text(json.dumps({
+            "access_token": self.access_token,
+            "token_type": "Bearer",
+            "refresh_token": self.refresh_token,
+            "expiry": expiry,
+        }), encoding="utf-8")
+        credential_path.write_text(json.dumps({
+            "installed": {
+                "client_id": "fake-client",
+                "client_secret": "fake-secret",
+                "token_uri": self.token_uri,
+            }
+        }), encoding="utf-8")
+        return token_path, credential_path
+
+    def rotate_token(self) -> None:
+        """讓目前的 access token 失效（模擬提前撤銷）"""
+        with self._lock:
+            self.access_token = f"fake-access-revoked-{next(self._issued)}"
+
+    # === 請求處理 ===
+
+    def issue_token(self, form: dict[str, str]) -> tuple[int, dict]:
+        if form.get("grant_type") != "refresh_token" or form.get("refresh_token") != self.refresh_token:
+            return 400, {"error": "invalid_grant", "error_description": "Bad Request"}
+        with self._lock:
+            self.refreshes += 1
+            self.access_token = f"fake-access-{next(self._issued)}"
+            return 200, {"access_token": self.access_token, "expires_in": self.expires_in, "token_type": "Bearer"}
+
+    def handle_api(self, method: str, path: str, query: dict[str, str], body: Any) -> tuple[int, Any]:
+        name, _, verb = path.removeprefix(API_PREFIX + "/").partition("/")
+        resource = RESOURCES.get(name)
+        if resource is None:
+            return error_body("notFound")
+        action = verb or METHOD_ACTIONS.get(method, "")
+        with self._lock:
+            self.calls.append((resource, action, dict(query)))
+        error = self.faults.check(resource, action)
+        if error:
+            return error_body(error.rsplit(", ", 1)[-1])
+
+        args = {("ids" if key == "id" else key): value for key, value in query.items()}
+        if isinstance(body, dict):
+            snippet = body.get("snippet", {})
+            args.setdefault("id", body.get("id", ""))
+            for key in ("playlistId", "videoId", "parentId"):
+                if key in snippet:
+                    args.setdefault(key, snippet[key])
+        response = self.channel.handle(resource, action, {**args, "maxResults": "0"})
+        self.faults.delay(response)
+
+        if action in ("delete", "rate", "setModerationStatus"):
+            return 204, None
+        if action == "getRating":
+            return 200, {"kind": "youtube#videoGetRatingResponse", "items": response}
+        if action != "list":
+            resource_body = {**(body or {}), **response}
+            if not resource_body.get("id"):
+                resource_body["id"] = "new"
+            return 200, resource_body
+
+        size = min(int(query.get("maxResults") or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+        start = int(query.get("pageToken") or 0)
+        page: dict[str, Any] = {
+            "kind": f"youtube#{resource}ListResponse",
+            "items": response[start:start + size],
+            "pageInfo": {"totalResults": len(response), "resultsPerPage": size},
+        }
+        if start + size < len(response):
+            page["nextPageToken"] = str(start + size)
+        if query.get("fields"):
+            page = project(page, parse_mask(query["fields"]))
+        return 200, page
+
+
+def _make_handler(server: FakeApiServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            with server._lock:
+                server.connections += 1
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def _read_body(self) -> bytes:
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+
+        def _reply(self, status: int, payload: Any) -> None:
+            data = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            if data:
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    data = gzip.compress(data)
+                    self.send_header("Content-Encoding", "gzip")
+                    with server._lock:
+                        server.gzip_responses += 1
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _dispatch(self) -> None:
+            with server._lock:
+                server.requests += 1
+            parts = urlsplit(self.path)
+            raw = self._read_body()
+            if parts.path == "/token":
+                form = {key: values[0] for key, values in parse_qs(raw.decode("ascii")).items()}
+                self._reply(*server.issue_token(form))
+                return
+            if self.headers.get("Authorization") != f"Bearer {server.access_token}":
+                self._reply(*error_body("authError"))
+                return
+            query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+            body = json.loads(raw) if raw else None
+            self._reply(*server.handle_api(self.command, parts.path, query, body))
+
+        do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    return Handler
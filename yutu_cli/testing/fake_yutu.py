@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""假 yutu 執行檔 - 以合成資料模擬 yutu CLI 與 `yutu mcp` 工作程序
+
+只依賴標準函式庫，可直接作為 YUTU_CLI_PATH 使用：
+
+    YUTU_CLI_PATH=/path/to/yutu_cli/testing/fake_yutu.py yutu-manager
+
+頻道規模（環境變數）：
+    FAKE_YUTU_PLAYLISTS: 播放清單數量（預設 5）
+    FAKE_YUTU_ITEMS: 每個播放清單的影片數（預設 20，例如 50000）
+    FAKE_YUTU_VIDEOS: 頻道上傳的影片數（預設 100）
+    FAKE_YUTU_COMMENTS: 每部影片的評論串數（預設 10）
+    FAKE_YUTU_CAPTIONS: 每部影片的字幕軌道數（預設 2）
+
+故障注入（環境變數）：
+    FAKE_YUTU_LATENCY_MS: 每次呼叫的固定延遲（毫秒）
+    FAKE_YUTU_PAGE_LATENCY_MS: 每 50 筆結果額外延遲（毫秒，模擬分頁請求）
+    FAKE_YUTU_ERROR_RATE: 隨機失敗機率（0 ~ 1）
+    FAKE_YUTU_ERROR_KIND: 失敗類型（backendError、rateLimitExceeded、
+        quotaExceeded、notFound、forbidden、authError，預設 backendError）
+    FAKE_YUTU_QUOTA_LIMIT: 配額上限，超過後回傳 quotaExceeded
+    FAKE_YUTU_QUOTA_FILE: 跨程序記錄已用配額的檔案（搭配 QUOTA_LIMIT）
+    FAKE_YUTU_SEED: 隨機種子
+    FAKE_YUTU_CRASH_AFTER: mcp 模式處理指定數量的工具呼叫後直接結束（模擬當機）
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+PAGE_SIZE = 50
+
+# 與 googleapi 錯誤訊息相同的格式：(HTTP 狀態碼, 訊息)
+ERROR_KINDS: dict[str, tuple[int, str]] = {
+    "backendError": (503, "The service is currently unavailable."),
+    "rateLimitExceeded": (403, "The request cannot be completed because you have exceeded your rate limit."),
+    "quotaExceeded": (403, "The request cannot be completed because you have exceeded your quota."),
+    "notFound": (404, "The requested resource could not be found."),
+    "forbidden": (403, "The request is not properly authorized."),
+    "authError": (401, "Invalid Credentials"),
+}
+
+# 各動作的配額成本（與 YouTube Data API 相同）
+QUOTA_COSTS: dict[tuple[str, str], int] = {
+    ("search", "list"): 100,
+    ("video", "insert"): 1600,
+    ("caption", "insert"): 400,
+    ("caption", "update"): 450,
+    ("caption", "download"): 200,
+}
+
+BASE_DATE = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def _int_env(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _timestamp(days: int) -> str:
+    return (BASE_DATE + timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def quota_cost(resource: str, action: str) -> int:
+    """取得動作的配額成本"""
+    if (resource, action) in QUOTA_COSTS:
+        return QUOTA_COSTS[(resource, action)]
+    return 1 if action in ("list", "getRating") else 50
+
+
+def format_api_error(kind: str) -> str:
+    """產生與 yutu（googleapi）相同格式的錯誤訊息"""
+    code, message = ERROR_KINDS.get(kind, ERROR_KINDS["backendError"])
+    return f"googleapi: Error {code}: {message}, {kind}"
+
+
+class FakeChannel:
+    """以固定規則產生的合成頻道資料（video n 的發布日期為第 n 天，越大越新）"""
+
+    channel_id = "UCfakechannel00000000000"
+    uploads_id = "UUfakechannel00000000000"
+
+    def __init__(
+        self,
+        playlists: int = 5,
+        items_per_playlist: int = 20,
+        videos: int = 100,
+        comments_per_video: int = 10,
+        captions_per_video: int = 2,
+    ):
+        self.playlists = playlists
+        self.items_per_playlist = items_per_playlist
+        self.videos = max(videos, 1)
+        self.comments_per_video = comments_per_video
+        self.captions_per_video = captions_per_video
+
+    @classmethod
+    def from_env(cls) -> "FakeChannel":
+        return cls(
+            playlists=_int_env("FAKE_YUTU_PLAYLISTS", 5),
+            items_per_playlist=_int_env("FAKE_YUTU_ITEMS", 20),
+            videos=_int_env("FAKE_YUTU_VIDEOS", 100),
+            comments_per_video=_int_env("FAKE_YUTU_COMMENTS", 10),
+            captions_per_video=_int_env("FAKE_YUTU_CAPTIONS", 2),
+        )
+
+    @staticmethod
+    def video_id(n: int) -> str:
+        return f"v{n:010d}"
+
+    @staticmethod
+    def video_number(video_id: str) -> int:
+        return int(video_id[1:]) if video_id[1:].isdigit() else 0
+
+    def playlist(self, n: int) -> dict:
+        return {
+            "kind": "youtube#playlist",
+            "id": f"PLfake{n:06d}",
+            "snippet": {
+                "title": f"播放清單 {n}",
+                "channelId": self.channel_id,
+                "publishedAt": _timestamp(n),
+            },
+            "contentDetails": {"itemCount": self.items_per_playlist},
+            "status": {"privacyStatus": "public"},
+        }
+
+    def playlist_item(self, playlist_id: str, position: int, video_n: int) -> dict:
+        video_id = self.video_id(video_n)
+        return {
+            "kind": "youtube#playlistItem",
+            # 與真實 API 相同：項目 ID 不隨位置改變（同一影片重複加入時以序號區分）
+            "id": f"{playlist_id}.{video_n:010d}.{position // self.videos}",
+            "snippet": {
+                "playlistId": playlist_id,
+                "position": position,
+                "title": f"影片 {video_n}",
+                "description": f"第 {video_n} 部影片的說明",
+                "channelTitle": "Fake Channel",
+                "videoOwnerChannelTitle": "Fake Channel",
+                "videoOwnerChannelId": self.channel_id,
+                "publishedAt": _timestamp(video_n),
+                "resourceId": {"kind": "youtube#video", "videoId": video_id},
+            },
+            "contentDetails": {"videoId": video_id, "videoPublishedAt": _timestamp(video_n)},
+        }
+
+    def playlist_items(self, playlist_id: str) -> list[dict]:
+        if playlist_id == self.uploads_id:
+            # 上傳清單依發布時間由新到舊
+            return [
+                self.playlist_item(playlist_id, pos, self.videos - 1 - pos)
+                for pos in range(self.videos)
+            ]
+        offset = sum(map(ord, playlist_id)) % self.videos
+        return [
+            self.playlist_item(playlist_id, pos, (offset + pos) % self.videos)
+            for pos in range(self.items_per_playlist)
+        ]
+
+    def video(self, video_id: str) -> dict:
+        n = self.video_number(video_id)
+        return {
+            "kind": "youtube#video",
+            "id": video_id,
+            "snippet": {
+                "title": f"影片 {n}",
+                "description": f"第 {n} 部影片的說明",
+                "channelId": self.channel_id,
+                "channelTitle": "Fake Channel",
+                "publishedAt": _timestamp(n),
+                "tags": ["fake", f"tag{n % 7}"],
+            },
+            "statistics": {
+                "viewCount": str(n * 37 % 100_000),
+                "likeCount": str(n % 500),
+                "commentCount": str(self.comments_per_video),
+            },
+            "contentDetails": {"duration": f"PT{n % 60}M{n % 59}S", "definition": "hd"},
+            "status": {"privacyStatus": "public"},
+        }
+
+    def search_result(self, n: int) -> dict:
+        return {
+            "kind": "youtube#searchResult",
+            "id": {"kind": "youtube#video", "videoId": self.video_id(n)},
+            "snippet": {
+                "title": f"影片 {n}",
+                "channelTitle": "Fake Channel",
+                "publishedAt": _timestamp(n),
+            },
+        }
+
+    def comment(self, comment_id: str, video_id: str, n: int, parent_id: str = "") -> dict:
+        snippet = {
+            "videoId": video_id,
+            "authorDisplayName": f"觀眾 {n}",
+            "textDisplay": f"第 {n} 則評論",
+            "textOriginal": f"第 {n} 則評論",
+            "likeCount": n % 13,
+            "publishedAt": _timestamp(n),
+            "updatedAt": _timestamp(n),
+        }
+        if parent_id:
+            snippet["parentId"] = parent_id
+        return {"kind": "youtube#comment", "id": comment_id, "snippet": snippet}
+
+    def comment_thread(self, video_id: str, n: int) -> dict:
+        thread_id = f"Ug{video_id}{n:06d}"
+        return {
+            "kind": "youtube#commentThread",
+            "id": thread_id,
+            "snippet": {
+                "videoId": video_id,
+                "topLevelComment": self.comment(thread_id, video_id, n),
+                "totalReplyCount": n % 3,
+                "canReply": True,
+            },
+            "replies": {
+                "comments": [
+                    self.comment(f"{thread_id}.{r}", video_id, n + r, thread_id)
+                    for r in range(n % 3)
+                ]
+            },
+        }
+
+    def caption(self, video_id: str, n: int) -> dict:
+        languages = ["zh-TW", "en", "ja", "ko"]
+        return {
+            "kind": "youtube#caption",
+            "id": f"AUieDa{video_id}{n}",
+            "snippet": {
+                "videoId": video_id,
+                "language": languages[n % len(languages)],
+                "name": "",
+                "trackKind": "standard",
+                "isDraft": False,
+                "lastUpdated": _timestamp(self.video_number(video_id)),
+            },
+        }
+
+    def handle(self, resource: str, action: str, args: dict[str, str]) -> object:
+        """依資源與動作產生回應"""
+        limit = int(args.get("maxResults", "0") or 0)
+
+        def cap(items: list) -> list:
+            return items[:limit] if limit > 0 else items
+
+        ids = [i for i in args.get("ids", "").split(",") if i]
+
+        if resource == "channel" and action == "list":
+            return [{
+                "kind": "youtube#channel",
+                "id": self.channel_id,
+                "snippet": {"title": "Fake Channel", "description": "合成資料頻道"},
+                "statistics": {
+                    "subscriberCount": "1000",
+                    "videoCount": str(self.videos),
+                    "viewCount": "123456",
+                },
+                "contentDetails": {"relatedPlaylists": {"uploads": self.uploads_id}},
+            }]
+        if resource == "playlist" and action == "list":
+            return cap([self.playlist(n) for n in range(self.playlists)])
+        if resource == "playlistItem" and action == "list":
+            return cap(self.playlist_items(args.get("playlistId", "")))
+        if resource == "video" and action == "list":
+            # 超出影片數的 ID 視為已刪除
+            return [self.video(v) for v in ids if self.video_number(v) < self.videos]
+        if resource == "video" and action == "getRating":
+            return [{"videoId": v, "rating": "none"} for v in ids]
+        if resource == "search" and action == "list":
+            return cap([self.search_result(n) for n in range(self.videos - 1, -1, -1)])
+        if resource == "commentThread" and action == "list":
+            video_id = args.get("videoId", "")
+            return cap([self.comment_thread(video_id, n) for n in range(self.comments_per_video)])
+        if resource == "comment" and action == "list":
+            parent_id = args.get("parentId", "")
+            return cap([self.comment(f"{parent_id}.{r}", "", r, parent_id) for r in range(2)])
+        if resource == "caption" and action == "list":
+            video_id = args.get("videoId", "")
+            return [self.caption(video_id, n) for n in range(self.captions_per_video)]
+        if action == "list":
+            return []
+        # 寫入動作：回傳被操作的資源
+        return {"kind": f"youtube#{resource}", "id": args.get("id") or args.get("ids") or "new"}
+
+
+class FaultInjector:
+    """依環境變數注入延遲、隨機錯誤與配額耗盡"""
+
+    def __init__(
+        self,
+        *,
+        latency_ms: float = 0,
+        page_latency_ms: float = 0,
+        error_rate: float = 0,
+        error_kind: str = "backendError",
+        quota_limit: int = 0,
+        quota_file: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.page_latency_ms = page_latency_ms
+        self.error_rate = error_rate
+        self.error_kind = error_kind
+        self.quota_limit = quota_limit
+        self.quota_file = quota_file
+        self.quota_used = 0
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_env(cls) -> "FaultInjector":
+        seed = os.environ.get("FAKE_YUTU_SEED")
+        return cls(
+            latency_ms=_float_env("FAKE_YUTU_LATENCY_MS", 0),
+            page_latency_ms=_float_env("FAKE_YUTU_PAGE_LATENCY_MS", 0),
+            error_rate=_float_env("FAKE_YUTU_ERROR_RATE", 0),
+            error_kind=os.environ.get("FAKE_YUTU_ERROR_KIND", "backendError"),
+            quota_limit=_int_env("FAKE_YUTU_QUOTA_LIMIT", 0),
+            quota_file=os.environ.get("FAKE_YUTU_QUOTA_FILE"),
+            seed=int(seed) if seed and seed.isdigit() else None,
+        )
+
+    def _charge(self, units: int) -> bool:
+        """記錄配額用量，超過上限時回傳 False"""
+        used = self.quota_used
+        if self.quota_file and os.path.exists(self.quota_file):
+            with open(self.quota_file, encoding="utf-8") as f:
+                used = int(f.read().strip() or 0)
+        if used + units > self.quota_limit:
+            return False
+        used += units
+        self.quota_used = used
+        if self.quota_file:
+            with open(self.quota_file, "w", encoding="utf-8") as f:
+                f.write(str(used))
+        return True
+
+    def check(self, resource: str, action: str) -> Optional[str]:
+        """呼叫前檢查，需要失敗時回傳錯誤訊息"""
+        if self.quota_limit and not self._charge(quota_cost(resource, action)):
+            return format_api_error("quotaExceeded")
+        if self.error_rate and self._random.random() < self.error_rate:
+            return format_api_error(self.error_kind)
+        return None
+
+    def delay(self, response: object) -> None:
+        """依結果筆數模擬網路延遲"""
+        pages = 1
+        if isinstance(response, list):
+            pages = max(1, -(-len(response) // PAGE_SIZE))
+        seconds = (self.latency_ms + self.page_latency_ms * pages) / 1000
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+def _parse_flags(argv: list[str]) -> dict[str, str]:
+    return {argv[i].lstrip("-"): argv[i + 1] for i in range(0, len(argv) - 1, 2)}
+
+
+def run_cli(argv: list[str]) -> int:
+    """模擬 `yutu <resource> <action> --flag value ...`"""
+    if len(argv) < 2:
+        print("usage: fake_yutu <resource> <action> [--flag value ...]", file=sys.stderr)
+        return 2
+    resource, action, *rest = argv
+    faults = FaultInjector.from_env()
+    error = faults.check(resource, action)
+    if error:
+        faults.delay(None)
+        print(error, file=sys.stderr)
+        return 1
+    response = FakeChannel.from_env().handle(resource, action, _parse_flags(rest))
+    faults.delay(response)
+    json.dump(response, sys.stdout, ensure_ascii=False)
+    return 0
+
+
+def run_mcp() -> int:
+    """模擬 `yutu mcp`：以 stdio 逐行交換 JSON-RPC 2.0 訊息"""
+    channel = FakeChannel.from_env()
+    faults = FaultInjector.from_env()
+    crash_after = _int_env("FAKE_YUTU_CRASH_AFTER", 0)
+    handled = 0
+    tools = [
+        f"{resource}-{action}"
+        for resource in ("channel", "playlist", "playlistItem", "video", "search",
+                         "commentThread", "comment", "caption")
+        for action in ("list", "insert", "update", "delete", "getRating", "rate")
+    ]
+
+    def reply(msg_id, result=None, error=None) -> None:
+        message = {"jsonrpc": "2.0", "id": msg_id}
+        if error is not None:
+            message["error"] = error
+        else:
+            message["result"] = result
+        sys.stdout.write(json.dumps(message, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        method = request.get("method")
+        msg_id = request.get("id")
+        if msg_id is None:
+            continue  # 通知不需回應
+        if method == "initialize":
+            reply(msg_id, {
+                "protocolVersion": request.get("params", {}).get("protocolVersion", ""),
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "fake-yutu", "version": "0.0.0"},
+            })
+        elif method == "tools/list":
+            reply(msg_id, {"tools": [{"name": name} for name in tools]})
+        elif method == "tools/call":
+            handled += 1
+            if crash_after and handled > crash_after:
+                return 1
+            params = request.get("params", {})
+            resource, _, action = params.get("name", "").partition("-")
+            error = faults.check(resource, action)
+            if error:
+                reply(msg_id, {"content": [{"type": "text", "text": error}], "isError": True})
+                continue
+            args = {k: str(v).lower() if isinstance(v, bool) else str(v)
+                    for k, v in params.get("arguments", {}).items()}
+            response = channel.handle(resource, action, args)
+            faults.delay(response)
+            text = json.dumps(response, ensure_ascii=False)
+            reply(msg_id, {"content": [{"type": "text", "text": text}], "isError": False})
+        else:
+            reply(msg_id, error={"code": -32601, "message": f"Method not found: {method}"})
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["mcp"]:
+        return run_mcp()
+    return run_cli(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""匯入耗時量測 - 在新的直譯器以 `python -X importtime` 執行程式碼並解析輸出
+
+`-X importtime` 在 stderr 對每個模組輸出一行：
+
+    import time: self [us] | cumulative | imported package
+    import time:       417 |      40697 | click
+
+模組名稱前的縮排代表巢狀深度；累計耗時包含它匯入的所有模組。
+"""
+
+import re
+import subprocess
+import sys
+from typing import Optional
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+# 只有互動式介面或 YutuCLI 才需要的模組（入口點不應在啟動時載入）
+HEAVY_MODULES = (
+    "pydantic",
+    "pydantic_settings",
+    "rich",
+    "questionary",
+    "prompt_toolkit",
+    "yutu_cli.app",
+    "yutu_cli.config",
+    "yutu_cli.utils.yutu",
+)
+
+
+def parse_importtime(output: str) -> dict[str, int]:
+    """解析 -X importtime 的輸出，回傳 模組名稱 -> 累計耗時（微秒）"""
+    modules: dict[str, int] = {}
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules.setdefault(match.group(4), int(match.group(2)))
+    return modules
+
+
+def measure_imports(code: str, env: Optional[dict[str, str]] = None) -> dict[str, int]:
+    """在新的直譯器執行程式碼，回傳各模組的累計匯入耗時（微秒）
+
+    Raises:
+        RuntimeError: 程式碼執行失敗
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "執行失敗")
+    return parse_importtime(proc.stderr)
+
+
+def loaded_heavy_modules(modules: dict[str, int]) -> list[str]:
+    """已載入的重量級模組（含其子模組）"""
+    return sorted(
+        name for name in modules
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
@@ -0,0 +1,558 @@
+"""直接呼叫 YouTube Data API 的傳輸層
+
+不啟動 yutu，改以 yutu 的 OAuth token 檔（YUTU_CACHE_TOKEN）直接呼叫 Data API v3：
+
+- 保持連線（keep-alive）的 HTTPS 連線池，多個命令共用已完成 TLS 握手的連線
+- 要求 gzip 壓縮的回應
+- access token 過期前以 refresh token 更新，結果保留在記憶體並寫回 token 檔（與 yutu 共用）
+- list 命令依 nextPageToken 逐頁取得，`--maxResults 0` 表示取得全部
+
+命令介面與 SubprocessTransport 相同（`yutu <resource> <action> --flag value ...`），
+輸出也與 yutu 的 JSON 輸出相同（list 為項目陣列）。沒有對應端點的命令
+（例如上傳影片、上傳或下載字幕）與非 JSON 輸出改用子程序模式執行。
+"""
+
+import gzip
+import http.client
+import json
+import os
+import re
+import socket
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode, urlsplit
+
+from yutu_cli import __app_name__, __version__
+from yutu_cli.utils.json_stream import loads
+from yutu_cli.utils.tracing import PHASE_CATEGORY, span
+from yutu_cli.utils.transport import CommandOutput, SubprocessTransport
+
+API_BASE_URL = "https://youtube.googleapis.com/youtube/v3"
+TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+# 每頁最多 50 筆（Data API 上限）
+PAGE_SIZE = 50
+
+# Google API 只在 User-Agent 含有 gzip 時壓縮回應
+USER_AGENT = f"{__app_name__}/{__version__} (gzip)"
+
+# access token 在到期前多少秒視為已過期
+EXPIRY_SKEW = timedelta(seconds=60)
+
+# yutu 的參數名稱 -> API 查詢參數名稱
+QUERY_ALIASES = {"ids": "id", "types": "type", "parts": "part"}
+
+
+class ApiError(RuntimeError):
+    """API 回應錯誤（訊息與 yutu 的 googleapi 錯誤格式相同）"""
+
+
+class TokenError(RuntimeError):
+    """無法取得或更新 access token"""
+
+
+# === OAuth token ===
+
+_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+
+def _parse_expiry(value: Optional[str]) -> Optional[datetime]:
+    """解析 Go oauth2.Token 的 expiry（奈秒精度的 RFC 3339；零值表示不會過期）"""
+    if not value or value.startswith("0001-01-01"):
+        return None
+    text = _FRACTION.sub(r"\1", value.replace("Z", "+00:00"))
+    try:
+        expiry = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return expiry if expiry.tzinfo else expiry.replace(tzinfo=timezone.utc)
+
+
+def _read_client_secret(path: Path) -> dict[str, str]:
+    """讀取 OAuth 用戶端憑證（client_secret.json 的 installed 或 web 區段）"""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise TokenError(f"oauth2: 無法讀取憑證檔案 {path}: {e}") from e
+    section = data.get("installed") or data.get("web") or data
+    if not section.get("client_id"):
+        raise TokenError(f"oauth2: 憑證檔案缺少 client_id: {path}")
+    return section
+
+
+class TokenSource:
+    """提供有效的 access token
+
+    讀取 yutu 的 token 檔；token 即將過期或被 API 拒絕時以 refresh token 更新，
+    並寫回 token 檔。其他程序（例如 yutu）更新 token 檔後會重新讀取。可多執行緒共用。
+    """
+
+    def __init__(self, token_path: Path, credential_path: Path):
+        self.token_path = Path(token_path)
+        self.credential_path = Path(credential_path)
+        self.refreshes = 0
+        self._token: dict[str, Any] = {}
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        """token 檔有變更時重新讀取"""
+        try:
+            mtime = self.token_path.stat().st_mtime
+        except OSError as e:
+            raise TokenError(f"oauth2: 找不到 token 檔案 {self.token_path}（請先以 yutu 完成授權）") from e
+        if mtime == self._mtime:
+            return
+        try:
+            self._token = json.loads(self.token_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            raise TokenError(f"oauth2: 無法讀取 token 檔案 {self.token_path}: {e}") from e
+        self._mtime = mtime
+
+    def _expired(self) -> bool:
+        if not self._token.get("access_token"):
+            return True
+        expiry = _parse_expiry(self._token.get("expiry"))
+        return expiry is not None and expiry - EXPIRY_SKEW <= datetime.now(timezone.utc)
+
+    def access_token(self, *, force_refresh: bool = False) -> str:
+        """取得 access token（過期或 force_refresh 時先更新）
+
+        Raises:
+            TokenError: 沒有 token 檔、沒有 refresh token 或更新失敗
+        """
+        with self._lock:
+            self._load()
+            if force_refresh or self._expired():
+                self._refresh()
+            return self._token["access_token"]
+
+    def _refresh(self) -> None:
+        refresh_token = self._token.get("refresh_token")
+        if not refresh_token:
+            raise TokenError("oauth2: token 已過期且沒有 refresh token（請重新以 yutu 授權）")
+        secret = _read_client_secret(self.credential_path)
+        form = urlencode({
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": secret["client_id"],
+            "client_secret": secret.get("client_secret", ""),
+        }).encode("ascii")
+
+        from urllib.error import HTTPError, URLError
+        from urllib.request import Request, urlopen
+
+        request = Request(
+            secret.get("token_uri") or TOKEN_URI,
+            data=form,
+            headers={"Content-Type": "application/x-www-form-urlencoded", "User-Agent": USER_AGENT},
+        )
+        try:
+            with urlopen(request, timeout=30) as response:
+                issued = json.loads(response.read())
+        except HTTPError as e:
+            detail = e.read().decode("utf-8", errors="replace")
+            raise TokenError(f"oauth2: cannot fetch token: {e.code} {detail}") from e
+        except (URLError, OSError, json.JSONDecodeError) as e:
+            raise TokenError(f"oauth2: cannot fetch token: {e}") from e
+
+        expires_in = int(issued.get("expires_in") or 3600)
+        self._token.update(
+            access_token=issued["access_token"],
+            token_type=issued.get("token_type", "Bearer"),
+            expiry=(datetime.now(timezone.utc) + timedelta(seconds=expires_in)).isoformat(),
+        )
+        if issued.get("refresh_token"):
+            self._token["refresh_token"] = issued["refresh_token"]
+        self.refreshes += 1
+        self._save()
+
+    def _save(self) -> None:
+        """寫回 token 檔（先寫暫存檔再取代，其他程序不會讀到寫到一半的檔案）"""
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.token_path.parent, prefix=".token-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._token, f)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.token_path)
+            self._mtime = self.token_path.stat().st_mtime
+        except OSError:
+            # 無法寫回時仍使用記憶體中的 token
+            pass
+
+
+# === HTTP 連線池 ===
+
+@dataclass
+class HttpResponse:
+    """已讀取完畢（並解壓縮）的 HTTP 回應"""
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+# 重用的閒置連線可能已被伺服器關閉，此時改用新連線重送。
+# POST 只在伺服器未回應就關閉連線（RemoteDisconnected）時重送，避免重複新增
+_STALE_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class ConnectionPool:
+    """同一主機的保持連線（keep-alive）HTTP(S) 連線池
+
+    每個請求從池中取出一條閒置連線（沒有時建立新連線），讀完回應後放回，
+    因此依序或並行的請求都能重用已完成 TLS 握手的連線。可多執行緒共用。
+    """
+
+    def __init__(self, base_url: str, *, max_idle: int = 8):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname or ""
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.max_idle = max_idle
+        self.opened = 0
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """取得連線（第二個值表示是否為重用的連線）"""
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                reused = True
+            else:
+                self.opened += 1
+                conn = None
+                reused = False
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = cls(self.host, self.port, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, reused
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: float = 60,
+    ) -> HttpResponse:
+        """送出請求並讀取完整回應（gzip 回應會解壓縮）
+
+        Raises:
+            TimeoutError: 超過 timeout 秒
+            OSError, http.client.HTTPException: 連線錯誤
+        """
+        while True:
+            conn, reused = self._acquire(timeout)
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_ERRORS as e:
+                conn.close()
+                if reused and (method != "POST" or isinstance(e, http.client.RemoteDisconnected)):
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if response.getheader("Content-Encoding", "").lower() == "gzip":
+                data = gzip.decompress(data)
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return HttpResponse(
+                response.status,
+                {name.lower(): value for name, value in response.getheaders()},
+                data,
+            )
+
+    def close(self) -> None:
+        """關閉所有閒置連線"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+# === 命令 -> 端點 ===
+
+def _playlist_body(flags: dict[str, str]) -> dict:
+    return {
+        "snippet": {"title": flags["title"], "description": flags.get("description", "")},
+        "status": {"privacyStatus": flags.get("privacy", "private")},
+    }
+
+
+def _playlist_item_body(flags: dict[str, str]) -> dict:
+    snippet: dict[str, Any] = {
+        "playlistId": flags["playlistId"],
+        "resourceId": {"kind": "youtube#video", "videoId": flags["videoId"]},
+    }
+    if "position" in flags:
+        snippet["position"] = int(flags["position"])
+    body: dict[str, Any] = {"snippet": snippet}
+    if "id" in flags:
+        body["id"] = flags["id"]
+    return body
+
+
+def _comment_thread_body(flags: dict[str, str]) -> dict:
+    return {
+        "snippet": {
+            "channelId": flags.get("channelId", ""),
+            "videoId": flags["videoId"],
+            "topLevelComment": {"snippet": {"textOriginal": flags["textOriginal"]}},
+        }
+    }
+
+
+def _comment_body(flags: dict[str, str]) -> dict:
+    snippet = {"textOriginal": flags["textOriginal"]}
+    if "parentId" in flags:
+        snippet["parentId"] = flags["parentId"]
+    body: dict[str, Any] = {"snippet": snippet}
+    if "id" in flags:
+        body["id"] = flags["id"]
+    return body
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """yutu 命令對應的 Data API 端點"""
+    method: str
+    path: str
+    part: Optional[str] = None
+    query: tuple[str, ...] = ()
+    body: Optional[Callable[[dict[str, str]], dict]] = None
+    paged: bool = False
+    items: bool = False
+    per_id: bool = False
+
+
+ENDPOINTS: dict[tuple[str, str], Endpoint] = {
+    ("channel", "list"): Endpoint(
+        "GET", "/channels", "snippet,contentDetails,statistics", ("id", "mine", "forHandle"), items=True,
+    ),
+    ("playlist", "list"): Endpoint(
+        "GET", "/playlists", "snippet,contentDetails,status", ("id", "mine", "channelId"), paged=True,
+    ),
+    ("playlist", "insert"): Endpoint("POST", "/playlists", "snippet,status", body=_playlist_body),
+    ("playlist", "delete"): Endpoint("DELETE", "/playlists", per_id=True),
+    ("playlistItem", "list"): Endpoint(
+        "GET", "/playlistItems", "snippet,contentDetails,status", ("id", "playlistId", "videoId"), paged=True,
+    ),
+    ("playlistItem", "insert"): Endpoint("POST", "/playlistItems", "snippet", body=_playlist_item_body),
+    ("playlistItem", "update"): Endpoint("PUT", "/playlistItems", "snippet", body=_playlist_item_body),
+    ("playlistItem", "delete"): Endpoint("DELETE", "/playlistItems", per_id=True),
+    ("search", "list"): Endpoint(
+        "GET", "/search", "snippet",
+        ("q", "type", "order", "forMine", "channelId", "publishedAfter", "publishedBefore", "regionCode"),
+        paged=True,
+    ),
+    ("video", "list"): Endpoint("GET", "/videos", "id,snippet,status", ("id", "myRating", "chart"), paged=True),
+    ("video", "getRating"): Endpoint("GET", "/videos/getRating", query=("id",), items=True),
+    ("video", "rate"): Endpoint("POST", "/videos/rate", query=("id", "rating")),
+    ("video", "delete"): Endpoint("DELETE", "/videos", per_id=True),
+    ("commentThread", "list"): Endpoint(
+        "GET", "/commentThreads", "snippet,replies",
+        ("id", "videoId", "allThreadsRelatedToChannelId", "order", "searchTerms", "moderationStatus", "textFormat"),
+        paged=True,
+    ),
+    ("commentThread", "insert"): Endpoint("POST", "/commentThreads", "snippet", body=_comment_thread_body),
+    ("comment", "list"): Endpoint("GET", "/comments", "snippet", ("id", "parentId", "textFormat"), paged=True),
+    ("comment", "insert"): Endpoint("POST", "/comments", "snippet", body=_comment_body),
+    ("comment", "update"): Endpoint("PUT", "/comments", "snippet", body=_comment_body),
+    ("comment", "delete"): Endpoint("DELETE", "/comments", per_id=True),
+    ("comment", "setModerationStatus"): Endpoint(
+        "POST", "/comments/setModerationStatus", query=("id", "moderationStatus", "banAuthor"),
+    ),
+    ("caption", "list"): Endpoint("GET", "/captions", "id,snippet", ("id", "videoId")),
+    ("caption", "delete"): Endpoint("DELETE", "/captions", per_id=True),
+}
+
+
+def parse_command(cmd: list[str]) -> tuple[str, str, dict[str, str]]:
+    """拆解 yutu 命令列為 (resource, action, 參數)
+
+    Examples:
+        >>> parse_command(["yutu", "video", "list", "--ids", "a", "--maxResults", "0"])
+        ('video', 'list', {'ids': 'a', 'maxResults': '0'})
+    """
+    resource, action, *args = cmd[1:]
+    return resource, action, {flag.lstrip("-"): value for flag, value in zip(args[0::2], args[1::2])}
+
+
+def format_api_error(status: int, body: bytes) -> str:
+    """將 API 錯誤回應轉為與 yutu 相同的 googleapi 錯誤訊息"""
+    try:
+        error = json.loads(body).get("error", {})
+    except (json.JSONDecodeError, AttributeError):
+        error = None
+    if not isinstance(error, dict) or not error:
+        text = body.decode("utf-8", errors="replace")[:200]
+        return f"googleapi: got HTTP response code {status} with body: {text}"
+    reasons = [e.get("reason") for e in error.get("errors", []) if e.get("reason")]
+    message = f"googleapi: Error {error.get('code', status)}: {error.get('message', '')}"
+    return f"{message}, {reasons[0]}" if reasons else message
+
+
+def _network_error(e: BaseException) -> str:
+    """連線錯誤訊息（含 retry.NETWORK_MARKERS 可辨識的片段）"""
+    if isinstance(e, ConnectionRefusedError):
+        marker = "connection refused"
+    elif isinstance(e, socket.gaierror):
+        marker = "no such host"
+    elif isinstance(e, (ConnectionResetError, http.client.RemoteDisconnected, BrokenPipeError)):
+        marker = "connection reset"
+    else:
+        marker = "unexpected EOF"
+    return f"api: {marker}: {e}"
+
+
+class ApiTransport:
+    """直接呼叫 YouTube Data API 執行命令（見模組說明）"""
+
+    name = "api"
+    # 可送出 fields 遮罩（yutu 沒有對應的旗標）
+    supports_fields = True
+
+    def __init__(
+        self,
+        *,
+        base_url: str = API_BASE_URL,
+        max_idle: int = 8,
+        fallback: Optional[SubprocessTransport] = None,
+    ):
+        self.pool = ConnectionPool(base_url, max_idle=max_idle)
+        self.fallback = fallback or SubprocessTransport()
+        self.requests = 0
+        self.fallback_calls = 0
+        self._tokens: Optional[TokenSource] = None
+        self._lock = threading.Lock()
+
+    def _token_source(self, env: dict[str, str]) -> TokenSource:
+        """依 yutu 的環境變數取得 token 來源（帳號改變時重新建立）"""
+        token_path = Path(env.get("YUTU_CACHE_TOKEN", "youtube.token.json"))
+        credential_path = Path(env.get("YUTU_CREDENTIAL", "client_secret.json"))
+        with self._lock:
+            tokens = self._tokens
+            if tokens is None or (tokens.token_path, tokens.credential_path) != (token_path, credential_path):
+                tokens = self._tokens = TokenSource(token_path, credential_path)
+            return tokens
+
+    def _request(
+        self,
+        tokens: TokenSource,
+        method: str,
+        path: str,
+        query: dict[str, str],
+        body: Optional[dict],
+        timeout: float,
+    ) -> Any:
+        """送出一個 API 請求；access token 被拒絕時更新後重送一次
+
+        Raises:
+            ApiError: API 回應錯誤
+            TokenError: 無法取得 access token
+        """
+        url = f"{path}?{urlencode(query)}" if query else path
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        for attempt in range(2):
+            headers = {
+                "Authorization": f"Bearer {tokens.access_token(force_refresh=attempt > 0)}",
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip",
+                "User-Agent": USER_AGENT,
+            }
+            if payload is not None:
+                headers["Content-Type"] = "application/json; charset=utf-8"
+            with self._lock:
+                self.requests += 1
+            with span("http", PHASE_CATEGORY, method=method, path=path) as current:
+                response = self.pool.request(method, url, body=payload, headers=headers, timeout=timeout)
+                current.set(status=response.status, bytes=len(response.body))
+            if response.status != 401:
+                break
+        if response.status >= 400:
+            raise ApiError(format_api_error(response.status, response.body))
+        return loads(response.body) if response.body.strip() else None
+
+    def _call(self, endpoint: Endpoint, flags: dict[str, str], tokens: TokenSource, timeout: float) -> Any:
+        """依端點送出請求，回傳與 yutu JSON 輸出相同的資料"""
+        if endpoint.per_id:
+            for item_id in (flags.get("ids") or flags.get("id") or "").split(","):
+                if item_id:
+                    self._request(tokens, endpoint.method, endpoint.path, {"id": item_id}, None, timeout)
+            return None
+
+        query: dict[str, str] = {}
+        for flag, value in flags.items():
+            name = QUERY_ALIASES.get(flag, flag)
+            if name in endpoint.query or name in ("part", "fields"):
+                query[name] = value
+        if endpoint.part:
+            query.setdefault("part", endpoint.part)
+        body = endpoint.body(flags) if endpoint.body else None
+
+        if not endpoint.paged:
+            data = self._request(tokens, endpoint.method, endpoint.path, query, body, timeout)
+            return (data or {}).get("items", []) if endpoint.items else data
+
+        limit = int(flags.get("maxResults") or 0)
+        items: list[dict] = []
+        while True:
+            query["maxResults"] = str(PAGE_SIZE if not limit else min(PAGE_SIZE, limit - len(items)))
+            page = self._request(tokens, endpoint.method, endpoint.path, query, None, timeout) or {}
+            items.extend(page.get("items", []))
+            next_token = page.get("nextPageToken")
+            if not next_token or (limit and len(items) >= limit):
+                return items[:limit] if limit else items
+            query["pageToken"] = next_token
+
+    def execute(self, cmd: list[str], env: dict[str, str], timeout: float) -> CommandOutput:
+        """執行命令（介面與 SubprocessTransport.execute 相同）
+
+        Raises:
+            subprocess.TimeoutExpired: 單一請求超過 timeout 秒
+        """
+        resource, action, flags = parse_command(cmd)
+        endpoint = ENDPOINTS.get((resource, action))
+        if endpoint is None or flags.pop("output", "json") != "json":
+            with self._lock:
+                self.fallback_calls += 1
+            return self.fallback.execute(cmd, env, timeout)
+
+        try:
+            data = self._call(endpoint, flags, self._token_source(env), timeout)
+        except (ApiError, TokenError) as e:
+            return CommandOutput(1, "", str(e))
+        except KeyError as e:
+            return CommandOutput(1, "", f"缺少參數：--{e.args[0]}")
+        except TimeoutError as e:
+            raise subprocess.TimeoutExpired(cmd, timeout) from e
+        except (OSError, http.client.HTTPException) as e:
+            return CommandOutput(1, "", _network_error(e))
+        return CommandOutput(0, "" if data is None else json.dumps(data, ensure_ascii=False))
+
+    def close(self) -> None:
+        """關閉閒置的連線"""
+        self.pool.close()
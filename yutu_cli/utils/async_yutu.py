@@ -0,0 +1,343 @@
+"""非同步 yutu CLI 包裝器 - 以有限並行數同時執行多個 yutu 命令"""
+
+import asyncio
+import subprocess
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Coroutine, Hashable, Iterable, Optional, TypeVar
+
+from yutu_cli.utils.batching import BatchResult, chunked, merge_batches, split_ids
+from yutu_cli.utils.retry import TIMEOUT
+from yutu_cli.utils.tracing import COMMAND_CATEGORY, PHASE_CATEGORY, annotate, span
+from yutu_cli.utils.yutu import HYDRATE_FIELDS, YutuCLI, YutuResult
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+async def _kill_process(proc: asyncio.subprocess.Process) -> None:
+    """終止子程序並回收，避免留下殭屍程序"""
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    await proc.wait()
+
+
+class AsyncYutuCLI(YutuCLI):
+    """以 asyncio 執行 yutu 命令的包裝器
+
+    與 YutuCLI 共用命令建構與快取邏輯；所有便捷方法
+    （`list_playlist_items`、`list_captions`、`list_comment_threads` 等）
+    都會回傳可 await 的物件。同時執行的子程序數量受 semaphore 限制。
+
+    Examples:
+        >>> async def main():
+        ...     yutu = AsyncYutuCLI(max_concurrency=16)
+        ...     return await yutu.fetch_many(yutu.list_playlist_items, playlist_ids)
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        super().__init__()
+        self.max_concurrency = max_concurrency or self.config.max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """取得目前事件迴圈的 semaphore（每個事件迴圈各自建立）"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(  # type: ignore[override]
+        self,
+        resource: str,
+        action: str,
+        *,
+        output_format: str = "json",
+        max_results: Optional[int] = None,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> YutuResult:
+        """非同步執行 yutu 命令
+
+        暫時性錯誤的重試規則與 `YutuCLI.run` 相同（等待時不阻塞事件迴圈）。
+
+        Args:
+            resource: 資源類型（playlist, video, search 等）
+            action: 動作（list, insert, delete 等）
+            output_format: 輸出格式（json, yaml）
+            max_results: 最大結果數（None 使用設定預設值）
+            use_cache: 是否允許使用回應快取（僅對唯讀動作生效）
+            timeout: 本次呼叫的超時秒數（None 使用設定預設值）
+            **kwargs: 其他參數
+
+        Returns:
+            YutuResult 物件
+
+        Raises:
+            asyncio.CancelledError: 工作被取消時（子程序會先被終止）
+        """
+        cmd = self._build_command(
+            resource, action,
+            output_format=output_format,
+            max_results=max_results,
+            **kwargs,
+        )
+
+        started = time.perf_counter()
+        with span(f"{resource}.{action}", COMMAND_CATEGORY, argv=cmd) as current:
+            result = await self._run_command_async(
+                resource, action, output_format, max_results, use_cache, timeout, cmd, kwargs
+            )
+            current.set(success=result.success, cached=result.cached, error_kind=result.error_kind)
+        self._observe(resource, action, result, started)
+        return result
+
+    async def _run_command_async(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        max_results: Optional[int],
+        use_cache: bool,
+        timeout: Optional[float],
+        cmd: list[str],
+        kwargs: dict[str, Any],
+    ) -> YutuResult:
+        """依序查詢快取、鏡像，再送出命令（含重試）"""
+        cache_key = self._cache_key_for(cmd, action, output_format, use_cache)
+        local = self._lookup_local(resource, action, output_format, use_cache, max_results, cache_key, kwargs)
+        if local is not None:
+            return local
+
+        timeout = timeout or self.config.command_timeout
+        attempt = 0
+        while True:
+            result = await self._execute_async(
+                resource, action, output_format, cache_key, cmd, timeout, kwargs
+            )
+            self._correct_quota_for(resource, action, kwargs, cmd, result)
+            settled = self._settle(resource, action, kwargs, result, attempt)
+            if settled is not None:
+                return settled
+            delay = self._retry_delay(resource, action, result, attempt)
+            if delay is None:
+                return result
+            await asyncio.sleep(delay)
+            attempt += 1
+            if self._needs_verification(action, result):
+                applied = await asyncio.to_thread(self._find_applied_insert, resource, action, kwargs)
+                if applied is not None:
+                    return self._settle(resource, action, kwargs, applied, attempt) or result
+
+    async def _execute_async(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        cache_key: Optional[str],
+        cmd: list[str],
+        timeout: float,
+        params: dict[str, Any],
+    ) -> YutuResult:
+        """記帳後送出一次命令"""
+        refused = self._reserve_quota(resource, action, params, cmd)
+        if refused is not None:
+            return refused
+
+        if self.transport.name != "subprocess":
+            # 常駐工作程序等傳輸層為同步介面，交給執行緒處理
+            return await self._run_in_thread(
+                resource, action, output_format, cache_key, cmd, timeout, params
+            )
+
+        async with self._get_semaphore():
+            try:
+                with span("spawn", PHASE_CATEGORY):
+                    proc = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        env=self._get_env(),
+                    )
+            except FileNotFoundError:
+                return YutuResult(
+                    success=False,
+                    error=f"找不到 yutu CLI: {self.config.cli_path}",
+                )
+            except Exception as e:
+                return YutuResult(success=False, error=f"執行錯誤: {e}")
+
+            try:
+                with span("wait", PHASE_CATEGORY):
+                    stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                await _kill_process(proc)
+                return YutuResult(
+                    success=False,
+                    error=f"命令執行超時（超過 {timeout} 秒）",
+                    error_kind=TIMEOUT,
+                )
+            except asyncio.CancelledError:
+                await _kill_process(proc)
+                raise
+
+        annotate(exit_code=proc.returncode, bytes_out=len(stdout))
+        return self._complete(
+            resource, action, output_format, cache_key,
+            proc.returncode or 0,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+            params,
+        )
+
+    async def _run_in_thread(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        cache_key: Optional[str],
+        cmd: list[str],
+        timeout: float,
+        params: dict[str, Any],
+    ) -> YutuResult:
+        """透過同步傳輸層執行命令（不阻塞事件迴圈）"""
+        async with self._get_semaphore():
+            try:
+                output = await asyncio.to_thread(
+                    self.transport.execute, cmd, self._get_env(), timeout
+                )
+            except subprocess.TimeoutExpired:
+                return YutuResult(
+                    success=False,
+                    error=f"命令執行超時（超過 {timeout} 秒）",
+                    error_kind=TIMEOUT,
+                )
+            except FileNotFoundError:
+                return YutuResult(
+                    success=False,
+                    error=f"找不到 yutu CLI: {self.config.cli_path}",
+                )
+            except Exception as e:
+                return YutuResult(success=False, error=f"執行錯誤: {e}")
+        annotate(exit_code=output.returncode, bytes_out=len(output.stdout))
+        return self._complete(
+            resource, action, output_format, cache_key,
+            output.returncode, output.stdout, output.stderr, params,
+        )
+
+    async def _gather_batches(
+        self,
+        fetch: Callable[[list[str]], Awaitable[YutuResult]],
+        ids: str | Iterable[str],
+        key: Callable[[dict], str],
+    ) -> BatchResult:
+        """切分 ID 並同時送出所有批次（並行數由 semaphore 控制）"""
+        ids = split_ids(ids)
+        chunks = chunked(ids)
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return merge_batches(ids, chunks, results, key)
+
+    async def batch_video_details(  # type: ignore[override]
+        self,
+        video_ids: str | list[str],
+        *,
+        max_workers: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> BatchResult:
+        """分批並行查詢影片詳情（並行數由 semaphore 控制，max_workers 不適用）"""
+        return await self._gather_batches(
+            partial(self._fetch_video_details, fields=fields), video_ids, lambda item: item.get("id", "")
+        )
+
+    async def get_video_details(  # type: ignore[override]
+        self, video_ids: str | list[str], *, fields: Optional[Iterable[str]] = None
+    ) -> YutuResult:
+        """取得影片詳情（超過 50 個 ID 時自動分批）"""
+        return YutuResult.from_batch(await self.batch_video_details(video_ids, fields=fields))
+
+    async def batch_video_rating(  # type: ignore[override]
+        self, video_ids: str | list[str], *, max_workers: Optional[int] = None
+    ) -> BatchResult:
+        """分批並行查詢影片評分狀態（並行數由 semaphore 控制，max_workers 不適用）"""
+        return await self._gather_batches(
+            self._fetch_video_rating, video_ids, lambda item: item.get("videoId", "")
+        )
+
+    async def get_video_rating(self, video_ids: str | list[str]) -> YutuResult:  # type: ignore[override]
+        """取得影片評分狀態（超過 50 個 ID 時自動分批）"""
+        return YutuResult.from_batch(await self.batch_video_rating(video_ids))
+
+    async def get_uploads_playlist_id(self) -> Optional[str]:  # type: ignore[override]
+        """取得我的頻道「上傳的影片」播放清單 ID（解析一次後保留；查詢失敗或沒有時為 None）"""
+        if self._uploads_playlist_id is None:
+            self._remember_uploads_playlist_id(await self._fetch_uploads_playlist_id())
+        return self._uploads_playlist_id or None
+
+    async def list_my_videos(  # type: ignore[override]
+        self,
+        max_results: Optional[int] = None,
+        *,
+        use_cache: bool = True,
+        hydrate: bool = False,
+    ) -> YutuResult:
+        """列出我的影片（透過 uploads 播放清單，詳見 YutuCLI.list_my_videos）"""
+        if self._uploads_playlist_id is None:
+            failed = self._remember_uploads_playlist_id(await self._fetch_uploads_playlist_id())
+            if failed is not None:
+                return failed
+        if not self._uploads_playlist_id:
+            return await self._search_my_videos(max_results, use_cache)
+
+        result = await self._list_uploads(self._uploads_playlist_id, max_results, use_cache)
+        if not result.success:
+            return result
+
+        details = None
+        if hydrate:
+            details = await self.batch_video_details(self._uploads_video_ids(result), fields=HYDRATE_FIELDS)
+        return self._build_my_videos_result(result, details)
+
+    async def download_caption(  # type: ignore[override]
+        self,
+        caption_id: str,
+        file_path: str,
+        fmt: str = "srt",
+        tlang: Optional[str] = None,
+    ) -> YutuResult:
+        """下載字幕檔案（詳見 YutuCLI.download_caption）"""
+        result = await self.run(
+            "caption", "download", output_format="silent",
+            **self._caption_download_params(caption_id, file_path, fmt, tlang),
+        )
+        return self._caption_downloaded(result, caption_id, file_path, tlang)
+
+    async def fetch_many(
+        self,
+        method: Callable[..., Awaitable[YutuResult]],
+        keys: Iterable[K],
+        **kwargs: Any,
+    ) -> dict[K, YutuResult]:
+        """對多個鍵並行呼叫同一個便捷方法
+
+        Args:
+            method: 便捷方法（例如 `self.list_playlist_items`）
+            keys: 傳給方法的第一個參數（例如播放清單 ID）
+            **kwargs: 其他傳給方法的參數
+
+        Returns:
+            鍵 -> 結果 的字典（順序與輸入相同）
+        """
+        keys = list(dict.fromkeys(keys))
+        results = await asyncio.gather(*(method(key, **kwargs) for key in keys))
+        return dict(zip(keys, results))
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """在同步程式碼（例如互動選單）中執行非同步工作"""
+    return asyncio.run(coro)
@@ -0,0 +1,127 @@
+"""批次處理模組 - 將大量 ID 切分成符合 API 上限的批次"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# YouTube Data API 單次請求可帶入的 ID 上限
+MAX_IDS_PER_REQUEST = 50
+
+
+def dedupe(ids: Iterable[str]) -> list[str]:
+    """去除重複與空白 ID，保留第一次出現的順序
+
+    Examples:
+        >>> dedupe(["a", " b", "a", "", "c"])
+        ['a', 'b', 'c']
+    """
+    return list(dict.fromkeys(i.strip() for i in ids if i and i.strip()))
+
+
+def chunked(items: Sequence[T], size: int = MAX_IDS_PER_REQUEST) -> list[list[T]]:
+    """將序列切分成固定大小的批次
+
+    Examples:
+        >>> chunked([1, 2, 3, 4, 5], 2)
+        [[1, 2], [3, 4], [5]]
+    """
+    if size <= 0:
+        raise ValueError("批次大小必須大於 0")
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def split_ids(ids: str | Iterable[str]) -> list[str]:
+    """接受逗號分隔字串或 ID 列表，回傳去重後的 ID 列表"""
+    if isinstance(ids, str):
+        ids = ids.split(",")
+    return dedupe(ids)
+
+
+@dataclass
+class BatchResult:
+    """批次查詢的合併結果"""
+    items: list[dict] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    calls: int = 0
+
+    @property
+    def success(self) -> bool:
+        """所有批次都成功（missing 不算失敗）"""
+        return not self.errors
+
+
+def merge_batches(
+    ids: Sequence[str],
+    chunks: Sequence[Sequence[str]],
+    results: Sequence,
+    key: Callable[[dict], str],
+) -> BatchResult:
+    """依輸入順序合併各批次的結果
+
+    Args:
+        ids: 去重後的完整 ID 列表（決定輸出順序）
+        chunks: 各批次的 ID
+        results: 各批次對應的 YutuResult
+        key: 從回應項目取得 ID 的函式
+
+    Returns:
+        BatchResult：找不到的 ID（已刪除或私人）列在 missing，
+        批次失敗的 ID 列在 failed
+    """
+    found: dict[str, dict] = {}
+    failed: set[str] = set()
+    errors: list[str] = []
+
+    for chunk, result in zip(chunks, results):
+        if not result.success:
+            failed.update(chunk)
+            errors.append(result.error or "批次查詢失敗")
+            continue
+        data = result.data
+        items = data if isinstance(data, list) else (data or {}).get("items", [])
+        for item in items:
+            found.setdefault(key(item), item)
+
+    batch = BatchResult(errors=errors, calls=len(chunks))
+    for video_id in ids:
+        if video_id in found:
+            batch.items.append(found[video_id])
+        elif video_id in failed:
+            batch.failed.append(video_id)
+        else:
+            batch.missing.append(video_id)
+    return batch
+
+
+def fetch_in_batches(
+    fetch: Callable[[list[str]], object],
+    ids: str | Iterable[str],
+    *,
+    key: Callable[[dict], str],
+    batch_size: int = MAX_IDS_PER_REQUEST,
+    max_workers: int = 4,
+) -> BatchResult:
+    """切分 ID 並以執行緒池並行查詢，再依輸入順序合併
+
+    Args:
+        fetch: 查詢單一批次的函式（接受 ID 列表，回傳 YutuResult）
+        ids: ID 列表或逗號分隔字串
+        key: 從回應項目取得 ID 的函式
+        batch_size: 每批 ID 數量
+        max_workers: 同時執行的批次數上限
+
+    Returns:
+        BatchResult
+    """
+    ids = split_ids(ids)
+    chunks = chunked(ids, batch_size)
+    if len(chunks) <= 1 or max_workers <= 1:
+        results = [fetch(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            results = list(pool.map(fetch, chunks))
+    return merge_batches(ids, chunks, results, key)
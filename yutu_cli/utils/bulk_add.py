@@ -0,0 +1,276 @@
+"""批次加入影片 - 將大量網址/影片 ID 加入播放清單
+
+輸入可為檔案、標準輸入或貼上的文字，每個網址或 ID 以空白、逗號或換行分隔。
+執行進度寫入 `<state_dir>/imports/` 下的進度檔，中斷後以相同的清單與
+播放清單重新執行，只會處理尚未完成的影片。
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from yutu_cli.utils.batching import dedupe
+from yutu_cli.utils.quota import QuotaLedger, is_quota_error, quota_cost
+from yutu_cli.utils.youtube_utils import extract_video_id
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
+
+VIDEO_ID_PATTERN = re.compile(r"^[\w-]{11}$")
+
+
+def parse_video_refs(text: str) -> tuple[list[str], list[str]]:
+    """從文字中取出影片 ID
+
+    Args:
+        text: 以空白、逗號或換行分隔的網址或影片 ID（# 開頭的行為註解）
+
+    Returns:
+        (去重後的影片 ID, 無法辨識的項目)
+
+    Examples:
+        >>> parse_video_refs("https://youtu.be/dQw4w9WgXcQ, dQw4w9WgXcQ\\nbad")
+        (['dQw4w9WgXcQ'], ['bad'])
+    """
+    ids: list[str] = []
+    invalid: list[str] = []
+    for line in text.splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        for token in re.split(r"[\s,]+", line):
+            if not token:
+                continue
+            video_id = extract_video_id(token)
+            if VIDEO_ID_PATTERN.match(video_id):
+                ids.append(video_id)
+            else:
+                invalid.append(token)
+    return dedupe(ids), invalid
+
+
+def read_video_refs(source: str) -> tuple[list[str], list[str]]:
+    """讀取檔案（`-` 為標準輸入）中的影片網址或 ID"""
+    if source == "-":
+        return parse_video_refs(sys.stdin.read())
+    return parse_video_refs(Path(source).expanduser().read_text(encoding="utf-8"))
+
+
+def playlist_video_ids(items: Iterable[dict]) -> set[str]:
+    """取得播放清單項目中的影片 ID"""
+    return {
+        item.get("contentDetails", {}).get("videoId")
+        or item.get("snippet", {}).get("resourceId", {}).get("videoId", "")
+        for item in items
+    } - {""}
+
+
+class ImportManifest:
+    """批次加入的進度檔
+
+    以播放清單 ID 與影片 ID 清單決定檔名，相同的匯入會讀到同一個進度檔。
+    每完成一部影片就寫回磁碟（先寫暫存檔再取代，中斷也不會留下半個檔案）。
+    """
+
+    def __init__(self, path: Path, playlist_id: str, video_ids: list[str]):
+        self.path = path
+        self.playlist_id = playlist_id
+        self.video_ids = video_ids
+        self.done: set[str] = set()
+        self.failed: dict[str, str] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            self._load()
+
+    @classmethod
+    def for_import(cls, directory: Path, playlist_id: str, video_ids: list[str]) -> "ImportManifest":
+        """取得某次匯入的進度檔（不存在時建立新的）"""
+        digest = hashlib.sha256("\n".join(video_ids).encode("utf-8")).hexdigest()[:12]
+        return cls(directory / f"{playlist_id}-{digest}.json", playlist_id, video_ids)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("playlist_id") != self.playlist_id:
+            return
+        self.done = set(data.get("done", []))
+        self.failed = dict(data.get("failed", {}))
+
+    @property
+    def pending(self) -> list[str]:
+        """尚未成功加入的影片（依輸入順序）"""
+        return [video_id for video_id in self.video_ids if video_id not in self.done]
+
+    @property
+    def resumed(self) -> bool:
+        """是否接續先前中斷的匯入"""
+        return bool(self.done or self.failed)
+
+    def mark(self, video_id: str, error: Optional[str] = None) -> None:
+        """記錄一部影片的結果並寫回磁碟"""
+        with self._lock:
+            if error is None:
+                self.done.add(video_id)
+                self.failed.pop(video_id, None)
+            else:
+                self.failed[video_id] = error
+            self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "playlist_id": self.playlist_id,
+            "total": len(self.video_ids),
+            "done": [video_id for video_id in self.video_ids if video_id in self.done],
+            "failed": self.failed,
+            "updated_at": time.time(),
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def remove(self) -> None:
+        """全部完成後刪除進度檔"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+@dataclass
+class BulkAddReport:
+    """批次加入結果"""
+    added: int = 0
+    already_present: int = 0
+    resumed: int = 0
+    deferred: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+    aborted: bool = False
+    calls: int = 0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and not self.aborted
+
+
+class BulkAdder:
+    """以執行緒池將影片加入播放清單
+
+    暫時性錯誤由 `YutuCLI.run` 重試（重試前會先確認結果未知的新增是否已生效），
+    這裡不再另外重試，以免重複加入。
+
+    Args:
+        yutu: YutuCLI 實例
+        playlist_id: 目標播放清單 ID
+        manifest: 進度檔
+        max_workers: 同時執行的新增數（1 表示依輸入順序加入）
+        progress: 每完成一部影片時呼叫，參數為 (已處理, 總數)
+        ledger: 配額帳本；指定時只加入剩餘預算負擔得起的影片，其餘留在進度檔中待下次執行
+    """
+
+    def __init__(
+        self,
+        yutu: YutuCLI,
+        playlist_id: str,
+        manifest: ImportManifest,
+        *,
+        max_workers: int = 4,
+        progress: Optional[Callable[[int, int], None]] = None,
+        ledger: Optional[QuotaLedger] = None,
+    ):
+        self.yutu = yutu
+        self.playlist_id = playlist_id
+        self.ledger = ledger
+        self.manifest = manifest
+        self.max_workers = max(1, max_workers)
+        self.progress = progress or (lambda done, total: None)
+        self.report = BulkAddReport()
+        self._abort = threading.Event()
+        self._lock = threading.Lock()
+        self._processed = 0
+
+    def existing_video_ids(self) -> Optional[set[str]]:
+        """目前播放清單中的影片（無法取得時回傳 None）"""
+        result = self.yutu.run(
+            "playlistItem", "list",
+            playlistId=self.playlist_id,
+            parts="contentDetails",
+            use_cache=False,
+        )
+        self.report.calls += 1
+        if not result.success:
+            return None
+        data = result.data
+        return playlist_video_ids(data if isinstance(data, list) else (data or {}).get("items", []))
+
+    def plan(self) -> Optional[list[str]]:
+        """計算要加入的影片：排除已完成與已在清單中的影片"""
+        existing = self.existing_video_ids()
+        if existing is None:
+            return None
+        self.report.resumed = len(self.manifest.done)
+        todo = []
+        for video_id in self.manifest.pending:
+            if video_id in existing:
+                self.report.already_present += 1
+                self.manifest.done.add(video_id)
+            else:
+                todo.append(video_id)
+        if self.ledger is not None:
+            affordable = self.ledger.affordable(quota_cost("playlistItem", "insert"), len(todo))
+            self.report.deferred = len(todo) - affordable
+            todo = todo[:affordable]
+        return todo
+
+    def _add(self, video_id: str) -> Optional[YutuResult]:
+        """加入一部影片（已中止時回傳 None）"""
+        if self._abort.is_set():
+            return None
+        result = self.yutu.add_to_playlist(self.playlist_id, video_id)
+        with self._lock:
+            self.report.calls += 1
+        if is_quota_error(result.error):
+            # 配額用盡或超出預算時其餘影片也無法加入，直接停止
+            self._abort.set()
+        return result
+
+    def _process(self, video_id: str, total: int) -> None:
+        result = self._add(video_id)
+        if result is not None:
+            error = None if result.success else (result.error or "新增失敗")
+            self.manifest.mark(video_id, error)
+        with self._lock:
+            if result is not None and result.success:
+                self.report.added += 1
+            elif result is not None:
+                self.report.failed[video_id] = result.error or "新增失敗"
+            self._processed += 1
+            self.progress(self._processed, total)
+
+    def run(self, todo: Optional[list[str]] = None) -> BulkAddReport:
+        """執行匯入（todo 為 None 時先呼叫 plan）"""
+        if todo is None:
+            todo = self.plan()
+            if todo is None:
+                self.report.aborted = True
+                self.report.failed["*"] = "無法取得播放清單內容"
+                return self.report
+
+        if self.max_workers == 1:
+            for video_id in todo:
+                self._process(video_id, len(todo))
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(lambda video_id: self._process(video_id, len(todo)), todo))
+
+        self.report.aborted = self._abort.is_set()
+        if not self.manifest.pending:
+            self.manifest.remove()
+        return self.report
@@ -0,0 +1,204 @@
+"""回應快取模組 - 以 SQLite 保存唯讀 yutu 命令的輸出"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# 可快取的唯讀動作
+CACHEABLE_ACTIONS = frozenset({"list", "getRating"})
+
+# 不會修改遠端資料的動作（執行後不需使快取失效）
+READ_ONLY_ACTIONS = CACHEABLE_ACTIONS | {"download"}
+
+# 各資源的預設存活時間（秒）
+DEFAULT_TTLS: dict[str, int] = {
+    "channel": 3600,
+    "playlist": 300,
+    "playlistItem": 300,
+    "video": 300,
+    "search": 600,
+    "commentThread": 120,
+    "comment": 120,
+    "caption": 600,
+}
+
+# 未列出的資源使用此存活時間
+FALLBACK_TTL = 300
+
+# 寫入某資源後需一併失效的資源（例如新增清單項目會改變清單的影片數）
+INVALIDATION_MAP: dict[str, tuple[str, ...]] = {
+    "playlist": ("playlist",),
+    "playlistItem": ("playlistItem", "playlist"),
+    "video": ("video", "search", "playlistItem"),
+    "commentThread": ("commentThread",),
+    "comment": ("comment", "commentThread"),
+    "caption": ("caption",),
+    "channel": ("channel",),
+}
+
+
+def make_cache_key(cmd: list[str], identity: str = "") -> str:
+    """由 yutu 命令列建構快取鍵
+
+    忽略執行檔路徑，並將 `--flag value` 參數排序，
+    讓參數順序不同但語意相同的命令共用同一個鍵。
+
+    Args:
+        cmd: `_build_command` 產生的命令列
+        identity: 憑證識別（不同帳號的回應不可共用）
+
+    Returns:
+        SHA-256 十六進位字串
+    """
+    resource, action, *args = cmd[1:]
+    pairs = sorted(zip(args[0::2], args[1::2]))
+    normalized = json.dumps([identity, resource, action, pairs], ensure_ascii=False)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """快取命中統計"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """命中率（0.0 ~ 1.0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """以 SQLite 儲存的回應快取（TTL + LRU 容量上限）"""
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        max_entries: int = 2000,
+        max_bytes: int = 50 * 1024 * 1024,
+        ttls: Optional[dict[str, int]] = None,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                resource TEXT NOT NULL,
+                action TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_resource ON responses(resource)"
+        )
+        self._conn.commit()
+
+    def ttl_for(self, resource: str) -> int:
+        """取得資源的存活時間（秒）"""
+        return self.ttls.get(resource, FALLBACK_TTL)
+
+    def get(self, key: str) -> Optional[str]:
+        """讀取快取內容，過期或不存在時回傳 None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.stats.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.stats.hits += 1
+            return row[0]
+
+    def put(self, key: str, resource: str, action: str, payload: str) -> None:
+        """寫入快取，必要時淘汰最久未使用的項目"""
+        ttl = self.ttl_for(resource)
+        if ttl <= 0:
+            return
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, resource, action, payload, size, now + ttl, now),
+            )
+            self.stats.stores += 1
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """移除過期項目，並依 LRU 淘汰直到符合容量上限"""
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        victims = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def invalidate(self, resource: str) -> None:
+        """資源被寫入後，使相關資源的快取失效"""
+        related = INVALIDATION_MAP.get(resource, (resource,))
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM responses WHERE resource = ?", [(r,) for r in related]
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """清除所有快取"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """關閉資料庫連線"""
+        with self._lock:
+            self._conn.close()
@@ -1,13 +1,20 @@
 """顯示輔助模組 - 使用 rich 美化輸出"""
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from yutu_cli.config import get_config
+from yutu_cli.utils.models import Caption, CommentThread, Playlist, PlaylistItem, Video, items_of, parse_models
+from yutu_cli.utils.search_index import SearchHit, highlight
+from yutu_cli.utils.table_view import Column, TableView, browse
+from yutu_cli.utils.tracing import traced
+
 console = Console()
 
 
@@ -76,9 +83,20 @@ def truncate(text: str | None, max_len: int = 60) -> str:
     return text[: max_len - 3] + "..."
 
 
+def table_page_size() -> int:
+    """表格每頁列數（未設定時依終端機高度扣除標題、表頭與提示列）"""
+    return get_config().table_page_size or max(10, console.height - 10)
+
+
+def _table_view(items: list, columns: list[Column], row, title: str) -> TableView:
+    """建立使用預設頁面大小的分頁表格"""
+    return TableView(items, columns, row, title=title, page_size=table_page_size())
+
+
+@traced("ui")
 def display_playlists(data: dict | list) -> None:
-    """顯示播放清單列表"""
-    items = data if isinstance(data, list) else data.get("items", [])
+    """顯示播放清單列表（data 可為 API 回應或 Playlist 列表）"""
+    items = parse_models(data, Playlist)
     
     if not items:
         console.print("[yellow]找不到任何播放清單[/yellow]")
@@ -95,15 +113,8 @@ def display_playlists(data: dict | list) -> None:
     table.add_column("隱私狀態", justify="center")
     table.add_column("ID", style="dim")
     
-    for i, item in enumerate(items, 1):
-        snippet = item.get("snippet", {})
-        content = item.get("contentDetails", {})
-        status = item.get("status", {})
-        
-        title = snippet.get("title", "無標題")
-        video_count = str(content.get("itemCount", 0))
-        privacy = status.get("privacyStatus", "unknown")
-        playlist_id = item.get("id", "")
+    for i, playlist in enumerate(items, 1):
+        privacy = playlist.privacy_status or "unknown"
         
         # 隱私狀態顏色
         privacy_style = {
@@ -112,48 +123,94 @@ def display_playlists(data: dict | list) -> None:
             "private": "[red]私人[/red]",
         }.get(privacy, privacy)
         
-        table.add_row(str(i), title, video_count, privacy_style, playlist_id)
+        table.add_row(str(i), playlist.title or "無標題", str(playlist.item_count), privacy_style, playlist.id)
     
     console.print(table)
 
 
+def _playlist_item_row(index: int, item: dict | PlaylistItem) -> tuple[str, str, str, str, str]:
+    """將播放清單項目轉換為表格列（分頁表格只轉換畫面上的列）"""
+    if not isinstance(item, PlaylistItem):
+        item = PlaylistItem.from_api(item)
+    title = truncate(item.title or "無標題", 50)
+    channel = truncate(item.channel_title, 20)
+    published = format_date(item.video_published_at)
+    
+    return str(index), title, channel, published, item.video_id
+
+
+def _playlist_items_table(title: Optional[str], *, show_header: bool = True) -> Table:
+    """建立播放清單項目表格（固定欄寬，讓分段輸出的表格對齊）"""
+    table = Table(title=title, show_header=show_header, header_style="bold cyan")
+    table.add_column("#", style="dim", width=5)
+    table.add_column("標題", style="bold", width=50)
+    table.add_column("頻道", style="dim", width=20)
+    table.add_column("發布日期", justify="center", width=10)
+    table.add_column("Video ID", style="dim", width=11)
+    return table
+
+
+@traced("ui")
 def display_playlist_items(data: dict | list, playlist_title: str = "") -> None:
-    """顯示播放清單中的影片"""
-    items = data if isinstance(data, list) else data.get("items", [])
+    """顯示播放清單中的影片（分頁瀏覽）"""
+    items = items_of(data)
     
     if not items:
         console.print("[yellow]播放清單中沒有影片[/yellow]")
         return
     
     title = f"🎥 {playlist_title}" if playlist_title else "🎥 播放清單內容"
-    table = Table(
-        title=f"{title}（共 {len(items)} 部影片）",
-        show_header=True,
-        header_style="bold cyan",
-    )
-    table.add_column("#", style="dim", width=4)
-    table.add_column("標題", style="bold", max_width=50)
-    table.add_column("頻道", style="dim")
-    table.add_column("發布日期", justify="center")
-    table.add_column("Video ID", style="dim")
+    columns = [
+        Column("#", style="dim"),
+        Column("標題", style="bold", max_width=50),
+        Column("頻道", style="dim", max_width=20),
+        Column("發布日期", justify="center"),
+        Column("Video ID", style="dim"),
+    ]
+    browse(_table_view(items, columns, _playlist_item_row, f"{title}（共 {len(items)} 部影片）"), console)
+
+
+@traced("ui")
+def display_playlist_items_progressive(
+    items: Iterable[dict | PlaylistItem], playlist_title: str = "", page_size: int = 100
+) -> int:
+    """邊接收邊顯示播放清單中的影片
+
+    每累積 `page_size` 筆就輸出一段表格，記憶體中只保留一段的資料，
+    適合搭配 `YutuResult.iter_items()` 顯示串流結果。
+
+    Args:
+        items: 播放清單項目（可為產生器）
+        playlist_title: 播放清單標題
+        page_size: 每段輸出的列數
+
+    Returns:
+        顯示的總筆數
+    """
+    title = f"🎥 {playlist_title}" if playlist_title else "🎥 播放清單內容"
+    count = 0
+    table = _playlist_items_table(title)
     
-    for i, item in enumerate(items, 1):
-        snippet = item.get("snippet", {})
-        content = item.get("contentDetails", {})
-        
-        title = truncate(snippet.get("title", "無標題"), 50)
-        channel = truncate(snippet.get("videoOwnerChannelTitle", ""), 20)
-        video_id = content.get("videoId", snippet.get("resourceId", {}).get("videoId", ""))
-        published = format_date(content.get("videoPublishedAt", ""))
-        
-        table.add_row(str(i), title, channel, published, video_id)
+    for count, item in enumerate(items, 1):
+        table.add_row(*_playlist_item_row(count, item))
+        if count % page_size == 0:
+            console.print(table)
+            table = _playlist_items_table(None, show_header=False)
     
-    console.print(table)
+    if table.row_count:
+        console.print(table)
+    
+    if count == 0:
+        console.print("[yellow]播放清單中沒有影片[/yellow]")
+    else:
+        console.print(f"[dim]{title}（共 {count} 部影片）[/dim]")
+    return count
 
 
+@traced("ui")
 def display_videos(data: dict | list) -> None:
-    """顯示影片列表"""
-    items = data if isinstance(data, list) else data.get("items", [])
+    """顯示影片列表（data 可為 API 回應或 Video 列表）"""
+    items = parse_models(data, Video)
     
     if not items:
         console.print("[yellow]找不到任何影片[/yellow]")
@@ -171,24 +228,47 @@ def display_videos(data: dict | list) -> None:
     table.add_column("時長", justify="center")
     table.add_column("發布日期", justify="center")
     
-    for i, item in enumerate(items, 1):
-        snippet = item.get("snippet", {})
-        stats = item.get("statistics", {})
-        content = item.get("contentDetails", {})
-        
-        title = truncate(snippet.get("title", "無標題"), 45)
-        views = format_count(stats.get("viewCount"))
-        likes = format_count(stats.get("likeCount"))
-        duration = format_duration(content.get("duration"))
-        published = format_date(snippet.get("publishedAt", ""))
+    for i, video in enumerate(items, 1):
+        title = truncate(video.title or "無標題", 45)
+        views = format_count(video.view_count)
+        likes = format_count(video.like_count)
+        duration = format_duration(video.duration)
+        published = format_date(video.published_at)
         
         table.add_row(str(i), title, views, likes, duration, published)
     
     console.print(table)
 
 
+def _search_result_row(index: int, item: dict) -> tuple[str, str, str, str, str, str]:
+    """將搜尋結果轉換為表格列"""
+    snippet = item.get("snippet", {})
+    id_info = item.get("id", {})
+    
+    kind = id_info.get("kind", "").replace("youtube#", "")
+    resource_id = (
+        id_info.get("videoId")
+        or id_info.get("playlistId")
+        or id_info.get("channelId")
+        or ""
+    )
+    title = truncate(snippet.get("title", "無標題"), 45)
+    channel = truncate(snippet.get("channelTitle", ""), 20)
+    published = format_date(snippet.get("publishedAt", ""))
+    
+    # 類型樣式
+    kind_style = {
+        "video": "[green]影片[/green]",
+        "playlist": "[blue]清單[/blue]",
+        "channel": "[yellow]頻道[/yellow]",
+    }.get(kind, kind)
+    
+    return str(index), kind_style, title, channel, published, resource_id
+
+
+@traced("ui")
 def display_search_results(data: dict | list) -> None:
-    """顯示搜尋結果"""
+    """顯示搜尋結果（分頁瀏覽）"""
     items = data if isinstance(data, list) else data.get("items", [])
     
     if not items:
@@ -198,45 +278,55 @@ def display_search_results(data: dict | list) -> None:
     page_info = data.get("pageInfo", {}) if isinstance(data, dict) else {}
     total = page_info.get("totalResults", len(items))
     
+    columns = [
+        Column("#", style="dim"),
+        Column("類型", justify="center", width=8),
+        Column("標題", style="bold", max_width=45),
+        Column("頻道", style="dim", max_width=20),
+        Column("發布日期", justify="center"),
+        Column("ID", style="dim"),
+    ]
+    title = f"🔍 搜尋結果（顯示 {len(items)} / 共 {total} 項）"
+    browse(_table_view(items, columns, _search_result_row, title), console)
+
+
+@traced("ui")
+def display_local_search_hits(hits: list[SearchHit], query: str, elapsed_ms: float) -> None:
+    """顯示本機全文搜尋結果
+
+    Args:
+        hits: SearchIndex.search 的結果
+        query: 查詢文字
+        elapsed_ms: 搜尋耗時（毫秒）
+    """
+    if not hits:
+        console.print(f"[yellow]找不到符合「{escape(query)}」的內容[/yellow]")
+        return
+
     table = Table(
-        title=f"🔍 搜尋結果（顯示 {len(items)} / 共 {total} 項）",
+        title=f"🏠 搜尋我的頻道：{escape(query)}（{len(hits)} 項，{elapsed_ms:.1f} ms）",
         show_header=True,
         header_style="bold cyan",
     )
     table.add_column("#", style="dim", width=4)
     table.add_column("類型", justify="center", width=8)
-    table.add_column("標題", style="bold", max_width=45)
-    table.add_column("頻道", style="dim")
-    table.add_column("發布日期", justify="center")
+    table.add_column("標題", style="bold", max_width=30)
+    table.add_column("內容", max_width=60)
     table.add_column("ID", style="dim")
-    
-    for i, item in enumerate(items, 1):
-        snippet = item.get("snippet", {})
-        id_info = item.get("id", {})
-        
-        kind = id_info.get("kind", "").replace("youtube#", "")
-        resource_id = (
-            id_info.get("videoId")
-            or id_info.get("playlistId")
-            or id_info.get("channelId")
-            or ""
+
+    for i, hit in enumerate(hits, 1):
+        table.add_row(
+            str(i),
+            hit.kind_label,
+            escape(truncate(hit.title, 30)),
+            highlight(hit.snippet.replace("\n", " ")),
+            hit.video_id or hit.ref,
         )
-        title = truncate(snippet.get("title", "無標題"), 45)
-        channel = truncate(snippet.get("channelTitle", ""), 20)
-        published = format_date(snippet.get("publishedAt", ""))
-        
-        # 類型樣式
-        kind_style = {
-            "video": "[green]影片[/green]",
-            "playlist": "[blue]清單[/blue]",
-            "channel": "[yellow]頻道[/yellow]",
-        }.get(kind, kind)
-        
-        table.add_row(str(i), kind_style, title, channel, published, resource_id)
-    
+
     console.print(table)
 
 
+@traced("ui")
 def display_channel_info(data: dict | list) -> None:
     """顯示頻道資訊"""
     items = data if isinstance(data, list) else data.get("items", [])
@@ -303,63 +393,63 @@ def format_moderation_status(status: str) -> str:
     return status_styles.get(status, status)
 
 
+def _comment_row(index: int, thread: dict | CommentThread) -> tuple[str, str, str, str, str, str]:
+    """將評論串轉換為表格列（分頁表格只轉換畫面上的列）"""
+    if not isinstance(thread, CommentThread):
+        thread = CommentThread.from_api(thread)
+    comment = thread.comment
+
+    author = truncate(comment.author, 15)
+    text = truncate(comment.text, 45)
+    likes = format_count(comment.like_count)
+    published = format_date(comment.published_at)
+
+    return str(index), author, text, likes, str(thread.reply_count), published
+
+
+@traced("ui")
 def display_comments(data: dict | list, video_title: str = "") -> None:
-    """顯示評論列表
+    """顯示評論列表（分頁瀏覽）
 
     Args:
-        data: 評論串資料（來自 commentThread list）
+        data: 評論串資料（來自 commentThread list，或 CommentThread 列表）
         video_title: 影片標題（用於表格標題）
     """
-    items = data if isinstance(data, list) else data.get("items", [])
+    items = items_of(data)
 
     if not items:
         console.print("[yellow]此影片沒有評論[/yellow]")
         return
 
     title = f"💬 {video_title}" if video_title else "💬 評論列表"
-    table = Table(
-        title=f"{title}（共 {len(items)} 則）",
-        show_header=True,
-        header_style="bold cyan",
-    )
-    table.add_column("#", style="dim", width=4)
-    table.add_column("用戶", style="bold", width=15)
-    table.add_column("評論內容", max_width=45)
-    table.add_column("👍", justify="right", style="magenta", width=6)
-    table.add_column("回覆", justify="right", style="blue", width=6)
-    table.add_column("日期", justify="center", width=10)
-
-    for i, item in enumerate(items, 1):
-        snippet = item.get("snippet", {})
-        top_comment = snippet.get("topLevelComment", {}).get("snippet", {})
-
-        author = truncate(top_comment.get("authorDisplayName", ""), 15)
-        text = truncate(top_comment.get("textDisplay", ""), 45)
-        likes = format_count(top_comment.get("likeCount", 0))
-        reply_count = str(snippet.get("totalReplyCount", 0))
-        published = format_date(top_comment.get("publishedAt", ""))
-
-        table.add_row(str(i), author, text, likes, reply_count, published)
-
-    console.print(table)
-
-
-def display_comment_detail(comment: dict, include_replies: bool = True) -> None:
+    columns = [
+        Column("#", style="dim"),
+        Column("用戶", style="bold", width=15),
+        Column("評論內容", max_width=45),
+        Column("👍", justify="right", style="magenta", width=6),
+        Column("回覆", justify="right", style="blue", width=6),
+        Column("日期", justify="center", width=10),
+    ]
+    browse(_table_view(items, columns, _comment_row, f"{title}（共 {len(items)} 則）"), console)
+
+
+@traced("ui")
+def display_comment_detail(comment: dict | CommentThread, include_replies: bool = True) -> None:
     """顯示單則評論詳情（含回覆）
 
     Args:
-        comment: 評論串資料
+        comment: 評論串資料或 CommentThread
         include_replies: 是否顯示回覆
     """
-    snippet = comment.get("snippet", {})
-    top_comment = snippet.get("topLevelComment", {}).get("snippet", {})
-    replies = comment.get("replies", {}).get("comments", [])
+    thread = comment if isinstance(comment, CommentThread) else CommentThread.from_api(comment)
+    top_comment = thread.comment
+    replies = thread.replies
 
-    author = top_comment.get("authorDisplayName", "匿名")
-    text = top_comment.get("textDisplay", "")
-    likes = format_count(top_comment.get("likeCount", 0))
-    published = format_date(top_comment.get("publishedAt", ""))
-    reply_count = snippet.get("totalReplyCount", 0)
+    author = top_comment.author or "匿名"
+    text = top_comment.text
+    likes = format_count(top_comment.like_count)
+    published = format_date(top_comment.published_at)
+    reply_count = thread.reply_count
 
     content = f"""[bold cyan]{author}[/bold cyan] · {published}
 {text}
@@ -370,11 +460,9 @@ def display_comment_detail(comment: dict, include_replies: bool = True) -> None:
     if include_replies and replies:
         content += "\n[bold]─── 回覆 ───[/bold]\n"
         for reply in replies[:5]:  # 最多顯示 5 則
-            r_snippet = reply.get("snippet", {})
-            r_author = r_snippet.get("authorDisplayName", "")
-            r_text = truncate(r_snippet.get("textDisplay", ""), 60)
-            r_date = format_date(r_snippet.get("publishedAt", ""))
-            content += f"\n[dim]{r_author}[/dim] · {r_date}\n{r_text}\n"
+            r_text = truncate(reply.text, 60)
+            r_date = format_date(reply.published_at)
+            content += f"\n[dim]{reply.author}[/dim] · {r_date}\n{r_text}\n"
 
         if reply_count > 5:
             content += f"\n[dim]...還有 {reply_count - 5} 則回覆[/dim]"
@@ -431,14 +519,15 @@ def format_language_name(lang_code: str) -> str:
     return lang_names.get(lang_code, lang_code)
 
 
+@traced("ui")
 def display_captions(data: dict | list, video_title: str = "") -> None:
     """顯示字幕列表
 
     Args:
-        data: 字幕資料（來自 caption list）
+        data: 字幕資料（來自 caption list，或 Caption 列表）
         video_title: 影片標題（用於表格標題）
     """
-    items = data if isinstance(data, list) else data.get("items", [])
+    items = parse_models(data, Caption)
 
     if not items:
         console.print("[yellow]此影片沒有字幕[/yellow]")
@@ -457,17 +546,12 @@ def display_captions(data: dict | list, video_title: str = "") -> None:
     table.add_column("狀態", justify="center", width=10)
     table.add_column("ID", style="dim")
 
-    for i, item in enumerate(items, 1):
-        snippet = item.get("snippet", {})
-        caption_id = item.get("id", "")
-
-        lang_code = snippet.get("language", "")
-        lang_display = format_language_name(lang_code)
-        name = snippet.get("name", "") or "（預設）"
-        track_kind = format_track_kind(snippet.get("trackKind", "standard"))
-        is_draft = snippet.get("isDraft", False)
-        status = "[yellow]草稿[/yellow]" if is_draft else "[green]已發布[/green]"
+    for i, caption in enumerate(items, 1):
+        lang_display = format_language_name(caption.language)
+        name = caption.name or "（預設）"
+        track_kind = format_track_kind(caption.track_kind)
+        status = "[yellow]草稿[/yellow]" if caption.is_draft else "[green]已發布[/green]"
 
-        table.add_row(str(i), f"{lang_display} ({lang_code})", name, track_kind, status, caption_id)
+        table.add_row(str(i), f"{lang_display} ({caption.language})", name, track_kind, status, caption.id)
 
     console.print(table)
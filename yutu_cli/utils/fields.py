@@ -0,0 +1,153 @@
+"""欄位投影 - 由呼叫端宣告需要的欄位，換算成最少的 parts 與 fields 遮罩
+
+欄位以點分隔的路徑表示，第一段即 Data API 的 part：
+
+    ("id", "snippet.title", "contentDetails.itemCount")
+    -> parts="contentDetails,snippet"
+    -> fields="items(id,snippet(title),contentDetails(itemCount)),nextPageToken"
+
+`parts` 決定 API 回傳哪些區段（yutu 與直接呼叫 API 都支援），
+`fields` 遮罩再進一步去掉區段中用不到的欄位（例如縮圖），只有支援的傳輸層會送出。
+
+FieldPlanner 在工作階段內合併同一端點重疊的需求：先查詢標題、再查看詳情時，
+第二次查詢改為兩者的聯集，之後兩種需求都由同一份回應（快取）滿足。
+"""
+
+import threading
+from typing import Any, Iterable, Optional
+
+Fields = frozenset[str]
+
+# 不需要額外 part 的欄位
+_FREE_FIELDS = frozenset({"id", "kind", "etag"})
+
+
+def normalize(fields: Iterable[str]) -> Fields:
+    """去除已被上層路徑涵蓋的欄位（`snippet` 涵蓋 `snippet.title`）"""
+    paths = {path.strip() for path in fields if path and path.strip()}
+    return frozenset(
+        path for path in paths
+        if not any(path.startswith(f"{other}.") for other in paths if other != path)
+    )
+
+
+def covers(have: Iterable[str], need: Iterable[str]) -> bool:
+    """have 的欄位是否包含 need 的所有欄位"""
+    have = normalize(have)
+    return all(
+        any(path == other or path.startswith(f"{other}.") for other in have)
+        for path in normalize(need)
+    )
+
+
+def parts_of(fields: Iterable[str]) -> frozenset[str]:
+    """欄位所屬的 part"""
+    return frozenset(path.split(".", 1)[0] for path in normalize(fields)) - _FREE_FIELDS
+
+
+def parts_for(fields: Iterable[str]) -> str:
+    """欄位需要的最少 parts（只需要 ID 時為 `id`）"""
+    return ",".join(sorted(parts_of(fields))) or "id"
+
+
+def _tree(fields: Iterable[str]) -> dict[str, Any]:
+    """路徑 -> 巢狀字典（葉節點為 None，表示整個欄位）"""
+    tree: dict[str, Any] = {}
+    for path in sorted(normalize(fields)):
+        node = tree
+        *parents, leaf = path.split(".")
+        for name in parents:
+            node = node.setdefault(name, {})
+        node[leaf] = None
+    return tree
+
+
+def _format(tree: dict[str, Any]) -> str:
+    return ",".join(
+        name if sub is None else f"{name}({_format(sub)})"
+        for name, sub in tree.items()
+    )
+
+
+def fields_mask(fields: Iterable[str], *, listing: bool = True) -> str:
+    """Data API 的 fields 遮罩（listing 時包在 items() 內並保留分頁權杖）
+
+    Examples:
+        >>> fields_mask(["id", "snippet.title", "snippet.resourceId.videoId"])
+        'items(id,snippet(resourceId(videoId),title)),nextPageToken'
+    """
+    mask = _format(_tree(fields))
+    return f"items({mask}),nextPageToken" if listing else mask
+
+
+def parse_mask(mask: str) -> Fields:
+    """將 fields 遮罩解析回欄位路徑
+
+    Examples:
+        >>> sorted(parse_mask("items(id,snippet(title)),nextPageToken"))
+        ['items.id', 'items.snippet.title', 'nextPageToken']
+    """
+    paths: set[str] = set()
+    stack: list[str] = []
+    name = ""
+    for char in mask + ",":
+        if char == "(":
+            stack.append(name.strip())
+            name = ""
+        elif char in ",)":
+            if name.strip():
+                paths.add(".".join([*stack, name.strip()]))
+            name = ""
+            if char == ")":
+                stack.pop()
+        else:
+            name += char
+    return frozenset(paths)
+
+
+def project(data: Any, fields: Iterable[str]) -> Any:
+    """只保留指定欄位（列表中的每個元素分別套用）"""
+    return _project(data, _tree(fields))
+
+
+def _project(data: Any, tree: Optional[dict[str, Any]]) -> Any:
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [_project(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {name: _project(data[name], sub) for name, sub in tree.items() if name in data}
+
+
+class FieldPlanner:
+    """在工作階段內合併同一端點的欄位需求（可多執行緒共用）
+
+    每個 (resource, action) 保留已規劃的欄位集合：
+        - 新需求已被某個集合涵蓋：沿用該集合（同一個命令，可命中快取）
+        - 與某個集合共用 part：兩者合併，之後的需求都使用聯集
+        - 都沒有交集：另外規劃，不讓無關的欄位增加回應大小
+    """
+
+    def __init__(self):
+        self._plans: dict[tuple[str, str], list[Fields]] = {}
+        self._lock = threading.Lock()
+
+    def plan(self, resource: str, action: str, fields: Iterable[str]) -> Fields:
+        """取得此次查詢實際要求的欄位"""
+        need = normalize(fields)
+        with self._lock:
+            plans = self._plans.setdefault((resource, action), [])
+            for index, planned in enumerate(plans):
+                if covers(planned, need):
+                    return planned
+                if parts_of(planned) & parts_of(need):
+                    plans[index] = normalize(planned | need)
+                    return plans[index]
+            plans.append(need)
+            return need
+
+    def reset(self) -> None:
+        """捨棄已規劃的需求"""
+        with self._lock:
+            self._plans.clear()
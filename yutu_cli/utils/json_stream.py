@@ -0,0 +1,138 @@
+"""串流 JSON 解析模組 - 從分段輸入中逐筆取出 items 陣列的元素"""
+
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    # 選用的快速解析器（pip install yutu-manager[fast]）
+    import orjson
+except ImportError:  # pragma: no cover - 視安裝環境而定
+    orjson = None
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def loads(text: str | bytes) -> Any:
+    """解析完整的 JSON 文件（已安裝 orjson 時使用 orjson）
+
+    兩者的錯誤都是 `json.JSONDecodeError`（orjson 的錯誤為其子類別）。
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class JsonItemStream:
+    """逐筆解析 yutu 的 JSON 輸出
+
+    支援兩種頂層結構：
+    - 陣列：`[item, item, ...]`
+    - 物件：`{"items": [item, ...], "pageInfo": {...}, ...}`
+
+    緩衝區只保留尚未解析完成的部分，因此記憶體用量約為
+    單一項目加上一個輸入區塊，與總項目數無關。
+    其他頂層欄位（例如 pageInfo）會存入 `metadata`。
+
+    Examples:
+        >>> stream = JsonItemStream(['{"items": [{"a"', ': 1}, {"a": 2}]}'])
+        >>> list(stream)
+        [{'a': 1}, {'a': 2}]
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.metadata: dict[str, Any] = {}
+
+    def _fill(self) -> bool:
+        """讀入下一個區塊，並丟棄已解析的部分；沒有更多資料時回傳 False"""
+        if self._eof:
+            return False
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos:] + chunk
+                self._pos = 0
+                return True
+        self._eof = True
+        return False
+
+    def _peek(self) -> Optional[str]:
+        """跳過空白並回傳下一個字元（不消耗），輸入結束時回傳 None"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"JSON 格式錯誤：預期 {char!r}，實際為 {found!r}")
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """解析下一個完整的 JSON 值"""
+        while True:
+            self._peek()
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+                # 值剛好結束在緩衝區尾端時（例如數字 12|3），需確認後面沒有接續
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def _iter_array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            char = self._peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"JSON 格式錯誤：陣列中出現 {char!r}")
+
+    def __iter__(self) -> Iterator[Any]:
+        char = self._peek()
+        if char is None:
+            return
+        if char == "[":
+            yield from self._iter_array()
+            return
+        if char != "{":
+            raise ValueError(f"JSON 格式錯誤：無法辨識的開頭 {char!r}")
+
+        self._pos += 1
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+            if key == "items" and self._peek() == "[":
+                yield from self._iter_array()
+            else:
+                self.metadata[key] = self._decode_value()
+            char = self._peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"JSON 格式錯誤：物件中出現 {char!r}")
+
+
+def iter_json_items(chunks: Iterable[str]) -> Iterator[Any]:
+    """從分段的 JSON 文字中逐筆產生 items 元素"""
+    return iter(JsonItemStream(chunks))
@@ -0,0 +1,271 @@
+"""指標模組 - 以 Prometheus 文字格式匯出 yutu 呼叫的計數與延遲
+
+YutuCLI 的每次呼叫都會更新 `YutuMetrics`：
+
+    yutu_calls_total{resource,action,source}        呼叫次數（source：傳輸層名稱，或本機回應的 local）
+    yutu_failures_total{resource,action,error_kind} 失敗次數（依錯誤類別）
+    yutu_call_duration_seconds{resource,action}     延遲分布（含重試與等待）
+    yutu_output_bytes_total{resource,action}        yutu 輸出的位元組數
+    yutu_quota_units_total{resource,action}         已記帳的配額單位
+    yutu_cache_hits_total{resource,action,layer}    快取與鏡像命中次數
+    yutu_retries_total{error_kind}                  重試次數
+
+無人值守的批次執行可將指標寫入 node-exporter 的 textfile collector 目錄
+（YUTU_METRICS_TEXTFILE，結束時以原子方式替換），或以 YUTU_METRICS_PORT
+在本機提供 `/metrics` 端點。只依賴標準函式庫。
+"""
+
+import math
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Optional
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 延遲分布的上界（秒）：涵蓋快取命中（毫秒級）到大型清單分頁（數十秒）
+DEFAULT_BUCKETS = (0.005, 0.025, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = threading.Lock()
+
+    def _key(self, values: tuple[object, ...]) -> LabelValues:
+        if len(values) != len(self.labels):
+            raise ValueError(f"{self.name} 需要標籤 {self.labels}")
+        return tuple(str(value) for value in values)
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """只增不減的計數"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: object, amount: float = 1) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for values, value in items:
+            yield f"{self.name}{_format_labels(self.labels, values)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """可任意設定的數值"""
+
+    kind = "gauge"
+
+    def set(self, *labels: object, value: float) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """依上界累計的分布（Prometheus histogram）"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, *labels: object, value: float) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, *labels: object) -> int:
+        with self._lock:
+            counts = self._counts.get(self._key(labels))
+            return counts[-1] if counts else 0
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        for values, counts, total in items:
+            for bound, count in zip(self.buckets, counts):
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, values, le)} {count}"
+            yield f"{self.name}_sum{_format_labels(self.labels, values)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labels, values)} {counts[-1]}"
+
+
+class MetricsRegistry:
+    """一組指標，輸出為 Prometheus 文字格式"""
+
+    def __init__(self):
+        self.metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self.metrics) + "\n"
+
+    def write_textfile(self, path: Path) -> Path:
+        """寫入 textfile collector 檔案（先寫暫存檔再替換，避免讀到寫一半的內容）"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+
+class YutuMetrics(MetricsRegistry):
+    """YutuCLI 呼叫的指標（見模組說明）"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: Counter = self.register(Counter(
+            "yutu_calls_total", "yutu calls by resource, action and source (transport name, or local)",
+            ("resource", "action", "source"),
+        ))
+        self.failures: Counter = self.register(Counter(
+            "yutu_failures_total", "failed yutu calls by error class", ("resource", "action", "error_kind"),
+        ))
+        self.duration: Histogram = self.register(Histogram(
+            "yutu_call_duration_seconds", "yutu call latency including retries", ("resource", "action"),
+        ))
+        self.output_bytes: Counter = self.register(Counter(
+            "yutu_output_bytes_total", "bytes of yutu output received", ("resource", "action"),
+        ))
+        self.quota_units: Counter = self.register(Counter(
+            "yutu_quota_units_total", "Data API quota units reserved", ("resource", "action"),
+        ))
+        self.cache_hits: Counter = self.register(Counter(
+            "yutu_cache_hits_total", "calls answered locally by layer (cache, mirror)", ("resource", "action", "layer"),
+        ))
+        self.retries: Counter = self.register(Counter(
+            "yutu_retries_total", "retries of transient failures by error class", ("error_kind",),
+        ))
+        self.last_flush: Gauge = self.register(Gauge(
+            "yutu_metrics_flush_timestamp_seconds", "unix time the metrics were last written",
+        ))
+
+    def observe_call(
+        self,
+        resource: str,
+        action: str,
+        *,
+        seconds: float,
+        source: str,
+        error_kind: Optional[str] = None,
+    ) -> None:
+        """記錄一次完成的呼叫（error_kind 不為 None 時視為失敗）"""
+        self.calls.inc(resource, action, source)
+        self.duration.observe(resource, action, value=seconds)
+        if error_kind is not None:
+            self.failures.inc(resource, action, error_kind)
+
+    def write_textfile(self, path: Path) -> Path:
+        self.last_flush.set(value=time.time())
+        return super().write_textfile(path)
+
+
+class MetricsServer:
+    """在背景執行緒提供 `/metrics` 的 HTTP 伺服器"""
+
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = "127.0.0.1"):
+        self.registry = registry
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(registry))
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.1}, name="yutu-metrics", daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def _make_handler(registry: MetricsRegistry) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            data = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
@@ -0,0 +1,560 @@
+"""頻道鏡像模組 - 將頻道資料保存於本機 SQLite，供選單即時、離線瀏覽
+
+鏡像內容由 `yutu_cli.utils.sync.ChannelSync` 寫入；YutuCLI 執行唯讀命令時，
+若鏡像中已有對應且未過時的資料，會直接由鏡像回應，不呼叫 API。
+寫入資料時會一併更新全文索引（見 `yutu_cli.utils.search_index`）。
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from yutu_cli.utils.search_index import (
+    IndexDocument,
+    SearchHit,
+    SearchIndex,
+    caption_text,
+    comment_document,
+    playlist_document,
+    playlist_item_document,
+    video_document,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS channel (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS videos (
+    id TEXT PRIMARY KEY,
+    published_at TEXT NOT NULL DEFAULT '',
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS playlists (
+    id TEXT PRIMARY KEY,
+    sort INTEGER NOT NULL,
+    item_count INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS playlist_items (
+    playlist_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    video_id TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    PRIMARY KEY (playlist_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_playlist_items_position ON playlist_items(playlist_id, position);
+CREATE INDEX IF NOT EXISTS idx_playlist_items_video ON playlist_items(video_id);
+CREATE TABLE IF NOT EXISTS captions (
+    id TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_captions_video ON captions(video_id);
+CREATE TABLE IF NOT EXISTS comment_threads (
+    id TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_comment_threads_video ON comment_threads(video_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL DEFAULT '',
+    item_count INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL NOT NULL,
+    stale INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+@dataclass
+class SyncState:
+    """單一同步範圍的狀態
+
+    範圍名稱：`channel`、`playlists`、`videos`、`playlist:<id>`、
+    `captions:<videoId>`、`comments:<videoId>`
+    """
+    scope: str
+    watermark: str
+    item_count: int
+    synced_at: float
+    stale: bool = False
+
+
+def _dumps(item: Any) -> str:
+    return json.dumps(item, ensure_ascii=False)
+
+
+def _split_ids(value: Any) -> list[str]:
+    return [i for i in str(value or "").split(",") if i]
+
+
+def _truthy(value: Any) -> bool:
+    return value is True or value == "true"
+
+
+class ChannelMirror:
+    """以 SQLite 儲存的頻道鏡像
+
+    Args:
+        path: 資料庫路徑（":memory:" 為記憶體資料庫）
+        max_age: 同步結果的有效秒數，超過後鏡像不再回應查詢（0 表示不過期）
+    """
+
+    def __init__(self, path: Path | str, *, max_age: float = 0):
+        self.path = Path(path)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self.index = SearchIndex(self._conn)
+        # 索引功能加入前建立的鏡像：以既有資料建立索引
+        if self.index.available and not len(self.index):
+            if self._conn.execute("SELECT 1 FROM videos LIMIT 1").fetchone():
+                self._rebuild_index()
+        self._conn.commit()
+
+    # === 同步狀態 ===
+
+    def state(self, scope: str) -> Optional[SyncState]:
+        """取得同步範圍的狀態（從未同步時回傳 None）"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT scope, watermark, item_count, synced_at, stale FROM sync_state WHERE scope = ?",
+                (scope,),
+            ).fetchone()
+        if row is None:
+            return None
+        return SyncState(row[0], row[1], row[2], row[3], bool(row[4]))
+
+    def _within_age(self, state: Optional[SyncState]) -> bool:
+        """範圍是否已同步且未超過 max_age"""
+        if state is None:
+            return False
+        return not self.max_age or time.time() - state.synced_at <= self.max_age
+
+    def is_fresh(self, scope: str) -> bool:
+        """範圍是否已同步、未超過 max_age，且之後沒有被本機寫入動作標記為過時"""
+        state = self.state(scope)
+        return self._within_age(state) and not state.stale
+
+    def needs_sync(self, scope: str) -> bool:
+        """範圍是否從未同步或已被標記為過時（不考慮 max_age，供增量同步判斷）"""
+        state = self.state(scope)
+        return state is None or state.stale
+
+    def set_state(self, scope: str, *, watermark: str = "", item_count: int = 0) -> None:
+        """記錄範圍同步完成"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, 0)",
+                (scope, watermark, item_count, time.time()),
+            )
+            self._conn.commit()
+
+    def mark_stale(self, *scopes: str) -> None:
+        """將範圍標記為過時（下次同步重新下載，鏡像查詢改走 API）"""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE sync_state SET stale = 1 WHERE scope = ?", [(s,) for s in scopes]
+            )
+            self._conn.commit()
+
+    def _mark_prefix_stale(self, prefix: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sync_state SET stale = 1 WHERE scope LIKE ?", (f"{prefix}%",)
+            )
+            self._conn.commit()
+
+    def stale_scopes(self, prefix: str = "") -> list[str]:
+        """列出被標記為過時的範圍"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT scope FROM sync_state WHERE stale = 1 AND scope LIKE ?", (f"{prefix}%",)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # === 寫入 ===
+
+    def _uploads_playlist_id(self) -> str:
+        row = self._conn.execute("SELECT data FROM channel").fetchone()
+        if row is None:
+            return ""
+        related = json.loads(row[0]).get("contentDetails", {}).get("relatedPlaylists", {})
+        return related.get("uploads", "")
+
+    def save_channel(self, channel: dict) -> None:
+        """儲存我的頻道資料（只保留一筆）"""
+        with self._lock:
+            self._conn.execute("DELETE FROM channel")
+            self._conn.execute(
+                "INSERT INTO channel VALUES (?, ?)", (channel.get("id", ""), _dumps(channel))
+            )
+            self._conn.commit()
+
+    def replace_playlists(self, playlists: list[dict]) -> list[str]:
+        """以最新的播放清單列表取代，回傳已不存在的播放清單 ID"""
+        current = {p.get("id", "") for p in playlists}
+        with self._lock:
+            known = {row[0] for row in self._conn.execute("SELECT id FROM playlists")}
+            removed = sorted(known - current)
+            self._conn.execute("DELETE FROM playlists")
+            self._conn.executemany(
+                "INSERT INTO playlists VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        p.get("id", ""),
+                        sort,
+                        int(p.get("contentDetails", {}).get("itemCount", 0) or 0),
+                        _dumps(p),
+                    )
+                    for sort, p in enumerate(playlists)
+                ],
+            )
+            for playlist_id in removed:
+                self._conn.execute("DELETE FROM playlist_items WHERE playlist_id = ?", (playlist_id,))
+                self._conn.execute("DELETE FROM sync_state WHERE scope = ?", (f"playlist:{playlist_id}",))
+                self.index.remove("playlist_item", ref=playlist_id)
+            self.index.remove("playlist", keys=[f"playlist:{playlist_id}" for playlist_id in known])
+            self.index.add(map(playlist_document, playlists))
+            self._conn.commit()
+        return removed
+
+    def replace_playlist_items(self, playlist_id: str, items: list[dict]) -> None:
+        """取代播放清單的所有項目（依列表順序重新編號）"""
+        with self._lock:
+            self._conn.execute("DELETE FROM playlist_items WHERE playlist_id = ?", (playlist_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO playlist_items VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        playlist_id,
+                        item.get("id", ""),
+                        position,
+                        item.get("contentDetails", {}).get("videoId")
+                        or item.get("snippet", {}).get("resourceId", {}).get("videoId", ""),
+                        _dumps(item),
+                    )
+                    for position, item in enumerate(items)
+                ],
+            )
+            # uploads 清單的內容與影片重複，只索引一般播放清單
+            if playlist_id != self._uploads_playlist_id():
+                self.index.replace(
+                    "playlist_item", playlist_id,
+                    (playlist_item_document(playlist_id, item) for item in items),
+                )
+            self._conn.commit()
+
+    def upsert_videos(self, videos: Iterable[dict]) -> None:
+        """新增或更新影片詳情"""
+        videos = list(videos)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        v.get("id", ""),
+                        v.get("snippet", {}).get("publishedAt", ""),
+                        int(v.get("statistics", {}).get("commentCount", 0) or 0),
+                        _dumps(v),
+                    )
+                    for v in videos
+                ],
+            )
+            self.index.add(map(video_document, videos))
+            self._conn.commit()
+
+    def remove_videos(self, video_ids: Iterable[str]) -> None:
+        """移除影片與其字幕、評論"""
+        rows = [(v,) for v in video_ids]
+        with self._lock:
+            self._conn.executemany("DELETE FROM videos WHERE id = ?", rows)
+            self._conn.executemany("DELETE FROM captions WHERE video_id = ?", rows)
+            self._conn.executemany("DELETE FROM comment_threads WHERE video_id = ?", rows)
+            self._conn.executemany(
+                "DELETE FROM sync_state WHERE scope IN ('captions:' || ?1, 'comments:' || ?1)", rows
+            )
+            for (video_id,) in rows:
+                self.index.remove("video", keys=[f"video:{video_id}"])
+                self.index.remove("comment", ref=video_id)
+                self.index.remove("caption", ref=video_id)
+            self._conn.commit()
+
+    def replace_captions(self, video_id: str, captions: list[dict]) -> None:
+        """取代影片的字幕軌道列表"""
+        with self._lock:
+            previous = {
+                row[0] for row in self._conn.execute("SELECT id FROM captions WHERE video_id = ?", (video_id,))
+            }
+            self._conn.execute("DELETE FROM captions WHERE video_id = ?", (video_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO captions VALUES (?, ?, ?)",
+                [(c.get("id", ""), video_id, _dumps(c)) for c in captions],
+            )
+            # 已刪除的字幕軌道不再出現在搜尋結果中
+            removed = previous - {c.get("id", "") for c in captions}
+            self.index.remove("caption", keys=[f"caption:{caption_id}" for caption_id in removed])
+            self._conn.commit()
+
+    def index_caption(self, caption_id: str, content: str) -> None:
+        """將下載的字幕檔內容加入全文索引
+
+        Args:
+            caption_id: 字幕軌道 ID
+            content: 字幕檔內容（SRT/VTT/SBV）
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT video_id, data FROM captions WHERE id = ?", (caption_id,)).fetchone()
+            video_id, language = "", ""
+            if row is not None:
+                video_id = row[0]
+                language = json.loads(row[1]).get("snippet", {}).get("language", "")
+            self.index.add([IndexDocument(
+                f"caption:{caption_id}", "caption", video_id, video_id, language, caption_text(content),
+            )])
+            self._conn.commit()
+
+    def replace_comment_threads(self, video_id: str, threads: list[dict]) -> None:
+        """取代影片的評論串"""
+        with self._lock:
+            self._conn.execute("DELETE FROM comment_threads WHERE video_id = ?", (video_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO comment_threads VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        t.get("id", ""),
+                        video_id,
+                        t.get("snippet", {}).get("topLevelComment", {}).get("snippet", {}).get("updatedAt", ""),
+                        _dumps(t),
+                    )
+                    for t in threads
+                ],
+            )
+            self.index.replace(
+                "comment", video_id, (comment_document(video_id, t) for t in threads)
+            )
+            self._conn.commit()
+
+    # === 讀取 ===
+
+    def _load(self, sql: str, params: tuple = ()) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_channel(self) -> Optional[dict]:
+        items = self._load("SELECT data FROM channel")
+        return items[0] if items else None
+
+    def get_playlists(self) -> list[dict]:
+        return self._load("SELECT data FROM playlists ORDER BY sort")
+
+    def playlist_item_counts(self) -> dict[str, int]:
+        """鏡像中各播放清單記錄的影片數"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, item_count FROM playlists").fetchall()
+        return dict(rows)
+
+    def get_playlist_items(self, playlist_id: str) -> list[dict]:
+        return self._load(
+            "SELECT data FROM playlist_items WHERE playlist_id = ? ORDER BY position", (playlist_id,)
+        )
+
+    def get_videos(self, video_ids: Iterable[str]) -> dict[str, dict]:
+        """依 ID 取得影片詳情（鏡像中沒有的 ID 不會出現在結果中）"""
+        ids = list(video_ids)
+        found: dict[str, dict] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            for video in self._load(f"SELECT data FROM videos WHERE id IN ({marks})", tuple(chunk)):
+                found[video.get("id", "")] = video
+        return found
+
+    def video_comment_counts(self) -> dict[str, int]:
+        """鏡像中各影片記錄的評論數"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, comment_count FROM videos").fetchall()
+        return dict(rows)
+
+    def get_captions(self, video_id: str) -> list[dict]:
+        return self._load("SELECT data FROM captions WHERE video_id = ? ORDER BY id", (video_id,))
+
+    def get_comment_threads(self, video_id: str) -> list[dict]:
+        return self._load(
+            "SELECT data FROM comment_threads WHERE video_id = ? ORDER BY updated_at DESC",
+            (video_id,),
+        )
+
+    def counts(self) -> dict[str, int]:
+        """各資料表的筆數"""
+        tables = ("videos", "playlists", "playlist_items", "captions", "comment_threads")
+        with self._lock:
+            return {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in tables
+            }
+
+    def last_synced(self) -> Optional[float]:
+        """最近一次同步的時間戳記"""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(synced_at) FROM sync_state").fetchone()
+        return row[0]
+
+    # === 全文搜尋 ===
+
+    def search(
+        self, text: str, *, limit: int = 50, kinds: Optional[Iterable[str]] = None
+    ) -> list[SearchHit]:
+        """全文搜尋鏡像中的標題、說明、評論與字幕"""
+        with self._lock:
+            return self.index.search(text, limit=limit, kinds=kinds)
+
+    def _rebuild_index(self) -> None:
+        """以鏡像資料重建索引（下載的字幕內容無法重建，予以保留）"""
+        for kind in ("video", "playlist", "playlist_item", "comment"):
+            for (ref,) in self._conn.execute(
+                "SELECT DISTINCT ref FROM search_docs WHERE kind = ?", (kind,)
+            ).fetchall():
+                self.index.remove(kind, ref=ref)
+
+        def rows(sql: str) -> list:
+            return self._conn.execute(sql).fetchall()
+
+        self.index.add(video_document(json.loads(data)) for (data,) in rows("SELECT data FROM videos"))
+        self.index.add(playlist_document(json.loads(data)) for (data,) in rows("SELECT data FROM playlists"))
+        uploads_id = self._uploads_playlist_id()
+        self.index.add(
+            playlist_item_document(playlist_id, json.loads(data))
+            for playlist_id, data in rows("SELECT playlist_id, data FROM playlist_items")
+            if playlist_id != uploads_id
+        )
+        self.index.add(
+            comment_document(video_id, json.loads(data))
+            for video_id, data in rows("SELECT video_id, data FROM comment_threads")
+        )
+
+    def rebuild_index(self) -> None:
+        """重建全文索引"""
+        with self._lock:
+            self._rebuild_index()
+            self._conn.commit()
+
+    # === 與 YutuCLI 整合 ===
+
+    def lookup(self, resource: str, action: str, params: dict[str, Any]) -> Optional[list[dict]]:
+        """以鏡像回應唯讀命令
+
+        Args:
+            resource: 資源類型
+            action: 動作
+            params: 命令參數（與傳給 YutuCLI.run 的關鍵字參數相同）
+
+        Returns:
+            項目列表；鏡像無法回應（未同步、已過時或不支援的查詢）時回傳 None
+        """
+        if action != "list":
+            return None
+
+        if resource == "channel" and _truthy(params.get("mine")):
+            channel = self.get_channel()
+            if channel is not None and self.is_fresh("channel"):
+                return [channel]
+        elif resource == "playlist" and _truthy(params.get("mine")):
+            if self.is_fresh("playlists"):
+                return self.get_playlists()
+        elif resource == "playlistItem" and params.get("playlistId"):
+            if self.is_fresh(f"playlist:{params['playlistId']}"):
+                return self.get_playlist_items(params["playlistId"])
+        elif resource == "video" and params.get("ids"):
+            # 本機修改過的影片會從鏡像刪除，因此只檢查同步時間（不看 stale 標記）
+            if not self._within_age(self.state("videos")):
+                return None
+            ids = _split_ids(params["ids"])
+            found = self.get_videos(ids)
+            # 任一影片不在鏡像中（或已被本機修改）時改走 API
+            if all(video_id in found for video_id in ids):
+                return [found[video_id] for video_id in ids]
+        elif resource == "commentThread" and params.get("videoId"):
+            if self.is_fresh(f"comments:{params['videoId']}"):
+                return self.get_comment_threads(params["videoId"])
+        elif resource == "caption" and params.get("videoId"):
+            if self.is_fresh(f"captions:{params['videoId']}"):
+                return self.get_captions(params["videoId"])
+        return None
+
+    def _playlists_of(self, column: str, values: list[str]) -> list[str]:
+        marks = ",".join("?" * len(values))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT playlist_id FROM playlist_items WHERE {column} IN ({marks})",
+                tuple(values),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _videos_of(self, table: str, ids: list[str]) -> list[str]:
+        marks = ",".join("?" * len(ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT video_id FROM {table} WHERE id IN ({marks})", tuple(ids)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def invalidate(self, resource: str, action: str, params: dict[str, Any]) -> None:
+        """寫入動作成功後，將受影響的鏡像範圍標記為過時"""
+        ids = _split_ids(params.get("ids")) + _split_ids(params.get("id"))
+
+        if resource == "playlist":
+            self.mark_stale("playlists", *(f"playlist:{i}" for i in ids))
+        elif resource == "playlistItem":
+            playlists = [params["playlistId"]] if params.get("playlistId") else []
+            if ids:
+                playlists += self._playlists_of("id", ids)
+            if playlists:
+                self.mark_stale(*(f"playlist:{p}" for p in playlists))
+            else:
+                self._mark_prefix_stale("playlist:")
+            self.mark_stale("playlists")  # itemCount 已改變
+        elif resource == "video":
+            if action == "rate":
+                return  # 評分不影響鏡像內容
+            with self._lock:
+                self._conn.executemany("DELETE FROM videos WHERE id = ?", [(i,) for i in ids])
+                self._conn.commit()
+            if ids:
+                self.mark_stale(*(f"playlist:{p}" for p in self._playlists_of("video_id", ids)))
+            self.mark_stale("videos")
+        elif resource in ("commentThread", "comment"):
+            videos = [params["videoId"]] if params.get("videoId") else []
+            if ids:
+                videos += self._videos_of("comment_threads", [i.split(".")[0] for i in ids])
+            if videos:
+                self.mark_stale(*(f"comments:{v}" for v in videos))
+            else:
+                self._mark_prefix_stale("comments:")
+        elif resource == "caption":
+            videos = [params["videoId"]] if params.get("videoId") else []
+            if ids:
+                videos += self._videos_of("captions", ids)
+            if videos:
+                self.mark_stale(*(f"captions:{v}" for v in videos))
+            else:
+                self._mark_prefix_stale("captions:")
+        elif resource == "channel":
+            self.mark_stale("channel")
+
+    def close(self) -> None:
+        """關閉資料庫連線"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,224 @@
+"""資料模型 - 將 API 回應的巢狀字典解析為精簡的型別物件
+
+每個模型只保留畫面與命令用得到的欄位（`__slots__`，不保留原始回應），
+由 `from_api` 解析一次之後，顯示與選單都直接讀取屬性：
+
+    videos = [Video.from_api(item) for item in result.iter_items()]
+    videos[0].title, videos[0].view_count
+
+`Video.from_api` 同時支援影片資源（`id` 為字串）、搜尋結果（`id.videoId`）
+與播放清單項目（`contentDetails.videoId`）三種結構。
+重複出現的短字串（頻道名稱、隱私狀態等）會以 `sys.intern` 共用。
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, TypeVar, Union
+
+M = TypeVar("M", "Video", "Playlist", "PlaylistItem", "CommentThread", "Caption")
+
+
+def items_of(data: Union[dict, list, None]) -> list:
+    """取得回應中的項目列表（支援陣列與 `{"items": [...]}` 兩種結構）"""
+    if isinstance(data, list):
+        return data
+    return (data or {}).get("items", [])
+
+
+def resource_id(item: dict) -> str:
+    """取得資源 ID（影片、播放清單或頻道）
+
+    Examples:
+        >>> resource_id({"id": "v1"})
+        'v1'
+        >>> resource_id({"id": {"kind": "youtube#playlist", "playlistId": "PL1"}})
+        'PL1'
+    """
+    id_info = item.get("id", "")
+    if isinstance(id_info, dict):
+        return id_info.get("videoId") or id_info.get("playlistId") or id_info.get("channelId") or ""
+    return str(id_info)
+
+
+def video_id_of(item: dict) -> str:
+    """取得影片 ID（影片資源、搜尋結果或播放清單項目）"""
+    if item.get("kind") == "youtube#playlistItem" or "resourceId" in item.get("snippet", {}):
+        return (
+            item.get("contentDetails", {}).get("videoId")
+            or item.get("snippet", {}).get("resourceId", {}).get("videoId", "")
+        )
+    return resource_id(item)
+
+
+def _int(value: Any) -> Optional[int]:
+    """API 以字串表示的計數（缺少時為 None）"""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _shared(value: Optional[str]) -> str:
+    return sys.intern(value) if value else ""
+
+
+@dataclass(slots=True)
+class Video:
+    """影片"""
+    id: str
+    title: str = ""
+    description: str = ""
+    channel_id: str = ""
+    channel_title: str = ""
+    published_at: str = ""
+    tags: tuple[str, ...] = ()
+    view_count: Optional[int] = None
+    like_count: Optional[int] = None
+    comment_count: Optional[int] = None
+    duration: str = ""
+    definition: str = ""
+    privacy_status: str = ""
+
+    @classmethod
+    def from_api(cls, item: dict) -> "Video":
+        snippet = item.get("snippet", {})
+        stats = item.get("statistics", {})
+        content = item.get("contentDetails", {})
+        return cls(
+            id=video_id_of(item),
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            channel_id=_shared(snippet.get("videoOwnerChannelId") or snippet.get("channelId")),
+            channel_title=_shared(snippet.get("videoOwnerChannelTitle") or snippet.get("channelTitle")),
+            published_at=content.get("videoPublishedAt") or snippet.get("publishedAt", ""),
+            tags=tuple(snippet.get("tags", ())),
+            view_count=_int(stats.get("viewCount")),
+            like_count=_int(stats.get("likeCount")),
+            comment_count=_int(stats.get("commentCount")),
+            duration=content.get("duration", ""),
+            definition=_shared(content.get("definition")),
+            privacy_status=_shared(item.get("status", {}).get("privacyStatus")),
+        )
+
+
+@dataclass(slots=True)
+class Playlist:
+    """播放清單"""
+    id: str
+    title: str = ""
+    description: str = ""
+    item_count: int = 0
+    privacy_status: str = ""
+    published_at: str = ""
+
+    @classmethod
+    def from_api(cls, item: dict) -> "Playlist":
+        snippet = item.get("snippet", {})
+        return cls(
+            id=resource_id(item),
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            item_count=_int(item.get("contentDetails", {}).get("itemCount")) or 0,
+            privacy_status=_shared(item.get("status", {}).get("privacyStatus")),
+            published_at=snippet.get("publishedAt", ""),
+        )
+
+
+@dataclass(slots=True)
+class PlaylistItem:
+    """播放清單中的一個項目"""
+    id: str
+    video_id: str = ""
+    playlist_id: str = ""
+    position: int = 0
+    title: str = ""
+    channel_title: str = ""
+    video_published_at: str = ""
+
+    @classmethod
+    def from_api(cls, item: dict) -> "PlaylistItem":
+        snippet = item.get("snippet", {})
+        content = item.get("contentDetails", {})
+        return cls(
+            id=item.get("id", ""),
+            video_id=content.get("videoId") or snippet.get("resourceId", {}).get("videoId", ""),
+            playlist_id=_shared(snippet.get("playlistId")),
+            position=_int(snippet.get("position")) or 0,
+            title=snippet.get("title", ""),
+            channel_title=_shared(snippet.get("videoOwnerChannelTitle")),
+            video_published_at=content.get("videoPublishedAt", ""),
+        )
+
+
+@dataclass(slots=True)
+class Comment:
+    """單則留言（頂層留言或回覆）"""
+    id: str
+    author: str = ""
+    text: str = ""
+    like_count: int = 0
+    published_at: str = ""
+
+    @classmethod
+    def from_api(cls, item: dict) -> "Comment":
+        snippet = item.get("snippet", {})
+        return cls(
+            id=item.get("id", ""),
+            author=_shared(snippet.get("authorDisplayName")),
+            text=snippet.get("textDisplay", ""),
+            like_count=_int(snippet.get("likeCount")) or 0,
+            published_at=snippet.get("publishedAt", ""),
+        )
+
+
+@dataclass(slots=True)
+class CommentThread:
+    """留言串（頂層留言與已載入的回覆）"""
+    id: str
+    comment: Comment
+    video_id: str = ""
+    reply_count: int = 0
+    replies: tuple[Comment, ...] = ()
+
+    @classmethod
+    def from_api(cls, item: dict) -> "CommentThread":
+        snippet = item.get("snippet", {})
+        return cls(
+            id=item.get("id", ""),
+            comment=Comment.from_api(snippet.get("topLevelComment", {})),
+            video_id=_shared(snippet.get("videoId")),
+            reply_count=_int(snippet.get("totalReplyCount")) or 0,
+            replies=tuple(Comment.from_api(reply) for reply in item.get("replies", {}).get("comments", [])),
+        )
+
+
+@dataclass(slots=True)
+class Caption:
+    """字幕軌道"""
+    id: str
+    video_id: str = ""
+    language: str = ""
+    name: str = ""
+    track_kind: str = "standard"
+    is_draft: bool = False
+
+    @classmethod
+    def from_api(cls, item: dict) -> "Caption":
+        snippet = item.get("snippet", {})
+        return cls(
+            id=item.get("id", ""),
+            video_id=_shared(snippet.get("videoId")),
+            language=_shared(snippet.get("language")),
+            name=snippet.get("name", ""),
+            track_kind=_shared(snippet.get("trackKind")) or "standard",
+            is_draft=bool(snippet.get("isDraft", False)),
+        )
+
+
+def parse_models(items: Union[dict, list, Iterable, None], model: type[M]) -> list[M]:
+    """將回應資料或項目解析為模型（已是模型的項目直接沿用）"""
+    if items is None or isinstance(items, dict):
+        items = items_of(items)
+    return [item if isinstance(item, model) else model.from_api(item) for item in items]
@@ -0,0 +1,118 @@
+"""播放清單清理 - 找出重複項目與失效影片並批次移除"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from yutu_cli.utils.batching import chunked
+from yutu_cli.utils.playlist_index import PlaylistEntry, PlaylistIndex
+from yutu_cli.utils.yutu import YutuCLI
+
+# playlistItems.delete 每個項目的配額成本
+DELETE_COST = 50
+
+# 每次 yutu 呼叫帶入的 playlistItem ID 數
+REMOVE_BATCH_SIZE = 50
+
+
+@dataclass
+class CleanupPlan:
+    """清理計畫（執行前可先顯示）"""
+    duplicates: list[PlaylistEntry] = field(default_factory=list)
+    placeholders: list[PlaylistEntry] = field(default_factory=list)
+    batch_size: int = REMOVE_BATCH_SIZE
+
+    @classmethod
+    def from_index(cls, index: PlaylistIndex, playlist_id: Optional[str] = None) -> "CleanupPlan":
+        """由索引找出要移除的項目（playlist_id 為 None 時涵蓋所有清單）"""
+        return cls(
+            duplicates=index.duplicates(playlist_id),
+            placeholders=index.placeholders(playlist_id),
+        )
+
+    @property
+    def entries(self) -> list[PlaylistEntry]:
+        """所有要移除的項目"""
+        return self.duplicates + self.placeholders
+
+    @property
+    def calls(self) -> int:
+        """需要的 yutu 呼叫次數"""
+        return len(chunked(self.entries, self.batch_size))
+
+    @property
+    def quota(self) -> int:
+        """預估耗用的配額"""
+        return len(self.entries) * DELETE_COST
+
+
+@dataclass
+class RemovalReport:
+    """批次移除結果"""
+    removed: list[PlaylistEntry] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    calls: int = 0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed
+
+
+def remove_entries(
+    yutu: YutuCLI,
+    entries: list[PlaylistEntry],
+    *,
+    batch_size: int = REMOVE_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> RemovalReport:
+    """以批次並行移除播放清單項目
+
+    每批以一次 `playlistItem delete --ids a,b,...` 送出；批次失敗時改為逐項移除，
+    以找出實際失敗的項目。
+
+    Args:
+        yutu: YutuCLI 實例
+        entries: 要移除的項目
+        batch_size: 每次呼叫的項目數
+        max_workers: 同時執行的批次數（None 使用 max_concurrency 設定）
+        progress: 每完成一批時呼叫，參數為 (已處理項目數, 總數)
+
+    Returns:
+        RemovalReport（failed 以 playlistItem ID 為鍵）
+    """
+    report = RemovalReport()
+    lock = threading.Lock()
+    done = 0
+
+    def remove(batch: list[PlaylistEntry]) -> None:
+        nonlocal done
+        result = yutu.remove_from_playlist([entry.item_id for entry in batch])
+        calls = 1
+        removed, failed = [], {}
+        if result.success:
+            removed = batch
+        elif len(batch) == 1:
+            failed[batch[0].item_id] = result.error or "移除失敗"
+        else:
+            for entry in batch:
+                single = yutu.remove_from_playlist(entry.item_id)
+                calls += 1
+                if single.success:
+                    removed.append(entry)
+                else:
+                    failed[entry.item_id] = single.error or "移除失敗"
+        with lock:
+            report.removed.extend(removed)
+            report.failed.update(failed)
+            report.calls += calls
+            done += len(batch)
+            if progress:
+                progress(done, len(entries))
+
+    batches = chunked(entries, batch_size)
+    workers = max(1, min(max_workers or yutu.config.max_concurrency, len(batches) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(remove, batches))
+    return report
@@ -0,0 +1,178 @@
+"""播放清單索引 - 以影片 ID 查詢它出現在哪些播放清單的哪些位置"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
+
+# 影片被刪除或轉為私人後，播放清單中留下的項目標題
+PLACEHOLDER_TITLES = frozenset({"Deleted video", "Private video"})
+
+
+@dataclass(frozen=True)
+class PlaylistEntry:
+    """播放清單中的一個項目"""
+    playlist_id: str
+    item_id: str
+    video_id: str
+    position: int
+    title: str = ""
+
+    @property
+    def placeholder(self) -> bool:
+        """是否為已刪除或私人影片留下的項目"""
+        return self.title in PLACEHOLDER_TITLES
+
+    @classmethod
+    def from_item(cls, playlist_id: str, item: dict, default_position: int = 0) -> "PlaylistEntry":
+        """由 playlistItem 資源建立"""
+        snippet = item.get("snippet", {})
+        video_id = (
+            item.get("contentDetails", {}).get("videoId")
+            or snippet.get("resourceId", {}).get("videoId", "")
+        )
+        position = snippet.get("position")
+        return cls(
+            playlist_id=playlist_id,
+            item_id=item.get("id", ""),
+            video_id=video_id,
+            position=default_position if position is None else int(position),
+            title=snippet.get("title", ""),
+        )
+
+
+class PlaylistIndex:
+    """影片 ID -> 播放清單項目 的索引"""
+
+    def __init__(self):
+        self.playlists: dict[str, list[PlaylistEntry]] = {}
+        self.by_video: dict[str, list[PlaylistEntry]] = {}
+
+    def add_playlist(self, playlist_id: str, items: Iterable[dict]) -> None:
+        """加入（或取代）一個播放清單的項目"""
+        self.remove_playlist(playlist_id)
+        entries = [
+            PlaylistEntry.from_item(playlist_id, item, position)
+            for position, item in enumerate(items)
+        ]
+        entries.sort(key=lambda entry: entry.position)
+        self.playlists[playlist_id] = entries
+        for entry in entries:
+            self.by_video.setdefault(entry.video_id, []).append(entry)
+
+    def remove_playlist(self, playlist_id: str) -> None:
+        """從索引移除一個播放清單"""
+        for entry in self.playlists.pop(playlist_id, []):
+            remaining = [e for e in self.by_video.get(entry.video_id, []) if e.playlist_id != playlist_id]
+            if remaining:
+                self.by_video[entry.video_id] = remaining
+            else:
+                self.by_video.pop(entry.video_id, None)
+
+    def discard(self, entries: Iterable[PlaylistEntry]) -> None:
+        """移除已從播放清單刪除的項目（其餘項目的位置不重新計算）"""
+        entries = list(entries)
+        gone = {(entry.playlist_id, entry.item_id) for entry in entries}
+        if not gone:
+            return
+        for playlist_id in {playlist_id for playlist_id, _ in gone}:
+            if playlist_id in self.playlists:
+                self.playlists[playlist_id] = [
+                    e for e in self.playlists[playlist_id] if (e.playlist_id, e.item_id) not in gone
+                ]
+        for video_id in {entry.video_id for entry in entries}:
+            remaining = [
+                e for e in self.by_video.get(video_id, []) if (e.playlist_id, e.item_id) not in gone
+            ]
+            if remaining:
+                self.by_video[video_id] = remaining
+            else:
+                self.by_video.pop(video_id, None)
+
+    def entries(self, video_id: str) -> list[PlaylistEntry]:
+        """影片在所有播放清單中的項目"""
+        return list(self.by_video.get(video_id, []))
+
+    def _scope(self, playlist_id: Optional[str]) -> list[list[PlaylistEntry]]:
+        if playlist_id is None:
+            return list(self.playlists.values())
+        return [self.playlists.get(playlist_id, [])]
+
+    def duplicates(self, playlist_id: Optional[str] = None) -> list[PlaylistEntry]:
+        """同一播放清單中重複的項目（保留位置最前面的一個，其餘列出）"""
+        found = []
+        for entries in self._scope(playlist_id):
+            seen: set[str] = set()
+            for entry in entries:
+                if entry.placeholder or not entry.video_id:
+                    continue
+                if entry.video_id in seen:
+                    found.append(entry)
+                seen.add(entry.video_id)
+        return found
+
+    def placeholders(self, playlist_id: Optional[str] = None) -> list[PlaylistEntry]:
+        """已刪除或私人影片留下的項目"""
+        return [
+            entry
+            for entries in self._scope(playlist_id)
+            for entry in entries
+            if entry.placeholder
+        ]
+
+
+@dataclass
+class IndexLoadResult:
+    """載入索引的結果"""
+    index: PlaylistIndex
+    errors: dict[str, str] = field(default_factory=dict)
+    calls: int = 0
+
+
+def _result_items(result: YutuResult) -> list[dict]:
+    data = result.data
+    return data if isinstance(data, list) else (data or {}).get("items", [])
+
+
+def load_playlist_index(
+    yutu: YutuCLI,
+    playlist_ids: Iterable[str],
+    *,
+    use_cache: bool = True,
+    max_workers: Optional[int] = None,
+    index: Optional[PlaylistIndex] = None,
+) -> IndexLoadResult:
+    """並行下載多個播放清單的項目並建立索引
+
+    Args:
+        yutu: YutuCLI 實例
+        playlist_ids: 播放清單 ID
+        use_cache: 是否允許使用回應快取與本機鏡像（準備修改清單時應為 False）
+        max_workers: 同時下載的清單數（None 使用 max_concurrency 設定）
+        index: 要更新的既有索引（None 建立新索引）
+
+    Returns:
+        IndexLoadResult，下載失敗的清單列在 errors
+    """
+    playlist_ids = list(dict.fromkeys(playlist_ids))
+    loaded = IndexLoadResult(index=index or PlaylistIndex(), calls=len(playlist_ids))
+
+    def fetch(playlist_id: str) -> YutuResult:
+        return yutu.run(
+            "playlistItem", "list",
+            playlistId=playlist_id,
+            parts="snippet,contentDetails",
+            use_cache=use_cache,
+        )
+
+    workers = max(1, min(max_workers or yutu.config.max_concurrency, len(playlist_ids) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(fetch, playlist_ids))
+
+    for playlist_id, result in zip(playlist_ids, results):
+        if result.success:
+            loaded.index.add_playlist(playlist_id, _result_items(result))
+        else:
+            loaded.errors[playlist_id] = result.error or "無法取得播放清單內容"
+    return loaded
@@ -0,0 +1,125 @@
+"""播放清單成員索引 - 查詢影片在哪些播放清單中，並一次從所有清單移除
+
+第一次查詢時並行下載所有播放清單的項目（經由回應快取與本機鏡像）並建立
+影片 ID -> 項目 的索引；之後的查詢直接查表。透過本服務移除項目時同步更新索引，
+其他修改播放清單的操作完成後應呼叫 `invalidate()`。
+"""
+
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from yutu_cli.utils.playlist_cleanup import RemovalReport, remove_entries
+from yutu_cli.utils.playlist_index import PlaylistEntry, PlaylistIndex, load_playlist_index
+from yutu_cli.utils.yutu import YutuCLI, YutuResult, get_yutu
+
+
+class PlaylistMembership:
+    """所有播放清單的成員索引（工作階段內共用）
+
+    Args:
+        yutu: YutuCLI 實例
+        max_age: 索引的有效秒數，超過後下次取用時重新載入
+    """
+
+    def __init__(self, yutu: YutuCLI, *, max_age: float = 300):
+        self.yutu = yutu
+        self.max_age = max_age
+        self.titles: dict[str, str] = {}
+        self.errors: dict[str, str] = {}
+        self._index: Optional[PlaylistIndex] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """索引是否已載入且未過期"""
+        return self._index is not None and time.monotonic() - self._loaded_at < self.max_age
+
+    def load(self, *, refresh: bool = False) -> YutuResult:
+        """載入所有播放清單的項目（已載入且未過期時直接回傳）
+
+        Args:
+            refresh: 略過快取重新下載
+
+        Returns:
+            YutuResult；個別播放清單下載失敗時仍為成功，失敗的清單列在 `errors`
+        """
+        if self.loaded and not refresh:
+            return YutuResult(success=True)
+
+        result = self.yutu.run(
+            "playlist", "list",
+            mine=True,
+            parts="snippet",
+            use_cache=not refresh,
+        )
+        if not result.success:
+            return result
+        data = result.data
+        playlists = data if isinstance(data, list) else (data or {}).get("items", [])
+        titles = {item.get("id", ""): item.get("snippet", {}).get("title", "") for item in playlists}
+
+        loaded = load_playlist_index(self.yutu, list(titles), use_cache=not refresh)
+        with self._lock:
+            self.titles = titles
+            self.errors = loaded.errors
+            self._index = loaded.index
+            self._loaded_at = time.monotonic()
+        return YutuResult(success=True)
+
+    def find(self, video_id: str) -> list[PlaylistEntry]:
+        """影片所在的播放清單項目（需先 load；同一清單可能出現多次）"""
+        with self._lock:
+            return self._index.entries(video_id) if self._index is not None else []
+
+    def playlists_containing(self, video_id: str) -> list[str]:
+        """包含此影片的播放清單 ID（依索引順序，不重複）"""
+        return list(dict.fromkeys(entry.playlist_id for entry in self.find(video_id)))
+
+    def remove_everywhere(
+        self,
+        video_id: str,
+        *,
+        playlist_ids: Optional[Iterable[str]] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> RemovalReport:
+        """從所有（或指定的）播放清單移除影片，只對實際存在的項目呼叫刪除
+
+        Args:
+            video_id: 影片 ID
+            playlist_ids: 只從這些播放清單移除（None 為全部）
+            progress: 進度回呼，參數為 (已處理項目數, 總數)
+
+        Returns:
+            RemovalReport；成功移除的項目會同步從索引刪除
+        """
+        entries = self.find(video_id)
+        if playlist_ids is not None:
+            wanted = set(playlist_ids)
+            entries = [entry for entry in entries if entry.playlist_id in wanted]
+        if not entries:
+            return RemovalReport()
+
+        report = remove_entries(self.yutu, entries, progress=progress)
+        with self._lock:
+            if self._index is not None:
+                self._index.discard(report.removed)
+        return report
+
+    def invalidate(self) -> None:
+        """捨棄索引，下次取用時重新載入"""
+        with self._lock:
+            self._index = None
+
+
+# 全域實例
+_membership: Optional[PlaylistMembership] = None
+
+
+def get_playlist_membership() -> PlaylistMembership:
+    """取得 PlaylistMembership 實例（單例模式）"""
+    global _membership
+    if _membership is None:
+        _membership = PlaylistMembership(get_yutu())
+    return _membership
@@ -0,0 +1,176 @@
+"""播放清單排序 - 以最少的 playlistItem update 將清單排成目標順序
+
+每次移動（`playlistItem update --position`）耗用 50 配額。目前順序中，
+依目標順序遞增的最長子序列（LIS）不需移動，只需移動其餘項目，
+因此移動次數為「項目數 - LIS 長度」，為可能的最小值。
+"""
+
+import bisect
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from yutu_cli.utils.yutu import YutuCLI
+
+# playlistItems.update 每次的配額成本
+MOVE_COST = 50
+
+SORT_KEYS = ("published", "views", "title", "custom")
+
+
+def longest_increasing_subsequence(values: list[int]) -> list[int]:
+    """回傳嚴格遞增最長子序列的索引（O(n log n)）
+
+    Examples:
+        >>> longest_increasing_subsequence([3, 0, 1, 4, 2])
+        [1, 2, 4]
+    """
+    tails: list[int] = []       # tails[k]：長度 k+1 的子序列結尾值
+    tail_index: list[int] = []  # 對應 tails 的索引
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect.bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[k] = value
+            tail_index[k] = i
+        previous[i] = tail_index[k - 1] if k else -1
+
+    result = []
+    i = tail_index[-1] if tail_index else -1
+    while i != -1:
+        result.append(i)
+        i = previous[i]
+    return result[::-1]
+
+
+@dataclass(frozen=True)
+class Move:
+    """將項目移到指定位置（從 0 起算，為移動當下的位置）"""
+    item_id: str
+    position: int
+
+
+def plan_moves(current: list[str], target: list[str]) -> list[Move]:
+    """計算把 current 排成 target 所需的最少移動
+
+    依目標順序由前往後處理需移動的項目，每個項目放到目標順序中前一個項目之後；
+    回傳的移動須依序執行。
+
+    Args:
+        current: 目前順序的項目 ID
+        target: 目標順序的項目 ID（須與 current 為相同集合）
+
+    Returns:
+        依序執行的 Move 列表
+
+    Raises:
+        ValueError: current 與 target 的項目不同
+    """
+    if sorted(current) != sorted(target) or len(set(current)) != len(current):
+        raise ValueError("目標順序必須包含與目前相同的項目")
+
+    rank = {item_id: i for i, item_id in enumerate(target)}
+    keep_indices = longest_increasing_subsequence([rank[item_id] for item_id in current])
+    keep = {current[i] for i in keep_indices}
+
+    order = list(current)
+    moves = []
+    for i, item_id in enumerate(target):
+        if item_id in keep:
+            continue
+        order.remove(item_id)
+        position = order.index(target[i - 1]) + 1 if i else 0
+        order.insert(position, item_id)
+        moves.append(Move(item_id, position))
+    return moves
+
+
+def _video_id(item: dict) -> str:
+    return (
+        item.get("contentDetails", {}).get("videoId")
+        or item.get("snippet", {}).get("resourceId", {}).get("videoId", "")
+    )
+
+
+def sort_items(
+    items: list[dict],
+    key: str,
+    *,
+    descending: bool = False,
+    views: Optional[dict[str, int]] = None,
+    custom: Optional[list[str]] = None,
+) -> list[str]:
+    """計算播放清單項目的目標順序
+
+    Args:
+        items: 目前順序的播放清單項目
+        key: published（發布日期）、views（觀看次數）、title（標題）或 custom（自訂清單）
+        descending: 是否由大到小（custom 時忽略）
+        views: 影片 ID -> 觀看次數（key 為 views 時需要）
+        custom: 影片 ID 的目標順序（key 為 custom 時需要；未列出的項目依原順序排在最後）
+
+    Returns:
+        目標順序的項目 ID（排序穩定：鍵值相同時維持原順序）
+    """
+    if key not in SORT_KEYS:
+        raise ValueError(f"不支援的排序方式：{key}")
+
+    if key == "custom":
+        wanted = {video_id: i for i, video_id in enumerate(custom or [])}
+        ordered = sorted(
+            items,
+            key=lambda item: wanted.get(_video_id(item), len(wanted)),
+        )
+        return [item.get("id", "") for item in ordered]
+
+    def sort_key(item: dict):
+        snippet = item.get("snippet", {})
+        if key == "published":
+            return item.get("contentDetails", {}).get("videoPublishedAt") or snippet.get("publishedAt", "")
+        if key == "views":
+            return (views or {}).get(_video_id(item), 0)
+        return snippet.get("title", "").casefold()
+
+    # reverse=True 仍是穩定排序，鍵值相同的項目維持原順序
+    ordered = sorted(items, key=sort_key, reverse=descending)
+    return [item.get("id", "") for item in ordered]
+
+
+@dataclass
+class ReorderReport:
+    """排序執行結果"""
+    moved: int = 0
+    total: int = 0
+    error: Optional[str] = None
+    calls: int = 0
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.moved == self.total
+
+
+def apply_moves(
+    yutu: YutuCLI,
+    playlist_id: str,
+    items: Iterable[dict],
+    moves: list[Move],
+    *,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> ReorderReport:
+    """依序執行移動（後面的位置依賴前面的結果，因此不能並行；遇到錯誤即停止）"""
+    video_ids = {item.get("id", ""): _video_id(item) for item in items}
+    report = ReorderReport(total=len(moves))
+    for move in moves:
+        result = yutu.move_playlist_item(
+            move.item_id, playlist_id, video_ids.get(move.item_id, ""), move.position
+        )
+        report.calls += 1
+        if not result.success:
+            report.error = result.error or "移動失敗"
+            break
+        report.moved += 1
+        if progress:
+            progress(report.moved, report.total)
+    return report
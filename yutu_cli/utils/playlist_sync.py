@@ -0,0 +1,282 @@
+"""播放清單宣告式同步 - 讓播放清單內容與清單檔一致
+
+清單檔列出播放清單應有的影片與順序，支援 JSON、YAML（需安裝 PyYAML）、
+CSV 與純文字（每行一個網址或 ID）。JSON/YAML 可為影片列表，或
+`{"playlist": "PL...", "title": "...", "videos": [...]}`。
+
+同步依序執行：移除不在清單檔中的項目（含重複項目）→ 並行加入缺少的影片 →
+以最少移動排成清單檔的順序。內容已一致時不會呼叫任何寫入 API，可重複執行。
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from yutu_cli.utils.batching import dedupe
+from yutu_cli.utils.bulk_add import BulkAdder, ImportManifest, parse_video_refs
+from yutu_cli.utils.playlist_cleanup import DELETE_COST, RemovalReport, remove_entries
+from yutu_cli.utils.playlist_index import PlaylistEntry
+from yutu_cli.utils.playlist_reorder import MOVE_COST, ReorderReport, apply_moves, plan_moves
+from yutu_cli.utils.yutu import YutuCLI
+
+# playlistItems.insert 每次的配額成本
+INSERT_COST = 50
+
+
+@dataclass
+class PlaylistManifest:
+    """清單檔內容"""
+    video_ids: list[str]
+    playlist_id: Optional[str] = None
+    title: str = ""
+    invalid: list[str] = field(default_factory=list)
+
+
+def _manifest_from_data(data: object) -> PlaylistManifest:
+    if isinstance(data, dict):
+        videos = data.get("videos") or data.get("items") or []
+        manifest = _manifest_from_data(videos)
+        manifest.playlist_id = data.get("playlist") or data.get("playlist_id") or None
+        manifest.title = data.get("title", "")
+        return manifest
+    if not isinstance(data, list):
+        raise ValueError("清單檔必須是影片列表，或包含 videos 欄位的物件")
+    refs = [
+        str(entry.get("id") or entry.get("video") or entry.get("url") or "")
+        if isinstance(entry, dict) else str(entry)
+        for entry in data
+    ]
+    video_ids, invalid = parse_video_refs("\n".join(refs))
+    return PlaylistManifest(video_ids=video_ids, invalid=invalid)
+
+
+def _load_yaml(text: str) -> object:
+    try:
+        import yaml
+    except ImportError as e:
+        raise ValueError("讀取 YAML 清單檔需要 PyYAML（uv pip install pyyaml）") from e
+    return yaml.safe_load(text)
+
+
+def _manifest_from_csv(text: str) -> PlaylistManifest:
+    """CSV：取第一欄（或名為 video/video_id/id/url 的欄位），首列可為標題列"""
+    rows = [row for row in csv.reader(io.StringIO(text)) if row and row[0].strip()]
+    column = 0
+    if rows:
+        header = [cell.strip().lower() for cell in rows[0]]
+        for name in ("video_id", "video", "id", "url"):
+            if name in header:
+                column = header.index(name)
+                rows = rows[1:]
+                break
+    video_ids, invalid = [], []
+    for row in rows:
+        cell = row[column].strip() if column < len(row) else ""
+        parsed, bad = parse_video_refs(cell)
+        video_ids += parsed
+        invalid += bad
+    return PlaylistManifest(video_ids=dedupe(video_ids), invalid=invalid)
+
+
+def load_manifest(path: str | Path) -> PlaylistManifest:
+    """讀取清單檔（依副檔名判斷格式）
+
+    Raises:
+        OSError: 無法讀取檔案
+        ValueError: 格式錯誤
+    """
+    path = Path(path).expanduser()
+    text = path.read_text(encoding="utf-8")
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        return _manifest_from_data(json.loads(text))
+    if suffix in (".yaml", ".yml"):
+        return _manifest_from_data(_load_yaml(text))
+    if suffix == ".csv":
+        return _manifest_from_csv(text)
+    video_ids, invalid = parse_video_refs(text)
+    return PlaylistManifest(video_ids=video_ids, invalid=invalid)
+
+
+@dataclass
+class PlaylistDiff:
+    """清單檔與目前播放清單的差異"""
+    target: list[str]
+    deletes: list[PlaylistEntry] = field(default_factory=list)
+    inserts: list[str] = field(default_factory=list)
+    moves: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return not (self.deletes or self.inserts or self.moves)
+
+    @property
+    def quota(self) -> int:
+        """預估耗用的配額（不含讀取）"""
+        return (
+            len(self.deletes) * DELETE_COST
+            + len(self.inserts) * INSERT_COST
+            + self.moves * MOVE_COST
+        )
+
+
+def _ordered_entries(playlist_id: str, items: list[dict]) -> list[PlaylistEntry]:
+    entries = [PlaylistEntry.from_item(playlist_id, item, i) for i, item in enumerate(items)]
+    return sorted(entries, key=lambda entry: entry.position)
+
+
+def _keep_entries(entries: list[PlaylistEntry], target: set[str]) -> tuple[list[PlaylistEntry], list[PlaylistEntry]]:
+    """分出要保留（每部目標影片第一個）與要移除的項目"""
+    keep, deletes, seen = [], [], set()
+    for entry in entries:
+        if entry.video_id in target and entry.video_id not in seen:
+            keep.append(entry)
+            seen.add(entry.video_id)
+        else:
+            deletes.append(entry)
+    return keep, deletes
+
+
+def diff_playlist(playlist_id: str, items: list[dict], target: list[str]) -> PlaylistDiff:
+    """計算讓播放清單與 target 一致所需的移除、加入與移動
+
+    新加入的影片會附加在最後，移動次數依此推算；並行加入時實際順序可能不同，
+    排序前會重新讀取播放清單再計算。
+    """
+    target = dedupe(target)
+    keep, deletes = _keep_entries(_ordered_entries(playlist_id, items), set(target))
+    present = {entry.video_id for entry in keep}
+    inserts = [video_id for video_id in target if video_id not in present]
+    projected = [entry.video_id for entry in keep] + inserts
+    return PlaylistDiff(
+        target=target,
+        deletes=deletes,
+        inserts=inserts,
+        moves=len(plan_moves(projected, target)),
+    )
+
+
+@dataclass
+class PlaylistSyncReport:
+    """同步執行結果"""
+    removed: int = 0
+    added: int = 0
+    moved: int = 0
+    calls: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+
+class PlaylistSyncer:
+    """將清單檔的內容套用到播放清單
+
+    Args:
+        yutu: YutuCLI 實例
+        playlist_id: 播放清單 ID
+        max_workers: 移除與加入時的並行數（None 使用 max_concurrency 設定）
+        progress: 進度回呼，參數為說明文字
+    """
+
+    def __init__(
+        self,
+        yutu: YutuCLI,
+        playlist_id: str,
+        *,
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[str], None]] = None,
+    ):
+        self.yutu = yutu
+        self.playlist_id = playlist_id
+        self.max_workers = max_workers or yutu.config.max_concurrency
+        self.progress = progress or (lambda message: None)
+        self.report = PlaylistSyncReport()
+
+    def fetch_items(self) -> Optional[list[dict]]:
+        """讀取目前的播放清單項目（略過快取；失敗時回傳 None）"""
+        result = self.yutu.run(
+            "playlistItem", "list",
+            playlistId=self.playlist_id,
+            parts="snippet,contentDetails",
+            use_cache=False,
+        )
+        self.report.calls += 1
+        if not result.success:
+            self.report.errors.append(result.error or "無法取得播放清單內容")
+            return None
+        data = result.data
+        return data if isinstance(data, list) else (data or {}).get("items", [])
+
+    def diff(self, target: list[str]) -> Optional[PlaylistDiff]:
+        """讀取播放清單並計算差異"""
+        items = self.fetch_items()
+        if items is None:
+            return None
+        return diff_playlist(self.playlist_id, items, target)
+
+    def _remove(self, diff: PlaylistDiff) -> None:
+        self.progress(f"正在移除 {len(diff.deletes)} 個項目...")
+        removal: RemovalReport = remove_entries(self.yutu, diff.deletes, max_workers=self.max_workers)
+        self.report.removed += len(removal.removed)
+        self.report.calls += removal.calls
+        self.report.errors += [f"移除 {item_id}：{error}" for item_id, error in removal.failed.items()]
+
+    def _insert(self, diff: PlaylistDiff) -> None:
+        self.progress(f"正在加入 {len(diff.inserts)} 部影片...")
+        manifest = ImportManifest.for_import(
+            self.yutu.config.state_dir / "imports", self.playlist_id, diff.inserts
+        )
+        adder = BulkAdder(
+            self.yutu, self.playlist_id, manifest,
+            max_workers=self.max_workers,
+            progress=lambda done, total: self.progress(f"正在加入影片... {done}/{total}"),
+        )
+        added = adder.run(diff.inserts)
+        self.report.added += added.added
+        self.report.calls += added.calls
+        self.report.errors += [f"加入 {video_id}：{error}" for video_id, error in added.failed.items()]
+        if added.aborted:
+            self.report.errors.append("配額已用盡，已停止加入")
+
+    def _reorder(self, target: list[str]) -> None:
+        items = self.fetch_items()
+        if items is None:
+            return
+        entries = _ordered_entries(self.playlist_id, items)
+        by_video = {}
+        for entry in entries:
+            by_video.setdefault(entry.video_id, entry.item_id)
+        if set(by_video) != set(target) or len(entries) != len(target):
+            self.report.errors.append("播放清單內容與清單檔仍不一致，略過排序")
+            return
+        moves = plan_moves(
+            [entry.item_id for entry in entries],
+            [by_video[video_id] for video_id in target],
+        )
+        if not moves:
+            return
+        self.progress(f"正在調整 {len(moves)} 個項目的位置...")
+        reorder: ReorderReport = apply_moves(
+            self.yutu, self.playlist_id, items, moves,
+            progress=lambda done, total: self.progress(f"正在調整位置... {done}/{total}"),
+        )
+        self.report.moved += reorder.moved
+        self.report.calls += reorder.calls
+        if reorder.error:
+            self.report.errors.append(f"移動：{reorder.error}")
+
+    def apply(self, diff: PlaylistDiff) -> PlaylistSyncReport:
+        """套用差異：移除 → 加入 → 排序（前一步失敗時不繼續）"""
+        if diff.deletes:
+            self._remove(diff)
+        if diff.inserts and self.report.success:
+            self._insert(diff)
+        if (diff.moves or diff.inserts) and self.report.success:
+            self._reorder(diff.target)
+        return self.report
+
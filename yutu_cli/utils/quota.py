@@ -0,0 +1,228 @@
+"""配額帳本 - 記錄每日 YouTube Data API 配額用量並執行預算上限
+
+YouTube 的每日配額於太平洋時間午夜重置。帳本依 (resource, action) 的單位成本
+累計實際送出的呼叫（快取與本機鏡像的回應不計），每次記帳後寫回磁碟，
+因此重新啟動或多個工作階段之間的累計不會遺失。
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Any, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# 預設每日配額
+DAILY_QUOTA = 10_000
+
+# 非預設成本的動作（其餘 list/getRating 為 1，寫入動作為 50）
+QUOTA_COSTS: dict[tuple[str, str], int] = {
+    ("search", "list"): 100,
+    ("video", "insert"): 1600,
+    ("caption", "list"): 50,
+    ("caption", "insert"): 400,
+    ("caption", "update"): 450,
+    ("caption", "download"): 200,
+}
+
+# list 端點每頁的項目數上限；yutu 以 maxResults 0 取得全部時會逐頁呼叫，每頁各自計費
+LIST_PAGE_SIZE = 50
+
+# 預算不足而未送出的呼叫，錯誤訊息中帶有此標記
+BUDGET_ERROR_MARKER = "quotaBudget"
+
+# API 回報配額用盡時的錯誤標記
+EXCEEDED_MARKERS = ("quotaExceeded", "exceeded your quota")
+
+
+def quota_cost(resource: str, action: str, params: Optional[dict[str, Any]] = None) -> int:
+    """取得一次呼叫的配額成本
+
+    刪除動作以逗號一次傳入多個 ID 時，依 ID 數計算。
+
+    Examples:
+        >>> quota_cost("playlistItem", "delete", {"ids": "a,b,c"})
+        150
+    """
+    if (resource, action) in QUOTA_COSTS:
+        cost = QUOTA_COSTS[(resource, action)]
+    else:
+        cost = 1 if action in ("list", "getRating") else 50
+    if action == "delete" and params and params.get("ids"):
+        cost *= len([part for part in str(params["ids"]).split(",") if part])
+    return cost
+
+
+def list_pages(max_results: Optional[int]) -> int:
+    """預估 list 呼叫的頁數（0 表示取得全部，頁數要到回應後才知道，先以一頁計）
+
+    Examples:
+        >>> list_pages(120), list_pages(0)
+        (3, 1)
+    """
+    if not max_results or max_results < 0:
+        return 1
+    return -(-max_results // LIST_PAGE_SIZE)
+
+
+def pages_for(item_count: int) -> int:
+    """實際回傳 item_count 個項目所需的頁數"""
+    return max(1, -(-item_count // LIST_PAGE_SIZE))
+
+
+def _pacific() -> tzinfo:
+    try:
+        return ZoneInfo("America/Los_Angeles")
+    except ZoneInfoNotFoundError:
+        # 沒有時區資料（例如 Windows 未安裝 tzdata）時以太平洋標準時間近似
+        return timezone(timedelta(hours=-8))
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """配額所屬的日期（太平洋時間，YYYY-MM-DD）"""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(_pacific()).date().isoformat()
+
+
+def next_reset(now: Optional[datetime] = None) -> datetime:
+    """下一次配額重置的時間（太平洋時間午夜，回傳 UTC）"""
+    now = (now or datetime.now(timezone.utc)).astimezone(_pacific())
+    midnight = datetime(now.year, now.month, now.day, tzinfo=now.tzinfo) + timedelta(days=1)
+    return midnight.astimezone(timezone.utc)
+
+
+@dataclass
+class QuotaUsage:
+    """某一天的配額用量"""
+    day: str
+    used: int = 0
+    calls: int = 0
+    by_action: dict[str, int] = field(default_factory=dict)
+
+
+class QuotaLedger:
+    """每日配額帳本
+
+    Args:
+        path: 帳本檔案（JSON）
+        daily_limit: 每日配額
+        budget: 自訂的每日預算（0 表示使用 daily_limit）
+    """
+
+    def __init__(self, path: Path, *, daily_limit: int = DAILY_QUOTA, budget: int = 0):
+        self.path = path
+        self.daily_limit = daily_limit
+        self.budget = min(budget, daily_limit) if budget > 0 else daily_limit
+        self.session_used = 0
+        self._lock = threading.Lock()
+
+    def _read(self) -> QuotaUsage:
+        """讀取今日用量（檔案不存在、損毀或為前一天時從 0 開始）"""
+        today = quota_day()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return QuotaUsage(day=today)
+        if not isinstance(data, dict) or data.get("day") != today:
+            return QuotaUsage(day=today)
+        return QuotaUsage(
+            day=today,
+            used=int(data.get("used", 0)),
+            calls=int(data.get("calls", 0)),
+            by_action=dict(data.get("by_action", {})),
+        )
+
+    def _write(self, usage: QuotaUsage) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(usage.__dict__, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # 帳本無法寫入時不影響正常執行
+            pass
+
+    def usage(self) -> QuotaUsage:
+        """今日用量"""
+        with self._lock:
+            return self._read()
+
+    @property
+    def used(self) -> int:
+        """今日已用配額"""
+        return self.usage().used
+
+    @property
+    def remaining(self) -> int:
+        """今日預算剩餘配額"""
+        return max(0, self.budget - self.used)
+
+    def affordable(self, unit_cost: int, count: int) -> int:
+        """在剩餘預算內最多可執行幾次成本為 unit_cost 的呼叫"""
+        if unit_cost <= 0:
+            return count
+        return min(count, self.remaining // unit_cost)
+
+    def _budget_error(self, units: int, remaining: int) -> str:
+        return (
+            f"配額預算不足：需要 {units:,}，今日剩餘 {remaining:,}"
+            f"（預算 {self.budget:,}，太平洋時間午夜重置）[{BUDGET_ERROR_MARKER}]"
+        )
+
+    def check(self, units: int) -> Optional[str]:
+        """預算足夠時回傳 None，否則回傳錯誤訊息（不記帳，供執行前預估）"""
+        remaining = self.remaining
+        return None if units <= remaining else self._budget_error(units, remaining)
+
+    def reserve(self, resource: str, action: str, units: int) -> Optional[str]:
+        """在送出呼叫前記帳
+
+        檢查與記帳在同一個鎖內完成，並行的呼叫不會一起超出預算。
+        API 對失敗的呼叫同樣計算配額，因此不論結果都不退還。
+
+        Returns:
+            預算足夠時記帳並回傳 None，否則不記帳並回傳錯誤訊息
+        """
+        with self._lock:
+            usage = self._read()
+            remaining = max(0, self.budget - usage.used)
+            if units > remaining:
+                return self._budget_error(units, remaining)
+            usage.used += units
+            usage.calls += 1
+            key = f"{resource}.{action}"
+            usage.by_action[key] = usage.by_action.get(key, 0) + units
+            self.session_used += units
+            self._write(usage)
+            return None
+
+    def adjust(self, resource: str, action: str, units: int) -> None:
+        """修正已送出呼叫的記帳（實際頁數與預估不同時）
+
+        呼叫已經發生，因此即使超出預算也照實記帳；units 為負數時退還多記的部分。
+        """
+        if not units:
+            return
+        with self._lock:
+            usage = self._read()
+            usage.used = max(0, usage.used + units)
+            key = f"{resource}.{action}"
+            usage.by_action[key] = max(0, usage.by_action.get(key, 0) + units)
+            self.session_used += units
+            self._write(usage)
+
+    def mark_exhausted(self) -> None:
+        """API 回報配額用盡時，將今日用量調整為每日上限"""
+        with self._lock:
+            usage = self._read()
+            if usage.used < self.daily_limit:
+                usage.used = self.daily_limit
+                self._write(usage)
+
+
+def is_quota_error(error: Optional[str]) -> bool:
+    """錯誤是否為配額用盡或超出預算（重試沒有意義）"""
+    error = error or ""
+    return BUDGET_ERROR_MARKER in error or any(marker in error for marker in EXCEEDED_MARKERS)
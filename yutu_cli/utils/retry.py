@@ -0,0 +1,147 @@
+"""錯誤分類與重試 - 將 yutu 的錯誤輸出分類，暫時性錯誤以指數退避重試
+
+yutu 失敗時在 stderr 輸出 googleapi 的錯誤（例如
+`googleapi: Error 503: The service is currently unavailable., backendError`）、
+OAuth 錯誤或 Go 的網路錯誤。依錯誤原因（reason）、HTTP 狀態碼與訊息內容分類。
+
+寫入動作的重試規則：
+    - update、delete、rate 等重複執行結果相同，可直接重試（重試 delete 得到
+      notFound 視為先前的嘗試已生效）
+    - insert 重複執行會產生重複資料；只有 rateLimitExceeded（請求確定未被處理）
+      可直接重試，其他結果未知的錯誤須先確認先前的嘗試是否已生效
+"""
+
+import random
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from yutu_cli.utils.cache import READ_ONLY_ACTIONS
+
+# 錯誤類別
+QUOTA_EXCEEDED = "quotaExceeded"
+RATE_LIMITED = "rateLimitExceeded"
+BACKEND_ERROR = "backendError"
+NOT_FOUND = "notFound"
+FORBIDDEN = "forbidden"
+AUTH_ERROR = "auth"
+NETWORK_ERROR = "network"
+TIMEOUT = "timeout"
+UNKNOWN = "unknown"
+
+# 可重試的錯誤類別
+RETRYABLE = frozenset({RATE_LIMITED, BACKEND_ERROR, NETWORK_ERROR, TIMEOUT})
+
+# 重複執行會產生重複資料的動作
+NON_IDEMPOTENT_ACTIONS = frozenset({"insert"})
+
+# 可在重試前確認是否已生效的 insert（見 YutuCLI._find_applied_insert）
+VERIFIABLE_INSERTS = frozenset({("playlistItem", "insert"), ("comment", "insert")})
+
+# googleapi 錯誤原因 -> 類別
+REASONS: dict[str, str] = {
+    "quotaExceeded": QUOTA_EXCEEDED,
+    "dailyLimitExceeded": QUOTA_EXCEEDED,
+    "quotaBudget": QUOTA_EXCEEDED,
+    "rateLimitExceeded": RATE_LIMITED,
+    "userRateLimitExceeded": RATE_LIMITED,
+    "backendError": BACKEND_ERROR,
+    "internalError": BACKEND_ERROR,
+    "serviceUnavailable": BACKEND_ERROR,
+    "forbidden": FORBIDDEN,
+    "insufficientPermissions": FORBIDDEN,
+    "authError": AUTH_ERROR,
+    "invalid_grant": AUTH_ERROR,
+    "unauthorized_client": AUTH_ERROR,
+}
+
+_REASON_PATTERN = re.compile(r"\b(\w+NotFound|notFound|" + "|".join(REASONS) + r")\b")
+_STATUS_PATTERN = re.compile(r"\bError (\d{3})\b")
+
+# 網路層錯誤（Go net/http 與 MCP 工作程序）的訊息片段
+NETWORK_MARKERS = (
+    "connection reset",
+    "connection refused",
+    "no such host",
+    "i/o timeout",
+    "TLS handshake timeout",
+    "unexpected EOF",
+    "broken pipe",
+    "context deadline exceeded",
+    "工作程序中斷",
+)
+
+
+def classify_error(message: Optional[str]) -> str:
+    """將錯誤訊息分類
+
+    Examples:
+        >>> classify_error("googleapi: Error 503: The service is currently unavailable., backendError")
+        'backendError'
+        >>> classify_error("googleapi: Error 404: Playlist not found., playlistNotFound")
+        'notFound'
+    """
+    message = message or ""
+    match = _REASON_PATTERN.search(message)
+    if match:
+        reason = match.group(1)
+        return REASONS.get(reason, NOT_FOUND)
+    if "命令執行超時" in message:
+        return TIMEOUT
+    if any(marker in message for marker in NETWORK_MARKERS):
+        return NETWORK_ERROR
+    if "Invalid Credentials" in message or "oauth2:" in message:
+        return AUTH_ERROR
+    status = _STATUS_PATTERN.search(message)
+    if status:
+        code = int(status.group(1))
+        if code == 429:
+            return RATE_LIMITED
+        if code >= 500:
+            return BACKEND_ERROR
+        return {401: AUTH_ERROR, 403: FORBIDDEN, 404: NOT_FOUND}.get(code, UNKNOWN)
+    return UNKNOWN
+
+
+def is_retryable(kind: Optional[str]) -> bool:
+    """錯誤類別是否可重試"""
+    return kind in RETRYABLE
+
+
+def can_retry(resource: str, action: str, kind: Optional[str]) -> bool:
+    """依動作的冪等性判斷此錯誤是否可以重試"""
+    if not is_retryable(kind):
+        return False
+    if action in READ_ONLY_ACTIONS or action not in NON_IDEMPOTENT_ACTIONS:
+        return True
+    # insert：只有確定未被處理，或能先確認是否已生效時才重試
+    return kind == RATE_LIMITED or (resource, action) in VERIFIABLE_INSERTS
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: Optional[random.Random] = None) -> float:
+    """第 attempt 次重試（從 0 起算）前的等待秒數（full jitter 指數退避）"""
+    return (rng or random).uniform(0, min(cap, base * 2 ** attempt))
+
+
+@dataclass
+class ErrorStats:
+    """各錯誤類別的次數統計"""
+    errors: Counter = field(default_factory=Counter)
+    retries: Counter = field(default_factory=Counter)
+    recovered: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_error(self, kind: str) -> None:
+        with self._lock:
+            self.errors[kind] += 1
+
+    def record_retry(self, kind: str) -> None:
+        with self._lock:
+            self.retries[kind] += 1
+
+    def record_recovered(self) -> None:
+        """重試後成功"""
+        with self._lock:
+            self.recovered += 1
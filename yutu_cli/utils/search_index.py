@@ -0,0 +1,292 @@
+"""全文索引模組 - 以 SQLite FTS5 索引頻道的標題、說明、評論與字幕
+
+索引與頻道鏡像共用同一個資料庫，由 ChannelMirror 在寫入資料時同步更新。
+
+中日韓文字沒有空白分詞，寫入與查詢時都會在每個 CJK 字元前後加上空白，
+讓 FTS5 以單字為詞元；查詢詞則轉為連續字元的片語，因此「頻道管理」
+只會比對到這四個字相連出現的位置。
+"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+_CJK_CHAR = re.compile(f"([{_CJK}])")
+_SPACES = re.compile(r"\s+")
+
+# snippet() 標記用的控制字元（顯示前再換成 rich 標記）
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+_MARKS = f"[{_MARK_START}{_MARK_END}]?"
+# 分詞時在 CJK 字元旁插入的空白（顯示 snippet 前移除）
+_CJK_GAP = re.compile(f"(?<=[{_CJK}])({_MARKS}) ({_MARKS})(?=\\S)|(?<=\\S)({_MARKS}) ({_MARKS})(?=[{_CJK}])")
+
+# 查詢語法：「"片語"」、「字首*」、一般詞
+_QUERY_TOKEN = re.compile(r'"([^"]*)"(\*?)|(\S+)')
+
+# 字幕檔的時間軸、序號與標籤
+_CAPTION_NOISE = re.compile(
+    r"^(WEBVTT.*|NOTE.*|\d+|[\d:.,]+\s*-->.*|[\d:.,]+,[\d:.,]+)$"
+)
+_TAGS = re.compile(r"<[^>]+>")
+
+KIND_LABELS = {
+    "video": "影片",
+    "playlist": "播放清單",
+    "playlist_item": "清單項目",
+    "comment": "評論",
+    "caption": "字幕",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_docs (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    video_id TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_search_docs_scope ON search_docs(kind, ref);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    title, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def segment(text: str) -> str:
+    """在 CJK 字元前後加上空白，讓 FTS5 以單字為詞元"""
+    return _SPACES.sub(" ", _CJK_CHAR.sub(r" \1 ", text or "")).strip()
+
+
+def build_query(text: str) -> str:
+    """將使用者輸入轉為 FTS5 查詢
+
+    支援 `"完整片語"`、`字首*`，多個詞之間為 AND。
+    所有詞都會加上引號，使用者輸入的 FTS5 運算子不會生效。
+
+    Examples:
+        >>> build_query('頻道 "open source" pyth*')
+        '"頻 道" AND "open source" AND "pyth"*'
+    """
+    terms = []
+    for match in _QUERY_TOKEN.finditer(text):
+        phrase, phrase_prefix, word = match.groups()
+        if word is not None:
+            prefix = "*" if word.endswith("*") else ""
+            body = word.rstrip("*")
+        else:
+            body, prefix = phrase, phrase_prefix
+        body = segment(body.replace('"', ""))
+        if body:
+            terms.append(f'"{body}"{prefix}')
+    return " AND ".join(terms)
+
+
+def caption_text(content: str) -> str:
+    """去除字幕檔（SRT/VTT/SBV）的序號、時間軸與標籤，只留下文字"""
+    lines = []
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not _CAPTION_NOISE.match(line):
+            lines.append(_TAGS.sub("", line))
+    return "\n".join(lines)
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    """檢查 SQLite 是否支援 FTS5"""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+@dataclass
+class SearchHit:
+    """搜尋結果"""
+    kind: str
+    ref: str
+    video_id: str
+    title: str
+    snippet: str
+    rank: float
+
+    @property
+    def kind_label(self) -> str:
+        return KIND_LABELS.get(self.kind, self.kind)
+
+
+@dataclass
+class IndexDocument:
+    """待索引的文件
+
+    Attributes:
+        key: 唯一鍵（例如 `video:<id>`）
+        kind: 文件類型（video/playlist/playlist_item/comment/caption）
+        ref: 所屬範圍（影片 ID、播放清單 ID 等，用於整批取代）
+        video_id: 相關影片 ID
+        title: 標題
+        body: 內文
+    """
+    key: str
+    kind: str
+    ref: str
+    video_id: str
+    title: str
+    body: str
+
+
+def video_document(video: dict) -> IndexDocument:
+    snippet = video.get("snippet", {})
+    video_id = video.get("id", "")
+    body = "\n".join([snippet.get("description", ""), " ".join(snippet.get("tags", []))])
+    return IndexDocument(f"video:{video_id}", "video", video_id, video_id, snippet.get("title", ""), body)
+
+
+def playlist_document(playlist: dict) -> IndexDocument:
+    snippet = playlist.get("snippet", {})
+    playlist_id = playlist.get("id", "")
+    return IndexDocument(
+        f"playlist:{playlist_id}", "playlist", playlist_id, "",
+        snippet.get("title", ""), snippet.get("description", ""),
+    )
+
+
+def playlist_item_document(playlist_id: str, item: dict) -> IndexDocument:
+    snippet = item.get("snippet", {})
+    video_id = (
+        item.get("contentDetails", {}).get("videoId")
+        or snippet.get("resourceId", {}).get("videoId", "")
+    )
+    return IndexDocument(
+        f"playlist_item:{playlist_id}:{item.get('id', '')}", "playlist_item", playlist_id,
+        video_id, snippet.get("title", ""), snippet.get("description", ""),
+    )
+
+
+def comment_document(video_id: str, thread: dict) -> IndexDocument:
+    snippet = thread.get("snippet", {})
+    top = snippet.get("topLevelComment", {}).get("snippet", {})
+    texts = [top.get("textOriginal") or top.get("textDisplay", "")]
+    for reply in thread.get("replies", {}).get("comments", []):
+        reply_snippet = reply.get("snippet", {})
+        texts.append(reply_snippet.get("textOriginal") or reply_snippet.get("textDisplay", ""))
+    return IndexDocument(
+        f"comment:{thread.get('id', '')}", "comment", video_id, video_id,
+        top.get("authorDisplayName", ""), "\n".join(texts),
+    )
+
+
+class SearchIndex:
+    """FTS5 全文索引（操作由呼叫端提供的連線，不自行加鎖或 commit）"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self.available = fts5_available(conn)
+        if self.available:
+            conn.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        if not self.available:
+            return 0
+        return self._conn.execute("SELECT COUNT(*) FROM search_docs").fetchone()[0]
+
+    def _delete_ids(self, ids: list[int]) -> None:
+        self._conn.executemany("DELETE FROM search_fts WHERE rowid = ?", [(i,) for i in ids])
+        self._conn.executemany("DELETE FROM search_docs WHERE id = ?", [(i,) for i in ids])
+
+    def add(self, documents: Iterable[IndexDocument]) -> None:
+        """新增或取代文件（以 key 判斷）"""
+        if not self.available:
+            return
+        for doc in documents:
+            row = self._conn.execute("SELECT id FROM search_docs WHERE key = ?", (doc.key,)).fetchone()
+            if row is not None:
+                self._delete_ids([row[0]])
+            cursor = self._conn.execute(
+                "INSERT INTO search_docs (key, kind, ref, video_id, title) VALUES (?, ?, ?, ?, ?)",
+                (doc.key, doc.kind, doc.ref, doc.video_id, doc.title),
+            )
+            self._conn.execute(
+                "INSERT INTO search_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (cursor.lastrowid, segment(doc.title), segment(doc.body)),
+            )
+
+    def remove(self, kind: str, *, ref: Optional[str] = None, keys: Iterable[str] = ()) -> None:
+        """移除同一範圍（kind + ref）或指定 key 的文件"""
+        if not self.available:
+            return
+        ids: list[int] = []
+        if ref is not None:
+            ids += [row[0] for row in self._conn.execute(
+                "SELECT id FROM search_docs WHERE kind = ? AND ref = ?", (kind, ref)
+            )]
+        for key in keys:
+            row = self._conn.execute("SELECT id FROM search_docs WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                ids.append(row[0])
+        self._delete_ids(ids)
+
+    def replace(self, kind: str, ref: str, documents: Iterable[IndexDocument]) -> None:
+        """以新的文件取代同一範圍的舊文件"""
+        self.remove(kind, ref=ref)
+        self.add(documents)
+
+    def clear(self) -> None:
+        if self.available:
+            self._conn.execute("DELETE FROM search_fts")
+            self._conn.execute("DELETE FROM search_docs")
+
+    def search(
+        self, text: str, *, limit: int = 50, kinds: Optional[Iterable[str]] = None
+    ) -> list[SearchHit]:
+        """搜尋索引
+
+        Args:
+            text: 查詢文字（支援 "片語" 與 字首*）
+            limit: 最多回傳筆數
+            kinds: 只搜尋指定類型
+
+        Returns:
+            依相關性（bm25）排序的結果
+        """
+        query = build_query(text)
+        if not self.available or not query:
+            return []
+        sql = (
+            "SELECT d.kind, d.ref, d.video_id, d.title, "
+            f"snippet(search_fts, -1, '{_MARK_START}', '{_MARK_END}', '…', 16), "
+            "bm25(search_fts, 5.0, 1.0) AS rank "
+            "FROM search_fts JOIN search_docs d ON d.id = search_fts.rowid "
+            "WHERE search_fts MATCH ?"
+        )
+        params: list = [query]
+        kinds = list(kinds or [])
+        if kinds:
+            sql += f" AND d.kind IN ({','.join('?' * len(kinds))})"
+            params += kinds
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        try:
+            rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            return []
+        return [
+            SearchHit(kind, ref, video_id, title, _CJK_GAP.sub(r"\1\2\3\4", snippet), rank)
+            for kind, ref, video_id, title, snippet, rank in rows
+        ]
+
+
+def highlight(snippet: str, style: str = "bold yellow") -> str:
+    """將 snippet 的標記轉為 rich 標記（其餘內容會先跳脫）"""
+    from rich.markup import escape
+
+    return (
+        escape(snippet)
+        .replace(_MARK_START, f"[{style}]")
+        .replace(_MARK_END, f"[/{style}]")
+    )
@@ -0,0 +1,329 @@
+"""頻道同步模組 - 將頻道資料增量同步到本機鏡像
+
+只下載自上次同步後有變動的部分：
+- 影片：uploads 清單由新到舊排列，依 publishedAt 水位逐步擴大讀取範圍，
+  遇到已知影片即停止；頻道影片數的變化與新影片數不符時（有影片被刪除）才完整重讀
+- 播放清單：依 itemCount 判斷，只重新下載影片數改變的清單
+- 評論：依影片的 commentCount 判斷，只重新下載評論數改變的影片
+- 字幕：只下載新影片（或本機修改過）的字幕列表
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from yutu_cli.utils.batching import fetch_in_batches
+from yutu_cli.utils.mirror import ChannelMirror
+from yutu_cli.utils.yutu import YutuCLI, YutuResult
+
+# 增量讀取 uploads 清單時依序嘗試的筆數（0 表示全部）
+UPLOAD_WINDOWS = (50, 500, 0)
+
+VIDEO_PARTS = "snippet,statistics,contentDetails,status"
+
+
+def _items(result: YutuResult) -> list[dict]:
+    data = result.data
+    return data if isinstance(data, list) else (data or {}).get("items", [])
+
+
+def _upload_video_id(item: dict) -> str:
+    return (
+        item.get("contentDetails", {}).get("videoId")
+        or item.get("snippet", {}).get("resourceId", {}).get("videoId", "")
+    )
+
+
+def _upload_published_at(item: dict) -> str:
+    return (
+        item.get("contentDetails", {}).get("videoPublishedAt")
+        or item.get("snippet", {}).get("publishedAt", "")
+    )
+
+
+@dataclass
+class SyncReport:
+    """同步結果摘要"""
+    videos_added: int = 0
+    videos_removed: int = 0
+    playlists_synced: int = 0
+    playlist_items: int = 0
+    comment_videos: int = 0
+    comment_threads: int = 0
+    caption_videos: int = 0
+    calls: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+
+class ChannelSync:
+    """將頻道資料同步到 ChannelMirror
+
+    所有 API 呼叫都略過回應快取與鏡像（`use_cache=False`），
+    確保寫入鏡像的是最新資料。
+    """
+
+    def __init__(
+        self,
+        yutu: YutuCLI,
+        mirror: Optional[ChannelMirror] = None,
+        *,
+        progress: Optional[Callable[[str], None]] = None,
+    ):
+        self.yutu = yutu
+        self.mirror = mirror or yutu.get_mirror(create=True)
+        if self.mirror is None:
+            raise OSError(f"無法開啟頻道鏡像：{yutu.config.mirror_path}")
+        self.progress = progress or (lambda message: None)
+        self.report = SyncReport()
+        self._previous_video_count: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _run(self, resource: str, action: str, **kwargs) -> YutuResult:
+        result = self.yutu.run(resource, action, use_cache=False, **kwargs)
+        with self._lock:
+            self.report.calls += 1
+            if not result.success:
+                self.report.errors.append(f"{resource} {action}: {result.error or '未知錯誤'}")
+        return result
+
+    # === 頻道與影片 ===
+
+    def sync_channel(self) -> Optional[dict]:
+        """同步頻道資料，回傳頻道項目"""
+        result = self._run("channel", "list", mine=True, parts="snippet,statistics,contentDetails")
+        items = _items(result)
+        if not result.success or not items:
+            return None
+        state = self.mirror.state("channel")
+        self._previous_video_count = None if state is None else state.item_count
+        video_count = int(items[0].get("statistics", {}).get("videoCount", 0) or 0)
+        self.mirror.save_channel(items[0])
+        self.mirror.set_state("channel", item_count=video_count)
+        return items[0]
+
+    def _list_uploads(self, uploads_id: str, max_results: int) -> Optional[list[dict]]:
+        result = self._run(
+            "playlistItem", "list",
+            playlistId=uploads_id,
+            parts="snippet,contentDetails",
+            max_results=max_results,
+        )
+        return _items(result) if result.success else None
+
+    def _fetch_videos(self, video_ids: list[str]) -> list[dict]:
+        """分批下載影片詳情（每 50 部 1 配額）"""
+        if not video_ids:
+            return []
+
+        def fetch(chunk: list[str]) -> YutuResult:
+            return self._run("video", "list", ids=",".join(chunk), parts=VIDEO_PARTS)
+
+        batch = fetch_in_batches(
+            fetch, video_ids,
+            key=lambda item: item.get("id", ""),
+            max_workers=self.yutu.config.max_concurrency,
+        )
+        return batch.items
+
+    def sync_videos(self, channel: dict, *, force: bool = False) -> list[str]:
+        """同步上傳的影片
+
+        Args:
+            channel: sync_channel 取得的頻道項目
+            force: 忽略水位，完整重讀 uploads 清單
+
+        Returns:
+            評論數有變動（或新增）的影片 ID，供 sync_comments 使用
+        """
+        uploads_id = channel.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+        if not uploads_id:
+            self.report.errors.append("無法取得 uploads 播放清單")
+            return []
+        video_count = int(channel.get("statistics", {}).get("videoCount", 0) or 0)
+        scope = f"playlist:{uploads_id}"
+        state = self.mirror.state(scope)
+        known = [] if force or state is None else self.mirror.get_playlist_items(uploads_id)
+        known_ids = {_upload_video_id(item) for item in known}
+        watermark = "" if state is None else state.watermark
+
+        uploads: Optional[list[dict]] = None
+        if known and not state.stale:
+            uploads = self._incremental_uploads(uploads_id, known, known_ids, watermark)
+            # 頻道影片數的變化與新影片數不符（例如有影片被刪除或轉為私人），改為完整重讀
+            added = 0 if uploads is None else len(uploads) - len(known)
+            if self._previous_video_count is None or video_count - self._previous_video_count != added:
+                uploads = None
+        if uploads is None:
+            self.progress("正在讀取所有上傳的影片...")
+            uploads = self._list_uploads(uploads_id, 0)
+            if uploads is None:
+                return []
+
+        current_ids = [_upload_video_id(item) for item in uploads]
+        removed = known_ids - set(current_ids)
+        if removed:
+            self.mirror.remove_videos(removed)
+        self.report.videos_removed += len(removed)
+        self.report.videos_added += len(set(current_ids) - known_ids)
+        self.mirror.replace_playlist_items(uploads_id, uploads)
+        newest = max((_upload_published_at(item) for item in uploads), default="")
+        self.mirror.set_state(scope, watermark=newest, item_count=len(uploads))
+
+        # 影片詳情每 50 部僅 1 配額，全部重新整理以取得最新統計（含 commentCount）
+        self.progress(f"正在更新 {len(current_ids)} 部影片的詳情...")
+        previous_counts = self.mirror.video_comment_counts()
+        videos = self._fetch_videos(current_ids)
+        self.mirror.upsert_videos(videos)
+        self.mirror.set_state("videos", watermark=newest, item_count=len(videos))
+
+        return [
+            video["id"] for video in videos
+            if previous_counts.get(video["id"]) != int(video.get("statistics", {}).get("commentCount", 0) or 0)
+        ]
+
+    def _incremental_uploads(
+        self, uploads_id: str, known: list[dict], known_ids: set[str], watermark: str
+    ) -> Optional[list[dict]]:
+        """只讀取水位之後的新影片，與鏡像中的舊項目合併"""
+        for window in UPLOAD_WINDOWS:
+            page = self._list_uploads(uploads_id, window)
+            if page is None:
+                return None
+            fresh = []
+            reached = False
+            for item in page:
+                if _upload_video_id(item) in known_ids and _upload_published_at(item) <= watermark:
+                    reached = True
+                    break
+                fresh.append(item)
+            if reached or window == 0 or len(page) < window:
+                fresh_ids = {_upload_video_id(item) for item in fresh}
+                return fresh + [item for item in known if _upload_video_id(item) not in fresh_ids]
+        return None
+
+    # === 播放清單 ===
+
+    def sync_playlists(self, *, force: bool = False) -> None:
+        """同步播放清單，只重新下載 itemCount 改變或被標記為過時的清單"""
+        result = self._run("playlist", "list", mine=True, parts="snippet,contentDetails,status")
+        if not result.success:
+            return
+        playlists = _items(result)
+        self.mirror.replace_playlists(playlists)
+        self.mirror.set_state("playlists", item_count=len(playlists))
+
+        for playlist in playlists:
+            playlist_id = playlist.get("id", "")
+            item_count = int(playlist.get("contentDetails", {}).get("itemCount", 0) or 0)
+            state = self.mirror.state(f"playlist:{playlist_id}")
+            if not force and state is not None and not state.stale and state.item_count == item_count:
+                continue
+            title = playlist.get("snippet", {}).get("title", playlist_id)
+            self.progress(f"正在同步播放清單「{title}」...")
+            # 與 uploads 清單、成員索引相同的 parts：鏡像不區分 parts，需含 contentDetails.videoId
+            items = self._run(
+                "playlistItem", "list", playlistId=playlist_id, parts="snippet,contentDetails"
+            )
+            if not items.success:
+                continue
+            entries = _items(items)
+            self.mirror.replace_playlist_items(playlist_id, entries)
+            self.mirror.set_state(f"playlist:{playlist_id}", item_count=item_count)
+            self.report.playlists_synced += 1
+            self.report.playlist_items += len(entries)
+
+    # === 評論與字幕 ===
+
+    def _fetch_per_video(
+        self, video_ids: list[str], fetch: Callable[[str], YutuResult]
+    ) -> list[tuple[str, YutuResult]]:
+        """以有限並行數逐部影片呼叫 API"""
+        with ThreadPoolExecutor(max_workers=self.yutu.config.max_concurrency) as pool:
+            return list(zip(video_ids, pool.map(fetch, video_ids)))
+
+    def sync_comments(self, video_ids: list[str]) -> None:
+        """重新下載指定影片與被標記為過時的評論串"""
+        stale = [scope.split(":", 1)[1] for scope in self.mirror.stale_scopes("comments:")]
+        targets = list(dict.fromkeys([*video_ids, *stale]))
+        if not targets:
+            return
+        self.progress(f"正在同步 {len(targets)} 部影片的評論...")
+
+        def fetch(video_id: str) -> YutuResult:
+            return self._run("commentThread", "list", videoId=video_id, parts="snippet,replies")
+
+        for video_id, result in self._fetch_per_video(targets, fetch):
+            if not result.success:
+                continue
+            threads = _items(result)
+            self.mirror.replace_comment_threads(video_id, threads)
+            newest = max(
+                (t.get("snippet", {}).get("topLevelComment", {}).get("snippet", {}).get("updatedAt", "")
+                 for t in threads),
+                default="",
+            )
+            self.mirror.set_state(f"comments:{video_id}", watermark=newest, item_count=len(threads))
+            self.report.comment_videos += 1
+            self.report.comment_threads += len(threads)
+
+    def sync_captions(self, video_ids: list[str], *, force: bool = False) -> None:
+        """下載尚未同步（或被標記為過時）影片的字幕列表
+
+        字幕列表每次呼叫耗用 50 配額，因此已同步的影片不會重新下載，
+        除非 force 為 True。
+        """
+        targets = [
+            video_id for video_id in video_ids
+            if force or self.mirror.needs_sync(f"captions:{video_id}")
+        ]
+        if not targets:
+            return
+        self.progress(f"正在同步 {len(targets)} 部影片的字幕列表...")
+
+        def fetch(video_id: str) -> YutuResult:
+            return self._run("caption", "list", videoId=video_id, parts="id,snippet")
+
+        for video_id, result in self._fetch_per_video(targets, fetch):
+            if not result.success:
+                continue
+            captions = _items(result)
+            self.mirror.replace_captions(video_id, captions)
+            self.mirror.set_state(f"captions:{video_id}", item_count=len(captions))
+            self.report.caption_videos += 1
+
+    # === 完整流程 ===
+
+    def sync_all(
+        self, *, force: bool = False, comments: bool = True, captions: bool = True
+    ) -> SyncReport:
+        """同步頻道、影片、播放清單、評論與字幕
+
+        Args:
+            force: 忽略水位與影片數，重新下載所有內容
+            comments: 是否同步評論
+            captions: 是否同步字幕列表
+
+        Returns:
+            SyncReport
+        """
+        self.report = SyncReport()
+        self.progress("正在同步頻道資訊...")
+        channel = self.sync_channel()
+        if channel is None:
+            return self.report
+
+        changed = self.sync_videos(channel, force=force)
+        self.sync_playlists(force=force)
+
+        uploads_id = channel.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads", "")
+        video_ids = [_upload_video_id(item) for item in self.mirror.get_playlist_items(uploads_id)]
+        if comments:
+            self.sync_comments(video_ids if force else changed)
+        if captions:
+            self.sync_captions(video_ids, force=force)
+        return self.report
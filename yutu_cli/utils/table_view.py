@@ -0,0 +1,253 @@
+"""虛擬化表格 - 大量資料只繪製目前頁面
+
+`TableView` 持有完整的項目序列，但只把目前頁面的項目轉成表格列；
+欄寬由固定數量的抽樣列決定，因此繪製一頁的時間與總筆數無關。
+`browse()` 提供鍵盤翻頁、跳頁與篩選。
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+import click
+import questionary
+from rich.cells import cell_len
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+# 計算欄寬時最多檢查的列數
+DEFAULT_SAMPLE_SIZE = 200
+
+
+@dataclass
+class Column:
+    """表格欄位定義"""
+    header: str
+    style: Optional[str] = None
+    justify: str = "left"
+    width: Optional[int] = None
+    max_width: Optional[int] = None
+
+
+def plain_text(cell: str) -> str:
+    """去除 rich 標記，回傳純文字"""
+    if "[" not in cell:
+        return cell
+    return Text.from_markup(cell).plain
+
+
+class TableView:
+    """分頁瀏覽的虛擬化表格
+
+    Args:
+        items: 全部項目（需支援 len 與索引）
+        columns: 欄位定義
+        row: 將 (編號, 項目) 轉為表格列的函式，只會對顯示或篩選到的項目呼叫
+        title: 表格標題
+        page_size: 每頁列數
+        sample_size: 計算欄寬時抽樣的列數
+    """
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        columns: list[Column],
+        row: Callable[[int, Any], Sequence[str]],
+        *,
+        title: str = "",
+        page_size: int = 20,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+    ):
+        self.items = items
+        self.columns = columns
+        self.title = title
+        self.page_size = max(1, page_size)
+        self.sample_size = max(2, sample_size)
+        self.page = 0
+        self.query = ""
+        self._format_row = row
+        self._rows: dict[int, tuple[str, ...]] = {}
+        self._texts: dict[int, str] = {}
+        self._matches: Optional[list[int]] = None
+        self._widths: Optional[list[Optional[int]]] = None
+
+    def row(self, index: int) -> tuple[str, ...]:
+        """取得第 index 個項目的表格列（格式化結果會保留）"""
+        cells = self._rows.get(index)
+        if cells is None:
+            cells = tuple(self._format_row(index + 1, self.items[index]))
+            self._rows[index] = cells
+        return cells
+
+    @property
+    def total(self) -> int:
+        """目前可瀏覽的筆數（有篩選時為符合的筆數）"""
+        return len(self.items) if self._matches is None else len(self._matches)
+
+    @property
+    def page_count(self) -> int:
+        """總頁數（至少 1 頁）"""
+        return max(1, math.ceil(self.total / self.page_size))
+
+    def go_to(self, page: int) -> None:
+        """跳到指定頁（從 0 起算，超出範圍時取最近的一頁）"""
+        self.page = min(max(page, 0), self.page_count - 1)
+
+    def next_page(self) -> None:
+        self.go_to(self.page + 1)
+
+    def prev_page(self) -> None:
+        self.go_to(self.page - 1)
+
+    def set_filter(self, query: str) -> int:
+        """只保留任一欄包含 query 的項目（不分大小寫，空字串清除篩選）
+
+        Returns:
+            符合的筆數
+        """
+        self.query = query.strip()
+        if not self.query:
+            self._matches = None
+        else:
+            needle = self.query.casefold()
+            self._matches = [
+                i for i in range(len(self.items)) if needle in self._search_text(i)
+            ]
+        self.page = 0
+        return self.total
+
+    def _search_text(self, index: int) -> str:
+        text = self._texts.get(index)
+        if text is None:
+            text = " ".join(plain_text(cell) for cell in self.row(index)).casefold()
+            self._texts[index] = text
+        return text
+
+    def sample_indices(self) -> list[int]:
+        """平均分布於全部項目的抽樣索引（最多 sample_size 個，含最後一筆）"""
+        count = len(self.items)
+        if count <= self.sample_size:
+            return list(range(count))
+        step = (count - 1) / (self.sample_size - 1)
+        return [round(i * step) for i in range(self.sample_size)]
+
+    def column_widths(self) -> list[Optional[int]]:
+        """依抽樣列計算欄寬（計算一次後固定，翻頁時欄位保持對齊）"""
+        if self._widths is None:
+            widths = [cell_len(column.header) for column in self.columns]
+            for index in self.sample_indices():
+                for i, cell in enumerate(self.row(index)[: len(widths)]):
+                    widths[i] = max(widths[i], cell_len(plain_text(cell)))
+            self._widths = [
+                column.width or (min(width, column.max_width) if column.max_width else width)
+                for column, width in zip(self.columns, widths)
+            ]
+        return self._widths
+
+    def visible_indices(self) -> list[int]:
+        """目前頁面的項目索引"""
+        start = self.page * self.page_size
+        end = start + self.page_size
+        if self._matches is None:
+            return list(range(start, min(end, len(self.items))))
+        return self._matches[start:end]
+
+    def caption(self) -> str:
+        """頁碼與篩選狀態說明"""
+        indices = self.visible_indices()
+        if not indices:
+            position = "沒有符合的項目"
+        else:
+            start = self.page * self.page_size + 1
+            position = f"第 {self.page + 1}/{self.page_count} 頁，{start}-{start + len(indices) - 1} / {self.total} 筆"
+        if self.query:
+            position += f"（篩選：{self.query}）"
+        return position
+
+    def render(self) -> Table:
+        """建立目前頁面的表格"""
+        table = Table(
+            title=self.title or None,
+            caption=self.caption() if self.page_count > 1 or self.query else None,
+            show_header=True,
+            header_style="bold cyan",
+        )
+        for column, width in zip(self.columns, self.column_widths()):
+            table.add_column(
+                column.header,
+                style=column.style,
+                justify=column.justify,
+                width=width,
+                no_wrap=True,
+                overflow="ellipsis",
+            )
+        for index in self.visible_indices():
+            table.add_row(*self.row(index))
+        return table
+
+
+# 按鍵與動作的對應（方向鍵與翻頁鍵為 ANSI 跳脫序列）
+KEY_ACTIONS: dict[str, str] = {
+    "n": "next", " ": "next", "j": "next", "\x1b[C": "next", "\x1b[B": "next", "\x1b[6~": "next",
+    "p": "prev", "b": "prev", "k": "prev", "\x1b[D": "prev", "\x1b[A": "prev", "\x1b[5~": "prev",
+    "g": "jump", "^": "first", "\x1b[H": "first", "G": "last", "$": "last", "\x1b[F": "last",
+    "/": "filter", "f": "filter",
+    "q": "quit", "\x1b": "quit", "\r": "quit", "\n": "quit",
+}
+
+BROWSE_HELP = "[dim]n/→ 下一頁  p/← 上一頁  g 跳頁  ^/$ 首末頁  / 篩選  q/Enter 結束[/dim]"
+
+
+def handle_key(view: TableView, key: str) -> str:
+    """套用翻頁按鍵，回傳動作名稱（jump/filter/quit 需由呼叫者處理）"""
+    action = KEY_ACTIONS.get(key, "")
+    if action == "next":
+        view.next_page()
+    elif action == "prev":
+        view.prev_page()
+    elif action == "first":
+        view.go_to(0)
+    elif action == "last":
+        view.go_to(view.page_count - 1)
+    return action
+
+
+def browse(view: TableView, console: Console) -> None:
+    """顯示表格，多於一頁且在終端機中時進入鍵盤瀏覽
+
+    非終端機輸出（重新導向或測試）只顯示第一頁。
+    """
+    console.print(view.render())
+    if view.page_count <= 1:
+        return
+    if not console.is_terminal:
+        console.print(f"[dim]僅顯示前 {view.page_size} 筆，共 {view.total} 筆[/dim]")
+        return
+
+    while True:
+        console.print(BROWSE_HELP)
+        try:
+            key = click.getchar()
+        except (KeyboardInterrupt, EOFError):
+            return
+
+        action = handle_key(view, key)
+        if action == "quit":
+            return
+        if action == "jump":
+            answer = questionary.text(
+                f"跳至第幾頁（1-{view.page_count}）：",
+                validate=lambda x: not x.strip() or x.strip().isdigit() or "請輸入頁碼",
+            ).ask()
+            if not answer or not answer.strip():
+                continue
+            view.go_to(int(answer) - 1)
+        elif action == "filter":
+            query = questionary.text("篩選關鍵字（留空清除）：", default=view.query).ask()
+            if query is None:
+                continue
+            view.set_filter(query)
+        elif not action:
+            continue
+        console.print(view.render())
@@ -0,0 +1,280 @@
+"""追蹤模組 - 記錄 yutu 呼叫、畫面輸出與選單功能的耗時
+
+啟用後（`--trace FILE` 或 YUTU_TRACE=FILE）每個區段記錄為 Chrome trace event，
+程式結束時寫入 FILE（可用 chrome://tracing 或 https://ui.perfetto.dev 開啟），
+並在標準錯誤輸出每種 yutu 命令的呼叫次數與 p50/p95 延遲：
+
+    YutuCLI.run             playlistItem.list  argv、exit_code、bytes_out、cached
+    ├── spawn / wait        啟動子程序、等待輸出（api 傳輸層為 http）
+    └── parse               JSON 解析
+
+子區段結束時會把耗時（`spawn_ms` 等）加到上層區段的 args。
+未啟用時 `span()` 只回傳共用的空物件，`traced` 只多一次判斷，不影響效能。
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import unicodedata
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Optional, TextIO, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# yutu 命令的區段類別（延遲摘要只統計此類別）與其子區段的類別
+COMMAND_CATEGORY = "yutu"
+PHASE_CATEGORY = "yutu.phase"
+
+_current: ContextVar[Optional["Span"]] = ContextVar("yutu_trace_span", default=None)
+
+
+class Span:
+    """一個計時區段（以 with 使用）"""
+
+    __slots__ = ("tracer", "name", "category", "args", "parent", "start_ns", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.parent: Optional[Span] = None
+        self.start_ns = 0
+        self._token = None
+
+    def set(self, **args: Any) -> None:
+        """附加或覆寫區段參數"""
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        self.parent = _current.get()
+        self._token = _current.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        try:
+            _current.reset(self._token)
+        except ValueError:
+            # 在不同的 context 結束（例如跨執行緒的產生器）
+            _current.set(self.parent)
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if self.parent is not None:
+            key = f"{self.name}_ms"
+            self.parent.args[key] = round(self.parent.args.get(key, 0) + duration_ns / 1e6, 3)
+        self.tracer.record(self, duration_ns)
+
+
+class _NullSpan:
+    """未啟用追蹤時的空區段"""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """最近序位法的百分位數（values 需已排序）"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, int(fraction * len(values) + 0.5) - 1))
+    return values[index]
+
+
+def _display_width(text: str) -> int:
+    """終端機顯示寬度（全形字元佔兩格）"""
+    return sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text)
+
+
+def _pad(text: str, width: int, *, left: bool) -> str:
+    padding = " " * (width - _display_width(text))
+    return text + padding if left else padding + text
+
+
+class Tracer:
+    """收集區段並輸出 Chrome trace event JSON（可多執行緒共用）"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.events: list[dict[str, Any]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def span(self, name: str, category: str, args: dict[str, Any]) -> Span:
+        return Span(self, name, category, args)
+
+    def record(self, span: Span, duration_ns: int) -> None:
+        """記錄已結束的區段（Chrome trace 的 complete event）"""
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span.start_ns - self._origin_ns) / 1000,
+            "dur": duration_ns / 1000,
+            "pid": self._pid,
+            "tid": thread.ident,
+            "args": span.args,
+        }
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Chrome trace event 格式（含執行緒名稱）"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Optional[Path] = None) -> Path:
+        """寫入追蹤檔"""
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace(), ensure_ascii=False, default=str), encoding="utf-8")
+        return path
+
+    def summary(self, category: str = COMMAND_CATEGORY) -> list[dict[str, Any]]:
+        """依區段名稱統計呼叫次數、失敗次數與延遲（毫秒），依總耗時排序"""
+        groups: dict[str, list[dict[str, Any]]] = {}
+        with self._lock:
+            for event in self.events:
+                if event["cat"] == category:
+                    groups.setdefault(event["name"], []).append(event)
+        rows = []
+        for name, events in groups.items():
+            durations = sorted(event["dur"] / 1000 for event in events)
+            rows.append({
+                "name": name,
+                "count": len(events),
+                "failed": sum(1 for event in events if event["args"].get("success") is False),
+                "cached": sum(1 for event in events if event["args"].get("cached")),
+                "p50_ms": percentile(durations, 0.5),
+                "p95_ms": percentile(durations, 0.95),
+                "total_ms": sum(durations),
+            })
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def format_summary(self) -> str:
+        """延遲摘要表（純文字）"""
+        rows = self.summary()
+        if not rows:
+            return "（沒有 yutu 呼叫）"
+        table = [("命令", "次數", "失敗", "快取", "p50 ms", "p95 ms", "總計 ms")]
+        table += [
+            (row["name"], str(row["count"]), str(row["failed"]), str(row["cached"]),
+             f"{row['p50_ms']:.1f}", f"{row['p95_ms']:.1f}", f"{row['total_ms']:.1f}")
+            for row in rows
+        ]
+        widths = [max(_display_width(line[column]) for line in table) for column in range(len(table[0]))]
+        return "\n".join(
+            "  ".join(
+                _pad(cell, width, left=column == 0)
+                for column, (cell, width) in enumerate(zip(line, widths))
+            ).rstrip()
+            for line in table
+        )
+
+    def finish(self, stream: Optional[TextIO] = None) -> None:
+        """寫入追蹤檔並輸出延遲摘要"""
+        stream = stream or sys.stderr
+        if self.path is not None:
+            path = self.write()
+            print(f"追蹤檔已寫入：{path}（{len(self.events)} 個區段）", file=stream)
+        print(self.format_summary(), file=stream)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """取得目前的追蹤器（未啟用時為 None）"""
+    return _tracer
+
+
+def tracing_enabled() -> bool:
+    """是否已啟用追蹤"""
+    return _tracer is not None
+
+
+def enable_tracing(path: Optional[Path] = None, *, at_exit: bool = True) -> Tracer:
+    """啟用追蹤；at_exit 時於程式結束時寫入 path 並輸出摘要"""
+    global _tracer
+    _tracer = Tracer(path)
+    if at_exit:
+        atexit.register(_tracer.finish)
+    return _tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """停用追蹤並回傳原本的追蹤器（不會寫入檔案）"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        atexit.unregister(tracer.finish)
+    return tracer
+
+
+def span(name: str, category: str = "app", **args: Any) -> Span | _NullSpan:
+    """開始一個區段（未啟用時回傳共用的空區段）
+
+    Examples:
+        >>> with span("parse", bytes=len(stdout)) as current:
+        ...     data = json.loads(stdout)
+        ...     current.set(items=len(data))
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, category, args)
+
+
+def annotate(**args: Any) -> None:
+    """附加參數到目前的區段（未啟用或不在區段內時忽略）"""
+    if _tracer is None:
+        return
+    current = _current.get()
+    if current is not None:
+        current.args.update(args)
+
+
+def traced(category: str, name: Optional[str] = None) -> Callable[[F], F]:
+    """將函式的每次呼叫記錄為區段（預設以函式名稱命名）"""
+
+    def decorator(func: F) -> F:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(label, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,342 @@
+"""傳輸層模組 - 決定 yutu 命令實際如何執行
+
+- SubprocessTransport：每個命令啟動一個 yutu 程序（預設）
+- McpTransport：啟動一個常駐的 `yutu mcp` 工作程序，
+  透過 stdio JSON-RPC 多工處理所有命令，省去每次啟動與載入 token 的成本
+- ApiTransport：不經過 yutu，直接呼叫 YouTube Data API（見 api_transport 模組）
+"""
+
+import itertools
+import json
+import subprocess
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from yutu_cli import __app_name__, __version__
+from yutu_cli.utils.cache import READ_ONLY_ACTIONS
+from yutu_cli.utils.tracing import PHASE_CATEGORY, span, tracing_enabled
+
+if TYPE_CHECKING:
+    from yutu_cli.utils.api_transport import ApiTransport
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+
+
+@dataclass
+class CommandOutput:
+    """單一命令的執行結果（與子程序輸出相同的形式）"""
+    returncode: int
+    stdout: str
+    stderr: str = ""
+
+
+class SubprocessTransport:
+    """每個命令啟動一個 yutu 子程序"""
+
+    name = "subprocess"
+
+    def execute(self, cmd: list[str], env: dict[str, str], timeout: float) -> CommandOutput:
+        """執行命令
+
+        Raises:
+            subprocess.TimeoutExpired: 超過 timeout 秒
+            FileNotFoundError: 找不到 yutu 執行檔
+        """
+        if not tracing_enabled():
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                env=env,
+                timeout=timeout,
+            )
+            return CommandOutput(result.returncode, result.stdout, result.stderr)
+
+        # 與 subprocess.run 相同，但分開記錄啟動與等待輸出的耗時
+        with span("spawn", PHASE_CATEGORY):
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
+        with proc, span("wait", PHASE_CATEGORY):
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                raise
+        return CommandOutput(proc.returncode, stdout, stderr)
+
+    def close(self) -> None:
+        """釋放資源（子程序模式不需要）"""
+
+
+# 數值與布林型參數；其餘參數（搜尋關鍵字、標題、留言內容等）即使是 "2024" 或 "true" 也保持字串
+NUMERIC_ARGUMENTS = frozenset({"maxResults", "position"})
+BOOLEAN_ARGUMENTS = frozenset({
+    "mine",
+    "forMine",
+    "home",
+    "isDraft",
+    "banAuthor",
+    "sync",
+    "notifySubscribers",
+    "embeddable",
+    "publicStatsViewable",
+    "madeForKids",
+    "selfDeclaredMadeForKids",
+})
+
+
+def _coerce_argument(flag: str, value: str) -> Any:
+    """將命令列參數值轉為 JSON 型別"""
+    if flag in BOOLEAN_ARGUMENTS and value in ("true", "false"):
+        return value == "true"
+    if flag in NUMERIC_ARGUMENTS and value.isdigit():
+        return int(value)
+    return value
+
+
+def command_to_tool_call(cmd: list[str]) -> tuple[str, dict[str, Any]]:
+    """將 yutu 命令列轉換為 MCP 工具名稱與參數
+
+    工具名稱依 yutu 的 `<resource>-<action>` 命名慣例，
+    `--output` 參數由工作程序決定，不會傳入。
+
+    Examples:
+        >>> command_to_tool_call(["yutu", "video", "list", "--ids", "a", "--maxResults", "0"])
+        ('video-list', {'ids': 'a', 'maxResults': 0})
+    """
+    resource, action, *args = cmd[1:]
+    arguments = {}
+    for flag, value in zip(args[0::2], args[1::2]):
+        name = flag.lstrip("-")
+        if name != "output":
+            arguments[name] = _coerce_argument(name, value)
+    return f"{resource}-{action}", arguments
+
+
+class _Pending:
+    """等待中的 JSON-RPC 請求"""
+
+    __slots__ = ("event", "response")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.response: Optional[dict] = None
+
+
+class WorkerCrashed(RuntimeError):
+    """MCP 工作程序在回應前結束"""
+
+
+class McpWorker:
+    """單一 `yutu mcp` 工作程序（stdio JSON-RPC 2.0，逐行一則訊息）"""
+
+    def __init__(self, cli_path: str, env: dict[str, str], timeout: float):
+        self._proc = subprocess.Popen(
+            [cli_path, "mcp"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._ids = itertools.count(1)
+        self._pending: dict[int, _Pending] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_loop, name="yutu-mcp-reader", daemon=True)
+        self._reader.start()
+
+        try:
+            self.request("initialize", {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": __app_name__, "version": __version__},
+            }, timeout)
+            self.notify("notifications/initialized")
+            tools = self.request("tools/list", {}, timeout).get("tools", [])
+        except Exception:
+            self.close()
+            raise
+        self.tools = frozenset(tool.get("name", "") for tool in tools)
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def _read_loop(self) -> None:
+        """讀取回應並交給對應的等待者"""
+        for line in self._proc.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            with self._lock:
+                pending = self._pending.pop(message.get("id"), None)
+            if pending is not None:
+                pending.response = message
+                pending.event.set()
+
+        # 工作程序已結束：喚醒所有等待者
+        with self._lock:
+            pending_list = list(self._pending.values())
+            self._pending.clear()
+        for pending in pending_list:
+            pending.event.set()
+
+    def _send(self, message: dict) -> None:
+        with self._write_lock:
+            self._proc.stdin.write(json.dumps(message, ensure_ascii=False) + "\n")
+            self._proc.stdin.flush()
+
+    def notify(self, method: str, params: Optional[dict] = None) -> None:
+        """送出不需回應的通知"""
+        message: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        self._send(message)
+
+    def request(self, method: str, params: dict, timeout: float) -> dict:
+        """送出請求並等待回應
+
+        Raises:
+            WorkerCrashed: 工作程序在回應前結束
+            subprocess.TimeoutExpired: 超過 timeout 秒
+            RuntimeError: 回應為 JSON-RPC 錯誤
+        """
+        msg_id = next(self._ids)
+        pending = _Pending()
+        with self._lock:
+            self._pending[msg_id] = pending
+        try:
+            self._send({"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params})
+        except (BrokenPipeError, OSError, ValueError) as e:
+            with self._lock:
+                self._pending.pop(msg_id, None)
+            raise WorkerCrashed(str(e)) from e
+
+        if not pending.event.wait(timeout):
+            with self._lock:
+                self._pending.pop(msg_id, None)
+            raise subprocess.TimeoutExpired(method, timeout)
+        if pending.response is None:
+            raise WorkerCrashed("yutu mcp 工作程序已結束")
+        if "error" in pending.response:
+            raise RuntimeError(pending.response["error"].get("message", "MCP 錯誤"))
+        return pending.response.get("result", {})
+
+    def close(self) -> None:
+        """結束工作程序"""
+        if self._proc.stdin:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+
+class McpTransport:
+    """透過常駐 `yutu mcp` 工作程序執行命令
+
+    - 多個執行緒可同時呼叫，請求以 JSON-RPC id 多工
+    - 工作程序當機時於下次呼叫重新啟動（超過 `max_restarts` 次後停用）
+    - 工作程序不支援的工具、非 JSON 輸出或工作程序無法使用時，
+      改用子程序模式執行
+    """
+
+    name = "mcp"
+
+    def __init__(self, *, max_restarts: int = 3, fallback: Optional[SubprocessTransport] = None):
+        self.max_restarts = max_restarts
+        self.fallback = fallback or SubprocessTransport()
+        self.restarts = 0
+        self.fallback_calls = 0
+        self._worker: Optional[McpWorker] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _get_worker(self, cli_path: str, env: dict[str, str], timeout: float) -> Optional[McpWorker]:
+        """取得可用的工作程序，必要時啟動或重新啟動"""
+        with self._lock:
+            if self._disabled:
+                return None
+            if self._worker is not None and self._worker.alive:
+                return self._worker
+            if self._worker is not None:
+                self._worker.close()
+                self._worker = None
+                self.restarts += 1
+                if self.restarts > self.max_restarts:
+                    self._disabled = True
+                    return None
+            try:
+                self._worker = McpWorker(cli_path, env, timeout)
+            except (OSError, RuntimeError, subprocess.TimeoutExpired):
+                # 無法啟動（例如 yutu 版本不支援 mcp）：之後都改用子程序
+                self._disabled = True
+                self._worker = None
+            return self._worker
+
+    def _run_fallback(self, cmd: list[str], env: dict[str, str], timeout: float) -> CommandOutput:
+        self.fallback_calls += 1
+        return self.fallback.execute(cmd, env, timeout)
+
+    def execute(self, cmd: list[str], env: dict[str, str], timeout: float) -> CommandOutput:
+        """執行命令（介面與 SubprocessTransport.execute 相同）"""
+        if "--output" in cmd and cmd[cmd.index("--output") + 1] != "json":
+            return self._run_fallback(cmd, env, timeout)
+
+        worker = self._get_worker(cmd[0], env, timeout)
+        tool, arguments = command_to_tool_call(cmd)
+        if worker is None or tool not in worker.tools:
+            return self._run_fallback(cmd, env, timeout)
+
+        try:
+            with span("wait", PHASE_CATEGORY, tool=tool):
+                result = worker.request("tools/call", {"name": tool, "arguments": arguments}, timeout)
+        except WorkerCrashed:
+            # 唯讀命令可安全地改用子程序重試；寫入命令結果未知，不重試
+            if cmd[2] in READ_ONLY_ACTIONS:
+                return self._run_fallback(cmd, env, timeout)
+            return CommandOutput(1, "", "yutu mcp 工作程序中斷，命令結果未知")
+        except RuntimeError as e:
+            return CommandOutput(1, "", str(e))
+
+        text = "".join(
+            part.get("text", "") for part in result.get("content", []) if part.get("type") == "text"
+        )
+        if result.get("isError"):
+            return CommandOutput(1, "", text)
+        return CommandOutput(0, text)
+
+    def close(self) -> None:
+        """結束工作程序"""
+        with self._lock:
+            if self._worker is not None:
+                self._worker.close()
+                self._worker = None
+
+
+def create_transport(
+    name: str, *, api_base_url: Optional[str] = None
+) -> "SubprocessTransport | McpTransport | ApiTransport":
+    """依設定名稱建立傳輸層"""
+    if name == "mcp":
+        return McpTransport()
+    if name == "api":
+        from yutu_cli.utils.api_transport import API_BASE_URL, ApiTransport
+
+        return ApiTransport(base_url=api_base_url or API_BASE_URL)
+    return SubprocessTransport()
@@ -0,0 +1,148 @@
+"""影片目錄服務 - 在工作階段內共用「我的影片」清單"""
+
+import threading
+import time
+from typing import Optional
+
+from yutu_cli.utils.yutu import YutuCLI, YutuResult, get_yutu
+
+
+def get_video_id(video: dict) -> str:
+    """從影片項目中提取 video ID
+
+    支援搜尋結果（`{"kind": "youtube#video", "videoId": "xxx"}`）
+    與影片資源（字串 ID）兩種結構。
+
+    Args:
+        video: 影片項目
+
+    Returns:
+        影片 ID
+    """
+    id_info = video.get("id", {})
+    if isinstance(id_info, dict):
+        return id_info.get("videoId", "")
+    return str(id_info)
+
+
+class VideoCatalog:
+    """我的影片目錄（載入一次後常駐記憶體，並於背景增量更新）
+
+    第一次取用時同步載入最新一頁（`page_size` 部），使用者要求時才載入全部影片
+    （`load(complete=True)`）；之後每次取用都直接回傳記憶體中的快照，
+    當快照超過 `refresh_interval` 秒時，於背景執行緒抓取最新一頁，
+    將新上傳的影片合併到最前面，不會阻塞選單。
+    """
+
+    def __init__(
+        self,
+        yutu: YutuCLI,
+        *,
+        page_size: int = 50,
+        refresh_interval: float = 300,
+    ):
+        self.yutu = yutu
+        self.page_size = page_size
+        self.refresh_interval = refresh_interval
+        self._items: Optional[list[dict]] = None
+        self._complete = False
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def loaded(self) -> bool:
+        """目錄是否已載入"""
+        return self._items is not None
+
+    @property
+    def complete(self) -> bool:
+        """目錄是否已包含全部影片"""
+        return self._complete
+
+    def _fetch(self, max_results: Optional[int] = None, *, use_cache: bool = True) -> YutuResult:
+        return self.yutu.list_my_videos(max_results=max_results, use_cache=use_cache)
+
+    @staticmethod
+    def _extract_items(result: YutuResult) -> list[dict]:
+        data = result.data
+        if isinstance(data, list):
+            return data
+        return data.get("items", []) if data else []
+
+    def load(self, *, complete: bool = False) -> YutuResult:
+        """同步載入目錄（已載入時直接回傳快照）
+
+        Args:
+            complete: 載入全部影片（已載入全部時不會重新呼叫）；
+                否則第一次只載入最新一頁
+
+        Returns:
+            YutuResult，data 為 `{"items": [...]}`
+        """
+        with self._lock:
+            if self._items is not None and (self._complete or not complete):
+                self._maybe_refresh()
+                return YutuResult(success=True, data={"items": list(self._items)})
+
+        result = self._fetch(0 if complete else self.page_size)
+        if not result.success:
+            return result
+
+        with self._lock:
+            self._items = self._extract_items(result)
+            self._complete = complete or len(self._items) < self.page_size
+            self._loaded_at = time.monotonic()
+            return YutuResult(success=True, data={"items": list(self._items)})
+
+    def _maybe_refresh(self) -> None:
+        """快照過舊時啟動背景更新（呼叫者須持有鎖）"""
+        if time.monotonic() - self._loaded_at < self.refresh_interval:
+            return
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(
+            target=self._refresh, name="video-catalog-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _refresh(self) -> None:
+        """抓取最新一頁並合併新影片"""
+        result = self._fetch(self.page_size, use_cache=False)
+        if not result.success:
+            return
+        self.merge(self._extract_items(result))
+
+    def merge(self, newest: list[dict]) -> None:
+        """將最新影片合併到快照最前面（已存在者以新資料取代）"""
+        with self._lock:
+            if self._items is None:
+                return
+            fresh_ids = {get_video_id(item) for item in newest}
+            rest = [item for item in self._items if get_video_id(item) not in fresh_ids]
+            self._items = newest + rest
+            self._loaded_at = time.monotonic()
+
+    def discard(self, video_id: str) -> None:
+        """從快照移除影片（例如影片已被刪除）"""
+        with self._lock:
+            if self._items is not None:
+                self._items = [item for item in self._items if get_video_id(item) != video_id]
+
+    def invalidate(self) -> None:
+        """捨棄快照，下次取用時重新載入"""
+        with self._lock:
+            self._items = None
+            self._complete = False
+
+
+# 全域實例
+_catalog: Optional[VideoCatalog] = None
+
+
+def get_video_catalog() -> VideoCatalog:
+    """取得 VideoCatalog 實例（單例模式）"""
+    global _catalog
+    if _catalog is None:
+        _catalog = VideoCatalog(get_yutu())
+    return _catalog
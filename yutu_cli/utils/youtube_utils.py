@@ -37,3 +37,33 @@ def extract_video_id(url_or_id: str) -> str:
 
     # 無法識別，原樣回傳
     return url_or_id
+
+
+def playlist_item_to_search_result(item: dict) -> dict:
+    """將 playlistItem 資源轉換為 search 結果的結構
+
+    讓來自「上傳的影片」播放清單的項目可以直接交給
+    `display_search_results` 與影片選擇器使用。
+
+    Args:
+        item: playlistItem 資源（需包含 snippet，contentDetails 可選）
+
+    Returns:
+        `{"id": {"kind": "youtube#video", "videoId": ...}, "snippet": {...}}`
+    """
+    snippet = item.get("snippet", {})
+    content = item.get("contentDetails", {})
+    video_id = content.get("videoId") or snippet.get("resourceId", {}).get("videoId", "")
+    return {
+        "kind": "youtube#searchResult",
+        "id": {"kind": "youtube#video", "videoId": video_id},
+        "snippet": {
+            "title": snippet.get("title", ""),
+            "description": snippet.get("description", ""),
+            "channelId": snippet.get("videoOwnerChannelId") or snippet.get("channelId", ""),
+            "channelTitle": snippet.get("videoOwnerChannelTitle") or snippet.get("channelTitle", ""),
+            # 影片本身的發布時間；私人影片沒有此欄位時改用加入清單的時間
+            "publishedAt": content.get("videoPublishedAt") or snippet.get("publishedAt", ""),
+            "thumbnails": snippet.get("thumbnails", {}),
+        },
+    }
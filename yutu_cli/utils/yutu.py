@@ -1,12 +1,109 @@
 """yutu CLI 包裝器 - 執行 yutu 命令並解析輸出"""
 
+import codecs
 import json
 import os
+import sqlite3
 import subprocess
-from dataclasses import dataclass
-from typing import Any, Optional
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
 
 from yutu_cli.config import get_config
+from yutu_cli.utils.batching import BatchResult, dedupe, fetch_in_batches
+from yutu_cli.utils.cache import (
+    CACHEABLE_ACTIONS,
+    READ_ONLY_ACTIONS,
+    CacheStats,
+    ResponseCache,
+    make_cache_key,
+)
+from yutu_cli.utils.fields import FieldPlanner, fields_mask, parts_for
+from yutu_cli.utils.json_stream import JsonItemStream, loads
+from yutu_cli.utils.metrics import MetricsServer, YutuMetrics
+from yutu_cli.utils.models import M, items_of, parse_models
+from yutu_cli.utils.quota import QuotaLedger, list_pages, pages_for, quota_cost
+from yutu_cli.utils.retry import (
+    NON_IDEMPOTENT_ACTIONS,
+    NOT_FOUND,
+    QUOTA_EXCEEDED,
+    RATE_LIMITED,
+    TIMEOUT,
+    ErrorStats,
+    backoff_delay,
+    can_retry,
+    classify_error,
+)
+from yutu_cli.utils.tracing import COMMAND_CATEGORY, PHASE_CATEGORY, annotate, span
+from yutu_cli.utils.transport import McpTransport, SubprocessTransport, create_transport
+from yutu_cli.utils.youtube_utils import playlist_item_to_search_result
+
+if TYPE_CHECKING:
+    from yutu_cli.utils.api_transport import ApiTransport
+    # 鏡像（含全文索引）只在已同步過時才載入
+    from yutu_cli.utils.mirror import ChannelMirror
+
+# 串流輸出無法解析時，等待 yutu 自行結束（以取得錯誤訊息）的秒數
+PARSE_ERROR_GRACE = 1.0
+
+# 未指定 fields 時查詢的欄位（完整的 part）
+VIDEO_DETAIL_FIELDS = ("id", "snippet", "statistics", "contentDetails", "status")
+PLAYLIST_FIELDS = ("id", "snippet", "contentDetails", "status")
+# list_my_videos(hydrate=True) 附加到搜尋結構的欄位
+HYDRATE_FIELDS = ("id", "statistics", "contentDetails", "status")
+
+
+class _ReadWatchdog:
+    """串流讀取時，子程序超過 timeout 秒沒有輸出就終止它
+
+    只計算等待子程序輸出的時間，呼叫端處理項目（例如繪製表格）的時間不計入。
+    """
+
+    def __init__(self, proc: subprocess.Popen, timeout: float):
+        self.proc = proc
+        self.timeout = timeout
+        self.timed_out = False
+        self._since: Optional[float] = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._watch, name="yutu-stream-watchdog", daemon=True)
+        self._thread.start()
+
+    def read(self, read: Callable[[], bytes]) -> bytes:
+        """執行一次讀取（期間受超時監控）"""
+        self._since = time.monotonic()
+        try:
+            return read()
+        finally:
+            self._since = None
+
+    def _watch(self) -> None:
+        interval = min(1.0, self.timeout / 4)
+        while not self._done.wait(interval):
+            since = self._since
+            if since is not None and time.monotonic() - since > self.timeout:
+                self.timed_out = True
+                self.proc.kill()
+                return
+
+    def stop(self) -> None:
+        self._done.set()
+
+
+def _single_id(params: dict[str, Any]) -> bool:
+    """delete 是否只針對一個 ID（`--ids a,b,c` 為批次）"""
+    ids = params.get("ids", params.get("id", ""))
+    return "," not in str(ids)
+
+
+def _max_results_in(cmd: list[str]) -> Optional[int]:
+    """命令中的 --maxResults（未指定時為 None）"""
+    try:
+        return int(cmd[cmd.index("--maxResults") + 1])
+    except (ValueError, IndexError):
+        return None
 
 
 @dataclass
@@ -16,6 +113,42 @@ class YutuResult:
     data: Optional[dict | list] = None
     error: Optional[str] = None
     raw_output: str = ""
+    cached: bool = False
+    missing_ids: list[str] = field(default_factory=list)
+    error_kind: Optional[str] = None
+    _stream: Optional[Iterator[dict]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def streaming(self) -> bool:
+        """是否為尚未讀取完畢的串流結果"""
+        return self._stream is not None
+
+    def iter_items(self) -> Iterator[dict]:
+        """逐筆產生結果項目
+
+        串流結果只能迭代一次；迭代結束後若子程序失敗，
+        `success` 會變為 False 並設定 `error`。
+        """
+        if self._stream is not None:
+            stream, self._stream = self._stream, None
+            yield from stream
+            return
+        data = self.data
+        yield from (data if isinstance(data, list) else (data or {}).get("items", []))
+
+    def models(self, model: type[M]) -> list[M]:
+        """將結果項目解析為模型（例如 `result.models(Playlist)`，串流結果同樣只能讀取一次）"""
+        return parse_models(self.iter_items(), model)
+
+    @classmethod
+    def from_batch(cls, batch: BatchResult) -> "YutuResult":
+        """由批次查詢結果建立 YutuResult（找不到的 ID 列於 missing_ids）"""
+        return cls(
+            success=batch.success,
+            data={"items": batch.items},
+            error="; ".join(dedupe(batch.errors)) or None,
+            missing_ids=batch.missing,
+        )
 
 
 class YutuCLI:
@@ -23,6 +156,23 @@ class YutuCLI:
     
     def __init__(self):
         self.config = get_config()
+        self._cache: Optional[ResponseCache] = None
+        self._uploads_playlist_id: Optional[str] = None
+        self._transport: Optional["SubprocessTransport | McpTransport | ApiTransport"] = None
+        self._mirror: Optional["ChannelMirror"] = None
+        # 同一個實例由多個執行緒共用（分批查詢、批次加入等），延遲建立的資源需加鎖
+        self._init_lock = threading.Lock()
+        self.quota = QuotaLedger(
+            self.config.quota_path,
+            daily_limit=self.config.quota_daily_limit,
+            budget=self.config.quota_budget,
+        )
+        self.error_stats = ErrorStats()
+        self.field_planner = FieldPlanner()
+        self.metrics = YutuMetrics()
+        self._metrics_server: Optional[MetricsServer] = None
+        if self.config.metrics_port is not None:
+            self._metrics_server = MetricsServer(self.metrics, self.config.metrics_port)
     
     def _build_command(
         self,
@@ -63,6 +213,297 @@ class YutuCLI:
         
         return cmd
     
+    def _projection(self, resource: str, action: str, fields: Iterable[str]) -> dict[str, str]:
+        """將呼叫端需要的欄位轉為 run 的 parts（及 fields 遮罩）參數
+
+        同一端點重疊的需求由 field_planner 合併，讓不同呼叫端共用同一個命令與快取；
+        只有支援的傳輸層（api）才會送出 fields 遮罩。
+        """
+        planned = self.field_planner.plan(resource, action, fields)
+        params = {"parts": parts_for(planned)}
+        if getattr(self.transport, "supports_fields", False):
+            params["fields"] = fields_mask(planned)
+        return params
+
+    def _credential_identity(self) -> str:
+        """取得憑證識別字串（用於區隔不同帳號的快取）"""
+        return f"{self.config.credential_path}|{self.config.token_path}"
+
+    def _get_cache(self) -> Optional[ResponseCache]:
+        """取得回應快取（停用或無法開啟時回傳 None）"""
+        if not self.config.cache_enabled:
+            return None
+        if self._cache is None:
+            with self._init_lock:
+                if self._cache is None and self.config.cache_enabled:
+                    try:
+                        self._cache = ResponseCache(
+                            self.config.cache_path,
+                            max_entries=self.config.cache_max_entries,
+                            max_bytes=self.config.cache_max_bytes,
+                            ttls=self.config.cache_ttls,
+                        )
+                    except (OSError, sqlite3.Error):
+                        # 快取無法使用時不影響正常執行
+                        self.config.cache_enabled = False
+        return self._cache
+
+    def get_mirror(self, *, create: bool = False) -> Optional["ChannelMirror"]:
+        """取得頻道鏡像
+
+        Args:
+            create: 鏡像資料庫不存在時是否建立（同步時使用）
+
+        Returns:
+            ChannelMirror，尚未同步過或無法開啟時回傳 None
+        """
+        if self._mirror is None:
+            path = self.config.mirror_path
+            if not create and not path.exists():
+                return None
+            from yutu_cli.utils.mirror import ChannelMirror
+
+            with self._init_lock:
+                if self._mirror is None:
+                    try:
+                        self._mirror = ChannelMirror(path, max_age=self.config.mirror_max_age)
+                    except (OSError, sqlite3.Error):
+                        return None
+        return self._mirror
+
+    @property
+    def transport(self) -> "SubprocessTransport | McpTransport | ApiTransport":
+        """取得傳輸層（依 transport 設定建立）"""
+        if self._transport is None:
+            with self._init_lock:
+                if self._transport is None:
+                    self._transport = create_transport(
+                        self.config.transport, api_base_url=self.config.api_base_url
+                    )
+        return self._transport
+
+    def close(self) -> None:
+        """釋放傳輸層資源（例如結束常駐的 yutu mcp 工作程序），並寫出指標"""
+        with self._init_lock:
+            transport, self._transport = self._transport, None
+            mirror, self._mirror = self._mirror, None
+        if transport is not None:
+            transport.close()
+        if mirror is not None:
+            mirror.close()
+        if self._metrics_server is not None:
+            self._metrics_server.close()
+            self._metrics_server = None
+        self.flush_metrics()
+
+    def flush_metrics(self) -> None:
+        """將指標寫入 metrics_textfile（未設定時略過）"""
+        if self.config.metrics_textfile is not None:
+            self.metrics.write_textfile(self.config.metrics_textfile)
+
+    def _observe(self, resource: str, action: str, result: YutuResult, started: float) -> None:
+        """記錄一次呼叫的指標（本機快取或鏡像回應的 source 為 local）"""
+        error_kind = None
+        if not result.success:
+            error_kind = result.error_kind or classify_error(result.error)
+        self.metrics.observe_call(
+            resource, action,
+            seconds=time.perf_counter() - started,
+            source="local" if result.cached else self.transport.name,
+            error_kind=error_kind,
+        )
+
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """快取命中統計（未啟用快取時為 None）"""
+        return self._cache.stats if self._cache is not None else None
+
+    @staticmethod
+    def _parse_output(stdout: str, output_format: str, *, cached: bool = False) -> YutuResult:
+        """將 yutu 的標準輸出轉換為 YutuResult"""
+        if output_format == "json" and stdout.strip():
+            try:
+                with span("parse", PHASE_CATEGORY, bytes=len(stdout)):
+                    data = loads(stdout)
+                return YutuResult(
+                    success=True,
+                    data=data,
+                    raw_output=stdout,
+                    cached=cached,
+                )
+            except json.JSONDecodeError as e:
+                return YutuResult(
+                    success=False,
+                    error=f"JSON 解析錯誤: {e}",
+                    raw_output=stdout,
+                )
+
+        return YutuResult(
+            success=True,
+            raw_output=stdout,
+            cached=cached,
+        )
+
+    def _cache_key_for(
+        self, cmd: list[str], action: str, output_format: str, use_cache: bool
+    ) -> Optional[str]:
+        """取得命令的快取鍵（不可快取時回傳 None）"""
+        if not use_cache or output_format != "json" or action not in CACHEABLE_ACTIONS:
+            return None
+        if self._get_cache() is None:
+            return None
+        return make_cache_key(cmd, self._credential_identity())
+
+    def _lookup_cache(self, cache_key: Optional[str], output_format: str) -> Optional[YutuResult]:
+        """查詢快取，命中時回傳結果"""
+        if cache_key is None or self.config.cache_refresh:
+            return None
+        payload = self._cache.get(cache_key)
+        if payload is None:
+            return None
+        return self._parse_output(payload, output_format, cached=True)
+
+    def _lookup_mirror(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        use_cache: bool,
+        max_results: Optional[int],
+        params: dict[str, Any],
+    ) -> Optional[YutuResult]:
+        """查詢本機鏡像，已同步且未過時時回傳結果"""
+        if not use_cache or output_format != "json" or self.config.cache_refresh:
+            return None
+        if not self.config.mirror_enabled:
+            return None
+        mirror = self.get_mirror()
+        if mirror is None:
+            return None
+        try:
+            items = mirror.lookup(resource, action, params)
+        except sqlite3.Error:
+            return None
+        if items is None:
+            return None
+        if max_results:
+            items = items[:max_results]
+        return YutuResult(success=True, data=items, cached=True)
+
+    def _lookup_local(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        use_cache: bool,
+        max_results: Optional[int],
+        cache_key: Optional[str],
+        params: dict[str, Any],
+    ) -> Optional[YutuResult]:
+        """依序查詢快取與本機鏡像，並記錄命中的層"""
+        cached = self._lookup_cache(cache_key, output_format)
+        if cached is not None:
+            self.metrics.cache_hits.inc(resource, action, "cache")
+            return cached
+        mirrored = self._lookup_mirror(resource, action, output_format, use_cache, max_results, params)
+        if mirrored is not None:
+            self.metrics.cache_hits.inc(resource, action, "mirror")
+        return mirrored
+
+    @staticmethod
+    def _quota_estimate(resource: str, action: str, params: dict[str, Any], cmd: list[str]) -> int:
+        """送出前預估的配額（list 依 --maxResults 預估頁數）"""
+        cost = quota_cost(resource, action, params)
+        if action == "list":
+            cost *= list_pages(_max_results_in(cmd))
+        return cost
+
+    def _reserve_quota(
+        self, resource: str, action: str, params: dict[str, Any], cmd: list[str]
+    ) -> Optional[YutuResult]:
+        """送出呼叫前記帳，超出配額預算時回傳失敗結果"""
+        cost = self._quota_estimate(resource, action, params, cmd)
+        error = self.quota.reserve(resource, action, cost)
+        if error is None:
+            self.metrics.quota_units.inc(resource, action, amount=cost)
+            return None
+        return YutuResult(success=False, error=error, error_kind=QUOTA_EXCEEDED)
+
+    def _correct_quota(
+        self, resource: str, action: str, params: dict[str, Any], cmd: list[str], item_count: int
+    ) -> None:
+        """list 呼叫完成後，依實際回傳的頁數修正預先記帳的配額"""
+        if action != "list":
+            return
+        delta = quota_cost(resource, action, params) * pages_for(item_count) - self._quota_estimate(
+            resource, action, params, cmd
+        )
+        self.quota.adjust(resource, action, delta)
+        if delta > 0:
+            # 計數器只增不減，退還的部分只反映在帳本
+            self.metrics.quota_units.inc(resource, action, amount=delta)
+
+    def _correct_quota_for(
+        self, resource: str, action: str, params: dict[str, Any], cmd: list[str], result: YutuResult
+    ) -> None:
+        """依已解析的結果修正 list 呼叫的配額（無法得知項目數時維持預估）"""
+        if result.success and not result.cached and isinstance(result.data, (list, dict)):
+            self._correct_quota(resource, action, params, cmd, len(items_of(result.data)))
+
+    def _complete(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        cache_key: Optional[str],
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> YutuResult:
+        """將子程序的輸出轉換為結果，並更新快取與鏡像"""
+        if returncode != 0:
+            kind = classify_error(stderr)
+            if kind == QUOTA_EXCEEDED:
+                # 實際用量以 API 為準（例如其他工具也在使用同一個專案）
+                self.quota.mark_exhausted()
+            return YutuResult(
+                success=False,
+                error=stderr or f"命令執行失敗（退出碼：{returncode}）",
+                raw_output=stdout,
+                error_kind=kind,
+            )
+
+        self.metrics.output_bytes.inc(resource, action, amount=len(stdout))
+        parsed = self._parse_output(stdout, output_format)
+        if not parsed.success:
+            return parsed
+        cache = self._get_cache()
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, resource, action, stdout)
+        elif action not in READ_ONLY_ACTIONS:
+            self._invalidate_after_write(resource, action, params or {})
+        return parsed
+
+    def _invalidate_after_write(self, resource: str, action: str, params: dict[str, Any]) -> None:
+        """寫入動作成功後，相關的快取與鏡像內容已過時
+
+        快取與鏡像在磁碟上跨程序共用，即使本程序尚未讀取過也要開啟並標記。
+        """
+        cache = self._get_cache()
+        if cache is not None:
+            cache.invalidate(resource)
+        mirror = self.get_mirror()
+        if mirror is not None:
+            try:
+                mirror.invalidate(resource, action, params)
+            except sqlite3.Error:
+                pass
+
+    def _get_env(self) -> dict[str, str]:
+        """合併環境變數（確保繼承父程序環境變數）"""
+        return {**os.environ, **self.config.get_env_dict()}
+
     def run(
         self,
         resource: str,
@@ -70,15 +511,20 @@ class YutuCLI:
         *,
         output_format: str = "json",
         max_results: Optional[int] = None,
+        use_cache: bool = True,
         **kwargs,
     ) -> YutuResult:
         """執行 yutu 命令
         
+        暫時性錯誤（5xx、速率限制、網路中斷、超時）依 retry_attempts 設定
+        以指數退避重試；結果未知的 insert 會先確認是否已生效再重試。
+        
         Args:
             resource: 資源類型（playlist, video, search 等）
             action: 動作（list, insert, delete 等）
             output_format: 輸出格式（json, yaml）
             max_results: 最大結果數（None 使用設定預設值）
+            use_cache: 是否允許使用回應快取（僅對唯讀動作生效）
             **kwargs: 其他參數
         
         Returns:
@@ -90,51 +536,74 @@ class YutuCLI:
             max_results=max_results,
             **kwargs,
         )
+        started = time.perf_counter()
+        with span(f"{resource}.{action}", COMMAND_CATEGORY, argv=cmd) as current:
+            result = self._run_command(resource, action, output_format, max_results, use_cache, cmd, kwargs)
+            current.set(success=result.success, cached=result.cached, error_kind=result.error_kind)
+        self._observe(resource, action, result, started)
+        return result
+
+    def _run_command(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        max_results: Optional[int],
+        use_cache: bool,
+        cmd: list[str],
+        kwargs: dict[str, Any],
+    ) -> YutuResult:
+        """依序查詢快取、鏡像，再送出命令（含重試）"""
+        cache_key = self._cache_key_for(cmd, action, output_format, use_cache)
+        local = self._lookup_local(resource, action, output_format, use_cache, max_results, cache_key, kwargs)
+        if local is not None:
+            return local
         
-        try:
-            # 合併環境變數（確保繼承父程序環境變數）
-            env = {**os.environ, **self.config.get_env_dict()}
+        attempt = 0
+        while True:
+            result = self._execute(resource, action, output_format, cache_key, cmd, kwargs)
+            self._correct_quota_for(resource, action, kwargs, cmd, result)
+            settled = self._settle(resource, action, kwargs, result, attempt)
+            if settled is not None:
+                return settled
+            delay = self._retry_delay(resource, action, result, attempt)
+            if delay is None:
+                return result
+            time.sleep(delay)
+            attempt += 1
+            if self._needs_verification(action, result):
+                applied = self._find_applied_insert(resource, action, kwargs)
+                if applied is not None:
+                    return self._settle(resource, action, kwargs, applied, attempt) or result
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                env=env,
-                timeout=120,  # 2 分鐘超時
-            )
-            
-            if result.returncode != 0:
-                return YutuResult(
-                    success=False,
-                    error=result.stderr or f"命令執行失敗（退出碼：{result.returncode}）",
-                    raw_output=result.stdout,
-                )
-            
-            # 解析 JSON 輸出
-            if output_format == "json" and result.stdout.strip():
-                try:
-                    data = json.loads(result.stdout)
-                    return YutuResult(
-                        success=True,
-                        data=data,
-                        raw_output=result.stdout,
-                    )
-                except json.JSONDecodeError as e:
-                    return YutuResult(
-                        success=False,
-                        error=f"JSON 解析錯誤: {e}",
-                        raw_output=result.stdout,
-                    )
-            
-            return YutuResult(
-                success=True,
-                raw_output=result.stdout,
+    def _execute(
+        self,
+        resource: str,
+        action: str,
+        output_format: str,
+        cache_key: Optional[str],
+        cmd: list[str],
+        params: dict[str, Any],
+    ) -> YutuResult:
+        """記帳後送出一次命令"""
+        refused = self._reserve_quota(resource, action, params, cmd)
+        if refused is not None:
+            return refused
+
+        timeout = self.config.command_timeout
+        try:
+            output = self.transport.execute(cmd, self._get_env(), timeout)
+            annotate(exit_code=output.returncode, bytes_out=len(output.stdout))
+            return self._complete(
+                resource, action, output_format, cache_key,
+                output.returncode, output.stdout, output.stderr, params,
             )
             
         except subprocess.TimeoutExpired:
             return YutuResult(
                 success=False,
-                error="命令執行超時（超過 120 秒）",
+                error=f"命令執行超時（超過 {timeout} 秒）",
+                error_kind=TIMEOUT,
             )
         except FileNotFoundError:
             return YutuResult(
@@ -146,16 +615,219 @@ class YutuCLI:
                 success=False,
                 error=f"執行錯誤: {e}",
             )
+
+    # === 重試 ===
+
+    def _settle(
+        self,
+        resource: str,
+        action: str,
+        params: dict[str, Any],
+        result: YutuResult,
+        attempt: int,
+    ) -> Optional[YutuResult]:
+        """判斷是否已得到最終結果（成功，或重試的單一 ID delete 得到 notFound）"""
+        if result.success:
+            if attempt:
+                self.error_stats.record_recovered()
+            return result
+        if attempt and action == "delete" and result.error_kind == NOT_FOUND and _single_id(params):
+            # 先前結果未知的嘗試其實已刪除成功
+            # （多個 ID 的批次只代表其中某個 ID 已不存在，以失敗回報，由呼叫端逐項處理）
+            self.error_stats.record_recovered()
+            self._invalidate_after_write(resource, action, params)
+            return YutuResult(success=True)
+        return None
+
+    def _retry_delay(
+        self, resource: str, action: str, result: YutuResult, attempt: int
+    ) -> Optional[float]:
+        """記錄錯誤；可重試時回傳等待秒數，否則回傳 None"""
+        kind = result.error_kind or classify_error(result.error)
+        self.error_stats.record_error(kind)
+        if attempt >= self.config.retry_attempts or not can_retry(resource, action, kind):
+            return None
+        self.error_stats.record_retry(kind)
+        self.metrics.retries.inc(kind)
+        return backoff_delay(attempt, self.config.retry_backoff, self.config.retry_max_backoff)
+
+    @staticmethod
+    def _needs_verification(action: str, result: YutuResult) -> bool:
+        """insert 失敗但結果未知，重試前須先確認是否已生效"""
+        return action in NON_IDEMPOTENT_ACTIONS and result.error_kind != RATE_LIMITED
+
+    def _find_applied_insert(
+        self, resource: str, action: str, params: dict[str, Any]
+    ) -> Optional[YutuResult]:
+        """確認結果未知的 insert 是否已生效
+
+        Returns:
+            None 表示尚未生效、可以重試；成功結果表示已生效（data 為找到的項目）；
+            失敗結果表示無法確認，不應重試
+        """
+        if (resource, action) == ("playlistItem", "insert"):
+            check = YutuCLI.run(
+                self, "playlistItem", "list",
+                playlistId=params.get("playlistId"),
+                parts="contentDetails",
+                use_cache=False,
+            )
+            section, key = "contentDetails", "videoId"
+        elif (resource, action) == ("comment", "insert"):
+            check = YutuCLI.run(
+                self, "comment", "list",
+                parentId=params.get("parentId"),
+                parts="snippet",
+                use_cache=False,
+            )
+            section, key = "snippet", "textOriginal"
+        else:
+            return YutuResult(success=False, error="無法確認寫入是否已生效")
+        if not check.success:
+            return check
+        for item in check.iter_items():
+            if item.get(section, {}).get(key) == params.get(key):
+                self._invalidate_after_write(resource, action, params)
+                return YutuResult(success=True, data=item)
+        return None
     
+    def stream(
+        self,
+        resource: str,
+        action: str,
+        *,
+        max_results: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+        **kwargs,
+    ) -> YutuResult:
+        """以串流方式執行 list 命令，邊讀取邊解析
+
+        不保留完整輸出，也不使用回應快取；記憶體用量約為單一項目
+        加上一個讀取區塊。請以 `result.iter_items()` 取得項目。
+        本機鏡像已同步的查詢會直接由鏡像回應。
+        yutu 超過 command_timeout 秒沒有輸出時會被終止，結果為 TIMEOUT 失敗。
+
+        Args:
+            resource: 資源類型
+            action: 動作（通常為 list）
+            max_results: 最大結果數（None 使用設定預設值）
+            chunk_size: 每次從子程序讀取的位元組數
+            **kwargs: 其他參數
+
+        Returns:
+            串流 YutuResult（子程序無法啟動時為失敗結果）
+        """
+        if self.transport.name == "api":
+            # 直接呼叫 API 時由傳輸層逐頁取得，不需要 yutu 子程序
+            # （以同步的 YutuCLI.run 執行，AsyncYutuCLI 覆寫的 run 是協程）
+            return YutuCLI.run(
+                self, resource, action, max_results=max_results, use_cache=False, **kwargs
+            )
+        mirrored = self._lookup_mirror(resource, action, "json", True, max_results, kwargs)
+        if mirrored is not None:
+            return mirrored
+        cmd = self._build_command(resource, action, max_results=max_results, **kwargs)
+        refused = self._reserve_quota(resource, action, kwargs, cmd)
+        if refused is not None:
+            return refused
+
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                env=self._get_env(),
+            )
+        except FileNotFoundError:
+            stderr_file.close()
+            return YutuResult(
+                success=False,
+                error=f"找不到 yutu CLI: {self.config.cli_path}",
+            )
+        except Exception as e:
+            stderr_file.close()
+            return YutuResult(success=False, error=f"執行錯誤: {e}")
+
+        result = YutuResult(success=True)
+        timeout = self.config.command_timeout
+
+        def read_chunks(watchdog: _ReadWatchdog) -> Iterator[str]:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            while True:
+                block = watchdog.read(lambda: proc.stdout.read1(chunk_size))
+                if not block:
+                    tail = decoder.decode(b"", final=True)
+                    if tail:
+                        yield tail
+                    return
+                yield decoder.decode(block)
+
+        def items() -> Iterator[dict]:
+            watchdog = _ReadWatchdog(proc, timeout)
+            killed = False
+            try:
+                stream = JsonItemStream(read_chunks(watchdog))
+                count = 0
+                try:
+                    for item in stream:
+                        count += 1
+                        yield item
+                except ValueError as e:
+                    # JSONDecodeError 也是 ValueError 的子類別；不再讀取輸出，
+                    # 子程序若未隨即結束就終止它，以免它因管線寫滿而卡住
+                    try:
+                        proc.wait(timeout=PARSE_ERROR_GRACE)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                        killed = True
+                    if not watchdog.timed_out:
+                        result.success = False
+                        result.error = f"JSON 解析錯誤: {e}"
+                result.data = stream.metadata or None
+                try:
+                    returncode = proc.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    watchdog.timed_out = True
+                    returncode = None
+                if watchdog.timed_out:
+                    result.success = False
+                    result.error = f"命令執行超時（超過 {timeout} 秒沒有輸出）"
+                    result.error_kind = TIMEOUT
+                elif returncode != 0 and not killed:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode("utf-8", errors="replace")
+                    result.success = False
+                    result.error = stderr or f"命令執行失敗（退出碼：{returncode}）"
+                if result.success:
+                    self._correct_quota(resource, action, kwargs, cmd, count)
+            finally:
+                watchdog.stop()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+                stderr_file.close()
+
+        result._stream = items()
+        return result
+
     # === 便捷方法 ===
     
-    def list_my_playlists(self, max_results: Optional[int] = None) -> YutuResult:
-        """列出我的播放清單"""
+    def list_my_playlists(
+        self, max_results: Optional[int] = None, *, fields: Optional[Iterable[str]] = None
+    ) -> YutuResult:
+        """列出我的播放清單
+
+        Args:
+            max_results: 最大結果數
+            fields: 需要的欄位（如 `("id", "snippet.title")`；None 為 snippet/contentDetails/status）
+        """
         return self.run(
             "playlist", "list",
             mine=True,
-            parts="snippet,contentDetails,status",
             max_results=max_results,
+            **self._projection("playlist", "list", fields or PLAYLIST_FIELDS),
         )
     
     def list_playlist_items(
@@ -168,6 +840,16 @@ class YutuCLI:
             max_results=max_results,
         )
     
+    def stream_playlist_items(
+        self, playlist_id: str, max_results: Optional[int] = None
+    ) -> YutuResult:
+        """以串流方式列出播放清單中的影片（適合數千部影片的清單）"""
+        return self.stream(
+            "playlistItem", "list",
+            playlistId=playlist_id,
+            max_results=max_results,
+        )
+
     def add_to_playlist(self, playlist_id: str, video_id: str) -> YutuResult:
         """新增影片到播放清單"""
         return self.run(
@@ -176,10 +858,27 @@ class YutuCLI:
             videoId=video_id,
         )
     
-    def remove_from_playlist(self, playlist_item_id: str) -> YutuResult:
-        """從播放清單移除影片（注意：使用 playlistItem ID，不是 video ID）"""
+    def remove_from_playlist(self, playlist_item_id: str | list[str]) -> YutuResult:
+        """從播放清單移除影片（注意：使用 playlistItem ID，不是 video ID；可一次傳入多個）"""
+        if not isinstance(playlist_item_id, str):
+            playlist_item_id = ",".join(playlist_item_id)
         return self.run("playlistItem", "delete", ids=playlist_item_id)
     
+    def move_playlist_item(
+        self, playlist_item_id: str, playlist_id: str, video_id: str, position: int
+    ) -> YutuResult:
+        """將播放清單項目移到指定位置（從 0 起算，50 配額）
+
+        playlistItems.update 會覆寫 snippet，因此需一併帶入 playlistId 與 videoId。
+        """
+        return self.run(
+            "playlistItem", "update",
+            id=playlist_item_id,
+            playlistId=playlist_id,
+            videoId=video_id,
+            position=position,
+        )
+
     def search_videos(
         self,
         query: str,
@@ -196,24 +895,173 @@ class YutuCLI:
             max_results=max_results,
         )
     
-    def get_video_details(self, video_ids: str | list[str]) -> YutuResult:
-        """取得影片詳情"""
-        if isinstance(video_ids, list):
-            video_ids = ",".join(video_ids)
+    def _fetch_video_details(
+        self, video_ids: list[str], *, fields: Optional[Iterable[str]] = None
+    ) -> YutuResult:
+        """查詢單一批次（最多 50 個）影片詳情"""
         return self.run(
             "video", "list",
-            ids=video_ids,
-            parts="snippet,statistics,contentDetails,status",
+            ids=",".join(video_ids),
+            **self._projection("video", "list", fields or VIDEO_DETAIL_FIELDS),
+        )
+
+    def batch_video_details(
+        self,
+        video_ids: str | list[str],
+        *,
+        max_workers: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> BatchResult:
+        """分批並行查詢影片詳情
+
+        ID 會先去重，再切成每批 50 個並行查詢，結果依輸入順序排列；
+        已刪除或私人的影片列在 `missing`。
+
+        Args:
+            video_ids: 影片 ID 列表或逗號分隔字串
+            max_workers: 同時查詢的批次數（None 使用 max_concurrency 設定）
+            fields: 需要的欄位（如 `("id", "snippet.title")`；None 為完整詳情）
+
+        Returns:
+            BatchResult
+        """
+        return fetch_in_batches(
+            partial(self._fetch_video_details, fields=fields),
+            video_ids,
+            key=lambda item: item.get("id", ""),
+            max_workers=max_workers or self.config.max_concurrency,
         )
+
+    def get_video_details(
+        self, video_ids: str | list[str], *, fields: Optional[Iterable[str]] = None
+    ) -> YutuResult:
+        """取得影片詳情（超過 50 個 ID 時自動分批；fields 同 batch_video_details）"""
+        return YutuResult.from_batch(self.batch_video_details(video_ids, fields=fields))
     
-    def list_my_videos(self, max_results: Optional[int] = None) -> YutuResult:
-        """列出我的影片"""
+    def _search_my_videos(
+        self, max_results: Optional[int] = None, use_cache: bool = True
+    ) -> YutuResult:
+        """以 search list 列出我的影片（每頁 100 配額，最多約 500 部）"""
         return self.run(
             "search", "list",
             forMine=True,
             types="video",
             max_results=max_results,
+            use_cache=use_cache,
+        )
+
+    def _fetch_uploads_playlist_id(self) -> YutuResult:
+        return self.run("channel", "list", mine=True, parts="contentDetails")
+
+    @staticmethod
+    def _parse_uploads_playlist_id(result: YutuResult) -> Optional[str]:
+        """從 channel list 結果取出 uploads 播放清單 ID"""
+        if not result.success or not result.data:
+            return None
+        data = result.data
+        items = data if isinstance(data, list) else data.get("items", [])
+        if not items:
+            return None
+        related = items[0].get("contentDetails", {}).get("relatedPlaylists", {})
+        return related.get("uploads") or None
+
+    def _remember_uploads_playlist_id(self, result: YutuResult) -> Optional[YutuResult]:
+        """保留 channel list 解析出的 uploads 清單 ID（頻道沒有時記為空字串）
+
+        Returns:
+            查詢失敗時回傳該結果且不保留（下次重新查詢），否則為 None
+        """
+        if not result.success:
+            return result
+        self._uploads_playlist_id = self._parse_uploads_playlist_id(result) or ""
+        return None
+
+    def get_uploads_playlist_id(self) -> Optional[str]:
+        """取得我的頻道「上傳的影片」播放清單 ID（解析一次後保留；查詢失敗或沒有時為 None）"""
+        if self._uploads_playlist_id is None:
+            self._remember_uploads_playlist_id(self._fetch_uploads_playlist_id())
+        return self._uploads_playlist_id or None
+
+    def _list_uploads(
+        self, uploads_id: str, max_results: Optional[int], use_cache: bool
+    ) -> YutuResult:
+        return self.run(
+            "playlistItem", "list",
+            playlistId=uploads_id,
+            parts="snippet,contentDetails",
+            max_results=max_results,
+            use_cache=use_cache,
+        )
+
+    @staticmethod
+    def _uploads_video_ids(result: YutuResult) -> list[str]:
+        data = result.data
+        items = data if isinstance(data, list) else (data or {}).get("items", [])
+        return [playlist_item_to_search_result(item)["id"]["videoId"] for item in items]
+
+    @staticmethod
+    def _build_my_videos_result(
+        result: YutuResult, details: Optional[BatchResult] = None
+    ) -> YutuResult:
+        """將 uploads 清單項目轉為 search 結構，並可附上影片詳情"""
+        data = result.data
+        items = data if isinstance(data, list) else (data or {}).get("items", [])
+        videos = [playlist_item_to_search_result(item) for item in items]
+
+        missing: list[str] = []
+        if details is not None:
+            by_id = {video.get("id"): video for video in details.items}
+            for video in videos:
+                detail = by_id.get(video["id"]["videoId"])
+                if detail:
+                    for part in ("statistics", "contentDetails", "status"):
+                        if part in detail:
+                            video[part] = detail[part]
+            missing = details.missing
+
+        return YutuResult(
+            success=True,
+            data={"items": videos, "pageInfo": {"totalResults": len(videos)}},
+            cached=result.cached,
+            missing_ids=missing,
         )
+
+    def list_my_videos(
+        self,
+        max_results: Optional[int] = None,
+        *,
+        use_cache: bool = True,
+        hydrate: bool = False,
+    ) -> YutuResult:
+        """列出我的影片
+
+        透過頻道的 uploads 播放清單分頁列出（每頁 1 配額、沒有筆數上限），
+        回傳與 search list 相同的結構；頻道沒有 uploads 清單時改用 search list
+        （每頁 100 配額）。查詢頻道失敗時直接回傳錯誤，不改用 search list。
+
+        Args:
+            max_results: 最大結果數（None 使用設定預設值，0 為全部）
+            use_cache: 是否允許使用回應快取
+            hydrate: 是否以批次 video list 附上 statistics/contentDetails/status
+
+        Returns:
+            YutuResult，data 為 `{"items": [...], "pageInfo": {...}}`
+        """
+        if self._uploads_playlist_id is None:
+            failed = self._remember_uploads_playlist_id(self._fetch_uploads_playlist_id())
+            if failed is not None:
+                return failed
+        if not self._uploads_playlist_id:
+            return self._search_my_videos(max_results, use_cache)
+
+        result = self._list_uploads(self._uploads_playlist_id, max_results, use_cache)
+        if not result.success:
+            return result
+
+        details = None
+        if hydrate:
+            details = self.batch_video_details(self._uploads_video_ids(result), fields=HYDRATE_FIELDS)
+        return self._build_my_videos_result(result, details)
     
     def get_my_channel(self) -> YutuResult:
         """取得我的頻道資訊"""
@@ -411,14 +1259,44 @@ class YutuCLI:
         Returns:
             YutuResult
         """
-        kwargs: dict[str, Any] = {
+        result = self.run(
+            "caption", "download", output_format="silent",
+            **self._caption_download_params(caption_id, file_path, fmt, tlang),
+        )
+        return self._caption_downloaded(result, caption_id, file_path, tlang)
+
+    @staticmethod
+    def _caption_download_params(
+        caption_id: str, file_path: str, fmt: str, tlang: Optional[str]
+    ) -> dict[str, Any]:
+        """caption download 的參數"""
+        params: dict[str, Any] = {
             "id": caption_id,
             "file": file_path,
             "tfmt": fmt,
         }
         if tlang:
-            kwargs["tlang"] = tlang
-        return self.run("caption", "download", output_format="silent", **kwargs)
+            params["tlang"] = tlang
+        return params
+
+    def _caption_downloaded(
+        self, result: YutuResult, caption_id: str, file_path: str, tlang: Optional[str]
+    ) -> YutuResult:
+        """下載成功後將原文字幕加入全文索引（翻譯的字幕不索引）"""
+        if result.success and not tlang:
+            self._index_caption_file(caption_id, file_path)
+        return result
+
+    def _index_caption_file(self, caption_id: str, file_path: str) -> None:
+        """將下載的字幕檔加入全文索引（失敗時不影響下載結果）"""
+        mirror = self.get_mirror(create=True)
+        if mirror is None:
+            return
+        try:
+            with open(file_path, encoding="utf-8", errors="replace") as f:
+                mirror.index_caption(caption_id, f.read())
+        except (OSError, sqlite3.Error):
+            pass
 
     def insert_caption(
         self,
@@ -523,8 +1401,31 @@ class YutuCLI:
         """
         return self.run("video", "rate", ids=video_id, rating=rating)
 
+    def _fetch_video_rating(self, video_ids: list[str]) -> YutuResult:
+        """查詢單一批次（最多 50 個）影片評分狀態"""
+        return self.run("video", "getRating", ids=",".join(video_ids))
+
+    def batch_video_rating(
+        self, video_ids: str | list[str], *, max_workers: Optional[int] = None
+    ) -> BatchResult:
+        """分批並行查詢影片評分狀態
+
+        Args:
+            video_ids: 影片 ID 列表或逗號分隔字串
+            max_workers: 同時查詢的批次數（None 使用 max_concurrency 設定）
+
+        Returns:
+            BatchResult
+        """
+        return fetch_in_batches(
+            self._fetch_video_rating,
+            video_ids,
+            key=lambda item: item.get("videoId", ""),
+            max_workers=max_workers or self.config.max_concurrency,
+        )
+
     def get_video_rating(self, video_ids: str | list[str]) -> YutuResult:
-        """取得影片評分狀態
+        """取得影片評分狀態（超過 50 個 ID 時自動分批）
 
         Args:
             video_ids: 影片 ID 或 ID 列表
@@ -532,9 +1433,7 @@ class YutuCLI:
         Returns:
             YutuResult
         """
-        if isinstance(video_ids, list):
-            video_ids = ",".join(video_ids)
-        return self.run("video", "getRating", ids=video_ids)
+        return YutuResult.from_batch(self.batch_video_rating(video_ids))
 
 
 # 全域實例